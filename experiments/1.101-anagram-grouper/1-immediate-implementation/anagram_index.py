@@ -0,0 +1,471 @@
+#!/usr/bin/env python3
+"""
+Anagram Index - persistent, memory-mapped anagram lookups
+
+find_anagrams_of_word scans its whole word list on every call. AnagramIndex is
+built once from a word list, saved to a compact file and memory-mapped on
+open, so lookups touch only a handful of pages and never rescan the list.
+
+File layout (all integers little-endian uint32):
+
+    header         magic, version, key count, word count, key bytes, word bytes
+    key offsets    key count + 1 offsets into the key blob
+    group offsets  key count + 1 indices into the word offsets
+    word offsets   word count + 1 offsets into the word blob
+    key blob       normalized keys (sorted letters), UTF-8, in sorted order
+    word blob      the words of each key's group, UTF-8, grouped by key
+
+Because the keys are sorted, all keys sharing a prefix form one contiguous
+range, which a binary search finds. Sub-anagram and wildcard queries walk the
+key table like a trie by narrowing that range one letter at a time.
+
+Example:
+    >>> index = AnagramIndex.build(['eat', 'tea', 'ate', 'tan', 'nat', 'bat'])
+    >>> index.find_anagrams('tea')
+    ['ate', 'eat']
+    >>> index.find_words('tabe')
+    ['ate', 'bat', 'eat', 'tea']
+"""
+
+import mmap
+import random
+import string
+import struct
+import sys
+import time
+from array import array
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Union
+
+from anagram_grouper import normalize_word, validate_input
+
+
+MAGIC = b'ANAGIDX\x00'
+VERSION = 1
+WILDCARD = '?'
+
+_HEADER = struct.Struct('<8s6I')
+_MAX_UINT32 = 2 ** 32 - 1
+
+
+def _uint32_array(data: Union[bytes, mmap.mmap], start: int, count: int) -> Sequence[int]:
+    """
+    View count little-endian uint32 values of data as a sequence of ints.
+
+    On little-endian machines this is a zero-copy view into the mapping.
+    """
+    view = memoryview(data)[start:start + 4 * count]
+    if sys.byteorder == 'little':
+        return view.cast('I')
+    values = array('I', view)
+    values.byteswap()
+    return values
+
+
+class AnagramIndex:
+    """
+    Read-only anagram index over a fixed word list.
+
+    Words are normalized the same way as by group_anagrams: case-insensitive,
+    with leading and trailing whitespace ignored. Identical words are stored
+    once.
+    """
+
+    def __init__(self, data: Union[bytes, mmap.mmap], source=None):
+        """
+        Wrap serialized index data; use build() or open() instead.
+
+        Args:
+            data (bytes or mmap): Index data in the format described above
+            source: Open file backing an mmap, closed together with the index
+
+        Raises:
+            ValueError: If the data is not an anagram index of this version
+        """
+        if len(data) < _HEADER.size:
+            raise ValueError("Not an anagram index: file is too short")
+        magic, version, key_count, word_count, key_bytes, word_bytes, _ = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError("Not an anagram index: bad magic number")
+        if version != VERSION:
+            raise ValueError(f"Unsupported anagram index version: {version}")
+
+        position = _HEADER.size
+        self._key_base = position + 4 * (2 * (key_count + 1) + word_count + 1)
+        self._word_base = self._key_base + key_bytes
+        if len(data) != self._word_base + word_bytes:
+            raise ValueError("Corrupt anagram index: size does not match header")
+
+        self._key_offsets = _uint32_array(data, position, key_count + 1)
+        position += 4 * (key_count + 1)
+        self._group_offsets = _uint32_array(data, position, key_count + 1)
+        position += 4 * (key_count + 1)
+        self._word_offsets = _uint32_array(data, position, word_count + 1)
+
+        self._data = data
+        self._source = source
+        self.key_count = key_count
+        self.word_count = word_count
+
+    @classmethod
+    def build(cls, words: List[str]) -> 'AnagramIndex':
+        """
+        Build an in-memory index from a word list.
+
+        Args:
+            words (List[str]): Words to index
+
+        Returns:
+            AnagramIndex: Index over the words, ready to query or save()
+
+        Raises:
+            TypeError: If input is not a list or contains non-string items
+            ValueError: If the word list is too large for the file format
+        """
+        return cls(cls.serialize(words))
+
+    @staticmethod
+    def serialize(words: List[str]) -> bytes:
+        """
+        Serialize a word list into the index file format.
+
+        Args:
+            words (List[str]): Words to index
+
+        Returns:
+            bytes: The index data
+
+        Raises:
+            TypeError: If input is not a list or contains non-string items
+            ValueError: If the word list is too large for the file format
+        """
+        groups: Dict[bytes, List[str]] = {}
+        for word in dict.fromkeys(validate_input(words)):
+            groups.setdefault(normalize_word(word).encode('utf-8'), []).append(word)
+
+        key_offsets = array('I', [0])
+        group_offsets = array('I', [0])
+        word_offsets = array('I', [0])
+        key_blob = bytearray()
+        word_blob = bytearray()
+        for key in sorted(groups):
+            key_blob += key
+            for word in sorted(groups[key], key=lambda w: (w.lower(), w)):
+                word_blob += word.encode('utf-8')
+                word_offsets.append(min(len(word_blob), _MAX_UINT32))
+            key_offsets.append(min(len(key_blob), _MAX_UINT32))
+            group_offsets.append(len(word_offsets) - 1)
+        if len(key_blob) >= _MAX_UINT32 or len(word_blob) >= _MAX_UINT32:
+            raise ValueError("Word list is too large for the anagram index format")
+
+        if sys.byteorder != 'little':
+            for offsets in (key_offsets, group_offsets, word_offsets):
+                offsets.byteswap()
+
+        header = _HEADER.pack(MAGIC, VERSION, len(groups), len(word_offsets) - 1,
+                              len(key_blob), len(word_blob), 0)
+        return b''.join([header, key_offsets.tobytes(), group_offsets.tobytes(),
+                         word_offsets.tobytes(), bytes(key_blob), bytes(word_blob)])
+
+    @classmethod
+    def open(cls, path: str) -> 'AnagramIndex':
+        """
+        Open a saved index by memory-mapping it.
+
+        Args:
+            path (str): Path written by save()
+
+        Returns:
+            AnagramIndex: Index backed by the file; close() it when done
+
+        Raises:
+            ValueError: If the file is not an anagram index
+        """
+        f = open(path, 'rb')
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            f.close()
+            raise ValueError("Not an anagram index: file is too short")
+        try:
+            return cls(data, source=f)
+        except ValueError:
+            data.close()
+            f.close()
+            raise
+
+    def save(self, path: str) -> int:
+        """
+        Write the index to a file.
+
+        Args:
+            path (str): Destination path
+
+        Returns:
+            int: Size of the file in bytes
+        """
+        with open(path, 'wb') as f:
+            f.write(self._data)
+        return len(self._data)
+
+    def close(self) -> None:
+        """Release the memory mapping, if any."""
+        # Views into the mapping must be released before it can be closed
+        for offsets in (self._key_offsets, self._group_offsets, self._word_offsets):
+            if isinstance(offsets, memoryview):
+                offsets.release()
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        if self._source is not None:
+            self._source.close()
+            self._source = None
+
+    def __enter__(self) -> 'AnagramIndex':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.word_count
+
+    def __contains__(self, word: str) -> bool:
+        if not isinstance(word, str) or not word.strip():
+            return False
+        return word.strip() in self._group(normalize_word(word).encode('utf-8'))
+
+    @property
+    def size(self) -> int:
+        """Size of the index data in bytes."""
+        return len(self._data)
+
+    def find_anagrams(self, word: str) -> List[str]:
+        """
+        Find the indexed anagrams of a word, like find_anagrams_of_word.
+
+        Each WILDCARD ('?') in the word stands for any one letter.
+
+        Args:
+            word (str): The word to find anagrams for
+
+        Returns:
+            List[str]: Anagrams of the word, excluding the word itself
+
+        Example:
+            >>> AnagramIndex.build(['tea', 'ate', 'cat', 'act']).find_anagrams('t?a')
+            ['ate', 'tea']
+        """
+        letters, wildcards = self._parse_query(word)
+        if wildcards:
+            keys = self._search(letters, wildcards, sum(letters.values()) + wildcards, exact=True)
+            words = [w for key in keys for w in self._group_at(key)]
+        else:
+            words = self._group(normalize_word(word).encode('utf-8'))
+
+        target = word.lower().strip()
+        return sorted((w for w in words if w.lower() != target), key=str.lower)
+
+    def find_words(self, letters: str, min_length: int = 1) -> List[str]:
+        """
+        Find the indexed words that can be formed from some of the letters.
+
+        Each letter may be used at most as often as it occurs; each WILDCARD
+        ('?') stands for any one letter.
+
+        Args:
+            letters (str): Available letters
+            min_length (int): Shortest word to return
+
+        Returns:
+            List[str]: Formable words, sorted alphabetically
+
+        Example:
+            >>> AnagramIndex.build(['tea', 'ate', 'at', 'bat']).find_words('eat', min_length=2)
+            ['at', 'ate', 'tea']
+        """
+        counts, wildcards = self._parse_query(letters)
+        keys = self._search(counts, wildcards, min_length, exact=False)
+        return sorted((w for key in keys for w in self._group_at(key)), key=str.lower)
+
+    @staticmethod
+    def _parse_query(query: str):
+        """Split a query into letter counts and a number of wildcards."""
+        if not isinstance(query, str):
+            raise TypeError(f"Expected string, got {type(query).__name__}")
+        normalized = normalize_word(query)
+        return Counter(normalized.replace(WILDCARD, '')), normalized.count(WILDCARD)
+
+    def _key(self, index: int) -> bytes:
+        base = self._key_base
+        return self._data[base + self._key_offsets[index]:base + self._key_offsets[index + 1]]
+
+    def _group_at(self, index: int) -> List[str]:
+        base = self._word_base
+        offsets = self._word_offsets
+        return [self._data[base + offsets[i]:base + offsets[i + 1]].decode('utf-8')
+                for i in range(self._group_offsets[index], self._group_offsets[index + 1])]
+
+    def _group(self, key: bytes) -> List[str]:
+        index = self._lower_bound(key, 0, self.key_count)
+        if index < self.key_count and self._key(index) == key:
+            return self._group_at(index)
+        return []
+
+    def _lower_bound(self, key: bytes, lo: int, hi: int) -> int:
+        """First index in [lo, hi) whose key is not less than key."""
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _prefix_end(self, prefix: bytes, lo: int, hi: int) -> int:
+        """First index in [lo, hi) whose key does not start with prefix."""
+        length = len(prefix)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key(mid)[:length] <= prefix:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _search(self, letters: Counter, wildcards: int, min_length: int, exact: bool) -> List[int]:
+        """
+        Walk the sorted key table as a trie and collect matching keys.
+
+        A key matches if it uses each letter at most as often as available,
+        with wildcards covering the rest, and is at least min_length long;
+        with exact set it must use every letter and wildcard.
+
+        Keys are sorted strings, so once the walk has passed a letter that
+        letter can no longer be used. For exact matches this means no child
+        may be larger than the smallest letter still available.
+        """
+        matches: List[int] = []
+        remaining = sum(letters.values())
+
+        def visit(prefix: str, encoded: bytes, lo: int, hi: int, wildcards: int, remaining: int):
+            depth = len(prefix)
+            if len(self._key(lo)) == len(encoded):
+                if depth >= min_length:
+                    matches.append(lo)
+                lo += 1
+            if lo >= hi or not (remaining or wildcards):
+                return
+            bound = min(c for c, n in letters.items() if n) if exact and remaining else None
+
+            if not wildcards:
+                # Only letters still available can extend the prefix, and
+                # keys are sorted, so none is smaller than the last letter
+                last = prefix[-1] if prefix else ''
+                for char in sorted(c for c, n in letters.items() if n and c >= last):
+                    if bound is not None and char > bound:
+                        break
+                    child = encoded + char.encode('utf-8')
+                    start = self._lower_bound(child, lo, hi)
+                    lo = self._prefix_end(child, start, hi)
+                    if start < lo:
+                        letters[char] -= 1
+                        visit(prefix + char, child, start, lo, 0, remaining - 1)
+                        letters[char] += 1
+                return
+
+            # With a wildcard any next letter fits: step through each distinct one
+            while lo < hi:
+                char = self._key(lo).decode('utf-8')[depth]
+                if bound is not None and char > bound:
+                    break
+                child = encoded + char.encode('utf-8')
+                end = self._prefix_end(child, lo, hi)
+                if letters[char]:
+                    letters[char] -= 1
+                    visit(prefix + char, child, lo, end, wildcards, remaining - 1)
+                    letters[char] += 1
+                else:
+                    visit(prefix + char, child, lo, end, wildcards - 1, remaining)
+                lo = end
+
+        if self.key_count:
+            visit('', b'', 0, self.key_count, wildcards, remaining)
+        return matches
+
+
+def benchmark(word_list: Optional[List[str]] = None, queries: int = 1000) -> Dict[str, float]:
+    """
+    Measure build time, index size and per-query latency.
+
+    Args:
+        word_list (List[str]): Words to index (default: 500,000 random words)
+        queries (int): Number of queries per query type
+
+    Returns:
+        Dict[str, float]: Timings in seconds and the index size in bytes
+    """
+    import os
+    import tempfile
+
+    rng = random.Random(0)
+    if word_list is None:
+        letters = string.ascii_lowercase
+        weights = [8, 2, 3, 4, 12, 2, 2, 6, 7, 1, 1, 4, 2, 7, 8, 2, 1, 6, 6, 9, 3, 1, 2, 1, 2, 1]
+        word_list = [''.join(rng.choices(letters, weights, k=rng.randint(2, 12))) for _ in range(500_000)]
+
+    start = time.perf_counter()
+    data = AnagramIndex.serialize(word_list)
+    build_time = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'words.idx')
+        with open(path, 'wb') as f:
+            f.write(data)
+
+        start = time.perf_counter()
+        index = AnagramIndex.open(path)
+        open_time = time.perf_counter() - start
+
+        samples = rng.sample(word_list, queries)
+        racks = [''.join(rng.sample(word, len(word))) for word in samples]
+        wildcard_racks = [rack[:-1] + WILDCARD for rack in racks]
+
+        def latency(query, arguments):
+            start = time.perf_counter()
+            for argument in arguments:
+                query(argument)
+            return (time.perf_counter() - start) / len(arguments)
+
+        results = {
+            'words': len(word_list),
+            'build_seconds': build_time,
+            'open_seconds': open_time,
+            'index_bytes': index.size,
+            'exact_seconds': latency(index.find_anagrams, samples),
+            'wildcard_seconds': latency(index.find_anagrams, wildcard_racks),
+            'sub_anagram_seconds': latency(lambda rack: index.find_words(rack[:7], min_length=2), racks),
+            'linear_scan_seconds': latency(lambda word: [w for w in word_list
+                                                         if normalize_word(w) == normalize_word(word)],
+                                           samples[:3]),
+        }
+        index.close()
+    return results
+
+
+if __name__ == "__main__":
+    words = None
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], encoding='utf-8') as f:
+            words = f.read().split()
+
+    print("=== Anagram Index Benchmark ===\n")
+    stats = benchmark(words)
+    print(f"Words indexed:       {stats['words']:,}")
+    print(f"Build time:          {stats['build_seconds']:.2f} s")
+    print(f"Open time (mmap):    {stats['open_seconds'] * 1e3:.3f} ms")
+    print(f"Index size:          {stats['index_bytes'] / 1e6:.1f} MB")
+    print(f"Exact anagram:       {stats['exact_seconds'] * 1e6:.1f} µs/query")
+    print(f"Wildcard anagram:    {stats['wildcard_seconds'] * 1e6:.1f} µs/query")
+    print(f"Sub-anagram (7):     {stats['sub_anagram_seconds'] * 1e6:.1f} µs/query")
+    print(f"Linear scan:         {stats['linear_scan_seconds'] * 1e3:.1f} ms/query")
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Simple tests for the persistent anagram index.
+
+Run this file to verify that all functions work correctly.
+"""
+
+import os
+import sys
+import tempfile
+from anagram_grouper import find_anagrams_of_word
+from anagram_index import AnagramIndex
+
+
+WORDS = ['eat', 'Tea', 'ate', 'tan', 'nat', 'bat', 'tab', 'at', 'a', 'listen', 'silent', ' enlist ', 'eat']
+
+
+def test_find_anagrams():
+    """Test exact-anagram lookups against find_anagrams_of_word."""
+    print("Testing find_anagrams...")
+
+    index = AnagramIndex.build(WORDS)
+    for word in ['eat', 'TEA', 'tinsel', 'bat', 'hello', '']:
+        expected = sorted(set(find_anagrams_of_word(word, WORDS)), key=str.lower)
+        assert index.find_anagrams(word) == expected, f"Mismatch for {word!r}"
+
+    # Duplicates and surrounding whitespace are dropped when indexing
+    assert len(index) == 12
+    assert 'enlist' in index
+    assert 'hello' not in index
+
+    print("✓ find_anagrams tests passed")
+
+
+def test_find_words():
+    """Test sub-anagram lookups."""
+    print("Testing find_words...")
+
+    index = AnagramIndex.build(WORDS)
+    assert index.find_words('eta') == ['a', 'at', 'ate', 'eat', 'Tea']
+    assert index.find_words('eta', min_length=3) == ['ate', 'eat', 'Tea']
+    assert index.find_words('abtt') == ['a', 'at', 'bat', 'tab']
+    assert index.find_words('xyz') == []
+
+    print("✓ find_words tests passed")
+
+
+def test_wildcards():
+    """Test wildcard letters in both query types."""
+    print("Testing wildcards...")
+
+    index = AnagramIndex.build(WORDS)
+    assert index.find_anagrams('t?a') == ['ate', 'bat', 'eat', 'nat', 'tab', 'tan', 'Tea']
+    assert index.find_anagrams('???') == ['ate', 'bat', 'eat', 'nat', 'tab', 'tan', 'Tea']
+    assert index.find_anagrams('l?') == []
+    assert index.find_words('b?') == ['a']
+    assert index.find_words('b??', min_length=3) == ['bat', 'tab']
+
+    print("✓ wildcard tests passed")
+
+
+def test_save_and_open():
+    """Test that a saved index answers the same queries through mmap."""
+    print("Testing save and open...")
+
+    index = AnagramIndex.build(WORDS)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'words.idx')
+        assert index.save(path) == os.path.getsize(path) == index.size
+
+        with AnagramIndex.open(path) as opened:
+            assert opened.find_anagrams('silent') == index.find_anagrams('silent')
+            assert opened.find_words('tabe') == index.find_words('tabe')
+            assert len(opened) == len(index)
+
+        # Files that are not an index are rejected
+        bad_path = os.path.join(directory, 'bad.idx')
+        with open(bad_path, 'wb') as f:
+            f.write(b'not an index at all, just some bytes')
+        try:
+            AnagramIndex.open(bad_path)
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+
+    print("✓ save and open tests passed")
+
+
+def test_invalid_input():
+    """Test input validation."""
+    print("Testing invalid input...")
+
+    try:
+        AnagramIndex.build(['eat', 42])
+        assert False, "Should have raised TypeError"
+    except TypeError:
+        pass
+
+    try:
+        AnagramIndex.build(WORDS).find_words(None)
+        assert False, "Should have raised TypeError"
+    except TypeError:
+        pass
+
+    # An empty index answers every query with no words
+    empty = AnagramIndex.build([])
+    assert empty.find_anagrams('eat') == []
+    assert empty.find_words('e?t') == []
+
+    print("✓ invalid input tests passed")
+
+
+def run_all_tests():
+    """Run all tests."""
+    print("Running anagram index tests...\n")
+
+    try:
+        test_find_anagrams()
+        test_find_words()
+        test_wildcards()
+        test_save_and_open()
+        test_invalid_input()
+
+        print("\n🎉 All tests passed!")
+        return True
+
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
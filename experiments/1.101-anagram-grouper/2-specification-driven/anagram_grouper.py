@@ -5,11 +5,16 @@ This module provides functionality to group strings that are anagrams of each ot
 Implemented according to the comprehensive specifications in anagram_grouper_specifications.md.
 """
 
-from collections import defaultdict
+from collections import Counter, defaultdict
 from typing import Iterable, List, Dict, Union
 import unicodedata
 
 
+# Words at least this long get their canonical form from character counts,
+# which is linear in the word length, instead of from a full sort
+COUNTING_THRESHOLD = 300
+
+
 def group_anagrams(
     words: Iterable[str],
     case_sensitive: bool = False,
@@ -55,28 +60,24 @@ def group_anagrams(
     if output_format not in ('list', 'dict'):
         raise ValueError(f"output_format must be 'list' or 'dict', got '{output_format}'")
 
-    # Convert to list to allow multiple iterations and validate input
     try:
-        word_list = list(words)
+        word_iter = iter(words)
     except TypeError:
         raise TypeError("Input must be iterable")
 
-    # Validate that all items are strings
-    for i, word in enumerate(word_list):
+    # Group anagrams using canonical form as key, validating in the same pass
+    anagram_groups = defaultdict(list)
+
+    for i, word in enumerate(word_iter):
         if not isinstance(word, str):
             raise TypeError(f"All items must be strings, but item at index {i} is {type(word).__name__}")
+        canonical_form = _get_canonical_form(word, case_sensitive)
+        anagram_groups[canonical_form].append(word)
 
     # Handle empty input
-    if not word_list:
+    if not anagram_groups:
         return [] if output_format == 'list' else {}
 
-    # Group anagrams using canonical form as key
-    anagram_groups = defaultdict(list)
-
-    for word in word_list:
-        canonical_form = _get_canonical_form(word, case_sensitive)
-        anagram_groups[canonical_form].append(word)
-
     # Sort within groups if requested
     if sort_within_groups:
         for group in anagram_groups.values():
@@ -108,7 +109,9 @@ def _get_canonical_form(word: str, case_sensitive: bool) -> str:
     The canonical form is created by:
     1. Normalizing Unicode characters
     2. Converting to lowercase if not case sensitive
-    3. Sorting the characters
+    3. Sorting the characters (or, for long words, counting them and
+       emitting each character as many times as it occurs - the same
+       string, without an O(m log m) sort)
 
     Args:
         word: The word to generate canonical form for
@@ -125,7 +128,9 @@ def _get_canonical_form(word: str, case_sensitive: bool) -> str:
         normalized = normalized.lower()
 
     # Sort characters to create canonical form
-    return ''.join(sorted(normalized))
+    if len(normalized) < COUNTING_THRESHOLD:
+        return ''.join(sorted(normalized))
+    return ''.join([char * count for char, count in sorted(Counter(normalized).items())])
 
 
 # Additional utility functions for advanced use cases
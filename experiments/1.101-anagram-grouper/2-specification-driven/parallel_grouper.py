@@ -0,0 +1,332 @@
+"""
+Parallel, Streaming Anagram Grouper
+
+This module groups anagrams in corpora too large for group_anagrams: words are
+read in chunks, canonical forms are computed in worker processes, and the
+partial groupings the workers return are merged in a final reduce. When a
+memory limit is given, partial groups are spilled to hash-partitioned files on
+disk and merged one partition at a time, so the input may be larger than RAM.
+
+Canonical forms are the ones group_anagrams uses, so the results are the same.
+"""
+
+import heapq
+import itertools
+import os
+import pickle
+import shutil
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from anagram_grouper import _get_canonical_form
+
+
+DEFAULT_CHUNK_SIZE = 50_000
+SPILL_PARTITIONS = 64
+
+# Groups per pickle record when writing a sorted partition back to disk
+_SORTED_BATCH_SIZE = 1_000
+
+
+def read_words(path: str, encoding: str = 'utf-8') -> Iterator[str]:
+    """
+    Stream words from a text file, one word (or phrase) per line.
+
+    Line endings are stripped and blank lines are skipped; the file is never
+    read into memory as a whole.
+
+    Args:
+        path: Path to the word list
+        encoding: Text encoding of the file (default: 'utf-8')
+
+    Yields:
+        Each non-blank line without its line ending
+
+    Examples:
+        >>> groups = group_anagrams_parallel(read_words('words.txt'))  # doctest: +SKIP
+    """
+    with open(path, 'r', encoding=encoding) as f:
+        for line in f:
+            word = line.rstrip('\r\n')
+            if word:
+                yield word
+
+
+def group_anagrams_parallel(
+    words: Iterable[str],
+    case_sensitive: bool = False,
+    sort_groups: bool = True,
+    sort_within_groups: bool = True,
+    output_format: str = 'list',
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_words_in_memory: Optional[int] = None,
+    spill_dir: Optional[str] = None
+) -> Union[List[List[str]], Dict[str, List[str]]]:
+    """
+    Group anagrams using worker processes; a drop-in for group_anagrams.
+
+    Args:
+        words: An iterable of strings, consumed lazily in chunks
+        case_sensitive: Whether to consider case when determining anagrams (default: False)
+        sort_groups: Whether to sort groups by their canonical representation (default: True)
+        sort_within_groups: Whether to sort words within each group (default: True)
+        output_format: Output format - 'list' for list of lists, 'dict' for dictionary (default: 'list')
+        workers: Number of worker processes (default: os.cpu_count(); 1 runs in-process)
+        chunk_size: Number of words sent to a worker at a time
+        max_words_in_memory: Spill partial groups to disk whenever the reduce
+            holds this many words (default: None, never spill)
+        spill_dir: Directory for spill files (default: the system temp directory)
+
+    Returns:
+        The same groups as group_anagrams with the same options. When
+        spilling with sort_groups=False, groups come out in partition order
+        rather than in order of first appearance.
+
+    Raises:
+        TypeError: If input contains non-string items or input is not iterable
+        ValueError: If output_format, workers or chunk_size is invalid
+
+    Examples:
+        >>> group_anagrams_parallel(['eat', 'tea', 'tan', 'ate', 'nat', 'bat'], workers=2)
+        [['ate', 'eat', 'tea'], ['nat', 'tan'], ['bat']]
+    """
+    if output_format not in ('list', 'dict'):
+        raise ValueError(f"output_format must be 'list' or 'dict', got '{output_format}'")
+
+    groups = iter_anagram_groups(
+        words,
+        case_sensitive=case_sensitive,
+        sort_groups=sort_groups,
+        sort_within_groups=sort_within_groups,
+        workers=workers,
+        chunk_size=chunk_size,
+        max_words_in_memory=max_words_in_memory,
+        spill_dir=spill_dir
+    )
+    if output_format == 'dict':
+        return dict(groups)
+    return [group for _, group in groups]
+
+
+def iter_anagram_groups(
+    words: Iterable[str],
+    case_sensitive: bool = False,
+    sort_groups: bool = True,
+    sort_within_groups: bool = True,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_words_in_memory: Optional[int] = None,
+    spill_dir: Optional[str] = None
+) -> Iterator[Tuple[str, List[str]]]:
+    """
+    Stream (canonical form, group) pairs without building the full result.
+
+    Combined with max_words_in_memory, memory use is bounded by the spill
+    limit plus the largest partition, so corpora larger than RAM can be
+    grouped and written out group by group.
+
+    Args:
+        words: An iterable of strings, consumed lazily in chunks
+        case_sensitive: Whether to consider case when determining anagrams (default: False)
+        sort_groups: Whether to yield groups in canonical-form order (default: True)
+        sort_within_groups: Whether to sort words within each group (default: True)
+        workers: Number of worker processes (default: os.cpu_count(); 1 runs in-process)
+        chunk_size: Number of words sent to a worker at a time
+        max_words_in_memory: Spill partial groups to disk whenever the reduce
+            holds this many words (default: None, never spill)
+        spill_dir: Directory for spill files (default: the system temp directory)
+
+    Yields:
+        (canonical form, list of words) for each anagram group
+
+    Raises:
+        TypeError: If input contains non-string items or input is not iterable
+        ValueError: If workers or chunk_size is not positive
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+
+    try:
+        word_iter = iter(words)
+    except TypeError:
+        raise TypeError("Input must be iterable")
+
+    store = None
+    merged: Dict[str, List[str]] = {}
+    held = 0
+    try:
+        for partial in _map_chunks(_read_chunks(word_iter, chunk_size), case_sensitive, workers):
+            held += _merge(merged, partial)
+            if max_words_in_memory is not None and held >= max_words_in_memory:
+                if store is None:
+                    store = _SpillStore(spill_dir)
+                store.spill(merged)
+                merged, held = {}, 0
+
+        if store is None:
+            yield from _finish(merged, sort_groups, sort_within_groups)
+            return
+
+        store.spill(merged)
+        merged = {}
+        yield from store.iter_groups(sort_groups, sort_within_groups)
+    finally:
+        if store is not None:
+            store.close()
+
+
+def _read_chunks(word_iter: Iterator, chunk_size: int) -> Iterator[List[str]]:
+    """Slice the input into lists of chunk_size words, checking their types."""
+    offset = 0
+    while True:
+        chunk = list(itertools.islice(word_iter, chunk_size))
+        if not chunk:
+            return
+        if not all(isinstance(word, str) for word in chunk):
+            index, word = next((i, word) for i, word in enumerate(chunk) if not isinstance(word, str))
+            raise TypeError(
+                f"All items must be strings, but item at index {offset + index} is {type(word).__name__}"
+            )
+        offset += len(chunk)
+        yield chunk
+
+
+def _group_chunk(chunk: List[str], case_sensitive: bool) -> Dict[str, List[str]]:
+    """Group one chunk of words by canonical form; runs in a worker process."""
+    groups: Dict[str, List[str]] = {}
+    for word in chunk:
+        key = _get_canonical_form(word, case_sensitive)
+        group = groups.get(key)
+        if group is None:
+            groups[key] = [word]
+        else:
+            group.append(word)
+    return groups
+
+
+def _map_chunks(chunks: Iterator[List[str]], case_sensitive: bool,
+                workers: int) -> Iterator[Dict[str, List[str]]]:
+    """
+    Group each chunk, in input order.
+
+    At most two chunks per worker are in flight, so the input is read only
+    as fast as the workers consume it.
+    """
+    if workers == 1:
+        for chunk in chunks:
+            yield _group_chunk(chunk, case_sensitive)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(_group_chunk, chunk, case_sensitive))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _merge(merged: Dict[str, List[str]], partial: Dict[str, List[str]]) -> int:
+    """Add a partial grouping into merged; returns the number of words added."""
+    added = 0
+    for key, group in partial.items():
+        existing = merged.get(key)
+        if existing is None:
+            merged[key] = group
+        else:
+            existing.extend(group)
+        added += len(group)
+    return added
+
+
+def _finish(groups: Dict[str, List[str]], sort_groups: bool,
+            sort_within_groups: bool) -> Iterator[Tuple[str, List[str]]]:
+    """Apply the requested ordering to an in-memory grouping."""
+    keys = sorted(groups) if sort_groups else groups
+    for key in keys:
+        group = groups[key]
+        if sort_within_groups:
+            group.sort()
+        yield key, group
+
+
+def _read_records(path: str) -> Iterator:
+    """Read back every record pickled into a spill file."""
+    if not os.path.exists(path):
+        return
+    with open(path, 'rb') as f:
+        while True:
+            try:
+                yield pickle.load(f)
+            except EOFError:
+                return
+
+
+class _SpillStore:
+    """
+    Hash-partitioned spill files for partial groupings.
+
+    Every canonical form always lands in the same partition, so partitions
+    can be reduced independently, one at a time. Spill files are private to
+    this process and removed by close().
+    """
+
+    def __init__(self, spill_dir: Optional[str] = None):
+        self.directory = tempfile.mkdtemp(prefix='anagram-spill-', dir=spill_dir)
+        self.partitions = SPILL_PARTITIONS
+
+    def _path(self, partition: int, suffix: str = 'spill') -> str:
+        return os.path.join(self.directory, f'{partition:03d}.{suffix}')
+
+    def spill(self, groups: Dict[str, List[str]]) -> None:
+        """Append a partial grouping, one record per partition."""
+        buckets: List[List[Tuple[str, List[str]]]] = [[] for _ in range(self.partitions)]
+        for key, group in groups.items():
+            buckets[hash(key) % self.partitions].append((key, group))
+        for partition, bucket in enumerate(buckets):
+            if bucket:
+                with open(self._path(partition), 'ab') as f:
+                    pickle.dump(bucket, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def _reduce_partition(self, partition: int) -> Dict[str, List[str]]:
+        """Merge every record of one partition, in the order it was spilled."""
+        merged: Dict[str, List[str]] = {}
+        for bucket in _read_records(self._path(partition)):
+            _merge(merged, dict(bucket))
+        return merged
+
+    def iter_groups(self, sort_groups: bool,
+                    sort_within_groups: bool) -> Iterator[Tuple[str, List[str]]]:
+        """Yield the final groups, merging partitions from disk."""
+        if not sort_groups:
+            for partition in range(self.partitions):
+                yield from _finish(self._reduce_partition(partition), False, sort_within_groups)
+            return
+
+        # Sort each partition on its own, then k-way merge the sorted runs;
+        # partitions that never received a key have no spill file
+        for partition in range(self.partitions):
+            if not os.path.exists(self._path(partition)):
+                continue
+            groups = list(_finish(self._reduce_partition(partition), True, sort_within_groups))
+            with open(self._path(partition, 'sorted'), 'wb') as f:
+                for start in range(0, len(groups), _SORTED_BATCH_SIZE):
+                    pickle.dump(groups[start:start + _SORTED_BATCH_SIZE], f,
+                                protocol=pickle.HIGHEST_PROTOCOL)
+            os.remove(self._path(partition))
+
+        runs = [itertools.chain.from_iterable(_read_records(self._path(partition, 'sorted')))
+                for partition in range(self.partitions)]
+        yield from heapq.merge(*runs, key=lambda item: item[0])
+
+    def close(self) -> None:
+        """Delete the spill files."""
+        shutil.rmtree(self.directory, ignore_errors=True)
@@ -0,0 +1,103 @@
+"""
+Test suite for the parallel, streaming anagram grouper.
+
+Every configuration must produce exactly what group_anagrams produces.
+"""
+
+import os
+import random
+import pytest
+from anagram_grouper import group_anagrams, _get_canonical_form, COUNTING_THRESHOLD
+from parallel_grouper import group_anagrams_parallel, iter_anagram_groups, read_words
+
+
+def _corpus(size: int = 20000) -> list:
+    """Random short words over a small alphabet, so that many are anagrams."""
+    rng = random.Random(42)
+    words = [''.join(rng.choice('abcdeE') for _ in range(rng.randint(1, 6))) for _ in range(size)]
+    return words + ['', 'Ééa', 'aÉé', 'x' * 400 + 'y', 'y' + 'x' * 400]
+
+
+class TestParallelGrouping:
+    """Test cases for group_anagrams_parallel."""
+
+    @pytest.mark.parametrize('options', [
+        {},
+        {'case_sensitive': True},
+        {'sort_within_groups': False},
+        {'sort_groups': False, 'sort_within_groups': False},
+        {'output_format': 'dict'},
+    ])
+    def test_matches_group_anagrams(self, options):
+        """Test in-process and multi-process runs against the serial result."""
+        words = _corpus()
+        expected = group_anagrams(words, **options)
+        assert group_anagrams_parallel(words, workers=1, **options) == expected
+        assert group_anagrams_parallel(words, workers=2, chunk_size=3000, **options) == expected
+
+    def test_spilling_matches_group_anagrams(self, tmp_path):
+        """Test that spilled partial groups merge back into the same result."""
+        words = _corpus()
+        result = group_anagrams_parallel(words, workers=2, chunk_size=1000,
+                                         max_words_in_memory=2500, spill_dir=str(tmp_path))
+        assert result == group_anagrams(words)
+        # Spill files are removed once the groups have been produced
+        assert os.listdir(tmp_path) == []
+
+    def test_spilling_without_sorting_keeps_groups(self, tmp_path):
+        """Test unsorted spilled output: same groups, input order within groups."""
+        words = _corpus()
+        result = group_anagrams_parallel(words, workers=1, chunk_size=1000, sort_groups=False,
+                                         sort_within_groups=False, max_words_in_memory=2500,
+                                         spill_dir=str(tmp_path))
+        expected = group_anagrams(words, sort_groups=False, sort_within_groups=False)
+        assert sorted(result) == sorted(expected)
+
+    @pytest.mark.parametrize('sort_groups', [True, False])
+    def test_spilling_small_corpus(self, tmp_path, sort_groups):
+        """Test spilling when most hash partitions stay empty."""
+        words = ['eat', 'tea', 'tan', 'ate', 'nat', 'bat', 'a', 'b', 'c', 'cc', 'ab', 'ba']
+        result = group_anagrams_parallel(words, workers=1, chunk_size=2, max_words_in_memory=2,
+                                         sort_groups=sort_groups, spill_dir=str(tmp_path))
+        expected = group_anagrams(words, sort_groups=sort_groups)
+        assert sorted(result) == sorted(expected)
+        if sort_groups:
+            assert result == expected
+        assert os.listdir(tmp_path) == []
+
+    def test_streams_from_generator(self):
+        """Test that a one-shot generator is consumed chunk by chunk."""
+        words = (w for w in ['eat', 'tea', 'tan', 'ate', 'nat', 'bat'])
+        groups = list(iter_anagram_groups(words, workers=1, chunk_size=2))
+        assert groups == [('abt', ['bat']), ('aet', ['ate', 'eat', 'tea']), ('ant', ['nat', 'tan'])]
+
+    def test_read_words(self, tmp_path):
+        """Test streaming a word list file."""
+        path = tmp_path / 'words.txt'
+        path.write_text('listen\nsilent\n\nenlist\r\nhello\n', encoding='utf-8')
+        assert list(read_words(str(path))) == ['listen', 'silent', 'enlist', 'hello']
+        assert group_anagrams_parallel(read_words(str(path)), workers=1) == [
+            ['hello'], ['enlist', 'listen', 'silent']
+        ]
+
+    def test_errors(self):
+        """Test the same validation errors as group_anagrams, with global indices."""
+        with pytest.raises(TypeError, match='item at index 5 is int'):
+            group_anagrams_parallel(['a', 'b', 'c', 'd', 'e', 5], workers=1, chunk_size=2)
+        with pytest.raises(TypeError, match='Input must be iterable'):
+            group_anagrams_parallel(123)
+        with pytest.raises(ValueError):
+            group_anagrams_parallel(['a'], output_format='set')
+        with pytest.raises(ValueError):
+            group_anagrams_parallel(['a'], workers=0)
+
+
+class TestCountingSignature:
+    """Test cases for canonical forms of long words."""
+
+    def test_counting_matches_sorting(self):
+        """Test that long words get the same canonical form as a full sort would give."""
+        rng = random.Random(7)
+        word = ''.join(rng.choice('zyxÉé AB') for _ in range(COUNTING_THRESHOLD * 3))
+        assert _get_canonical_form(word, True) == ''.join(sorted(word))
+        assert _get_canonical_form(word, False) == ''.join(sorted(word.lower()))
@@ -3,10 +3,11 @@ Input handling module for the Multilingual Word Counter.
 Handles various input sources: files, URLs, stdin.
 """
 
+import codecs
 import sys
 import os
 import requests
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator, Tuple
 from urllib.parse import urlparse
 
 try:
@@ -28,6 +29,10 @@ except ImportError:
     BS4_AVAILABLE = False
 
 
+# Encodings tried, in order, when reading text files
+TEXT_ENCODINGS = ['utf-8', 'utf-16', 'latin-1', 'cp1252']
+
+
 class InputHandler:
     """Handles various input sources for text processing."""
 
@@ -126,6 +131,51 @@ class InputHandler:
         except Exception as e:
             raise IOError(f"Error reading from stdin: {str(e)}")
 
+    def read_file_chunks(self, file_path: str, chunk_size: int = 1_048_576) -> Iterator[str]:
+        """
+        Read text from a file in chunks, without loading it into memory.
+
+        The encoding is chosen as by read_file, but from the first chunk
+        only; undecodable bytes later in the file are replaced. Document
+        formats (.docx, .pdf) cannot be streamed and come as one chunk.
+
+        Args:
+            file_path: Path to the file
+            chunk_size: Bytes to read at a time
+
+        Returns:
+            Iterator over text chunks
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            IOError: If file cannot be read (possibly while iterating)
+        """
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        if os.path.splitext(file_path)[1].lower() in ('.docx', '.pdf'):
+            return iter([self.read_file(file_path)])
+        return self._iter_text_file(file_path, chunk_size)
+
+    def read_stdin_chunks(self, chunk_size: int = 1_048_576) -> Iterator[str]:
+        """
+        Read text from standard input in chunks.
+
+        Args:
+            chunk_size: Characters to read at a time
+
+        Yields:
+            Text chunks until end of input
+        """
+        try:
+            while True:
+                chunk = sys.stdin.read(chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+        except Exception as e:
+            raise IOError(f"Error reading from stdin: {str(e)}")
+
     def get_file_metadata(self, file_path: str) -> Dict[str, Any]:
         """
         Get metadata about a file.
@@ -154,9 +204,7 @@ class InputHandler:
 
     def _read_text_file(self, file_path: str) -> str:
         """Read a plain text file."""
-        encodings = ['utf-8', 'utf-16', 'latin-1', 'cp1252']
-
-        for encoding in encodings:
+        for encoding in TEXT_ENCODINGS:
             try:
                 with open(file_path, 'r', encoding=encoding) as file:
                     return file.read()
@@ -167,6 +215,33 @@ class InputHandler:
 
         raise IOError(f"Could not decode file {file_path} with any supported encoding")
 
+    def _iter_text_file(self, file_path: str, chunk_size: int) -> Iterator[str]:
+        """Decode a plain text file chunk by chunk."""
+        try:
+            with open(file_path, 'rb') as file:
+                block = file.read(chunk_size)
+                decoder = None
+                for encoding in TEXT_ENCODINGS:
+                    try:
+                        codecs.getincrementaldecoder(encoding)().decode(block)
+                    except UnicodeDecodeError:
+                        continue
+                    decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+                    break
+                if decoder is None:
+                    raise IOError(f"Could not decode file {file_path} with any supported encoding")
+
+                while block:
+                    text = decoder.decode(block)
+                    if text:
+                        yield text
+                    block = file.read(chunk_size)
+                text = decoder.decode(b'', final=True)
+                if text:
+                    yield text
+        except OSError as e:
+            raise IOError(f"Error reading text file: {str(e)}")
+
     def _read_docx_file(self, file_path: str) -> str:
         """Read a Microsoft Word document."""
         if not DOCX_AVAILABLE:
@@ -282,4 +357,47 @@ class InputHandler:
         except Exception as e:
             # Return error information in metadata
             metadata['error'] = str(e)
-            return "", metadata
\ No newline at end of file
+            return "", metadata
+
+    def process_input_stream(
+        self,
+        input_source: str,
+        input_type: Optional[str] = None,
+        chunk_size: int = 1_048_576
+    ) -> Tuple[Iterator[str], Dict[str, Any]]:
+        """
+        Process input from various sources as a stream of text chunks.
+
+        Files and stdin are read lazily; URLs and direct text arrive as a
+        single chunk.
+
+        Args:
+            input_source: Input source (file path, URL, or text)
+            input_type: Optional type hint ('file', 'url', 'text', 'stdin')
+            chunk_size: Size of each chunk read from a file or stdin
+
+        Returns:
+            Tuple of (text chunk iterator, metadata)
+        """
+        if input_type is None:
+            input_type = self.detect_input_type(input_source)
+
+        if input_type not in ('file', 'stdin'):
+            text, metadata = self.process_input(input_source, input_type)
+            return iter([text]), metadata
+
+        metadata = {'input_type': input_type, 'input_source': input_source}
+
+        try:
+            if input_type == 'file':
+                chunks = self.read_file_chunks(input_source, chunk_size)
+                metadata.update(self.get_file_metadata(input_source))
+            else:
+                chunks = self.read_stdin_chunks(chunk_size)
+
+            return chunks, metadata
+
+        except Exception as e:
+            # Return error information in metadata
+            metadata['error'] = str(e)
+            return iter(()), metadata
\ No newline at end of file
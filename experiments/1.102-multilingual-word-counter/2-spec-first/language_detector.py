@@ -6,6 +6,7 @@ Handles automatic detection of text language with confidence scoring.
 import re
 from typing import List, Dict
 from langdetect import detect, detect_langs, DetectorFactory
+from langdetect.detector_factory import init_factory
 from langdetect.lang_detect_exception import LangDetectException
 
 from models import LanguageResult, ProcessingConfig, LANGUAGE_NAMES
@@ -20,6 +21,10 @@ class LanguageDetector:
         # Set seed for consistent results
         DetectorFactory.seed = 0
 
+    def warm_up(self):
+        """Load the language profiles now rather than on the first detection."""
+        init_factory()
+
     def detect_language(self, text: str) -> LanguageResult:
         """
         Detect the primary language of the input text.
@@ -55,8 +55,10 @@ class ProcessingConfig:
         'ar', 'hi', 'nl', 'sv', 'tr'
     ])
     enable_mixed_language: bool = True
-    max_text_length: int = 1_000_000
+    max_text_length: int = 1_000_000      # Longer inputs are streamed, not truncated
     output_format: str = "json"
+    chunk_size: int = 1_048_576           # Characters per chunk when streaming
+    language_sample_size: int = 100_000   # Leading characters used to detect a stream's languages
 
 
 # Language code to name mapping
@@ -14,12 +14,15 @@ Examples:
     python multilingual_word_counter.py https://example.com/article
     python multilingual_word_counter.py --format json --verbose input.docx
     cat input.txt | python multilingual_word_counter.py --stdin
+    python multilingual_word_counter.py --batch --workers 4 *.txt
 """
 
 import sys
 import os
+import json
 import argparse
-from typing import Optional, List
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, List, Iterator, Tuple
 
 from models import ProcessingConfig
 from text_analyzer import TextAnalyzer
@@ -49,18 +52,20 @@ class MultilingualWordCounter:
             Dictionary with processing results and any errors
         """
         try:
-            # Get text and metadata from input
-            text, metadata = self.input_handler.process_input(input_source, input_type)
+            # Get a text stream and metadata from input; files and stdin are read lazily
+            chunks, metadata = self.input_handler.process_input_stream(
+                input_source, input_type, self.config.chunk_size
+            )
 
-            if not text and metadata.get('error'):
+            if metadata.get('error'):
                 return {
                     'success': False,
                     'error': metadata['error'],
                     'metadata': metadata
                 }
 
-            # Analyze the text
-            result = self.analyzer.analyze(text, metadata)
+            # Analyze the text; inputs over max_text_length are streamed, not truncated
+            result = self.analyzer.analyze_stream(chunks, metadata)
 
             return {
                 'success': True,
@@ -75,12 +80,54 @@ class MultilingualWordCounter:
                 'metadata': {'input_source': input_source}
             }
 
-    def process_batch(self, input_sources: List[str]) -> dict:
+    def iter_batch(self, input_sources: List[str], workers: Optional[int] = 1) -> Iterator[Tuple[str, dict]]:
+        """
+        Process multiple input sources, yielding results in input order.
+
+        With more than one worker, sources are spread over a process pool whose
+        workers load language profiles and dictionaries once, at start-up. Each
+        result is yielded as soon as it and every source before it have finished.
+
+        Args:
+            input_sources: List of input sources
+            workers: Number of worker processes (None uses every CPU; 1 runs in-process)
+
+        Yields:
+            (source, result) pairs, where result is what process_single returns
+
+        Raises:
+            ValueError: If workers is less than 1
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+
+        if workers == 1 or len(input_sources) < 2:
+            for source in input_sources:
+                yield source, self.process_single(source)
+            return
+
+        executor = ProcessPoolExecutor(
+            max_workers=min(workers, len(input_sources)),
+            initializer=_init_worker,
+            initargs=(self.config,)
+        )
+        try:
+            futures = [executor.submit(_process_in_worker, source) for source in input_sources]
+            for source, future in zip(input_sources, futures):
+                yield source, future.result()
+        finally:
+            # Don't start sources nobody will read if the caller stops early
+            executor.shutdown(cancel_futures=True)
+
+    def process_batch(self, input_sources: List[str], workers: Optional[int] = 1) -> dict:
         """
         Process multiple input sources.
 
         Args:
             input_sources: List of input sources
+            workers: Number of worker processes (None uses every CPU; 1 runs in-process)
 
         Returns:
             Dictionary with batch processing results
@@ -88,8 +135,7 @@ class MultilingualWordCounter:
         results = []
         errors = []
 
-        for source in input_sources:
-            result = self.process_single(source)
+        for source, result in self.iter_batch(input_sources, workers):
             if result['success']:
                 results.append(result['result'])
             else:
@@ -119,6 +165,22 @@ class MultilingualWordCounter:
             return self.formatter.to_human_readable(result, verbose)
 
 
+# Application instance of a batch worker process, created by _init_worker
+_worker_app = None
+
+
+def _init_worker(config: ProcessingConfig):
+    """Build the worker's application and load its language data once."""
+    global _worker_app
+    _worker_app = MultilingualWordCounter(config)
+    _worker_app.analyzer.warm_up()
+
+
+def _process_in_worker(input_source: str) -> dict:
+    """Process one batch source in a worker process."""
+    return _worker_app.process_single(input_source)
+
+
 def create_argument_parser() -> argparse.ArgumentParser:
     """Create and configure the argument parser."""
     parser = argparse.ArgumentParser(
@@ -139,6 +201,7 @@ Examples:
     input_group.add_argument(
         'input',
         nargs='*',
+        default=[],
         help='Input text, file path(s), or URL(s)'
     )
     input_group.add_argument(
@@ -167,6 +230,13 @@ Examples:
         help='Process multiple files in batch mode'
     )
 
+    parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        default=1,
+        help='Worker processes for batch mode (default: 1, 0 uses every CPU)'
+    )
+
     # Language options
     parser.add_argument(
         '--language', '-l',
@@ -215,6 +285,8 @@ def main():
     # Validate arguments
     if not args.stdin and not args.input:
         parser.error("No input provided. Use INPUT argument or --stdin option.")
+    if args.workers < 0:
+        parser.error("--workers must not be negative.")
 
     # Create configuration
     config = ProcessingConfig(
@@ -237,7 +309,7 @@ def main():
             result_data = app.process_single(input_source)
         else:
             # Multiple inputs or batch mode
-            batch_result = app.process_batch(args.input)
+            batch_result = app.process_batch(args.input, args.workers or None)
 
             if not batch_result['success'] and not args.quiet:
                 for error in batch_result['errors']:
@@ -246,14 +318,14 @@ def main():
             if batch_result['results']:
                 # Format batch output
                 if args.format == 'json':
-                    output = app.formatter.to_json({
+                    output = json.dumps({
                         'batch_summary': {
                             'total_processed': batch_result['total_processed'],
                             'successful': batch_result['successful'],
                             'failed': batch_result['failed']
                         },
                         'results': [app.formatter._result_to_dict(r) for r in batch_result['results']]
-                    }, pretty=args.verbose)
+                    }, indent=2 if args.verbose else None, ensure_ascii=False)
                 else:
                     output = app.formatter.format_for_batch(
                         batch_result['results'],
@@ -14,7 +14,7 @@ from models import (
 )
 from language_detector import LanguageDetector
 from word_counter import WordCounter
-from text_analyzer import TextAnalyzer
+from text_analyzer import TextAnalyzer, split_at_boundary
 from input_handler import InputHandler
 from output_formatter import OutputFormatter
 from multilingual_word_counter import MultilingualWordCounter
@@ -208,6 +208,45 @@ class TestTextAnalyzer:
         count = self.analyzer._count_paragraphs(text)
         assert count == 3
 
+    def test_analyze_stream_matches_analyze(self):
+        """Test that streamed chunks give the same statistics as the whole text."""
+        text = ("The quick brown fox jumps over the lazy dog. Does it?\n\n"
+                "It does... and then it runs away!  \n \nThe end") * 50
+        expected = self.analyzer.analyze(text)
+
+        config = ProcessingConfig(max_text_length=100, chunk_size=64)
+        streaming = TextAnalyzer(config)
+        for size in (64, 100, 997):
+            chunks = [text[i:i + size] for i in range(0, len(text), size)]
+            result = streaming.analyze_stream(chunks)
+            assert result.metadata['streamed'] is True
+            assert result.word_count.total_words == expected.word_count.total_words
+            assert result.statistics == expected.statistics
+
+    def test_small_stream_analyzed_in_memory(self):
+        """Test that a stream within max_text_length is analyzed like analyze()."""
+        text = "Hello world. This is a test sentence. And another one!"
+        result = self.analyzer.analyze_stream([text[:10], text[10:]])
+        assert result.text == text
+        assert 'streamed' not in result.metadata
+        assert result.word_count.word_list == self.analyzer.analyze(text).word_count.word_list
+
+    def test_long_text_not_truncated(self):
+        """Test that text over max_text_length is analyzed in full."""
+        analyzer = TextAnalyzer(ProcessingConfig(max_text_length=1000, chunk_size=256))
+        text = "This sentence has six words. " * 200
+        result = analyzer.analyze(text)
+        assert result.statistics.character_count == len(text)
+        assert result.statistics.sentence_count == 200
+        assert result.word_count.total_words == 1000
+
+    def test_split_at_boundary(self):
+        """Test that chunks are cut before whitespace, never inside a word."""
+        assert split_at_boundary("one two thr", 100) == ("one two", " thr")
+        assert split_at_boundary("one two\n\n", 100) == ("one two", "\n\n")
+        # Without a usable boundary the whole text is taken
+        assert split_at_boundary("你好世界", 2) == ("你好世界", "")
+
 
 class TestInputHandler:
     """Test the input handling functionality."""
@@ -287,6 +326,23 @@ class TestInputHandler:
         assert text == "Hello world"
         assert metadata['input_type'] == 'text'
 
+    def test_read_file_chunks(self):
+        """Test chunked file reading with multi-byte characters split across reads."""
+        content = "Grüße aus Köln. " * 100
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt', encoding='utf-8') as f:
+            f.write(content)
+            temp_path = f.name
+
+        try:
+            chunks = list(self.handler.read_file_chunks(temp_path, chunk_size=7))
+            assert len(chunks) > 1
+            assert ''.join(chunks) == content
+        finally:
+            os.unlink(temp_path)
+
+        with pytest.raises(FileNotFoundError):
+            self.handler.read_file_chunks("nonexistent_file.txt")
+
     def test_get_file_metadata(self):
         """Test getting file metadata."""
         with tempfile.NamedTemporaryFile(mode='w', delete=False) as f:
@@ -402,6 +458,26 @@ class TestMultilingualWordCounter:
         assert result['successful'] == 3
         assert len(result['results']) == 3
 
+    def test_process_batch_parallel(self):
+        """Test that worker processes give the sequential results, in input order."""
+        inputs = ["Hello world", "Bonjour le monde entier", "", "Guten Morgen, wie geht es Ihnen?"]
+        sequential = self.app.process_batch(inputs)
+        parallel = self.app.process_batch(inputs, workers=2)
+        assert parallel['total_processed'] == 4
+        assert [r.word_count.total_words for r in parallel['results']] == \
+            [r.word_count.total_words for r in sequential['results']]
+        assert [[lang.language for lang in r.detected_languages] for r in parallel['results']] == \
+            [[lang.language for lang in r.detected_languages] for r in sequential['results']]
+
+    def test_iter_batch_order_and_errors(self):
+        """Test that iter_batch keeps input order and reports failures per source."""
+        inputs = ["one two three", "/nonexistent/missing.txt", "four five"]
+        items = list(self.app.iter_batch(inputs, workers=2))
+        assert [source for source, _ in items] == inputs
+        assert [result['success'] for _, result in items] == [True, False, True]
+        with pytest.raises(ValueError):
+            list(self.app.iter_batch(inputs, workers=0))
+
     def test_format_output_json(self):
         """Test JSON output formatting."""
         result = self.app.process_single("Hello world", "text")['result']
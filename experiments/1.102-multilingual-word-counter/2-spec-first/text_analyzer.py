@@ -3,15 +3,132 @@ Text analysis module for the Multilingual Word Counter.
 Generates comprehensive text statistics and analysis.
 """
 
+import itertools
 import re
 import time
-from typing import Dict, Any
+from collections import Counter
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
 
-from models import AnalysisResult, TextStatistics, ProcessingConfig
+from models import AnalysisResult, TextStatistics, ProcessingConfig, WordCountResult
 from language_detector import LanguageDetector
 from word_counter import WordCounter
 
 
+SENTENCE_END = re.compile(r'[.!?]+')
+PARAGRAPH_BREAK = re.compile(r'\n\s*\n')
+_ASCII_WHITESPACE = ' \n\t\r\f\v'
+
+
+def split_at_boundary(text: str, max_carry: int) -> Tuple[str, str]:
+    """
+    Split text into a part that is safe to analyze now and a part to carry.
+
+    The cut is made at the start of the last whitespace run, so words and
+    paragraph breaks are never split. If that would carry more than
+    max_carry characters (text without spaces, such as Chinese), the cut is
+    made at the end of the text instead.
+
+    Args:
+        text: Buffered text
+        max_carry: Largest carry-over to accept
+
+    Returns:
+        Tuple of (text to analyze, text to prepend to the next chunk)
+    """
+    cut = max(text.rfind(char) for char in _ASCII_WHITESPACE)
+    if cut < 0 or len(text) - cut > max_carry:
+        cut = len(text)
+    while cut > 0 and text[cut - 1].isspace():
+        cut -= 1
+    return text[:cut], text[cut:]
+
+
+class TextAccumulator:
+    """
+    Single-pass text statistics over a sequence of text pieces.
+
+    Each piece is tokenized once; counts, word frequencies, sentences and
+    paragraphs are carried across pieces, so feeding a text in pieces cut by
+    split_at_boundary gives the same results as feeding it whole. Memory use
+    is bounded by the vocabulary, not by the length of the text.
+    """
+
+    def __init__(self, word_counter: WordCounter, language: str = None, keep_words: bool = False):
+        """
+        Initialize the accumulator.
+
+        Args:
+            word_counter: Word counter used for tokenization
+            language: Language code used for tokenization
+            keep_words: Whether to keep the full word list
+        """
+        self.word_counter = word_counter
+        self.language = language
+        self.keep_words = keep_words
+
+        self.total_words = 0
+        self.word_list: List[str] = []
+        self.frequencies: Counter = Counter()
+        self.character_count = 0
+        self.character_count_no_spaces = 0
+        self.sentence_count = 0
+        self.paragraph_count = 0
+        self._in_sentence = False
+        self._in_paragraph = False
+
+    def feed(self, text: str) -> None:
+        """Add the next piece of text; pieces must not split words or whitespace runs."""
+        if not text:
+            return
+
+        self.character_count += len(text)
+        self.character_count_no_spaces += len(text) - text.count(' ') - text.count('\t') - text.count('\n')
+
+        count, words = self.word_counter.count_and_list_words(text, self.language)
+        self.total_words += count
+        if self.keep_words:
+            self.word_list.extend(words)
+        self.frequencies.update(word.lower() for word in words if len(word) > 2 and word.isalpha())
+
+        # A sentence (paragraph) ends at a terminator (blank line) if it has content
+        for i, part in enumerate(SENTENCE_END.split(text)):
+            if i and self._in_sentence:
+                self.sentence_count += 1
+                self._in_sentence = False
+            if part.strip():
+                self._in_sentence = True
+        for i, part in enumerate(PARAGRAPH_BREAK.split(text)):
+            if i and self._in_paragraph:
+                self.paragraph_count += 1
+                self._in_paragraph = False
+            if part.strip():
+                self._in_paragraph = True
+
+    def finish(self) -> None:
+        """Count the final sentence and paragraph; call once after the last piece."""
+        if self._in_sentence:
+            self.sentence_count += 1
+            self._in_sentence = False
+        if self._in_paragraph:
+            self.paragraph_count += 1
+            self._in_paragraph = False
+
+    def statistics(self, top_n: int = 10) -> TextStatistics:
+        """Build TextStatistics from the accumulated counts."""
+        average_words_per_sentence = (
+            self.total_words / self.sentence_count
+            if self.sentence_count > 0 else 0.0
+        )
+        return TextStatistics(
+            character_count=self.character_count,
+            character_count_no_spaces=self.character_count_no_spaces,
+            sentence_count=self.sentence_count,
+            paragraph_count=self.paragraph_count,
+            average_words_per_sentence=round(average_words_per_sentence, 2),
+            most_frequent_words=self.frequencies.most_common(top_n)
+        )
+
+
 class TextAnalyzer:
     """Generates comprehensive text statistics and analysis."""
 
@@ -21,10 +138,18 @@ class TextAnalyzer:
         self.language_detector = LanguageDetector(self.config)
         self.word_counter = WordCounter(self.config)
 
+    def warm_up(self):
+        """Load language profiles and dictionaries up front, e.g. in a worker process."""
+        self.language_detector.warm_up()
+        self.word_counter.warm_up()
+
     def analyze(self, text: str, metadata: Dict[str, Any] = None) -> AnalysisResult:
         """
         Perform comprehensive analysis of input text.
 
+        Texts longer than config.max_text_length are analyzed in chunks, as
+        by analyze_stream, rather than truncated.
+
         Args:
             text: Input text to analyze
             metadata: Optional metadata dictionary
@@ -37,18 +162,27 @@ class TextAnalyzer:
         if not text or not text.strip():
             return self._create_empty_result(text, time.time() - start_time, metadata)
 
-        # Check text length limit
         if len(text) > self.config.max_text_length:
-            text = text[:self.config.max_text_length]
+            chunk_size = self.config.chunk_size
+            chunks = (text[i:i + chunk_size] for i in range(0, len(text), chunk_size))
+            result = self._analyze_chunks(chunks, text[:self.config.language_sample_size], metadata, start_time)
+            result.text = text
+            return result
 
         # Detect languages
         detected_languages = self._detect_languages(text)
 
-        # Analyze word counts
-        word_count_result = self._analyze_word_counts(text, detected_languages)
-
-        # Generate statistics
-        statistics = self._generate_statistics(text, word_count_result)
+        if self._is_mixed_language(text, detected_languages):
+            # Segmentation needs the text per language, so mixed texts take several passes
+            word_count_result = self._analyze_mixed_language_text(text, detected_languages)
+            statistics = self._generate_statistics(text, word_count_result)
+        else:
+            language = detected_languages[0].language if detected_languages else None
+            accumulator = TextAccumulator(self.word_counter, language, keep_words=True)
+            accumulator.feed(text)
+            accumulator.finish()
+            word_count_result = self._single_language_result(accumulator, language or 'unknown')
+            statistics = accumulator.statistics()
 
         processing_time = time.time() - start_time
 
@@ -61,6 +195,91 @@ class TextAnalyzer:
             metadata=metadata or {}
         )
 
+    def analyze_stream(self, chunks: Iterable[str], metadata: Dict[str, Any] = None) -> AnalysisResult:
+        """
+        Analyze text arriving in chunks, such as a file read piece by piece.
+
+        Input up to config.max_text_length characters is analyzed in memory
+        exactly as by analyze(). Longer input is never held in memory as a
+        whole: each chunk is tokenized once, partial words and sentences are
+        carried into the next chunk, and languages are detected from the
+        first config.language_sample_size characters. For streamed input
+        the result's text and word_list are empty.
+
+        Args:
+            chunks: Iterable of text chunks, split anywhere
+            metadata: Optional metadata dictionary
+
+        Returns:
+            AnalysisResult with complete analysis
+        """
+        start_time = time.time()
+        chunks = iter(chunks)
+
+        # Buffer up to the in-memory limit to decide how to analyze
+        buffered = []
+        buffered_length = 0
+        for chunk in chunks:
+            buffered.append(chunk)
+            buffered_length += len(chunk)
+            if buffered_length > self.config.max_text_length:
+                break
+        else:
+            return self.analyze(''.join(buffered), metadata)
+
+        head = ''.join(buffered)
+        result = self._analyze_chunks(
+            itertools.chain([head], chunks), head[:self.config.language_sample_size], metadata, start_time
+        )
+        result.text = ''
+        return result
+
+    def _analyze_chunks(self, chunks: Iterator[str], sample: str, metadata: Optional[Dict[str, Any]],
+                        start_time: float) -> AnalysisResult:
+        """Analyze chunked text in a single tokenization pass with bounded memory."""
+        detected_languages = self._detect_languages(sample)
+        language = detected_languages[0].language if detected_languages else None
+        shares = None
+        if self._is_mixed_language(sample, detected_languages):
+            segments = self.language_detector.detect_language_segments(sample)
+            sample_counts = self.word_counter.count_by_language(sample, segments)
+            sample_total = sum(sample_counts.values())
+            if sample_total:
+                shares = {lang: count / sample_total for lang, count in sample_counts.items()}
+                language = max(sample_counts, key=sample_counts.get)
+
+        accumulator = TextAccumulator(self.word_counter, language)
+        carry = ''
+        for chunk in chunks:
+            piece, carry = split_at_boundary(carry + chunk, self.config.chunk_size)
+            accumulator.feed(piece)
+        accumulator.feed(carry)
+        accumulator.finish()
+
+        if shares:
+            # Per-sentence detection is too slow for whole streams, so the
+            # sample's language mix is applied to the total
+            word_count_result = WordCountResult(
+                total_words=accumulator.total_words,
+                words_by_language={lang: round(accumulator.total_words * share) for lang, share in shares.items()},
+                word_list=[],
+                language_distribution=shares
+            )
+        else:
+            word_count_result = self._single_language_result(accumulator, language or 'unknown')
+
+        stream_metadata = dict(metadata or {})
+        stream_metadata.update({'streamed': True, 'language_sample_chars': len(sample)})
+
+        return AnalysisResult(
+            text='',
+            detected_languages=detected_languages,
+            word_count=word_count_result,
+            statistics=accumulator.statistics(),
+            processing_time=time.time() - start_time,
+            metadata=stream_metadata
+        )
+
     def _detect_languages(self, text: str):
         """Detect languages in the text."""
         if self.config.enable_mixed_language:
@@ -73,47 +292,21 @@ class TextAnalyzer:
         primary_language = self.language_detector.detect_language(text)
         return [primary_language] if primary_language.language != 'unknown' else []
 
-    def _analyze_word_counts(self, text: str, detected_languages):
-        """Analyze word counts for detected languages."""
-        from models import WordCountResult
-
-        if not detected_languages:
-            # No language detected, use default counting
-            total_words = self.word_counter.count_words(text)
-            word_list = self.word_counter.get_word_list(text)
-            return WordCountResult(
-                total_words=total_words,
-                words_by_language={'unknown': total_words},
-                word_list=word_list,
-                language_distribution={'unknown': 1.0}
-            )
-
-        primary_language = detected_languages[0]
-
-        # Check if this is a mixed language text
-        if len(detected_languages) > 1 and self.language_detector.is_mixed_language(text):
-            return self._analyze_mixed_language_text(text, detected_languages)
-        else:
-            return self._analyze_single_language_text(text, primary_language.language)
-
-    def _analyze_single_language_text(self, text: str, language: str):
-        """Analyze text in a single language."""
-        from models import WordCountResult
-
-        total_words = self.word_counter.count_words(text, language)
-        word_list = self.word_counter.get_word_list(text, language)
+    def _is_mixed_language(self, text: str, detected_languages) -> bool:
+        """Check whether text should be segmented by language."""
+        return len(detected_languages) > 1 and self.language_detector.is_mixed_language(text)
 
+    def _single_language_result(self, accumulator: TextAccumulator, language: str) -> WordCountResult:
+        """Build the word count result for text in a single language."""
         return WordCountResult(
-            total_words=total_words,
-            words_by_language={language: total_words},
-            word_list=word_list,
+            total_words=accumulator.total_words,
+            words_by_language={language: accumulator.total_words},
+            word_list=accumulator.word_list,
             language_distribution={language: 1.0}
         )
 
     def _analyze_mixed_language_text(self, text: str, detected_languages):
         """Analyze text containing multiple languages."""
-        from models import WordCountResult
-
         # Segment text by language
         language_segments = self.language_detector.detect_language_segments(text)
 
@@ -179,7 +372,7 @@ class TextAnalyzer:
     def _count_sentences(self, text: str) -> int:
         """Count sentences in text."""
         # Use regex to find sentence endings
-        sentences = re.split(r'[.!?]+', text)
+        sentences = SENTENCE_END.split(text)
         # Filter out empty sentences
         sentences = [s.strip() for s in sentences if s.strip()]
         return len(sentences)
@@ -187,7 +380,7 @@ class TextAnalyzer:
     def _count_paragraphs(self, text: str) -> int:
         """Count paragraphs in text."""
         # Split by double newlines or more
-        paragraphs = re.split(r'\n\s*\n', text)
+        paragraphs = PARAGRAPH_BREAK.split(text)
         # Filter out empty paragraphs
         paragraphs = [p.strip() for p in paragraphs if p.strip()]
         return len(paragraphs)
@@ -205,8 +398,6 @@ class TextAnalyzer:
 
     def _create_empty_result(self, text: str, processing_time: float, metadata: Dict[str, Any]) -> AnalysisResult:
         """Create an empty analysis result for empty or invalid text."""
-        from models import WordCountResult, TextStatistics
-
         return AnalysisResult(
             text=text or "",
             detected_languages=[],
@@ -252,7 +443,7 @@ class TextAnalyzer:
         avg_words_per_sentence = word_count / sentence_count
 
         # Calculate average sentence length in characters
-        sentences = re.split(r'[.!?]+', text)
+        sentences = SENTENCE_END.split(text)
         sentence_lengths = [len(s.strip()) for s in sentences if s.strip()]
         avg_sentence_length = (
             sum(sentence_lengths) / len(sentence_lengths)
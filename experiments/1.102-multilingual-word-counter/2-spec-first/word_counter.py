@@ -4,7 +4,7 @@ Implements language-specific word counting algorithms.
 """
 
 import re
-from typing import Dict, List
+from typing import Dict, List, Tuple
 from collections import Counter
 
 try:
@@ -22,6 +22,9 @@ except ImportError:
 
 from models import WordCountResult, ProcessingConfig
 
+# Set once NLTK data has been looked up, so each process checks only once
+_nltk_data_checked = False
+
 
 class WordCounter:
     """Counts words using language-specific algorithms."""
@@ -33,7 +36,9 @@ class WordCounter:
 
     def _setup_dependencies(self):
         """Setup required language processing dependencies."""
-        if NLTK_AVAILABLE:
+        global _nltk_data_checked
+        if NLTK_AVAILABLE and not _nltk_data_checked:
+            _nltk_data_checked = True
             try:
                 # Download required NLTK data if not present
                 nltk.data.find('tokenizers/punkt')
@@ -43,6 +48,11 @@ class WordCounter:
                 except:
                     pass  # Continue without NLTK if download fails
 
+    def warm_up(self):
+        """Load the jieba dictionary now rather than on the first Chinese text."""
+        if JIEBA_AVAILABLE:
+            jieba.initialize()
+
     def count_words(self, text: str, language: str = None) -> int:
         """
         Count words in text using appropriate algorithm for language.
@@ -107,6 +117,24 @@ class WordCounter:
         else:
             return self._get_words_latin(cleaned_text)
 
+    def count_and_list_words(self, text: str, language: str = None) -> Tuple[int, List[str]]:
+        """
+        Count and tokenize text with a single tokenization pass.
+
+        Args:
+            text: Input text
+            language: Language code (if known)
+
+        Returns:
+            Tuple of (word count, list of words), equal to count_words()
+            and get_word_list()
+        """
+        words = self.get_word_list(text, language)
+        if language == 'ja':
+            # Japanese counts are estimated from characters, not from the word list
+            return self.count_words(text, language), words
+        return len(words), words
+
     def count_by_language(self, text: str, language_segments: Dict[str, List[str]]) -> Dict[str, int]:
         """
         Count words by language for mixed-language texts.
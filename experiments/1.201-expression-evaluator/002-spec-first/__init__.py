@@ -10,13 +10,22 @@ __author__ = "Expression Evaluator Team"
 __description__ = "Mathematical expression parser and evaluator"
 
 from .expression_manager import ExpressionManager
-from .models import EvaluationResult, ValidationResult
+from .compiler import CompiledExpression
+from .workbook import Workbook
+from .models import (
+    EvaluationResult, ValidationResult, VectorizedResult, RecalculationResult, OptimizationResult
+)
 from .exceptions import ExpressionError, SyntaxError, EvaluationError
 
 __all__ = [
     'ExpressionManager',
+    'CompiledExpression',
+    'Workbook',
     'EvaluationResult',
     'ValidationResult',
+    'VectorizedResult',
+    'RecalculationResult',
+    'OptimizationResult',
     'ExpressionError',
     'SyntaxError',
     'EvaluationError'
@@ -0,0 +1,188 @@
+"""
+Caching support for the Expression Evaluator system.
+
+This module provides the bounded LRU cache used by ExpressionManager for
+parsed expressions and evaluated values, and a JSON store that lets a
+restarted process reload its parsed expressions without re-parsing them.
+"""
+
+import json
+import os
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Tuple
+try:
+    from .models import ExpressionNode, NodeType, OptimizationResult
+    from .compiler import CompiledExpression
+except ImportError:
+    from models import ExpressionNode, NodeType, OptimizationResult
+    from compiler import CompiledExpression
+
+
+# Format tag written to, and required from, cache files
+CACHE_FILE_VERSION = 1
+
+
+class LRUCache:
+    """
+    Dictionary-like cache that evicts the least recently used entry.
+
+    Lookups through get() count as hits or misses; a cache with max_size 0
+    stores nothing, which is how optional caches are switched off.
+    """
+
+    def __init__(self, max_size: int):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of entries (0 disables the cache)
+
+        Raises:
+            ValueError: If max_size is negative
+        """
+        if max_size < 0:
+            raise ValueError("Cache size must be non-negative")
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the value for key and mark it most recently used."""
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        if self.max_size == 0:
+            return
+        if key in self._entries:
+            self._entries.move_to_end(key)
+        elif len(self._entries) >= self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        self._entries[key] = value
+
+    def clear(self) -> None:
+        """Remove every entry; counters are kept."""
+        self._entries.clear()
+
+    def reset_statistics(self) -> None:
+        """Zero the hit, miss and eviction counters."""
+        self.hits = self.misses = self.evictions = 0
+
+    def items(self) -> Iterator[Tuple[Hashable, Any]]:
+        """Iterate entries from least to most recently used."""
+        return iter(self._entries.items())
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups that hit."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __str__(self) -> str:
+        return f"LRUCache(size={len(self)}/{self.max_size}, hits={self.hits}, misses={self.misses})"
+
+
+@dataclass
+class CachedExpression:
+    """A parsed and validated expression, plus its optimized and compiled forms once built."""
+    ast: ExpressionNode
+    compiled: Optional[CompiledExpression] = None
+    optimization: Optional[OptimizationResult] = None
+
+
+def _node_to_data(node: ExpressionNode) -> Dict[str, Any]:
+    """Convert an AST to plain JSON-compatible data."""
+    data: Dict[str, Any] = {'type': node.node_type.value}
+    if node.value is not None:
+        data['value'] = node.value
+    if node.operator:
+        data['operator'] = node.operator
+    if node.left:
+        data['left'] = _node_to_data(node.left)
+    if node.right:
+        data['right'] = _node_to_data(node.right)
+    if node.children:
+        data['children'] = [_node_to_data(child) for child in node.children]
+    return data
+
+
+def _node_from_data(data: Dict[str, Any]) -> ExpressionNode:
+    """Rebuild an AST from the data written by _node_to_data."""
+    return ExpressionNode(
+        node_type=NodeType(data['type']),
+        value=data.get('value'),
+        left=_node_from_data(data['left']) if 'left' in data else None,
+        right=_node_from_data(data['right']) if 'right' in data else None,
+        children=[_node_from_data(child) for child in data.get('children', ())],
+        operator=data.get('operator')
+    )
+
+
+def save_expressions(filepath: str, entries: List[Tuple[str, ExpressionNode]]) -> int:
+    """
+    Write parsed expressions to a JSON cache file.
+
+    The file is written to a temporary path and atomically renamed, so a
+    crash mid-write never leaves a truncated cache behind.
+
+    Args:
+        filepath: Destination path
+        entries: (expression, AST) pairs, least recently used first
+
+    Returns:
+        The number of expressions written
+    """
+    payload = {
+        'version': CACHE_FILE_VERSION,
+        'expressions': [[expression, _node_to_data(ast)] for expression, ast in entries],
+    }
+    tmp_path = f"{filepath}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, separators=(',', ':'))
+    os.replace(tmp_path, filepath)
+    return len(payload['expressions'])
+
+
+def load_expressions(filepath: str) -> List[Tuple[str, ExpressionNode]]:
+    """
+    Read parsed expressions from a JSON cache file.
+
+    Args:
+        filepath: Path written by save_expressions
+
+    Returns:
+        (expression, AST) pairs, least recently used first
+
+    Raises:
+        ValueError: If the file is not a cache file of a supported version
+    """
+    with open(filepath, 'r', encoding='utf-8') as f:
+        try:
+            payload = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Corrupt expression cache file: {filepath}") from e
+
+    if not isinstance(payload, dict) or payload.get('version') != CACHE_FILE_VERSION:
+        raise ValueError(f"Unsupported expression cache file: {filepath}")
+
+    try:
+        return [(expression, _node_from_data(data)) for expression, data in payload['expressions']]
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"Corrupt expression cache file: {filepath}") from e
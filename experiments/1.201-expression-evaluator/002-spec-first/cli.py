@@ -253,7 +253,10 @@ Examples:
             print(f"  Total evaluations: {stats['total_evaluations']}")
             print(f"  Total time: {stats['total_evaluation_time']:.3f}s")
             print(f"  Average time: {stats['average_evaluation_time']:.3f}s")
-            print(f"  Cache size: {stats['cache_size']}")
+            print(f"  Cache size: {stats['cache_size']} "
+                  f"({stats['value_cache_hits']} hits, {stats['value_cache_misses']} misses)")
+            print(f"  Parse cache size: {stats['parse_cache_size']} "
+                  f"({stats['parse_cache_hits']} hits, {stats['parse_cache_misses']} misses)")
             print(f"  Variables: {stats['variable_count']}")
             print(f"  Functions: {stats['function_count']}")
 
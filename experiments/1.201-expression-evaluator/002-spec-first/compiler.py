@@ -0,0 +1,407 @@
+"""
+Compiler service for the Expression Evaluator system.
+
+This module lowers a validated AST into a tree of Python closures, once.
+Evaluating the compiled form skips tokenizing, parsing and the per-node
+type dispatch of the Evaluator, which makes it the right tool for running
+one formula against many variable bindings.
+"""
+
+import operator
+import time
+from typing import Callable, Dict, Optional
+try:
+    from .models import ExpressionNode, NodeType, VariableContext, EvaluationResult
+    from .evaluator import Evaluator
+    from .exceptions import EvaluationError, VariableError, FunctionError
+except ImportError:
+    from models import ExpressionNode, NodeType, VariableContext, EvaluationResult
+    from evaluator import Evaluator
+    from exceptions import EvaluationError, VariableError, FunctionError
+
+
+# A compiled node: takes the call's variable bindings, returns the node's value
+NodeFunction = Callable[[Dict[str, float]], float]
+
+
+class CompiledExpression:
+    """
+    An expression compiled to Python closures, callable as f(**variables).
+
+    Variables are looked up in the call's keyword arguments first and then
+    in the variable context the expression was compiled with, so persistent
+    variables set on an ExpressionManager keep working. Functions are
+    resolved when the expression is compiled.
+
+    Errors carry the same messages as ExpressionManager.evaluate_expression
+    reports, and the Evaluator's recursion and time limits still apply: the
+    depth limit is enforced when compiling, the time limit on every call.
+    """
+
+    __slots__ = ('expression', 'variables', '_root', '_has_calls')
+
+    def __init__(self, expression: str, root: NodeFunction, variables: frozenset, has_calls: bool):
+        self.expression = expression
+        self.variables = variables
+        self._root = root
+        self._has_calls = has_calls
+
+    def __call__(self, **variables: float) -> float:
+        """
+        Evaluate the expression with the given variable values.
+
+        Returns:
+            Numerical result
+
+        Raises:
+            EvaluationError: If evaluation fails
+        """
+        if not self._has_calls:
+            # Pure arithmetic on a depth-limited tree cannot hit the time limit
+            try:
+                return self._root(variables)
+            except EvaluationError as e:
+                raise EvaluationError(Evaluator.friendly_error_message(str(e))) from e
+            except RecursionError as e:
+                raise EvaluationError("Maximum recursion depth exceeded") from e
+
+        start_time = time.time()
+        try:
+            result = self._root(variables)
+        except EvaluationError as e:
+            raise EvaluationError(Evaluator.friendly_error_message(str(e))) from e
+        except RecursionError as e:
+            raise EvaluationError("Maximum recursion depth exceeded") from e
+
+        if time.time() - start_time > Evaluator.MAX_EXECUTION_TIME:
+            raise EvaluationError("Execution time limit exceeded")
+        return result
+
+    def evaluate(self, variables: Optional[Dict[str, float]] = None) -> EvaluationResult:
+        """
+        Evaluate the expression and wrap the outcome like Evaluator.evaluate.
+
+        Args:
+            variables: Optional variable values for this evaluation
+
+        Returns:
+            EvaluationResult containing the computed value or error information
+        """
+        start_time = time.time()
+        try:
+            value = self(**variables) if variables else self()
+        except Exception as e:
+            return EvaluationResult.error_result(
+                Evaluator.friendly_error_message(str(e)),
+                execution_time=time.time() - start_time
+            )
+        return EvaluationResult.success_result(value, time.time() - start_time)
+
+    def __str__(self) -> str:
+        """String representation of the compiled expression."""
+        return f"CompiledExpression({self.expression!r})"
+
+    __repr__ = __str__
+
+
+class Compiler:
+    """
+    Lowers validated ASTs into CompiledExpression closure trees.
+
+    Every node becomes one closure; number literals are converted once and
+    operations with a literal right operand get a specialised closure, so a
+    call does no more work than the arithmetic itself plus the Evaluator's
+    zero and domain checks. An operation node reached through several
+    parents, as in an optimized AST with shared subexpressions, is computed
+    once per call and its value reused.
+    """
+
+    def __init__(self, context: Optional[VariableContext] = None):
+        """
+        Initialize the compiler.
+
+        Args:
+            context: Variable context for lookups (creates default if not provided)
+        """
+        self.context = context or VariableContext()
+
+    def compile(self, node: ExpressionNode, expression: str = "") -> CompiledExpression:
+        """
+        Compile an AST into a callable.
+
+        Args:
+            node: Root node of a validated AST
+            expression: Source text, kept for display
+
+        Returns:
+            CompiledExpression for the AST
+
+        Raises:
+            EvaluationError: If the AST is too deep, calls an unknown function
+                or passes the wrong number of arguments to a built-in
+        """
+        self._variables = set()
+        self._has_calls = False
+        self._shared = self._find_shared_nodes(node)
+        self._memo: Dict[int, NodeFunction] = {}
+        try:
+            root = self._compile_node(node, 1)
+        except RecursionError as e:
+            # Python's own stack limit can be lower than MAX_RECURSION_DEPTH
+            raise EvaluationError("Maximum recursion depth exceeded") from e
+        return CompiledExpression(expression, root, frozenset(self._variables), self._has_calls)
+
+    @staticmethod
+    def _find_shared_nodes(root: ExpressionNode) -> set:
+        """Ids of operation nodes that have more than one parent."""
+        seen, shared = set(), set()
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            for child in (node.left, node.right, *(node.children or ())):
+                if child is None or child.node_type in (NodeType.NUMBER, NodeType.VARIABLE,
+                                                        NodeType.CONSTANT):
+                    continue
+                if id(child) in seen:
+                    shared.add(id(child))
+                else:
+                    seen.add(id(child))
+                    stack.append(child)
+        return shared
+
+    def _compile_node(self, node: ExpressionNode, depth: int) -> NodeFunction:
+        """Compile a single AST node and, recursively, its operands."""
+        if depth > Evaluator.MAX_RECURSION_DEPTH:
+            raise EvaluationError("Maximum recursion depth exceeded")
+
+        if id(node) in self._shared:
+            return self._compile_shared(node, depth)
+        return self._compile_unshared(node, depth)
+
+    def _compile_shared(self, node: ExpressionNode, depth: int) -> NodeFunction:
+        """Compile a node with several parents so it runs once per call."""
+        key = id(node)
+        if key in self._memo:
+            return self._memo[key]
+
+        compute = self._compile_unshared(node, depth)
+
+        # The bindings dict is private to each call, and an int key can never
+        # clash with a variable name, so it doubles as the per-call memo
+        def shared(env):
+            try:
+                return env[key]
+            except KeyError:
+                value = env[key] = compute(env)
+                return value
+        self._memo[key] = shared
+        return shared
+
+    def _compile_unshared(self, node: ExpressionNode, depth: int) -> NodeFunction:
+        """Dispatch on the node type."""
+        if node.node_type == NodeType.NUMBER:
+            return self._compile_number(node)
+        elif node.node_type in (NodeType.VARIABLE, NodeType.CONSTANT):
+            return self._compile_name(node)
+        elif node.node_type == NodeType.BINARY_OP:
+            return self._compile_binary_operation(node, depth)
+        elif node.node_type == NodeType.UNARY_OP:
+            return self._compile_unary_operation(node, depth)
+        elif node.node_type == NodeType.FUNCTION_CALL:
+            return self._compile_function_call(node, depth)
+        else:
+            raise EvaluationError(f"Unknown node type: {node.node_type}")
+
+    def _compile_number(self, node: ExpressionNode) -> NodeFunction:
+        """Compile a number node to a closure returning the literal."""
+        if node.value is None:
+            raise EvaluationError("Number node has no value")
+
+        try:
+            value = float(node.value)
+        except (ValueError, TypeError) as e:
+            raise EvaluationError(f"Invalid number: {node.value}") from e
+
+        def number(env):
+            return value
+        number.literal = value
+        return number
+
+    def _compile_name(self, node: ExpressionNode) -> NodeFunction:
+        """Compile a variable or constant node to a binding-then-context lookup."""
+        if node.value is None:
+            raise EvaluationError(f"{node.node_type.value.capitalize()} node has no name")
+
+        name = str(node.value)
+        if node.node_type == NodeType.VARIABLE:
+            self._variables.add(name)
+        get_variable = self.context.get_variable
+
+        def lookup(env):
+            try:
+                return env[name]
+            except KeyError:
+                pass
+            try:
+                return get_variable(name)
+            except VariableError as e:
+                raise EvaluationError(str(e)) from e
+        return lookup
+
+    def _compile_binary_operation(self, node: ExpressionNode, depth: int) -> NodeFunction:
+        """Compile a binary operation node."""
+        if not node.left or not node.right:
+            raise EvaluationError("Binary operation missing operand(s)")
+
+        if not node.operator:
+            raise EvaluationError("Binary operation missing operator")
+
+        left = self._compile_node(node.left, depth + 1)
+        right = self._compile_node(node.right, depth + 1)
+        op = node.operator
+        literal = getattr(right, 'literal', None)
+        error = f"Mathematical error in {op} operation: "
+
+        if op == '+':
+            if literal is not None:
+                def add(env):
+                    try:
+                        return left(env) + literal
+                    except (OverflowError, ValueError) as e:
+                        raise EvaluationError(error + str(e)) from e
+            else:
+                def add(env):
+                    try:
+                        return left(env) + right(env)
+                    except (OverflowError, ValueError) as e:
+                        raise EvaluationError(error + str(e)) from e
+            return add
+
+        elif op == '-':
+            if literal is not None:
+                def subtract(env):
+                    try:
+                        return left(env) - literal
+                    except (OverflowError, ValueError) as e:
+                        raise EvaluationError(error + str(e)) from e
+            else:
+                def subtract(env):
+                    try:
+                        return left(env) - right(env)
+                    except (OverflowError, ValueError) as e:
+                        raise EvaluationError(error + str(e)) from e
+            return subtract
+
+        elif op == '*':
+            if literal is not None:
+                def multiply(env):
+                    try:
+                        return left(env) * literal
+                    except (OverflowError, ValueError) as e:
+                        raise EvaluationError(error + str(e)) from e
+            else:
+                def multiply(env):
+                    try:
+                        return left(env) * right(env)
+                    except (OverflowError, ValueError) as e:
+                        raise EvaluationError(error + str(e)) from e
+            return multiply
+
+        elif op == '/' and literal is not None and literal != 0:
+            def divide_by_literal(env):
+                try:
+                    return left(env) / literal
+                except (OverflowError, ValueError) as e:
+                    raise EvaluationError(error + str(e)) from e
+            return divide_by_literal
+
+        elif op in ('/', '//', '%'):
+            message = "Modulo by zero" if op == '%' else "Division by zero"
+            operation = {'/': operator.truediv, '//': operator.floordiv, '%': operator.mod}[op]
+
+            def divide(env):
+                a = left(env)
+                b = right(env)
+                if b == 0:
+                    raise EvaluationError(message)
+                try:
+                    return operation(a, b)
+                except (OverflowError, ValueError) as e:
+                    raise EvaluationError(error + str(e)) from e
+            return divide
+
+        elif op in ('**', '^'):
+            def power(env):
+                a = left(env)
+                b = right(env)
+                if a == 0 and b < 0:
+                    raise EvaluationError("Zero to negative power is undefined")
+                if a < 0 and not float(b).is_integer():
+                    raise EvaluationError("Negative base with non-integer exponent")
+                try:
+                    return a ** b
+                except (OverflowError, ValueError) as e:
+                    raise EvaluationError(error + str(e)) from e
+            return power
+
+        raise EvaluationError(f"Unknown binary operator: {op}")
+
+    def _compile_unary_operation(self, node: ExpressionNode, depth: int) -> NodeFunction:
+        """Compile a unary operation node."""
+        if not node.right:
+            raise EvaluationError("Unary operation missing operand")
+
+        if not node.operator:
+            raise EvaluationError("Unary operation missing operator")
+
+        operand = self._compile_node(node.right, depth + 1)
+
+        if node.operator == '+':
+            def positive(env):
+                return +operand(env)
+            return positive
+        elif node.operator == '-':
+            def negative(env):
+                return -operand(env)
+            return negative
+        else:
+            raise EvaluationError(f"Unknown unary operator: {node.operator}")
+
+    def _compile_function_call(self, node: ExpressionNode, depth: int) -> NodeFunction:
+        """Compile a function call node, resolving the function now."""
+        if not node.value:
+            raise EvaluationError("Function call missing function name")
+
+        function_name = str(node.value)
+
+        try:
+            function = self.context.get_function(function_name)
+        except FunctionError as e:
+            raise EvaluationError(str(e)) from e
+
+        arguments = [self._compile_node(child, depth + 1) for child in node.children or []]
+
+        expected_args = Evaluator.FUNCTION_ARG_COUNTS.get(function_name)
+        if expected_args is not None and expected_args != -1 and len(arguments) != expected_args:
+            raise EvaluationError(
+                f"Error calling function {function_name}: "
+                f"Function {function_name} expects {expected_args} argument(s), got {len(arguments)}"
+            )
+
+        check_domain = (Evaluator.check_function_domain
+                        if function_name in Evaluator.DOMAIN_CHECKED_FUNCTIONS else None)
+        self._has_calls = True
+
+        def call(env):
+            args = [argument(env) for argument in arguments]
+            try:
+                if check_domain is not None:
+                    check_domain(function_name, args)
+                try:
+                    result = function(*args)
+                except (ValueError, ArithmeticError) as e:
+                    raise EvaluationError(f"Mathematical error in {function_name}: {str(e)}") from e
+                return float(result)
+            except Exception as e:
+                raise EvaluationError(f"Error calling function {function_name}: {str(e)}") from e
+        return call
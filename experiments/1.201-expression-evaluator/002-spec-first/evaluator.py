@@ -30,6 +30,33 @@ class Evaluator:
     # Maximum execution time in seconds
     MAX_EXECUTION_TIME = 10.0
 
+    # Expected argument counts of the built-in functions (-1 means variable)
+    FUNCTION_ARG_COUNTS = {
+        # 0 arguments
+        # (none currently)
+
+        # 1 argument
+        'abs': 1, 'round': 1, 'int': 1, 'float': 1,
+        'sin': 1, 'cos': 1, 'tan': 1,
+        'asin': 1, 'acos': 1, 'atan': 1,
+        'sinh': 1, 'cosh': 1, 'tanh': 1,
+        'log': 1, 'log10': 1, 'log2': 1, 'ln': 1,
+        'exp': 1, 'sqrt': 1,
+        'ceil': 1, 'floor': 1, 'factorial': 1,
+        'degrees': 1, 'radians': 1,
+
+        # 2 arguments
+        'atan2': 2, 'pow': 2,
+
+        # Variable arguments
+        'min': -1, 'max': -1, 'sum': -1,
+    }
+
+    # Functions whose arguments check_function_domain validates
+    DOMAIN_CHECKED_FUNCTIONS = frozenset(
+        ('sqrt', 'log', 'log10', 'log2', 'ln', 'asin', 'acos', 'factorial')
+    )
+
     def __init__(self, context: Optional[VariableContext] = None):
         """
         Initialize the evaluator.
@@ -70,18 +97,30 @@ class Evaluator:
 
         except Exception as e:
             execution_time = time.time() - start_time
-            error_message = str(e)
-
-            # Add specific error handling for common math errors
-            if "division by zero" in error_message.lower():
-                error_message = "Division by zero is not allowed"
-            elif "domain error" in error_message.lower():
-                error_message = "Mathematical domain error (e.g., sqrt of negative number)"
-            elif "overflow" in error_message.lower():
-                error_message = "Numerical overflow - result too large"
+            error_message = self.friendly_error_message(str(e))
 
             return EvaluationResult.error_result(error_message, execution_time=execution_time)
 
+    @staticmethod
+    def friendly_error_message(error_message: str) -> str:
+        """
+        Replace common low-level math error messages with user-facing ones.
+
+        Args:
+            error_message: Message of the exception raised during evaluation
+
+        Returns:
+            The message to report in an EvaluationResult
+        """
+        # Add specific error handling for common math errors
+        if "division by zero" in error_message.lower():
+            return "Division by zero is not allowed"
+        elif "domain error" in error_message.lower():
+            return "Mathematical domain error (e.g., sqrt of negative number)"
+        elif "overflow" in error_message.lower():
+            return "Numerical overflow - result too large"
+        return error_message
+
     def _evaluate_node(self, node: ExpressionNode) -> float:
         """
         Recursively evaluate a single AST node.
@@ -268,6 +307,34 @@ class Evaluator:
                     f"Function {function_name} expects {expected_args} argument(s), got {len(args)}"
                 )
 
+        self.check_function_domain(function_name, args)
+
+        # Call the function
+        try:
+            if len(args) == 0:
+                return function()
+            elif len(args) == 1:
+                return function(args[0])
+            elif len(args) == 2:
+                return function(args[0], args[1])
+            else:
+                return function(*args)
+
+        except (ValueError, ArithmeticError, OverflowError) as e:
+            raise EvaluationError(f"Mathematical error in {function_name}: {str(e)}") from e
+
+    @staticmethod
+    def check_function_domain(function_name: str, args) -> None:
+        """
+        Reject arguments outside the domain of a built-in function.
+
+        Args:
+            function_name: Name of the function
+            args: List of evaluated arguments
+
+        Raises:
+            EvaluationError: If an argument is outside the function's domain
+        """
         # Special handling for functions that may have domain restrictions
         if function_name == 'sqrt' and len(args) == 1:
             if args[0] < 0:
@@ -289,20 +356,6 @@ class Evaluator:
             if args[0] < 0 or not float(args[0]).is_integer():
                 raise EvaluationError("Factorial requires non-negative integer")
 
-        # Call the function
-        try:
-            if len(args) == 0:
-                return function()
-            elif len(args) == 1:
-                return function(args[0])
-            elif len(args) == 2:
-                return function(args[0], args[1])
-            else:
-                return function(*args)
-
-        except (ValueError, ArithmeticError, OverflowError) as e:
-            raise EvaluationError(f"Mathematical error in {function_name}: {str(e)}") from e
-
     def _get_expected_arg_count(self, function_name: str) -> Optional[int]:
         """
         Get the expected argument count for a function.
@@ -313,28 +366,7 @@ class Evaluator:
         Returns:
             Expected argument count, or None if unknown, or -1 if variable
         """
-        arg_counts = {
-            # 0 arguments
-            # (none currently)
-
-            # 1 argument
-            'abs': 1, 'round': 1, 'int': 1, 'float': 1,
-            'sin': 1, 'cos': 1, 'tan': 1,
-            'asin': 1, 'acos': 1, 'atan': 1,
-            'sinh': 1, 'cosh': 1, 'tanh': 1,
-            'log': 1, 'log10': 1, 'log2': 1, 'ln': 1,
-            'exp': 1, 'sqrt': 1,
-            'ceil': 1, 'floor': 1, 'factorial': 1,
-            'degrees': 1, 'radians': 1,
-
-            # 2 arguments
-            'atan2': 2, 'pow': 2,
-
-            # Variable arguments
-            'min': -1, 'max': -1, 'sum': -1,
-        }
-
-        return arg_counts.get(function_name)
+        return self.FUNCTION_ARG_COUNTS.get(function_name)
 
     def set_variable(self, name: str, value: float) -> None:
         """Set a variable value in the context."""
@@ -8,7 +8,10 @@ and batch processing.
 
 from expression_manager import ExpressionManager, evaluate, validate
 from models import VariableContext
+from tokenizer import Tokenizer
+from parser import Parser
 import math
+import time
 
 
 def basic_usage_examples():
@@ -171,9 +174,27 @@ def performance_examples():
     print(f"   Speedup: {result1.execution_time / result2.execution_time:.1f}x")
     print()
 
+    # Tokenizer and parser throughput on a long generated expression
+    print("4. Tokenize/parse throughput:")
+    long_expr = " + ".join(f"sin(x{i} * 2.5) ** 2 / (y - {i}.75e-3)" for i in range(1000))
+    tokenizer = Tokenizer()
+
+    start = time.perf_counter()
+    token_count = len(tokenizer.tokenize(long_expr))
+    tokenize_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    Parser(tokenizer).parse(long_expr)
+    parse_time = time.perf_counter() - start
+
+    print(f"   Expression length: {len(long_expr)} characters, {token_count} tokens")
+    print(f"   Tokenize: {tokenize_time:.6f} seconds ({token_count / tokenize_time:,.0f} tokens/sec)")
+    print(f"   Tokenize + parse: {parse_time:.6f} seconds ({token_count / parse_time:,.0f} tokens/sec)")
+    print()
+
     # Statistics
     stats = manager.get_statistics()
-    print("4. Overall statistics:")
+    print("5. Overall statistics:")
     for key, value in stats.items():
         if isinstance(value, float):
             print(f"   {key}: {value:.6f}")
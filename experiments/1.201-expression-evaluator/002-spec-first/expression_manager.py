@@ -6,21 +6,35 @@ coordinating between tokenizer, parser, and evaluator components.
 """
 
 import time
-from typing import Optional, Dict, List, Union
+from typing import Any, Optional, Dict, List, Union
 try:
-    from .models import EvaluationResult, ValidationResult, VariableContext, ExpressionNode
+    from .models import (EvaluationResult, ValidationResult, VariableContext, ExpressionNode,
+                         VectorizedResult, OptimizationResult)
     from .tokenizer import Tokenizer
     from .parser import Parser
     from .evaluator import Evaluator
+    from .compiler import Compiler, CompiledExpression
+    from .vectorized import VectorizedEvaluator
+    from .optimizer import Optimizer
+    from .cache import LRUCache, CachedExpression, save_expressions, load_expressions
     from .exceptions import ExpressionError, SyntaxError, EvaluationError, ValidationError
 except ImportError:
-    from models import EvaluationResult, ValidationResult, VariableContext, ExpressionNode
+    from models import (EvaluationResult, ValidationResult, VariableContext, ExpressionNode,
+                        VectorizedResult, OptimizationResult)
     from tokenizer import Tokenizer
     from parser import Parser
     from evaluator import Evaluator
+    from compiler import Compiler, CompiledExpression
+    from vectorized import VectorizedEvaluator
+    from optimizer import Optimizer
+    from cache import LRUCache, CachedExpression, save_expressions, load_expressions
     from exceptions import ExpressionError, SyntaxError, EvaluationError, ValidationError
 
 
+# Marks a value cache miss; any float, even NaN, can be a cached value
+_MISSING = object()
+
+
 class ExpressionManager:
     """
     High-level interface for mathematical expression evaluation.
@@ -28,24 +42,56 @@ class ExpressionManager:
     This class orchestrates the entire expression evaluation workflow,
     from tokenization through parsing to evaluation, providing a simple
     API for users while handling all the complexity internally.
+
+    Two bounded LRU caches avoid repeated work: the parse cache maps
+    expression text to its validated AST (and optimized and compiled
+    forms), whatever the variable values, and the optional value cache maps
+    an expression plus its variable values to the result.
+
+    Unless optimization is switched off, ASTs go through the Optimizer
+    between parsing and evaluation; get_ast_string still shows the AST as
+    parsed unless asked for the optimized one.
     """
 
-    def __init__(self, context: Optional[VariableContext] = None):
+    # Default cache capacities
+    DEFAULT_PARSE_CACHE_SIZE = 1024
+    DEFAULT_VALUE_CACHE_SIZE = 1000
+
+    def __init__(self, context: Optional[VariableContext] = None,
+                 parse_cache_size: int = DEFAULT_PARSE_CACHE_SIZE,
+                 value_cache_size: int = DEFAULT_VALUE_CACHE_SIZE,
+                 optimize: bool = True):
         """
         Initialize the expression manager.
 
         Args:
             context: Optional variable context (creates default if not provided)
+            parse_cache_size: Maximum number of parsed expressions to keep
+            value_cache_size: Maximum number of results to keep (0 disables
+                the value cache)
+            optimize: Fold constants, simplify identities and share common
+                subexpressions before evaluating
         """
         self.context = context or VariableContext()
         self.tokenizer = Tokenizer()
         self.parser = Parser(self.tokenizer)
         self.evaluator = Evaluator(self.context)
+        self.compiler = Compiler(self.context)
+        self.vectorized_evaluator = VectorizedEvaluator(self.context)
+        self.optimizer = Optimizer(self.context)
+        self.optimize = optimize
 
         # Performance tracking
         self.evaluation_count = 0
         self.total_evaluation_time = 0.0
-        self.cache = {}  # Simple expression cache
+        self.parse_cache = LRUCache(parse_cache_size)
+        self.value_cache = LRUCache(value_cache_size)
+        self.optimized_count = 0
+        self.nodes_before_optimization = 0
+        self.nodes_after_optimization = 0
+        # Bumped whenever compiled forms go stale, so holders of
+        # CompiledExpression objects (e.g. a Workbook) know to recompile
+        self.compile_generation = 0
 
     def evaluate_expression(
         self,
@@ -84,19 +130,19 @@ class ExpressionManager:
                     if not isinstance(value, (int, float)):
                         raise TypeError(f"Variable value must be numeric, got {type(value)}")
 
-            # Check cache (simple caching for identical expressions)
+            # Check the value cache (identical expression and variables)
             cache_key = (expression, tuple(sorted(variables.items())) if variables else None)
-            if cache_key in self.cache:
-                cached_result = self.cache[cache_key]
-                return EvaluationResult.success_result(
-                    cached_result,
-                    time.time() - start_time
-                )
-
-            # Parse the expression
+            if self.value_cache.max_size:
+                cached_result = self.value_cache.get(cache_key, _MISSING)
+                if cached_result is not _MISSING:
+                    return EvaluationResult.success_result(
+                        cached_result,
+                        time.time() - start_time
+                    )
+
+            # Parse the expression (or reuse its cached AST)
             try:
-                ast = self.parser.parse(expression)
-                self.parser.validate_ast(ast)
+                entry = self._get_parsed(expression)
             except SyntaxError as e:
                 return EvaluationResult.error_result(
                     str(e),
@@ -104,12 +150,20 @@ class ExpressionManager:
                     execution_time=time.time() - start_time
                 )
 
+            # Folded constants would ignore variables that shadow them
+            if variables and not variables.keys().isdisjoint(self.context.constants):
+                ast = entry.ast
+            else:
+                ast = self._get_optimized(entry)
+
             # Evaluate the expression
             result = self.evaluator.evaluate(ast, variables)
+            # Report parsing and optimization time along with evaluation
+            result.execution_time = time.time() - start_time
 
             # Cache successful results
-            if result.success and len(self.cache) < 1000:  # Limit cache size
-                self.cache[cache_key] = result.value
+            if result.success:
+                self.value_cache.put(cache_key, result.value)
 
             # Update statistics
             self.evaluation_count += 1
@@ -144,6 +198,83 @@ class ExpressionManager:
         self.parser.validate_ast(ast)
         return ast
 
+    def _get_parsed(self, expression: str) -> CachedExpression:
+        """
+        Look up an expression in the parse cache, parsing it on a miss.
+
+        The cached AST is shared between callers and must not be modified.
+
+        Raises:
+            SyntaxError: If expression has syntax errors
+        """
+        entry = self.parse_cache.get(expression)
+        if entry is None:
+            entry = CachedExpression(self.parse_expression(expression))
+            self.parse_cache.put(expression, entry)
+        return entry
+
+    def _get_optimized(self, entry: CachedExpression) -> ExpressionNode:
+        """The AST to execute for a cache entry: optimized unless disabled."""
+        if not self.optimize:
+            return entry.ast
+        return self._get_optimization(entry).optimized
+
+    def _get_optimization(self, entry: CachedExpression) -> OptimizationResult:
+        """Optimize a cache entry's AST once and record the node counts."""
+        if entry.optimization is None:
+            entry.optimization = self.optimizer.optimize(entry.ast)
+            self.optimized_count += 1
+            self.nodes_before_optimization += entry.optimization.nodes_before
+            self.nodes_after_optimization += entry.optimization.nodes_after
+        return entry.optimization
+
+    def optimize_expression(self, expression: str) -> OptimizationResult:
+        """
+        Run the optimizer on an expression and report what it did.
+
+        Args:
+            expression: Mathematical expression string
+
+        Returns:
+            OptimizationResult with the original and optimized ASTs and
+            before/after node counts
+
+        Raises:
+            SyntaxError: If expression has syntax errors
+        """
+        if not isinstance(expression, str):
+            raise TypeError("Expression must be a string")
+
+        return self._get_optimization(self._get_parsed(expression))
+
+    def compile(self, expression: str) -> CompiledExpression:
+        """
+        Parse and compile an expression once for repeated evaluation.
+
+        The result is callable as f(**variables) and is much faster than
+        evaluate_expression when the same formula is evaluated against many
+        variable bindings. Variables missing from a call fall back to the
+        manager's persistent variables; functions are bound at compile time.
+
+        Args:
+            expression: Mathematical expression string
+
+        Returns:
+            CompiledExpression for the expression
+
+        Raises:
+            SyntaxError: If expression has syntax errors
+            EvaluationError: If expression calls an unknown function or
+                passes the wrong number of arguments to a built-in
+        """
+        if not isinstance(expression, str):
+            raise TypeError("Expression must be a string")
+
+        entry = self._get_parsed(expression)
+        if entry.compiled is None:
+            entry.compiled = self.compiler.compile(self._get_optimized(entry), expression)
+        return entry.compiled
+
     def validate_expression(self, expression: str) -> ValidationResult:
         """
         Validate expression syntax without evaluation.
@@ -162,8 +293,7 @@ class ExpressionManager:
                 return ValidationResult.invalid_result(["Expression cannot be empty"])
 
             # Try to parse the expression
-            ast = self.parser.parse(expression)
-            self.parser.validate_ast(ast)
+            self._get_parsed(expression)
 
             return ValidationResult.valid_result()
 
@@ -197,6 +327,43 @@ class ExpressionManager:
 
         return results
 
+    def evaluate_vectorized(self, expression: str, columns: Dict[str, Any]) -> VectorizedResult:
+        """
+        Evaluate one expression over columns of variable values with NumPy.
+
+        Rows that the scalar evaluator would reject (division by zero,
+        domain or overflow errors) do not raise: they are NaN in the values
+        and flagged in the result's error_mask, with one mask per message
+        in its errors dict.
+
+        Args:
+            expression: Mathematical expression string
+            columns: Variable name -> NumPy array (or sequence, or scalar)
+
+        Returns:
+            VectorizedResult with a value and an error flag per row
+
+        Raises:
+            SyntaxError: If expression has syntax errors
+            EvaluationError: If a variable or function is unknown
+            ImportError: If NumPy is not installed
+        """
+        if not isinstance(columns, dict):
+            raise TypeError("Columns must be a dictionary")
+        for name in columns:
+            if not isinstance(name, str):
+                raise TypeError(f"Variable name must be string, got {type(name)}")
+
+        if not isinstance(expression, str):
+            raise TypeError("Expression must be a string")
+
+        ast = self._get_optimized(self._get_parsed(expression))
+        result = self.vectorized_evaluator.evaluate(ast, columns)
+
+        self.evaluation_count += 1
+        self.total_evaluation_time += result.execution_time
+        return result
+
     def set_variable(self, name: str, value: float) -> None:
         """
         Set a variable value.
@@ -214,8 +381,11 @@ class ExpressionManager:
             raise TypeError("Variable value must be numeric")
 
         self.evaluator.set_variable(name, value)
-        # Clear cache when variables change
-        self.cache.clear()
+        # Cached values may depend on the variable; parsed forms do not,
+        # but optimized forms have constants folded in
+        self.value_cache.clear()
+        if name in self.context.constants:
+            self._invalidate_derived_forms()
 
     def get_variable(self, name: str) -> float:
         """
@@ -235,7 +405,7 @@ class ExpressionManager:
     def clear_variables(self) -> None:
         """Clear all user-defined variables."""
         self.evaluator.clear_variables()
-        self.cache.clear()
+        self.value_cache.clear()
 
     def get_variables(self) -> Dict[str, float]:
         """Get all current variables."""
@@ -266,7 +436,7 @@ class ExpressionManager:
             raise TypeError("Function must be callable")
 
         self.context.functions[name] = function
-        self.cache.clear()
+        self._invalidate_derived_forms()
 
     def remove_function(self, name: str) -> None:
         """
@@ -280,16 +450,25 @@ class ExpressionManager:
         """
         if name in self.context.functions:
             del self.context.functions[name]
-            self.cache.clear()
+            self._invalidate_derived_forms()
         else:
             raise KeyError(f"Function '{name}' not found")
 
-    def get_ast_string(self, expression: str) -> str:
+    def _invalidate_derived_forms(self) -> None:
+        """Drop cached values, optimized and compiled forms, which bind functions and constants."""
+        self.value_cache.clear()
+        for _, entry in self.parse_cache.items():
+            entry.compiled = None
+            entry.optimization = None
+        self.compile_generation += 1
+
+    def get_ast_string(self, expression: str, optimized: bool = False) -> str:
         """
         Get string representation of expression's AST.
 
         Args:
             expression: Mathematical expression string
+            optimized: Show the AST after the optimizer instead of as parsed
 
         Returns:
             String representation of the AST
@@ -297,12 +476,52 @@ class ExpressionManager:
         Raises:
             SyntaxError: If expression has syntax errors
         """
-        ast = self.parse_expression(expression)
-        return self.parser.ast_to_string(ast)
+        if not isinstance(expression, str):
+            raise TypeError("Expression must be a string")
+
+        if optimized:
+            return self.parser.ast_to_string(self.optimize_expression(expression).optimized)
+        return self.parser.ast_to_string(self._get_parsed(expression).ast)
 
     def clear_cache(self) -> None:
-        """Clear the expression cache."""
-        self.cache.clear()
+        """Clear the parse and value caches."""
+        self.parse_cache.clear()
+        self.value_cache.clear()
+
+    def save_cache(self, filepath: str) -> int:
+        """
+        Save the parsed expressions in the parse cache to a file.
+
+        A restarted process can load_cache the file to warm its parse cache
+        with its hot formula set instead of re-parsing every formula. Values
+        are not saved, since they depend on variables.
+
+        Args:
+            filepath: Destination path
+
+        Returns:
+            The number of expressions saved
+        """
+        return save_expressions(filepath, [(expression, entry.ast)
+                                           for expression, entry in self.parse_cache.items()])
+
+    def load_cache(self, filepath: str) -> int:
+        """
+        Load parsed expressions written by save_cache into the parse cache.
+
+        Args:
+            filepath: Path written by save_cache
+
+        Returns:
+            The number of expressions loaded
+
+        Raises:
+            ValueError: If the file is not a valid cache file
+        """
+        entries = load_expressions(filepath)
+        for expression, ast in entries:
+            self.parse_cache.put(expression, CachedExpression(ast))
+        return len(entries)
 
     def get_statistics(self) -> Dict[str, Union[int, float]]:
         """
@@ -318,7 +537,15 @@ class ExpressionManager:
             'total_evaluations': self.evaluation_count,
             'total_evaluation_time': self.total_evaluation_time,
             'average_evaluation_time': avg_time,
-            'cache_size': len(self.cache),
+            'cache_size': len(self.value_cache),
+            'value_cache_hits': self.value_cache.hits,
+            'value_cache_misses': self.value_cache.misses,
+            'parse_cache_size': len(self.parse_cache),
+            'parse_cache_hits': self.parse_cache.hits,
+            'parse_cache_misses': self.parse_cache.misses,
+            'optimized_expressions': self.optimized_count,
+            'nodes_before_optimization': self.nodes_before_optimization,
+            'nodes_after_optimization': self.nodes_after_optimization,
             'variable_count': len(self.context.variables),
             'function_count': len(self.context.functions)
         }
@@ -327,6 +554,11 @@ class ExpressionManager:
         """Reset all statistics."""
         self.evaluation_count = 0
         self.total_evaluation_time = 0.0
+        self.parse_cache.reset_statistics()
+        self.value_cache.reset_statistics()
+        self.optimized_count = 0
+        self.nodes_before_optimization = 0
+        self.nodes_after_optimization = 0
 
     def __str__(self) -> str:
         """String representation of the expression manager."""
@@ -338,7 +570,7 @@ class ExpressionManager:
     def __repr__(self) -> str:
         """Detailed string representation."""
         return (f"ExpressionManager(context={self.context}, "
-                f"cache_size={len(self.cache)}, "
+                f"cache_size={len(self.value_cache)}, "
                 f"evaluations={self.evaluation_count})")
 
 
@@ -366,6 +598,22 @@ def evaluate(expression: str, variables: Optional[Dict[str, float]] = None) -> f
         raise ExpressionError(result.error_message)
 
 
+def compile(expression: str) -> CompiledExpression:
+    """
+    Convenience function to compile a single expression.
+
+    Args:
+        expression: Mathematical expression string
+
+    Returns:
+        CompiledExpression, callable as f(**variables)
+
+    Raises:
+        ExpressionError: If the expression cannot be compiled
+    """
+    return ExpressionManager().compile(expression)
+
+
 def validate(expression: str) -> bool:
     """
     Convenience function to validate an expression.
@@ -205,6 +205,91 @@ class EvaluationResult:
             return f"Error: {self.error_message}"
 
 
+@dataclass
+class VectorizedResult:
+    """Result of evaluating one expression over columns of variable values."""
+    values: Any = None
+    error_mask: Any = None
+    errors: Dict[str, Any] = None
+    execution_time: float = 0.0
+
+    def __post_init__(self):
+        if self.errors is None:
+            self.errors = {}
+
+    @property
+    def success(self) -> bool:
+        """True if every row evaluated without error."""
+        return not self.errors
+
+    @property
+    def error_count(self) -> int:
+        """Number of rows that failed."""
+        return int(self.error_mask.sum()) if self.error_mask is not None else 0
+
+    def __len__(self) -> int:
+        return len(self.values) if self.values is not None else 0
+
+    def __str__(self) -> str:
+        if self.success:
+            return f"Success: {len(self)} rows (took {self.execution_time:.3f}s)"
+        else:
+            summary = "; ".join(f"{message} ({int(mask.sum())} rows)"
+                                for message, mask in self.errors.items())
+            return f"Partial: {self.error_count} of {len(self)} rows failed: {summary}"
+
+
+@dataclass
+class RecalculationResult:
+    """Outcome of one incremental workbook update."""
+    recalculated: List[str] = None
+    changed: List[str] = None
+    errors: Dict[str, str] = None
+    execution_time: float = 0.0
+
+    def __post_init__(self):
+        if self.recalculated is None:
+            self.recalculated = []
+        if self.changed is None:
+            self.changed = []
+        if self.errors is None:
+            self.errors = {}
+
+    @property
+    def touched(self) -> int:
+        """Number of formulas the update recomputed."""
+        return len(self.recalculated)
+
+    def __str__(self) -> str:
+        result = (f"Recalculated {self.touched} formula(s), {len(self.changed)} changed "
+                  f"(took {self.execution_time:.3f}s)")
+        if self.errors:
+            result += f", {len(self.errors)} error(s)"
+        return result
+
+
+@dataclass
+class OptimizationResult:
+    """Original and optimized ASTs of one expression, with what the pass did."""
+    original: Optional[ExpressionNode] = None
+    optimized: Optional[ExpressionNode] = None
+    nodes_before: int = 0
+    nodes_after: int = 0
+    folded: int = 0
+    simplified: int = 0
+    common_subexpressions: int = 0
+
+    @property
+    def nodes_saved(self) -> int:
+        """Number of nodes the pass removed."""
+        return self.nodes_before - self.nodes_after
+
+    def __str__(self) -> str:
+        return (f"Optimized {self.nodes_before} -> {self.nodes_after} nodes "
+                f"({self.folded} folded, {self.simplified} simplified, "
+                f"{self.common_subexpressions} shared)")
+
+
 @dataclass
 class ValidationResult:
     """Result of expression validation."""
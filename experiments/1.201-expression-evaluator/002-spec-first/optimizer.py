@@ -0,0 +1,212 @@
+"""
+Optimizer service for the Expression Evaluator system.
+
+This module rewrites a validated AST into a cheaper equivalent before it is
+evaluated or compiled:
+
+- constant folding: subtrees without variables are evaluated once, with
+  the Evaluator itself, so folded values match evaluation exactly; a
+  subtree whose evaluation fails is left alone to fail at run time
+- identities: x * 1, 1 * x, x + -0, -0 + x, x - 0, x / 1, x ** 1 and +x
+  become x when x is known to evaluate to a float; otherwise the float
+  literal would have converted an int variable, so they are kept.
+  Identities that are unsafe for inf, NaN or -0.0, such as x * 0 and
+  x + 0 (-0.0 + 0.0 is 0.0), are not applied
+- common subexpressions: structurally identical subtrees are merged into
+  one shared node, turning the tree into a DAG that the Compiler
+  evaluates once per call
+
+The original AST is never modified, so it stays available for display.
+"""
+
+import math
+from typing import Dict, Optional, Set, Tuple
+try:
+    from .models import ExpressionNode, NodeType, VariableContext, OptimizationResult
+    from .evaluator import Evaluator
+except ImportError:
+    from models import ExpressionNode, NodeType, VariableContext, OptimizationResult
+    from evaluator import Evaluator
+
+
+_DEFAULT_FUNCTIONS = VariableContext()._get_default_functions()
+
+# (operator, literal, sign of the literal) triples that leave a float
+# operand unchanged, including -0.0, inf and NaN
+_RIGHT_IDENTITIES = {('+', 0.0, -1.0), ('-', 0.0, 1.0), ('*', 1.0, 1.0), ('/', 1.0, 1.0),
+                     ('**', 1.0, 1.0), ('^', 1.0, 1.0)}
+_LEFT_IDENTITIES = {('+', 0.0, -1.0), ('*', 1.0, 1.0)}
+
+
+def _is_identity(identities: Set[Tuple[str, float, float]], operator: str,
+                 literal: ExpressionNode) -> bool:
+    """Whether operator with this NUMBER literal leaves the other operand unchanged."""
+    value = float(literal.value)
+    return (operator, value, math.copysign(1.0, value)) in identities
+
+
+def _is_float(node: ExpressionNode) -> bool:
+    """Whether a (folded) node always evaluates to a float, never an int."""
+    if node.node_type == NodeType.NUMBER:
+        return True
+    if node.node_type == NodeType.UNARY_OP:
+        return _is_float(node.right)
+    if node.node_type == NodeType.BINARY_OP:
+        return node.operator == '/' or _is_float(node.left) or _is_float(node.right)
+    # Variables, shadowable constants and function results may be ints
+    return False
+
+
+def count_nodes(node: Optional[ExpressionNode]) -> int:
+    """Count the nodes of an AST; nodes shared in a DAG are counted once."""
+    seen: Set[int] = set()
+    stack = [node] if node is not None else []
+    while stack:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        stack.extend(child for child in (current.left, current.right) if child is not None)
+        stack.extend(current.children or ())
+    return len(seen)
+
+
+class Optimizer:
+    """
+    Constant folding, identity simplification and common subexpression
+    sharing over ExpressionNode ASTs.
+    """
+
+    def __init__(self, context: Optional[VariableContext] = None):
+        """
+        Initialize the optimizer.
+
+        Args:
+            context: Variable context whose constants and functions are used
+                for folding (creates default if not provided)
+        """
+        self.context = context or VariableContext()
+        self.evaluator = Evaluator(self.context)
+
+    def optimize(self, node: ExpressionNode) -> OptimizationResult:
+        """
+        Optimize an AST.
+
+        Constants shadowed by a variable of the same name, and calls to
+        functions other than the built-ins, are never folded or shared.
+
+        Args:
+            node: Root node of a validated AST
+
+        Returns:
+            OptimizationResult with the original and optimized ASTs and
+            before/after node counts
+        """
+        result = OptimizationResult(original=node, nodes_before=count_nodes(node))
+        folded = self._fold(node, result)
+        result.optimized = self._share(folded, {}, result)[0]
+        result.nodes_after = count_nodes(result.optimized)
+        return result
+
+    def _is_pure_function(self, name: str) -> bool:
+        """Only the built-in functions are known to have no side effects."""
+        function = self.context.functions.get(name)
+        return function is not None and function is _DEFAULT_FUNCTIONS.get(name)
+
+    def _try_fold(self, node: ExpressionNode, result: OptimizationResult) -> ExpressionNode:
+        """Replace a variable-free node by its value, unless evaluating it fails."""
+        evaluation = self.evaluator.evaluate(node)
+        if not evaluation.success:
+            return node
+        result.folded += 1
+        return ExpressionNode(NodeType.NUMBER, value=float(evaluation.value))
+
+    def _fold(self, node: ExpressionNode, result: OptimizationResult) -> ExpressionNode:
+        """Fold constants and apply identities bottom-up, building new nodes."""
+        if node.node_type == NodeType.CONSTANT:
+            name = str(node.value)
+            if name in self.context.variables or name not in self.context.constants:
+                return node
+            return self._try_fold(node, result)
+
+        if node.node_type == NodeType.UNARY_OP:
+            operand = self._fold(node.right, result)
+            if node.operator == '+':
+                result.simplified += 1
+                return operand
+            rebuilt = ExpressionNode(NodeType.UNARY_OP, right=operand, operator=node.operator)
+            if operand.node_type == NodeType.NUMBER:
+                return self._try_fold(rebuilt, result)
+            return rebuilt
+
+        if node.node_type == NodeType.BINARY_OP:
+            left = self._fold(node.left, result)
+            right = self._fold(node.right, result)
+            rebuilt = ExpressionNode(NodeType.BINARY_OP, left=left, right=right, operator=node.operator)
+            if left.node_type == NodeType.NUMBER and right.node_type == NodeType.NUMBER:
+                return self._try_fold(rebuilt, result)
+            if (right.node_type == NodeType.NUMBER and _is_float(left)
+                    and _is_identity(_RIGHT_IDENTITIES, node.operator, right)):
+                result.simplified += 1
+                return left
+            if (left.node_type == NodeType.NUMBER and _is_float(right)
+                    and _is_identity(_LEFT_IDENTITIES, node.operator, left)):
+                result.simplified += 1
+                return right
+            return rebuilt
+
+        if node.node_type == NodeType.FUNCTION_CALL:
+            children = [self._fold(child, result) for child in node.children or []]
+            rebuilt = ExpressionNode(NodeType.FUNCTION_CALL, value=node.value, children=children)
+            if (self._is_pure_function(str(node.value))
+                    and all(child.node_type == NodeType.NUMBER for child in children)):
+                return self._try_fold(rebuilt, result)
+            return rebuilt
+
+        return node
+
+    def _share(self, node: ExpressionNode, table: Dict[Tuple, ExpressionNode],
+               result: OptimizationResult) -> Tuple[ExpressionNode, bool]:
+        """
+        Merge structurally identical subtrees into one node (hash-consing).
+
+        Returns:
+            (canonical node, whether the subtree may be shared)
+        """
+        if node.node_type == NodeType.NUMBER:
+            key = (NodeType.NUMBER, repr(node.value))  # keeps 0.0 and -0.0 apart
+            shareable = True
+        elif node.node_type in (NodeType.VARIABLE, NodeType.CONSTANT):
+            key = (node.node_type, node.value)
+            shareable = True
+        else:
+            left = right = None
+            shareable = True
+            if node.left is not None:
+                left, ok = self._share(node.left, table, result)
+                shareable &= ok
+            if node.right is not None:
+                right, ok = self._share(node.right, table, result)
+                shareable &= ok
+            children = []
+            for child in node.children or []:
+                child, ok = self._share(child, table, result)
+                children.append(child)
+                shareable &= ok
+            if node.node_type == NodeType.FUNCTION_CALL:
+                shareable &= self._is_pure_function(str(node.value))
+
+            node = ExpressionNode(node.node_type, value=node.value, left=left, right=right,
+                                  children=children, operator=node.operator)
+            if not shareable:
+                return node, False
+            key = (node.node_type, node.value, node.operator,
+                   id(left), id(right), tuple(id(child) for child in children))
+
+        existing = table.get(key)
+        if existing is not None:
+            if existing.node_type not in (NodeType.NUMBER, NodeType.VARIABLE, NodeType.CONSTANT):
+                result.common_subexpressions += 1
+            return existing, True
+        table[key] = node
+        return node, shareable
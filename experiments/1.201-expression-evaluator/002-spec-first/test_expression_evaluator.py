@@ -14,12 +14,16 @@ from .expression_manager import ExpressionManager, evaluate, validate
 from .tokenizer import Tokenizer
 from .parser import Parser
 from .evaluator import Evaluator
+from .compiler import CompiledExpression
+from .workbook import Workbook
+from .optimizer import Optimizer, count_nodes
 from .models import (
     Token, TokenType, ExpressionNode, NodeType, VariableContext,
     EvaluationResult, ValidationResult
 )
 from .exceptions import (
-    ExpressionError, SyntaxError, EvaluationError, VariableError, FunctionError
+    ExpressionError, SyntaxError, EvaluationError, VariableError, FunctionError,
+    ValidationError
 )
 
 
@@ -82,6 +86,19 @@ class TestTokenizer:
         with pytest.raises(SyntaxError):
             self.tokenizer.tokenize("2 + @ 3")
 
+    def test_iter_tokens_streams_same_tokens(self):
+        """Test that iter_tokens yields lazily and matches tokenize."""
+        expression = " sin(x) ** 2.5e-3 // max(a, b) % pi "
+        assert list(self.tokenizer.iter_tokens(expression)) == self.tokenizer.tokenize(expression)
+
+        stream = self.tokenizer.iter_tokens("1 + 2 $ 3")
+        assert next(stream).value == "1"
+        assert next(stream).value == "+"
+        assert next(stream).value == "2"
+        with pytest.raises(SyntaxError) as info:
+            next(stream)
+        assert info.value.position == 6
+
     def test_validate_unmatched_parentheses(self):
         """Test validation of unmatched parentheses."""
         tokens = self.tokenizer.tokenize("((2 + 3)")
@@ -311,6 +328,336 @@ class TestEvaluator:
         assert "undefined variable" in result.error_message.lower()
 
 
+class TestCompiler:
+    """Test cases for compiled expressions."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.manager = ExpressionManager()
+
+    def test_compiled_matches_evaluator(self):
+        """Test that compiled expressions agree with the tree-walking evaluator."""
+        expressions = [
+            "2 + 3 * 4", "2 ** 3 ** 2", "-x + (+y)", "x // y", "x % y",
+            "sqrt(x**2 + y**2)", "max(x, y, 3)", "sin(pi/4) + cos(x / 2)",
+        ]
+        bindings = [{"x": 3.0, "y": 4.0}, {"x": -7.5, "y": 2.0}, {"x": 10, "y": 3}]
+
+        for expr in expressions:
+            compiled = self.manager.compile(expr)
+            assert isinstance(compiled, CompiledExpression)
+            for variables in bindings:
+                expected = ExpressionManager().evaluate_expression(expr, variables)
+                assert compiled(**variables) == expected.value, (expr, variables)
+
+    def test_compiled_error_messages(self):
+        """Test that compiled expressions report the evaluator's error messages."""
+        cases = [
+            ("1 / x", {"x": 0}),
+            ("x % 0", {"x": 1}),
+            ("sqrt(x)", {"x": -1}),
+            ("log(x)", {"x": 0}),
+            ("x ** 0.5", {"x": -4}),
+            ("10 ** x", {"x": 400}),
+            ("undefined_var", {}),
+        ]
+        for expr, variables in cases:
+            expected = ExpressionManager().evaluate_expression(expr, variables)
+            with pytest.raises(EvaluationError) as info:
+                self.manager.compile(expr)(**variables)
+            assert str(info.value) == expected.error_message, expr
+
+            result = self.manager.compile(expr).evaluate(variables)
+            assert not result.success
+            assert result.error_message == expected.error_message
+
+    def test_compile_time_errors(self):
+        """Test errors that are detected when compiling."""
+        with pytest.raises(SyntaxError):
+            self.manager.compile("2 +")
+        with pytest.raises(EvaluationError, match="Unknown function"):
+            self.manager.compile("nosuch(1)")
+        with pytest.raises(EvaluationError, match="expects 1 argument"):
+            self.manager.compile("sin(1, 2)")
+
+        deep = ExpressionNode(NodeType.NUMBER, value=1.0)
+        for _ in range(Evaluator.MAX_RECURSION_DEPTH):
+            deep = ExpressionNode(NodeType.UNARY_OP, right=deep, operator='-')
+        with pytest.raises(EvaluationError, match="recursion depth"):
+            self.manager.compiler.compile(deep)
+
+    def test_compiled_uses_persistent_variables(self):
+        """Test fallback to manager variables and constants."""
+        self.manager.set_variable("r", 2.0)
+        area = self.manager.compile("pi * r ** 2")
+        assert area() == pytest.approx(math.pi * 4)
+        assert area(r=1.0) == pytest.approx(math.pi)
+        assert area.variables == frozenset({"r"})
+
+
+class TestOptimizer:
+    """Test cases for the AST optimizer."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.manager = ExpressionManager()
+
+    def test_constant_folding(self):
+        """Test that variable-free subtrees fold into single numbers."""
+        result = self.manager.optimize_expression("2 * pi * 3 + x")
+        assert result.folded == 3
+        assert result.nodes_before == 7
+        assert result.nodes_after == 3
+        assert result.optimized.left.node_type == NodeType.NUMBER
+        assert result.optimized.left.value == pytest.approx(6 * math.pi)
+
+    def test_identities(self):
+        """Test that identity operations on floats are removed but x * 0 is kept."""
+        result = self.manager.optimize_expression("(x / 2 * 1 - 0) / 1 - sin(0) + -0")
+        assert result.optimized.node_type == NodeType.BINARY_OP
+        assert result.optimized.operator == '/'
+        assert result.optimized.left.node_type == NodeType.VARIABLE
+        assert result.nodes_saved == 12
+
+        # Only -0.0 + 0.0 changes the sign, but that is enough to keep x + 0
+        assert self.manager.optimize_expression("x / 2 + 0").nodes_saved == 0
+
+        kept = self.manager.optimize_expression("x * 0")
+        assert kept.nodes_saved == 0
+        assert self.manager.evaluate_expression("x * 0", {"x": float("inf")}).value != 0
+
+    def test_identities_keep_int_variables_float(self):
+        """Test that optimized and unoptimized evaluation agree on int variables."""
+        plain = ExpressionManager(optimize=False, value_cache_size=0)
+        optimized = ExpressionManager(value_cache_size=0)
+        expressions = ["x + 0", "0 + x", "x - 0", "x * 1", "1 * x", "x / 1", "x ** 1", "x ^ 1",
+                       "factorial(x * 1)", "factorial(x - 0)", "factorial(y - ((0^pi)/(-1-2)))",
+                       "+x", "atan2(0, z + 0)", "atan2(0, z - 0)"]
+        for expression in expressions:
+            for variables in ({"x": 3, "y": 4, "z": -0.0}, {"x": 3.0, "y": 4.0, "z": 0.0}):
+                expected = plain.evaluate_expression(expression, variables)
+                actual = optimized.evaluate_expression(expression, variables)
+                assert actual.success == expected.success, expression
+                assert actual.error_message == expected.error_message, expression
+                assert type(actual.value) is type(expected.value), expression
+                assert repr(actual.value) == repr(expected.value), expression
+
+    def test_common_subexpressions_are_shared(self):
+        """Test that repeated subtrees become one node and results are unchanged."""
+        expression = "(x + y) * (x + y) + sqrt(x + y)"
+        result = self.manager.optimize_expression(expression)
+        assert result.common_subexpressions == 2
+        assert result.optimized.left.left is result.optimized.left.right
+        assert count_nodes(result.optimized) < result.nodes_before
+
+        compiled = self.manager.compile(expression)
+        for x, y in [(1, 3), (0.5, 2), (7, -3)]:
+            expected = (x + y) ** 2 + math.sqrt(x + y)
+            assert compiled(x=x, y=y) == pytest.approx(expected)
+            assert self.manager.evaluate_expression(expression, {"x": x, "y": y}).value == pytest.approx(expected)
+
+    def test_original_ast_is_kept(self):
+        """Test that get_ast_string shows the original AST unless asked otherwise."""
+        original = self.manager.get_ast_string("x + 2 * 3")
+        assert "BINARY_OP (*)" in original
+        optimized = self.manager.get_ast_string("x + 2 * 3", optimized=True)
+        assert "BINARY_OP (*)" not in optimized
+        assert "NUMBER: 6.0" in optimized
+
+    def test_failing_subtrees_are_not_folded(self):
+        """Test that folding never hides an evaluation error."""
+        result = self.manager.optimize_expression("1 / 0 + x")
+        assert result.folded == 0
+        evaluation = self.manager.evaluate_expression("1 / 0 + x", {"x": 1})
+        assert not evaluation.success
+        assert "Division by zero" in evaluation.error_message
+
+    def test_shadowed_constants_and_custom_functions(self):
+        """Test that variables named like constants and custom functions are respected."""
+        assert self.manager.evaluate_expression("2 * pi", {"pi": 1}).value == 2.0
+        calls = []
+        self.manager.add_function("tick", lambda: calls.append(1) or 1.0)
+        result = self.manager.optimize_expression("tick() + tick()")
+        assert result.folded == 0 and result.common_subexpressions == 0
+        assert self.manager.compile("tick() + tick()")() == 2.0
+        assert len(calls) == 2
+
+    def test_optimization_can_be_disabled(self):
+        """Test that optimize=False evaluates the parsed AST as is."""
+        manager = ExpressionManager(optimize=False)
+        assert manager.evaluate_expression("2 * 3 + x", {"x": 1}).value == 7.0
+        assert manager.get_statistics()['optimized_expressions'] == 0
+        assert Optimizer().optimize(manager.parse_expression("+x")).nodes_after == 1
+
+
+class TestVectorizedEvaluation:
+    """Test cases for NumPy evaluation over columns."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.np = pytest.importorskip("numpy")
+        self.manager = ExpressionManager()
+
+    def _assert_rows_match(self, expr, x, y):
+        """Compare every row with the scalar evaluator given that row's values."""
+        result = self.manager.evaluate_vectorized(expr, {"x": x, "y": y})
+        assert len(result) == len(x)
+        for row in range(len(x)):
+            expected = ExpressionManager().evaluate_expression(
+                expr, {"x": float(x[row]), "y": float(y[row])})
+            messages = [msg for msg, mask in result.errors.items() if mask[row]]
+            if expected.success:
+                assert not result.error_mask[row], (expr, row, messages)
+                assert result.values[row] == pytest.approx(expected.value, nan_ok=True), (expr, row)
+            else:
+                assert result.error_mask[row], (expr, row, expected.error_message)
+                assert self.np.isnan(result.values[row])
+                assert messages == [expected.error_message], (expr, row)
+
+    def test_vectorized_matches_scalar(self):
+        """Test that each row agrees with the scalar evaluator, errors included."""
+        x = self.np.array([1.0, 0.0, -4.0, 2.0, 3.0])
+        y = self.np.array([2.0, 1.0, 0.5, 0.0, 400.0])
+        expressions = ["x / y", "sqrt(x) + y", "x ** y", "log(x)", "y % x",
+                       "asin(x / 4)", "exp(y)", "max(x, y) * pi"]
+
+        for expr in expressions:
+            self._assert_rows_match(expr, x, y)
+
+    def test_vectorized_matches_scalar_edge_cases(self):
+        """Test row parity for overflow, non-finite values and Python-specific semantics."""
+        values = [0.0, 1.0, -1.0, 2.5, -2.5, 5.0, 171.0, 1000.0, 1e300, -1e300,
+                  float("inf"), float("-inf"), float("nan")]
+        x = self.np.array([a for a in values for _ in values])
+        y = self.np.array([b for _ in values for b in values])
+        expressions = ["factorial(x)", "factorial(y / 2) + x", "x ** y", "x ^ -y", "pow(x, y)",
+                       "int(x)", "round(y)", "ceil(x) + floor(y)", "min(x, y)", "max(y, x, 3)",
+                       "log(x)", "sqrt(y)", "tan(x)", "exp(x)", "degrees(y)", "x // y", "x % y"]
+
+        for expr in expressions:
+            self._assert_rows_match(expr, x, y)
+
+    def test_vectorized_error_messages(self):
+        """Test the messages that differ from NumPy's own notion of an error."""
+        result = self.manager.evaluate_vectorized("factorial(x)", {"x": [5.0, 1000.0, -1.0]})
+        assert result.errors["Error calling function factorial: "
+                             "'float' object cannot be interpreted as an integer"].tolist() == [True, True, False]
+        assert result.errors["Error calling function factorial: "
+                             "Factorial requires non-negative integer"].tolist() == [False, False, True]
+
+        result = self.manager.evaluate_vectorized("x ** 2000", {"x": [2.0, 1.0]})
+        assert list(result.errors) == ["Mathematical error in ** operation: (34, 'Numerical result out of range')"]
+        assert result.values[1] == 1.0
+
+    def test_vectorized_scalars_and_custom_functions(self):
+        """Test scalar broadcasting, context variables and row-wise custom functions."""
+        self.manager.set_variable("rate", 0.5)
+        self.manager.add_function("inverse", lambda v: 1 / v)
+
+        result = self.manager.evaluate_vectorized("inverse(x) * rate + k", {"x": [1, 0, 4], "k": 1})
+        assert result.values[0] == 1.5
+        assert result.error_mask.tolist() == [False, True, False]
+        assert result.values[2] == 1.125
+        assert not result.success and result.error_count == 1
+
+    def test_vectorized_whole_expression_errors(self):
+        """Test errors that apply to every row are raised."""
+        with pytest.raises(SyntaxError):
+            self.manager.evaluate_vectorized("2 +", {})
+        with pytest.raises(EvaluationError, match="Undefined variable"):
+            self.manager.evaluate_vectorized("x + z", {"x": [1.0]})
+        with pytest.raises(EvaluationError, match="do not match"):
+            self.manager.evaluate_vectorized("x + y", {"x": [1.0, 2.0], "y": [1.0, 2.0, 3.0]})
+
+
+class TestWorkbook:
+    """Test cases for incremental workbook recalculation."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.workbook = Workbook()
+        self.workbook.set_variables({"price": 10, "qty": 3, "rate": 0.2})
+        self.workbook.define_many({
+            "total": "subtotal + tax",
+            "subtotal": "price * qty",
+            "tax": "subtotal * rate",
+            "discount": "rate * 100",
+        })
+
+    def test_values_and_dependencies(self):
+        """Test formulas defined out of order and the derived dependency graph."""
+        assert self.workbook["subtotal"] == 30.0
+        assert self.workbook["total"] == pytest.approx(36.0)
+        assert self.workbook.get_dependencies("tax") == {"subtotal", "rate"}
+        assert self.workbook.get_dependents("subtotal") == {"total", "tax"}
+        assert not self.workbook.errors
+
+    def test_only_downstream_formulas_recalculate(self):
+        """Test that an input change touches only its dependents, in order."""
+        result = self.workbook.set_variable("qty", 4)
+        assert result.recalculated == ["subtotal", "tax", "total"]
+        assert result.touched == 3
+        assert self.workbook["total"] == pytest.approx(48.0)
+
+        # Same value: nothing to do
+        assert self.workbook.set_variable("qty", 4).touched == 0
+
+        # Unchanged intermediate values stop propagation
+        self.workbook.define("clamped", "min(price, 5)")
+        self.workbook.define("doubled", "clamped * 2")
+        result = self.workbook.set_variable("price", 20)
+        assert "clamped" in result.recalculated
+        assert "doubled" not in result.recalculated
+
+    def test_errors_and_cycles(self):
+        """Test per-formula errors, their propagation and cycle rejection."""
+        self.workbook.set_variable("qty", 0)
+        self.workbook.define("unit", "total / qty")
+        assert self.workbook.errors["unit"] == "Division by zero is not allowed"
+        with pytest.raises(EvaluationError):
+            self.workbook.get("unit")
+
+        self.workbook.set_variable("qty", 2)
+        assert "unit" not in self.workbook.errors
+
+        with pytest.raises(ValidationError, match="subtotal -> total -> subtotal"):
+            self.workbook.define("subtotal", "total * 2")
+        assert self.workbook.formulas["subtotal"] == "price * qty"
+
+        with pytest.raises(VariableError):
+            self.workbook.set_variable("total", 1)
+
+    def test_function_changes_recompile_formulas(self):
+        """Test that formulas follow functions added, replaced and removed on the manager."""
+        manager = self.workbook.manager
+        manager.add_function("fee", lambda amount: amount * 0.1)
+        self.workbook.define("charge", "fee(total) + 1")
+        assert self.workbook["charge"] == pytest.approx(4.6)
+
+        manager.add_function("fee", lambda amount: amount * 0.5)
+        assert self.workbook["charge"] == pytest.approx(19.0)
+        assert self.workbook.last_update.changed == ["charge"]
+
+        manager.remove_function("fee")
+        result = self.workbook.set_variable("qty", 4)
+        assert result.errors["charge"] == "Unknown function: fee"
+        assert self.workbook["total"] == pytest.approx(48.0)
+
+        manager.add_function("fee", lambda amount: amount)
+        assert self.workbook["charge"] == pytest.approx(49.0)
+        assert not self.workbook.errors
+
+    def test_nan_that_stays_nan_is_unchanged(self):
+        """Test that a formula whose value stays NaN does not propagate."""
+        self.workbook.set_variables({"reading": float("nan"), "scale": 2})
+        self.workbook.define_many({"scaled": "reading * scale", "offset": "scaled + 1"})
+        assert math.isnan(self.workbook["offset"])
+
+        result = self.workbook.set_variable("scale", 3)
+        assert result.recalculated == ["scaled"]
+        assert result.changed == []
+
+
 class TestExpressionManager:
     """Test cases for the ExpressionManager class."""
 
@@ -390,6 +737,50 @@ class TestExpressionManager:
         # Second evaluation should be faster due to caching
         assert time2 <= time1
 
+    def test_parse_cache_is_bounded_lru(self):
+        """Test that parsed expressions are reused independent of variable values."""
+        manager = ExpressionManager(parse_cache_size=2, value_cache_size=0)
+        manager.evaluate_expression("x + 1", {"x": 1})
+        manager.evaluate_expression("x + 1", {"x": 2})
+        manager.evaluate_expression("y * 2", {"y": 3})
+        manager.evaluate_expression("x + 1", {"x": 3})  # refreshes "x + 1"
+        manager.evaluate_expression("z - 1", {"z": 4})  # evicts "y * 2"
+
+        stats = manager.get_statistics()
+        assert stats['parse_cache_size'] == 2
+        assert stats['parse_cache_hits'] == 2
+        assert stats['parse_cache_misses'] == 3
+        assert stats['cache_size'] == 0
+        assert "x + 1" in manager.parse_cache and "y * 2" not in manager.parse_cache
+
+    def test_value_cache_statistics(self):
+        """Test value cache hits, misses and invalidation."""
+        self.manager.evaluate_expression("a * 2", {"a": 2})
+        self.manager.evaluate_expression("a * 2", {"a": 2})
+        self.manager.evaluate_expression("a * 2", {"a": 3})
+        stats = self.manager.get_statistics()
+        assert (stats['value_cache_hits'], stats['value_cache_misses']) == (1, 2)
+
+        self.manager.set_variable("k", 1.0)
+        assert self.manager.get_statistics()['cache_size'] == 0
+        assert self.manager.get_statistics()['parse_cache_size'] == 1
+
+    def test_save_and_load_cache(self, tmp_path):
+        """Test that a new manager reloads parsed expressions without parsing."""
+        for expr in ["sqrt(x**2 + y**2)", "-a // 2 % max(b, 3)", "2.5e3 * pi"]:
+            self.manager.evaluate_expression(expr, {"x": 3, "y": 4, "a": 7, "b": 1})
+        path = str(tmp_path / "expressions.json")
+        assert self.manager.save_cache(path) == 3
+
+        restarted = ExpressionManager()
+        assert restarted.load_cache(path) == 3
+        restarted.parser.parse = None  # any parse would now fail
+        for expr, _ in list(self.manager.parse_cache.items()):
+            assert restarted.get_ast_string(expr) == self.manager.get_ast_string(expr)
+            result = restarted.evaluate_expression(expr, {"x": 3, "y": 4, "a": 7, "b": 1})
+            assert result.success
+        assert restarted.get_statistics()['parse_cache_misses'] == 0
+
     def test_statistics(self):
         """Test evaluation statistics."""
         # Reset statistics
@@ -23,9 +23,9 @@ class Tokenizer:
     functions, variables, and other elements of mathematical expressions.
     """
 
-    # Regular expressions for token patterns
+    # Regular expressions for token patterns, tried in this order
     PATTERNS = {
-        TokenType.NUMBER: r'\d+\.?\d*([eE][+-]?\d+)?',
+        TokenType.NUMBER: r'\d+\.?\d*(?:[eE][+-]?\d+)?',
         TokenType.FUNCTION: r'[a-zA-Z_][a-zA-Z0-9_]*(?=\s*\()',
         TokenType.VARIABLE: r'[a-zA-Z_][a-zA-Z0-9_]*',
         TokenType.OPERATOR: r'\*\*|//|[+\-*/()%^]',
@@ -49,6 +49,21 @@ class Tokenizer:
     # Mathematical constants
     CONSTANTS = {'pi', 'e', 'tau', 'inf'}
 
+    # All patterns in one alternation: named groups in PATTERNS order, plus
+    # whitespace to skip and a catch-all for invalid characters. Alternation
+    # takes the first branch that matches, exactly like trying each pattern
+    # in turn, but the regex is compiled once and scanned in a single pass.
+    TOKEN_REGEX = re.compile(
+        r'(?P<WHITESPACE>\s+)|'
+        + '|'.join(f'(?P<{token_type.value}>{pattern})' for token_type, pattern in PATTERNS.items())
+        + r'|(?P<MISMATCH>.)',
+        re.DOTALL
+    )
+
+    # Group name -> token type; operator matches of '(' and ')' become parens
+    _GROUP_TYPES = {token_type.value: token_type for token_type in PATTERNS}
+    _PAREN_TYPES = {'(': TokenType.LEFT_PAREN, ')': TokenType.RIGHT_PAREN}
+
     def __init__(self):
         """Initialize the tokenizer."""
         self.expression = ""
@@ -68,72 +83,57 @@ class Tokenizer:
         Raises:
             SyntaxError: If the expression contains invalid syntax
         """
+        self.tokens = list(self.iter_tokens(expression))
+        return self.tokens
+
+    def iter_tokens(self, expression: str) -> Iterator[Token]:
+        """
+        Lazily tokenize a mathematical expression.
+
+        Tokens are produced one at a time from a single scan of the
+        expression, ending with an EOF token. Positions are offsets into the
+        expression with surrounding whitespace stripped, as for tokenize.
+
+        Args:
+            expression: The mathematical expression to tokenize
+
+        Yields:
+            Tokens in order of appearance
+
+        Raises:
+            SyntaxError: When an invalid character is reached
+        """
         self.expression = expression.strip()
         self.position = 0
-        self.tokens = []
 
-        if not self.expression:
-            return [Token(TokenType.EOF, "", 0)]
+        group_types = self._GROUP_TYPES
+        paren_types = self._PAREN_TYPES
+        constants = self.CONSTANTS
 
-        while self.position < len(self.expression):
-            if self._skip_whitespace():
-                continue
+        for match in self.TOKEN_REGEX.finditer(self.expression):
+            kind = match.lastgroup
+            value = match.group()
+            token_position = match.start()
+            self.position = match.end()
 
-            token = self._next_token()
-            if token is None:
+            if kind == 'WHITESPACE':
+                continue
+            if kind == 'MISMATCH':
+                self.position = token_position
                 raise SyntaxError(
-                    f"Invalid character '{self.expression[self.position]}'",
-                    position=self.position,
+                    f"Invalid character '{value}'",
+                    position=token_position,
                     suggestion="Check for unsupported characters or typos"
                 )
 
-            self.tokens.append(token)
-
-        # Add EOF token
-        self.tokens.append(Token(TokenType.EOF, "", self.position))
-        return self.tokens
+            token_type = group_types[kind]
+            if token_type == TokenType.VARIABLE and value in constants:
+                token_type = TokenType.CONSTANT
+            elif token_type == TokenType.OPERATOR and value in paren_types:
+                token_type = paren_types[value]
+            yield Token(token_type, value, token_position)
 
-    def _skip_whitespace(self) -> bool:
-        """Skip whitespace characters."""
-        start_pos = self.position
-        while self.position < len(self.expression) and self.expression[self.position].isspace():
-            self.position += 1
-        return self.position > start_pos
-
-    def _next_token(self) -> Optional[Token]:
-        """Get the next token from the expression."""
-        if self.position >= len(self.expression):
-            return None
-
-        # Try to match each token type
-        for token_type, pattern in self.PATTERNS.items():
-            regex = re.compile(pattern)
-            match = regex.match(self.expression, self.position)
-
-            if match:
-                value = match.group(0)
-                token_position = self.position
-                self.position = match.end()
-
-                # Special handling for different token types
-                if token_type == TokenType.VARIABLE:
-                    # Check if it's actually a constant
-                    if value in self.CONSTANTS:
-                        return Token(TokenType.CONSTANT, value, token_position)
-                    # Check if it's actually a function (this shouldn't happen due to regex)
-                    return Token(TokenType.VARIABLE, value, token_position)
-                elif token_type == TokenType.OPERATOR:
-                    # Handle special cases for operators
-                    if value in ('(', ')'):
-                        if value == '(':
-                            return Token(TokenType.LEFT_PAREN, value, token_position)
-                        else:
-                            return Token(TokenType.RIGHT_PAREN, value, token_position)
-                    return Token(TokenType.OPERATOR, value, token_position)
-                else:
-                    return Token(token_type, value, token_position)
-
-        return None
+        yield Token(TokenType.EOF, "", self.position)
 
     def get_operator_precedence(self, operator: str) -> int:
         """Get the precedence of an operator."""
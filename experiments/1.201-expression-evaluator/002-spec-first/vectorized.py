@@ -0,0 +1,308 @@
+"""
+Vectorized evaluation service for the Expression Evaluator system.
+
+This module evaluates one AST over whole columns of variable values with
+NumPy, mapping the operators and the default functions of VariableContext
+onto ufuncs. Each AST node is visited once per call rather than once per
+row. Errors that the Evaluator raises for a single row - division by zero,
+domain and overflow errors - are collected into per-row masks instead.
+
+NumPy is optional for the rest of the package; only this mode needs it.
+"""
+
+import time
+from typing import Any, Callable, Dict, List, Optional
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy is optional
+    np = None
+try:
+    from .models import ExpressionNode, NodeType, VariableContext, VectorizedResult
+    from .evaluator import Evaluator
+    from .exceptions import EvaluationError, VariableError, FunctionError
+except ImportError:
+    from models import ExpressionNode, NodeType, VariableContext, VectorizedResult
+    from evaluator import Evaluator
+    from exceptions import EvaluationError, VariableError, FunctionError
+
+
+# str() of the OverflowError raised by float ** float
+_POW_OVERFLOW = "(34, 'Numerical result out of range')"
+
+
+def _python_min(*args):
+    """min() as Python computes it: a later NaN never replaces the result."""
+    result = args[0]
+    for arg in args[1:]:
+        result = np.where(arg < result, arg, result)
+    return result
+
+
+def _python_max(*args):
+    """max() as Python computes it: a later NaN never replaces the result."""
+    result = args[0]
+    for arg in args[1:]:
+        result = np.where(arg > result, arg, result)
+    return result
+
+
+def _python_pow(base, exponent):
+    """Built-in pow on floats: -inf to a fractional power is inf or 0, not NaN."""
+    result = np.power(base, exponent)
+    fractional = np.isneginf(base) & np.isfinite(exponent) & (np.floor(exponent) != exponent)
+    return np.where(fractional, np.where(exponent > 0, np.inf, 0.0), result)
+
+
+def _build_ufuncs() -> Dict[str, Callable]:
+    """Map default function names to NumPy equivalents with the same semantics."""
+    if np is None:
+        return {}
+    return {
+        'abs': np.abs,
+        'round': np.round,  # round half to even, like Python's round
+        'int': np.trunc,
+        'float': np.asarray,
+        'sin': np.sin, 'cos': np.cos, 'tan': np.tan,
+        'asin': np.arcsin, 'acos': np.arccos, 'atan': np.arctan,
+        'atan2': np.arctan2,
+        'sinh': np.sinh, 'cosh': np.cosh, 'tanh': np.tanh,
+        'log': np.log, 'log10': np.log10, 'log2': np.log2, 'ln': np.log,
+        'exp': np.exp, 'sqrt': np.sqrt, 'pow': _python_pow,
+        'ceil': np.ceil, 'floor': np.floor,
+        'degrees': np.degrees, 'radians': np.radians,
+        'min': _python_min,
+        'max': _python_max,
+    }
+
+
+_UFUNCS = _build_ufuncs()
+_DEFAULT_FUNCTIONS = VariableContext()._get_default_functions()
+
+
+class _RowErrors:
+    """Per-row error state for one vectorized evaluation."""
+
+    def __init__(self, shape):
+        self.shape = shape
+        self.mask = np.zeros(shape, dtype=bool)
+        self.errors: Dict[str, Any] = {}
+
+    def record(self, condition, message: str) -> None:
+        """Mark rows where condition holds, unless an earlier error already did."""
+        new = np.broadcast_to(condition, self.shape) & ~self.mask
+        if not new.any():
+            return
+        message = Evaluator.friendly_error_message(message)
+        if message in self.errors:
+            self.errors[message] |= new
+        else:
+            self.errors[message] = new.copy()
+        self.mask |= new
+
+
+class VectorizedEvaluator:
+    """
+    Evaluates an AST over columns of variable values with NumPy.
+
+    Default functions run as ufuncs; factorial, sum and custom functions
+    added to the context are called row by row, so their results and error
+    messages are exactly the scalar ones. The first error in a row wins, as it does in the
+    Evaluator, and failed rows are NaN in the result.
+    """
+
+    def __init__(self, context: Optional[VariableContext] = None):
+        """
+        Initialize the vectorized evaluator.
+
+        Args:
+            context: Variable context for lookups (creates default if not provided)
+        """
+        self.context = context or VariableContext()
+
+    def evaluate(self, node: ExpressionNode, columns: Dict[str, Any]) -> VectorizedResult:
+        """
+        Evaluate an AST for every row of the given columns.
+
+        Args:
+            node: Root node of a validated AST
+            columns: Variable name -> array of values (or a scalar); arrays
+                must broadcast against each other
+
+        Returns:
+            VectorizedResult with a value and an error flag per row
+
+        Raises:
+            ImportError: If NumPy is not installed
+            EvaluationError: If a variable or function is unknown, a built-in
+                gets the wrong number of arguments, or the AST is too deep
+        """
+        if np is None:
+            raise ImportError("Vectorized evaluation requires NumPy")
+
+        start_time = time.time()
+        arrays = {name: np.asarray(values, dtype=np.float64) for name, values in columns.items()}
+        try:
+            shape = np.broadcast_shapes(*(array.shape for array in arrays.values()))
+        except ValueError as e:
+            raise EvaluationError(f"Column lengths do not match: {str(e)}") from e
+
+        state = _RowErrors(shape)
+        with np.errstate(all='ignore'):
+            values = np.array(np.broadcast_to(self._evaluate_node(node, arrays, state, 1), shape),
+                              dtype=np.float64)
+        values[state.mask] = np.nan
+
+        return VectorizedResult(values=values, error_mask=state.mask, errors=state.errors,
+                                execution_time=time.time() - start_time)
+
+    def _evaluate_node(self, node: ExpressionNode, arrays: Dict[str, Any],
+                       state: _RowErrors, depth: int):
+        """Evaluate a single AST node over all rows."""
+        if depth > Evaluator.MAX_RECURSION_DEPTH:
+            raise EvaluationError("Maximum recursion depth exceeded")
+
+        if node.node_type == NodeType.NUMBER:
+            return np.float64(node.value)
+        elif node.node_type in (NodeType.VARIABLE, NodeType.CONSTANT):
+            name = str(node.value)
+            if name in arrays:
+                return arrays[name]
+            try:
+                return np.float64(self.context.get_variable(name))
+            except VariableError as e:
+                raise EvaluationError(str(e)) from e
+        elif node.node_type == NodeType.BINARY_OP:
+            left = self._evaluate_node(node.left, arrays, state, depth + 1)
+            right = self._evaluate_node(node.right, arrays, state, depth + 1)
+            return self._binary_operation(node.operator, left, right, state)
+        elif node.node_type == NodeType.UNARY_OP:
+            operand = self._evaluate_node(node.right, arrays, state, depth + 1)
+            if node.operator == '+':
+                return operand
+            elif node.operator == '-':
+                return np.negative(operand)
+            raise EvaluationError(f"Unknown unary operator: {node.operator}")
+        elif node.node_type == NodeType.FUNCTION_CALL:
+            args = [self._evaluate_node(child, arrays, state, depth + 1)
+                    for child in node.children or []]
+            return self._function_call(str(node.value), args, state)
+        else:
+            raise EvaluationError(f"Unknown node type: {node.node_type}")
+
+    @staticmethod
+    def _binary_operation(op: str, left, right, state: _RowErrors):
+        """Apply a binary operator, recording the rows the Evaluator would reject."""
+        if op == '+':
+            return np.add(left, right)
+        elif op == '-':
+            return np.subtract(left, right)
+        elif op == '*':
+            return np.multiply(left, right)
+        elif op in ('/', '//', '%'):
+            state.record(right == 0, "Modulo by zero" if op == '%' else "Division by zero")
+            if op == '/':
+                return np.true_divide(left, right)
+            elif op == '//':
+                return np.floor_divide(left, right)
+            return np.mod(left, right)
+        elif op in ('**', '^'):
+            state.record((left == 0) & (right < 0), "Zero to negative power is undefined")
+            non_integer = (np.floor(right) != right) | np.isinf(right)
+            state.record((left < 0) & non_integer, "Negative base with non-integer exponent")
+            result = np.power(left, right)
+            state.record(np.isinf(result) & np.isfinite(left) & np.isfinite(right),
+                         f"Mathematical error in {op} operation: {_POW_OVERFLOW}")
+            return result
+        raise EvaluationError(f"Unknown binary operator: {op}")
+
+    def _function_call(self, function_name: str, args: List[Any], state: _RowErrors):
+        """Call a function on whole columns, or row by row for custom functions."""
+        try:
+            function = self.context.get_function(function_name)
+        except FunctionError as e:
+            raise EvaluationError(str(e)) from e
+
+        expected_args = Evaluator.FUNCTION_ARG_COUNTS.get(function_name)
+        if expected_args is not None and expected_args != -1 and len(args) != expected_args:
+            raise EvaluationError(
+                f"Error calling function {function_name}: "
+                f"Function {function_name} expects {expected_args} argument(s), got {len(args)}"
+            )
+
+        if function is not _DEFAULT_FUNCTIONS.get(function_name):
+            return self._call_per_row(function, function_name, args, state)
+        if function_name not in _UFUNCS or (function_name in ('min', 'max') and len(args) < 2):
+            return self._call_per_row(function, function_name, args, state)
+
+        prefix = f"Error calling function {function_name}: "
+        self._check_domain(function_name, args, prefix, state)
+
+        result = _UFUNCS[function_name](*args)
+
+        # Whatever the math module would have raised on shows up as NaN or inf
+        finite_args = np.all([np.broadcast_to(np.isfinite(arg), state.shape) for arg in args], axis=0)
+        nan_args = np.any([np.broadcast_to(np.isnan(arg), state.shape) for arg in args], axis=0)
+        state.record(np.isnan(result) & ~nan_args,
+                     f"{prefix}Mathematical error in {function_name}: math domain error")
+        if function_name != 'degrees':  # math.degrees overflows to inf silently
+            overflow = _POW_OVERFLOW if function_name == 'pow' else "math range error"
+            state.record(np.isinf(result) & finite_args,
+                         f"{prefix}Mathematical error in {function_name}: {overflow}")
+        return result
+
+    @staticmethod
+    def _check_domain(function_name: str, args: List[Any], prefix: str, state: _RowErrors) -> None:
+        """Vectorized counterpart of Evaluator.check_function_domain."""
+        if function_name == 'sqrt':
+            state.record(args[0] < 0, prefix + "Square root of negative number")
+        elif function_name in ('log', 'log10', 'log2', 'ln'):
+            state.record(args[0] <= 0, prefix + "Logarithm of non-positive number")
+        elif function_name == 'asin':
+            state.record(~((-1 <= args[0]) & (args[0] <= 1)),
+                         prefix + "arcsine domain error: argument must be in [-1, 1]")
+        elif function_name == 'acos':
+            state.record(~((-1 <= args[0]) & (args[0] <= 1)),
+                         prefix + "arccosine domain error: argument must be in [-1, 1]")
+        elif function_name == 'pow':
+            base, exponent = args
+            finite = np.isfinite(base) & np.isfinite(exponent)
+            state.record(finite & (base == 0) & (exponent < 0),
+                         prefix + "Mathematical error in pow: 0.0 cannot be raised to a negative power")
+            # The built-in pow returns a complex number, which float() rejects
+            complex_result = finite & (base < 0) & (np.floor(exponent) != exponent)
+            state.record(complex_result & np.isinf(np.power(-base, exponent)),
+                         prefix + "Mathematical error in pow: complex exponentiation")
+            state.record(complex_result,
+                         prefix + "float() argument must be a string or a real number, not 'complex'")
+        elif function_name in ('int', 'round', 'ceil', 'floor'):
+            # Each of these converts its result to a Python int
+            state.record(np.isinf(args[0]), prefix + f"Mathematical error in {function_name}: "
+                                                     "cannot convert float infinity to integer")
+            state.record(np.isnan(args[0]), prefix + f"Mathematical error in {function_name}: "
+                                                     "cannot convert float NaN to integer")
+
+    def _call_per_row(self, function: Callable, function_name: str, args: List[Any],
+                      state: _RowErrors):
+        """Call a Python function once per row with the Evaluator's checks."""
+        evaluator = Evaluator(self.context)
+        columns = [np.broadcast_to(arg, state.shape).ravel().tolist() for arg in args]
+        skip = state.mask.ravel()
+        result = np.full(state.mask.size, np.nan)
+        failures: Dict[str, List[int]] = {}
+
+        for row in range(state.mask.size):
+            if skip[row]:
+                continue
+            row_args = [column[row] for column in columns]
+            try:
+                result[row] = float(evaluator._call_function_safely(function, row_args, function_name))
+            except Exception as e:
+                message = f"Error calling function {function_name}: {str(e)}"
+                failures.setdefault(message, []).append(row)
+
+        for message, rows in failures.items():
+            condition = np.zeros(state.mask.size, dtype=bool)
+            condition[rows] = True
+            state.record(condition.reshape(state.shape), message)
+
+        return result.reshape(state.shape)
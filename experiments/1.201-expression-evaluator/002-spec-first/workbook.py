@@ -0,0 +1,396 @@
+"""
+Workbook service for the Expression Evaluator system.
+
+This module keeps a spreadsheet-like set of named formulas whose variables
+may be input values or other formulas. The dependency graph is derived from
+each formula's AST; cycles are rejected when a formula is defined. When an
+input changes only the formulas downstream of it are recomputed, in
+topological order, and propagation stops wherever a value did not change.
+When the manager's functions or constants change, every formula is
+recompiled and recomputed on the next update or read.
+"""
+
+import heapq
+import time
+from typing import Dict, Iterable, List, Optional, Set, Union
+try:
+    from .models import RecalculationResult
+    from .expression_manager import ExpressionManager
+    from .compiler import CompiledExpression
+    from .tokenizer import Tokenizer
+    from .exceptions import EvaluationError, VariableError, ValidationError
+except ImportError:
+    from models import RecalculationResult
+    from expression_manager import ExpressionManager
+    from compiler import CompiledExpression
+    from tokenizer import Tokenizer
+    from exceptions import EvaluationError, VariableError, ValidationError
+
+
+class _CompileFailure:
+    """Stands in for a formula that no longer compiles, e.g. after its function was removed."""
+
+    __slots__ = ('variables', 'message')
+
+    def __init__(self, variables: frozenset, message: str):
+        self.variables = variables
+        self.message = message
+
+    def __call__(self, **variables: float) -> float:
+        raise EvaluationError(self.message)
+
+
+class Workbook:
+    """
+    Named formulas with incremental, dependency-ordered recalculation.
+
+    Formulas are compiled once through the workbook's ExpressionManager.
+    Every update returns a RecalculationResult naming the formulas it
+    recomputed, so callers can see how much of the graph a change touched.
+    """
+
+    def __init__(self, manager: Optional[ExpressionManager] = None):
+        """
+        Initialize the workbook.
+
+        Args:
+            manager: Expression manager used to parse and compile formulas;
+                its variables and constants are visible to every formula
+        """
+        self.manager = manager or ExpressionManager()
+        self.formulas: Dict[str, str] = {}
+        self.inputs: Dict[str, float] = {}
+        self.errors: Dict[str, str] = {}
+        self.last_update: Optional[RecalculationResult] = None
+
+        self._results: Dict[str, float] = {}
+        self._compiled: Dict[str, Union[CompiledExpression, _CompileFailure]] = {}
+        self._compile_generation = self.manager.compile_generation
+        self._dependencies: Dict[str, frozenset] = {}
+        # name -> formulas that reference it; name may be a formula, an
+        # input, or not defined yet
+        self._dependents: Dict[str, Set[str]] = {}
+        # formula -> position in a topological order; None when stale
+        self._ranks: Optional[Dict[str, int]] = None
+
+    def define(self, name: str, expression: str) -> RecalculationResult:
+        """
+        Define or redefine a named formula and recompute what depends on it.
+
+        Args:
+            name: Formula name, usable as a variable in other formulas
+            expression: Mathematical expression string
+
+        Returns:
+            RecalculationResult for the formula and its dependents
+
+        Raises:
+            VariableError: If the name is invalid or already an input
+            SyntaxError: If the expression has syntax errors
+            ValidationError: If the formula would create a circular reference
+        """
+        return self.define_many({name: expression})
+
+    def define_many(self, formulas: Dict[str, str]) -> RecalculationResult:
+        """
+        Define several formulas at once and recompute them in a single pass.
+
+        Formulas may refer to each other in any order. If any formula is
+        invalid, none of them is defined.
+
+        Args:
+            formulas: Formula name -> expression string
+
+        Returns:
+            RecalculationResult for the formulas and their dependents
+
+        Raises:
+            VariableError: If a name is invalid or already an input
+            SyntaxError: If an expression has syntax errors
+            ValidationError: If the formulas would create a circular reference
+        """
+        compiled = {}
+        for name, expression in formulas.items():
+            self._check_name(name)
+            if name in self.inputs:
+                raise VariableError(f"'{name}' is an input variable, not a formula")
+            compiled[name] = self.manager.compile(expression)
+
+        previous = {name: (self.formulas[name], self._compiled[name])
+                    for name in formulas if name in self.formulas}
+        try:
+            for name, expression in formulas.items():
+                self._register(name, expression, compiled[name])
+            for name in formulas:
+                cycle = self._find_cycle(name)
+                if cycle:
+                    raise ValidationError(f"Circular reference: {' -> '.join(cycle)}")
+        except ValidationError:
+            for name in formulas:
+                self._unregister(name)
+            for name, (expression, old) in previous.items():
+                self._register(name, expression, old)
+            raise
+
+        return self._recalculate(formulas)
+
+    def remove(self, name: str) -> RecalculationResult:
+        """
+        Remove a formula and recompute the formulas that referred to it.
+
+        Args:
+            name: Formula name
+
+        Returns:
+            RecalculationResult for the former dependents
+
+        Raises:
+            KeyError: If no formula has that name
+        """
+        if name not in self.formulas:
+            raise KeyError(f"Formula '{name}' not found")
+
+        self._unregister(name)
+        self._results.pop(name, None)
+        self.errors.pop(name, None)
+        return self._recalculate(self._dependents.get(name, ()))
+
+    def set_variable(self, name: str, value: float) -> RecalculationResult:
+        """
+        Set an input value and recompute only the formulas downstream of it.
+
+        Args:
+            name: Input variable name
+            value: New value
+
+        Returns:
+            RecalculationResult for the update
+
+        Raises:
+            VariableError: If the name belongs to a formula
+            TypeError: If value is not numeric
+        """
+        return self.set_variables({name: value})
+
+    def set_variables(self, values: Dict[str, float]) -> RecalculationResult:
+        """
+        Set several inputs and recompute their downstream formulas in one pass.
+
+        A formula that depends on several of the inputs is recomputed once.
+
+        Args:
+            values: Input variable name -> new value
+
+        Returns:
+            RecalculationResult for the update
+
+        Raises:
+            VariableError: If a name belongs to a formula
+            TypeError: If a value is not numeric
+        """
+        for name, value in values.items():
+            self._check_name(name)
+            if name in self.formulas:
+                raise VariableError(f"'{name}' is a formula; redefine it instead")
+            if not isinstance(value, (int, float)):
+                raise TypeError(f"Variable value must be numeric, got {type(value)}")
+
+        seeds = set()
+        for name, value in values.items():
+            if name not in self.inputs or self.inputs[name] != value:
+                seeds.update(self._dependents.get(name, ()))
+            self.inputs[name] = value
+        return self._recalculate(seeds)
+
+    def recalculate_all(self) -> RecalculationResult:
+        """Recompute every formula, e.g. after the manager's variables changed."""
+        return self._recalculate(self.formulas)
+
+    def _refresh(self) -> None:
+        """Recompute everything if the manager's functions or constants changed."""
+        if self._compile_generation != self.manager.compile_generation:
+            self.recalculate_all()
+
+    def get(self, name: str) -> float:
+        """
+        Get the current value of a formula or input.
+
+        Raises:
+            EvaluationError: If the formula failed to evaluate
+            VariableError: If nothing has that name
+        """
+        self._refresh()
+        if name in self.errors:
+            raise EvaluationError(self.errors[name])
+        if name in self._results:
+            return self._results[name]
+        if name in self.inputs:
+            return self.inputs[name]
+        raise VariableError(f"Undefined variable: {name}")
+
+    def __getitem__(self, name: str) -> float:
+        return self.get(name)
+
+    def get_values(self) -> Dict[str, float]:
+        """Get the value of every formula that evaluated successfully."""
+        self._refresh()
+        return dict(self._results)
+
+    def get_dependencies(self, name: str) -> Set[str]:
+        """Get the names a formula refers to directly."""
+        return set(self._dependencies.get(name, ()))
+
+    def get_dependents(self, name: str) -> Set[str]:
+        """Get the formulas that refer to a name directly."""
+        return set(self._dependents.get(name, ()))
+
+    def _check_name(self, name: str) -> None:
+        """Reject names that could never be referenced as a variable."""
+        if not isinstance(name, str) or not name.isidentifier():
+            raise VariableError(f"Invalid name: {name!r}")
+        if name in Tokenizer.CONSTANTS or name in self.manager.context.functions:
+            raise VariableError(f"'{name}' is a reserved constant or function name")
+
+    def _register(self, name: str, expression: str,
+                  compiled: Union[CompiledExpression, _CompileFailure]) -> None:
+        """Add a formula to the graph, replacing any previous definition."""
+        self._unregister(name)
+        self.formulas[name] = expression
+        self._compiled[name] = compiled
+        self._dependencies[name] = compiled.variables
+        for dependency in compiled.variables:
+            self._dependents.setdefault(dependency, set()).add(name)
+        self._ranks = None
+
+    def _unregister(self, name: str) -> None:
+        """Remove a formula's edges from the graph; its dependents keep theirs."""
+        for dependency in self._dependencies.pop(name, ()):
+            dependents = self._dependents.get(dependency)
+            if dependents is not None:
+                dependents.discard(name)
+                if not dependents:
+                    del self._dependents[dependency]
+        self.formulas.pop(name, None)
+        self._compiled.pop(name, None)
+        self._ranks = None
+
+    def _find_cycle(self, start: str) -> Optional[List[str]]:
+        """Return a dependency path from start back to itself, if one exists."""
+        parents: Dict[str, str] = {}
+        stack = [start]
+        while stack:
+            current = stack.pop()
+            for dependency in self._dependencies.get(current, ()):
+                if dependency == start:
+                    chain = [current]
+                    while chain[-1] != start:
+                        chain.append(parents[chain[-1]])
+                    return chain[::-1] + [start]
+                if dependency in self._dependencies and dependency not in parents:
+                    parents[dependency] = current
+                    stack.append(dependency)
+        return None
+
+    def _topological_ranks(self) -> Dict[str, int]:
+        """Number the formulas so that every formula follows its dependencies."""
+        if self._ranks is not None:
+            return self._ranks
+
+        pending = {name: sum(1 for dependency in dependencies if dependency in self.formulas)
+                   for name, dependencies in self._dependencies.items()}
+        ready = [name for name, count in pending.items() if count == 0]
+        ranks: Dict[str, int] = {}
+        while ready:
+            name = ready.pop()
+            ranks[name] = len(ranks)
+            for dependent in self._dependents.get(name, ()):
+                pending[dependent] -= 1
+                if pending[dependent] == 0:
+                    ready.append(dependent)
+
+        self._ranks = ranks
+        return ranks
+
+    def _recalculate(self, seeds: Iterable[str]) -> RecalculationResult:
+        """
+        Recompute the seed formulas and, where a value changed, their dependents.
+
+        Formulas are taken from a heap ordered by topological rank, so each
+        one is recomputed at most once and only after all its dependencies.
+        """
+        start_time = time.time()
+        if self._compile_generation != self.manager.compile_generation:
+            self._recompile()
+            seeds = self.formulas
+        ranks = self._topological_ranks()
+        heap = [(ranks[name], name) for name in set(seeds) if name in ranks]
+        heapq.heapify(heap)
+        queued = {name for _, name in heap}
+        result = RecalculationResult()
+
+        while heap:
+            _, name = heapq.heappop(heap)
+            result.recalculated.append(name)
+            if not self._evaluate(name):
+                continue
+            result.changed.append(name)
+            for dependent in self._dependents.get(name, ()):
+                if dependent not in queued:
+                    queued.add(dependent)
+                    heapq.heappush(heap, (ranks[dependent], dependent))
+
+        result.errors = {name: self.errors[name] for name in result.recalculated if name in self.errors}
+        result.execution_time = time.time() - start_time
+        self.last_update = result
+        return result
+
+    def _recompile(self) -> None:
+        """Recompile every formula against the manager's current functions and constants."""
+        self._compile_generation = self.manager.compile_generation
+        for name, expression in self.formulas.items():
+            try:
+                self._compiled[name] = self.manager.compile(expression)
+            except EvaluationError as e:
+                self._compiled[name] = _CompileFailure(self._dependencies[name], str(e))
+
+    def _evaluate(self, name: str) -> bool:
+        """Evaluate one formula from its dependencies' values; True if it changed."""
+        variables = {}
+        error = None
+        for dependency in self._dependencies[name]:
+            if dependency in self.errors:
+                error = f"Depends on '{dependency}', which has an error"
+                break
+            if dependency in self._results:
+                variables[dependency] = self._results[dependency]
+            elif dependency in self.inputs:
+                variables[dependency] = self.inputs[dependency]
+            # Anything else falls back to the manager's variables and constants
+
+        if error is None:
+            try:
+                value = self._compiled[name](**variables)
+            except EvaluationError as e:
+                error = str(e)
+
+        if error is not None:
+            changed = self.errors.get(name) != error
+            self.errors[name] = error
+            self._results.pop(name, None)
+            return changed
+
+        previous_error = self.errors.pop(name, None)
+        previous = self._results.get(name)
+        self._results[name] = value
+        if previous_error is not None or previous is None:
+            return True
+        # NaN never equals itself, but a NaN that stays NaN has not changed
+        return previous != value and (previous == previous or value == value)
+
+    def __len__(self) -> int:
+        return len(self.formulas)
+
+    def __str__(self) -> str:
+        """String representation of the workbook."""
+        return (f"Workbook(formulas={len(self.formulas)}, inputs={len(self.inputs)}, "
+                f"errors={len(self.errors)})")
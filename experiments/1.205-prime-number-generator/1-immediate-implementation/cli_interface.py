@@ -8,6 +8,7 @@ offering a user-friendly menu system for all available functionality.
 import sys
 import os
 from typing import List, Optional, Any
+import number_theory
 from prime_generator import PrimeGenerator, timing_decorator
 
 
@@ -116,13 +117,15 @@ class PrimeGeneratorCLI:
 
         print("\nChoose method:")
         print("1. Basic trial division")
-        print("2. Optimized algorithm (default)")
+        print("2. Optimized trial division")
         print("3. Cached method")
+        print("4. Miller-Rabin (default)")
 
-        method_choice = self.get_user_input("Select method (1-3) [2]: ", str)
+        method_choice = self.get_user_input("Select method (1-4) [4]: ", str)
 
-        method_map = {'1': 'basic', '2': 'optimized', '3': 'cached', '': 'optimized'}
-        method = method_map.get(method_choice, 'optimized')
+        method_map = {'1': 'basic', '2': 'optimized', '3': 'cached', '4': 'miller_rabin',
+                      '': 'miller_rabin'}
+        method = method_map.get(method_choice, 'miller_rabin')
 
         @timing_decorator
         def check_with_timing():
@@ -305,11 +308,11 @@ class PrimeGeneratorCLI:
         print("─" * 40)
         print("Mersenne primes have the form 2^p - 1 where p is prime")
 
-        p = self.get_user_input("Enter exponent p: ", int, min_value=2, max_value=50)
+        p = self.get_user_input("Enter exponent p: ", int, min_value=2, max_value=100000)
         if p is None:
             return
 
-        if p > 20:
+        if p > 10000:
             print("Warning: Large exponents may take significant time to compute.")
             confirm = self.get_user_input("Continue? (y/n): ", str)
             if not confirm or not confirm.lower().startswith('y'):
@@ -320,12 +323,13 @@ class PrimeGeneratorCLI:
             return self.generator.is_mersenne_prime(p)
 
         print(f"\nChecking if 2^{p} - 1 is a Mersenne prime...")
-        mersenne_number = (2 ** p) - 1
-        print(f"Mersenne candidate: {mersenne_number}")
+        digits = number_theory.mersenne_digits(p)
+        shown = (2 ** p) - 1 if digits <= 60 else f"({digits}-digit number)"
+        print(f"Mersenne candidate: {shown}")
 
         is_mersenne = check_mersenne()
 
-        result = f"2^{p} - 1 = {mersenne_number} is {'a Mersenne prime' if is_mersenne else 'not a Mersenne prime'}"
+        result = f"2^{p} - 1 = {shown} is {'a Mersenne prime' if is_mersenne else 'not a Mersenne prime'}"
         print(f"\nResult: {result}")
 
         self.log_operation(f"Mersenne check: 2^{p} - 1", result)
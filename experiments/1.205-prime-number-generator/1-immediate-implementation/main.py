@@ -13,11 +13,13 @@ Usage:
     python main.py --first 10               # First 10 primes
     python main.py --factorize 60           # Prime factorization of 60
     python main.py --benchmark 1000         # Benchmark algorithms up to 1000
+    python main.py --range 1000 2000        # Primes between 1000 and 2000
 """
 
 import sys
 import argparse
 from typing import List, Optional
+import number_theory
 from prime_generator import PrimeGenerator, timing_decorator
 from cli_interface import PrimeGeneratorCLI
 
@@ -48,6 +50,8 @@ Examples:
   %(prog)s --mersenne 13          Check if 2^13-1 is Mersenne prime
   %(prog)s --benchmark 1000       Benchmark algorithms up to 1000
   %(prog)s --batch 2,3,4,17,25    Check multiple numbers for primality
+  %(prog)s --range 1000000000000 1000100000000 --workers 4 --format count
+                                  Sieve a range with 4 worker processes
 
 For more features and educational content, run without arguments
 to enter interactive mode.
@@ -107,11 +111,16 @@ to enter interactive mode.
             help='Check multiple numbers (comma-separated) for primality'
         )
 
+        group.add_argument(
+            '--range', type=int, nargs=2, metavar=('START', 'END'),
+            help='Generate all prime numbers between START and END'
+        )
+
         # Optional parameters
         parser.add_argument(
-            '--method', choices=['basic', 'optimized', 'sieve', 'cached'],
-            default='optimized',
-            help='Algorithm method to use (default: optimized)'
+            '--method', choices=['miller_rabin', 'basic', 'optimized', 'sieve', 'cached'],
+            default='miller_rabin',
+            help='Algorithm method to use (default: miller_rabin)'
         )
 
         parser.add_argument(
@@ -120,6 +129,12 @@ to enter interactive mode.
             help='Output format for prime lists (default: list)'
         )
 
+        parser.add_argument(
+            '--workers', type=int, default=1, metavar='N',
+            help='Worker processes for --range; with --benchmark, also time '
+                 'a parallel range sieve (default: 1)'
+        )
+
         parser.add_argument(
             '--timing', action='store_true',
             help='Show execution timing information'
@@ -193,6 +208,19 @@ to enter interactive mode.
 
         self.format_primes_output(primes, format_type, verbose)
 
+    def handle_range(self, start: int, end: int, workers: int, format_type: str,
+                     timing: bool, verbose: bool):
+        """Handle prime generation within a range."""
+        if timing:
+            @timing_decorator
+            def generate_with_timing():
+                return self.generator.generate_primes_in_range(start, end, workers)
+            primes = generate_with_timing()
+        else:
+            primes = self.generator.generate_primes_in_range(start, end, workers)
+
+        self.format_primes_output(primes, format_type, verbose)
+
     def handle_first_n(self, count: int, format_type: str, timing: bool, verbose: bool):
         """Handle generating first N primes."""
         if timing:
@@ -294,23 +322,26 @@ to enter interactive mode.
             print(f"{p} is not prime, so 2^{p}-1 cannot be a Mersenne prime")
             return
 
-        mersenne_number = (2 ** p) - 1
+        digits = number_theory.mersenne_digits(p)
 
         if timing:
             @timing_decorator
             def check_with_timing():
-                return self.generator.is_prime(mersenne_number)
+                return self.generator.is_mersenne_prime(p)
             is_prime = check_with_timing()
         else:
-            is_prime = self.generator.is_prime(mersenne_number)
+            is_prime = self.generator.is_mersenne_prime(p)
 
-        print(f"2^{p} - 1 = {mersenne_number}")
+        if digits <= 60:
+            print(f"2^{p} - 1 = {(2 ** p) - 1}")
+        else:
+            print(f"2^{p} - 1 ({digits} digits)")
         print(f"Result: {'Mersenne prime' if is_prime else 'Not a Mersenne prime'}")
 
         if verbose:
-            print(f"Number of digits: {len(str(mersenne_number))}")
+            print(f"Number of digits: {digits}")
 
-    def handle_benchmark(self, limit: int, verbose: bool):
+    def handle_benchmark(self, limit: int, verbose: bool, workers: int = 1):
         """Handle performance benchmarking."""
         print(f"Benchmarking prime generation methods up to {limit}...")
 
@@ -332,6 +363,18 @@ to enter interactive mode.
             speedup = slowest[1]['time'] / fastest[1]['time']
             print(f"Speedup: {speedup:.1f}x faster")
 
+        if workers > 1:
+            print(f"\nParallel range sieve up to {limit}:")
+            print("-" * 50)
+            try:
+                parallel = self.generator.benchmark_parallel_range(0, limit, workers)
+            except ValueError as e:
+                print(f"Skipped: {e}")
+                return
+            for count, data in parallel.items():
+                print(f"{count:3d} worker(s): {data['time']:.4f}s "
+                      f"({data['count']} primes, {data['speedup']:.2f}x)")
+
     def handle_batch(self, numbers_str: str, method: str, verbose: bool):
         """Handle batch prime checking."""
         try:
@@ -396,11 +439,15 @@ to enter interactive mode.
                 self.handle_mersenne(args.mersenne, args.timing, args.verbose)
 
             elif args.benchmark is not None:
-                self.handle_benchmark(args.benchmark, args.verbose)
+                self.handle_benchmark(args.benchmark, args.verbose, args.workers)
 
             elif args.batch is not None:
                 self.handle_batch(args.batch, args.method, args.verbose)
 
+            elif args.range is not None:
+                self.handle_range(args.range[0], args.range[1], args.workers,
+                                  args.format, args.timing, args.verbose)
+
         except KeyboardInterrupt:
             print("\nOperation interrupted by user.")
             sys.exit(1)
@@ -429,7 +476,8 @@ to enter interactive mode.
             args.gaps is not None,
             args.mersenne is not None,
             args.benchmark is not None,
-            args.batch is not None
+            args.batch is not None,
+            args.range is not None
         ])
 
         if has_args:
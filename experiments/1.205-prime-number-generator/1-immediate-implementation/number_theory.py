@@ -0,0 +1,375 @@
+"""
+Number Theory Engine
+
+Fast primality testing and factorization for arbitrarily large integers,
+using only Python's standard library.
+
+Features:
+- Segmented odd-only Sieve of Eratosthenes, shared by every sieve in
+  prime_generator (whole ranges, parallel chunks and the small-prime table)
+- Small-prime wheel prefilter (trial division by the primes below 1000)
+- Deterministic Miller-Rabin for every n < 2^64
+- Baillie-PSW (strong base-2 + strong Lucas) probable-prime test above 2^64
+- Pollard-rho factorization with Brent's cycle detection
+- Lucas-Lehmer test for Mersenne numbers 2^p - 1
+"""
+
+import math
+import random
+from itertools import compress
+from typing import Iterator, List, Optional, Tuple
+
+
+# Odd numbers per segment of the range sieve (256 KB, about one L2 cache)
+SEGMENT_SIZE = 1 << 18
+
+
+def odd_primes_up_to(limit: int) -> List[int]:
+    """Odd primes up to limit, from an odd-only bytearray sieve."""
+    if limit < 3:
+        return []
+    size = (limit - 1) // 2 + 1  # index i stands for 2i + 1
+    flags = bytearray(b'\x01') * size
+    flags[0] = 0
+    for i in range(1, (math.isqrt(limit) - 1) // 2 + 1):
+        if flags[i]:
+            p = 2 * i + 1
+            first = (p * p - 1) // 2
+            flags[first::p] = bytes(len(range(first, size, p)))
+    return list(compress(range(1, 2 * size, 2), flags))
+
+
+def primes_in_range(start: int, end: int,
+                    base_primes: Optional[List[int]] = None) -> Iterator[int]:
+    """
+    Yield the primes in [start, end] with a segmented odd-only sieve.
+
+    base_primes must contain every odd prime up to sqrt(end) in ascending
+    order; larger entries are harmless. They are sieved on demand when
+    omitted.
+    """
+    if end < 2:
+        return
+    if base_primes is None:
+        base_primes = odd_primes_up_to(math.isqrt(end))
+    if start <= 2:
+        yield 2
+
+    low = max(start, 3) | 1
+    root = math.isqrt(end)
+    primes = [p for p in base_primes if p <= root]
+
+    # Position of the next odd multiple of each prime, relative to low
+    offsets = []
+    for p in primes:
+        first = max(p * p, (low + p - 1) // p * p)
+        if first % 2 == 0:
+            first += p
+        offsets.append((first - low) // 2)
+
+    while low <= end:
+        size = min(SEGMENT_SIZE, (end - low) // 2 + 1)
+        segment = bytearray(b'\x01') * size
+        for j, p in enumerate(primes):
+            index = offsets[j]
+            if index < size:
+                count = (size - 1 - index) // p + 1
+                segment[index::p] = bytes(count)
+                index += count * p
+            offsets[j] = index - size
+        if low == 1:
+            segment[0] = 0
+        yield from compress(range(low, low + 2 * size, 2), segment)
+        low += 2 * size
+
+
+SMALL_PRIMES = list(primes_in_range(0, 999))
+_SMALL_PRIME_SET = frozenset(SMALL_PRIMES)
+_SMALL_PRIMORIAL = math.prod(SMALL_PRIMES)
+_SMALL_LIMIT_SQUARED = 1000 * 1000
+
+# Jim Sinclair's bases: deterministic for every n < 2^64
+_MR_BASES_64 = (2, 325, 9375, 28178, 450775, 9780504, 1795265022)
+_UINT64_LIMIT = 1 << 64
+
+# Residues mod 30 coprime to 2, 3 and 5: the only candidates on a 2-3-5 wheel
+_WHEEL_30 = (1, 7, 11, 13, 17, 19, 23, 29)
+
+
+def _strong_probable_prime(n: int, base: int, d: int, s: int) -> bool:
+    """Strong probable-prime test of odd n to one base, with n - 1 = d * 2^s."""
+    x = pow(base, d, n)
+    if x == 1 or x == n - 1:
+        return True
+    for _ in range(s - 1):
+        x = x * x % n
+        if x == n - 1:
+            return True
+    return False
+
+
+def _strong_lucas_probable_prime(n: int) -> bool:
+    """
+    Strong Lucas probable-prime test with Selfridge's parameters.
+
+    n must be odd, greater than 2 and not a perfect square.
+    """
+    # Selfridge method A: first D in 5, -7, 9, -11, ... with Jacobi(D/n) = -1
+    D = 5
+    while True:
+        j = jacobi(D, n)
+        if j == -1:
+            break
+        if j == 0 and abs(D) != n:
+            return False
+        D = -D - 2 if D > 0 else -D + 2
+    P, Q = 1, (1 - D) // 4
+
+    # n + 1 = d * 2^s with d odd
+    d, s = n + 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+
+    # Binary ladder for U_d, V_d, Q^d (mod n)
+    U, V, Qk = 1, P, Q % n
+    inv2 = (n + 1) // 2
+    for bit in bin(d)[3:]:
+        U, V = U * V % n, (V * V - 2 * Qk) % n
+        Qk = Qk * Qk % n
+        if bit == '1':
+            U, V = (P * U + V) * inv2 % n, (D * U + P * V) * inv2 % n
+            Qk = Qk * Q % n
+
+    if U == 0 or V == 0:
+        return True
+    for _ in range(s - 1):
+        V = (V * V - 2 * Qk) % n
+        if V == 0:
+            return True
+        Qk = Qk * Qk % n
+    return False
+
+
+def jacobi(a: int, n: int) -> int:
+    """
+    Jacobi symbol (a/n) for odd positive n.
+
+    Returns:
+        -1, 0 or 1
+    """
+    a %= n
+    result = 1
+    while a:
+        while a % 2 == 0:
+            a //= 2
+            if n % 8 in (3, 5):
+                result = -result
+        a, n = n, a
+        if a % 4 == 3 and n % 4 == 3:
+            result = -result
+        a %= n
+    return result if n == 1 else 0
+
+
+def is_prime(n: int) -> bool:
+    """
+    Test n for primality.
+
+    Small factors are removed with one gcd against the product of the primes
+    below 1000. Survivors below 2^64 get the deterministic 7-base
+    Miller-Rabin test, so the answer is exact; larger survivors get the
+    Baillie-PSW test, for which no counterexample is known.
+
+    Args:
+        n: Number to test
+
+    Returns:
+        True if n is prime (or, above 2^64, a BPSW probable prime)
+    """
+    if n < 2:
+        return False
+    if n in _SMALL_PRIME_SET:
+        return True
+    if math.gcd(n, _SMALL_PRIMORIAL) != 1:
+        return False
+    if n < _SMALL_LIMIT_SQUARED:
+        return True
+
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+
+    if n < _UINT64_LIMIT:
+        return all(_strong_probable_prime(n, base % n, d, s)
+                   for base in _MR_BASES_64 if base % n)
+
+    if not _strong_probable_prime(n, 2, d, s):
+        return False
+    if math.isqrt(n) ** 2 == n:
+        return False
+    return _strong_lucas_probable_prime(n)
+
+
+def next_prime(n: int) -> int:
+    """Smallest prime greater than n, stepping over a mod-30 wheel."""
+    if n < 2:
+        return 2
+    for p in (3, 5, 7):
+        if n < p:
+            return p
+
+    base = n - n % 30
+    index = 0
+    while True:
+        candidate = base + _WHEEL_30[index]
+        if candidate > n and is_prime(candidate):
+            return candidate
+        index += 1
+        if index == len(_WHEEL_30):
+            index = 0
+            base += 30
+
+
+def previous_prime(n: int) -> Optional[int]:
+    """Largest prime less than n, or None if n <= 2."""
+    if n <= 2:
+        return None
+    for p in (7, 5, 3, 2):
+        if n > p and n <= 11:
+            return p
+
+    base = n - n % 30
+    index = len(_WHEEL_30) - 1
+    while True:
+        candidate = base + _WHEEL_30[index]
+        if candidate < n and is_prime(candidate):
+            return candidate
+        index -= 1
+        if index < 0:
+            index = len(_WHEEL_30) - 1
+            base -= 30
+
+
+def pollard_brent(n: int, rng: Optional[random.Random] = None) -> int:
+    """
+    Find a non-trivial factor of an odd composite n.
+
+    Pollard's rho with Brent's cycle detection, batching gcds over blocks of
+    128 steps; a fresh random polynomial is tried whenever a run fails.
+
+    Args:
+        n: Odd composite number
+        rng: Random source for the polynomial constants
+
+    Returns:
+        A divisor d with 1 < d < n
+    """
+    if n % 2 == 0:
+        return 2
+    rng = rng or random.Random(n)
+    block = 128
+
+    while True:
+        y, c = rng.randrange(1, n), rng.randrange(1, n)
+        g = r = q = 1
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(block, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += block
+            r *= 2
+
+        if g == n:
+            # The batched product overshot: replay the block one step at a time
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = math.gcd(abs(x - ys), n)
+
+        if g != n:
+            return g
+
+
+def factorize(n: int) -> List[Tuple[int, int]]:
+    """
+    Prime factorization of n.
+
+    Args:
+        n: Number to factorize
+
+    Returns:
+        Sorted list of (prime, power) tuples; empty for n < 2
+    """
+    if n < 2:
+        return []
+
+    counts = {}
+    for p in SMALL_PRIMES:
+        if p * p > n:
+            break
+        while n % p == 0:
+            counts[p] = counts.get(p, 0) + 1
+            n //= p
+
+    stack = [n] if n > 1 else []
+    while stack:
+        m = stack.pop()
+        if is_prime(m):
+            counts[m] = counts.get(m, 0) + 1
+            continue
+        root = math.isqrt(m)
+        if root * root == m:
+            stack.extend((root, root))
+            continue
+        d = pollard_brent(m)
+        stack.extend((d, m // d))
+
+    return sorted(counts.items())
+
+
+def lucas_lehmer(p: int) -> bool:
+    """
+    Lucas-Lehmer test: is the Mersenne number 2^p - 1 prime?
+
+    Reduction mod 2^p - 1 uses shifts and masks instead of division.
+
+    Args:
+        p: Exponent, which must itself be prime for the test to apply
+
+    Returns:
+        True if 2^p - 1 is prime
+    """
+    if p == 2:
+        return True
+    if p < 2 or not is_prime(p):
+        return False
+
+    m = (1 << p) - 1
+    s = 4
+    for _ in range(p - 2):
+        s = s * s + m - 2  # + m keeps it non-negative without changing s mod m
+        while s > m:
+            s = (s & m) + (s >> p)
+    return s in (0, m)
+
+
+def mersenne_digits(p: int) -> int:
+    """
+    Number of decimal digits of 2^p - 1, without building the number.
+
+    2^p is never a power of ten, so 2^p - 1 has as many digits as 2^p.
+    Converting a huge int to str is quadratic and, since Python 3.11,
+    refused beyond 4300 digits.
+    """
+    if p < 1:
+        return 1
+    return math.floor(p * math.log10(2)) + 1
@@ -5,17 +5,52 @@ This module provides comprehensive prime number generation and analysis function
 using only Python's standard library.
 
 Features:
-- Multiple prime checking algorithms
+- Multiple prime checking algorithms, including deterministic Miller-Rabin
 - Prime generation with different strategies
 - Sieve of Eratosthenes implementation
-- Prime factorization
+- Segmented range sieve, optionally spread over worker processes
+- Prime factorization (Pollard-rho/Brent) and Lucas-Lehmer Mersenne testing
 - Performance timing utilities
 """
 
 import time
 import math
+import os
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
 from typing import List, Iterator, Tuple, Optional
 
+import number_theory
+
+
+# Integers handed to a worker process per task in parallel mode
+CHUNK_SPAN = 2 * number_theory.SEGMENT_SIZE * 16
+
+# Smallest task the parallel benchmark hands a worker: one full sieve segment
+MIN_BENCHMARK_CHUNK_SPAN = 2 * number_theory.SEGMENT_SIZE
+
+
+# Base primes of the current parallel run, loaded once per worker process
+_worker_base_primes: List[int] = []
+
+
+def _init_range_worker(shm_name: str, count: int):
+    """Read the shared base-prime table into this worker."""
+    global _worker_base_primes
+    block = shared_memory.SharedMemory(name=shm_name)
+    try:
+        with block.buf[:count * 8] as raw, raw.cast('Q') as view:
+            _worker_base_primes = view.tolist()
+    finally:
+        block.close()
+
+
+def _sieve_range_chunk(start: int, end: int) -> List[int]:
+    """Worker task: sieve one chunk of the range."""
+    return list(number_theory.primes_in_range(start, end, _worker_base_primes))
+
 
 class PrimeGenerator:
     """
@@ -27,13 +62,15 @@ class PrimeGenerator:
         self._cache = {2: True, 3: True}  # Cache for is_prime results
         self._known_primes = [2, 3]  # Cache for generated primes
 
-    def is_prime(self, n: int, method: str = "optimized") -> bool:
+    def is_prime(self, n: int, method: str = "miller_rabin") -> bool:
         """
         Check if a number is prime using the specified method.
 
         Args:
             n: Number to check
-            method: Algorithm to use ("basic", "optimized", or "cached")
+            method: Algorithm to use ("miller_rabin", "basic", "optimized",
+                or "cached"); "miller_rabin" is exact below 2^64 and a
+                Baillie-PSW probable-prime test above
 
         Returns:
             True if n is prime, False otherwise
@@ -44,7 +81,9 @@ class PrimeGenerator:
         if n in self._cache:
             return self._cache[n]
 
-        if method == "basic":
+        if method == "miller_rabin":
+            result = number_theory.is_prime(n)
+        elif method == "basic":
             result = self._is_prime_basic(n)
         elif method == "optimized":
             result = self._is_prime_optimized(n)
@@ -117,7 +156,8 @@ class PrimeGenerator:
 
         Args:
             limit: Upper limit (inclusive)
-            method: Algorithm to use ("sieve", "trial", or "optimized")
+            method: Algorithm to use ("sieve", "trial", "optimized", or
+                "miller_rabin")
 
         Returns:
             List of prime numbers up to the limit
@@ -131,6 +171,8 @@ class PrimeGenerator:
             return [n for n in range(2, limit + 1) if self.is_prime(n, "basic")]
         elif method == "optimized":
             return [n for n in range(2, limit + 1) if self.is_prime(n, "optimized")]
+        elif method == "miller_rabin":
+            return [n for n in range(2, limit + 1) if number_theory.is_prime(n)]
         else:
             raise ValueError(f"Unknown method: {method}")
 
@@ -144,23 +186,76 @@ class PrimeGenerator:
         Returns:
             List of prime numbers up to the limit
         """
-        if limit < 2:
-            return []
+        return list(number_theory.primes_in_range(0, limit))
 
-        # Create boolean array and initialize all entries as True
-        is_prime = [True] * (limit + 1)
-        is_prime[0] = is_prime[1] = False
+    def generate_primes_in_range(self, start: int, end: int, workers: int = 1) -> List[int]:
+        """
+        Generate all prime numbers in [start, end].
+
+        Only the window itself is sieved, so ranges far from zero are cheap.
+
+        Args:
+            start: Range start (inclusive)
+            end: Range end (inclusive)
+            workers: Number of worker processes to sieve with
+
+        Returns:
+            List of prime numbers in the range
+        """
+        return list(self.iter_primes_in_range(start, end, workers))
+
+    def iter_primes_in_range(self, start: int, end: int, workers: int = 1) -> Iterator[int]:
+        """
+        Yield the primes in [start, end] in ascending order.
 
-        p = 2
-        while p * p <= limit:
-            if is_prime[p]:
-                # Mark all multiples of p as not prime
-                for i in range(p * p, limit + 1, p):
-                    is_prime[i] = False
-            p += 1
+        With workers > 1 the range is cut into chunks that are sieved in a
+        process pool. The base primes up to sqrt(end) are sieved once and
+        shared with the workers through shared memory; chunks are yielded in
+        order, with at most two per worker in flight.
 
-        # Collect all prime numbers
-        return [i for i in range(2, limit + 1) if is_prime[i]]
+        Args:
+            start: Range start (inclusive)
+            end: Range end (inclusive)
+            workers: Number of worker processes to sieve with
+
+        Returns:
+            Iterator over the prime numbers in the range
+        """
+        if start > end:
+            raise ValueError(f"Start ({start}) must be <= end ({end})")
+        if workers < 1:
+            raise ValueError(f"Workers must be at least 1, got {workers}")
+
+        start = max(start, 0)
+        if workers == 1 or end - start + 1 < 2 * CHUNK_SPAN:
+            return number_theory.primes_in_range(start, end)
+        return self._iter_primes_parallel(start, end, workers)
+
+    def _iter_primes_parallel(self, start: int, end: int, workers: int,
+                              chunk_span: int = CHUNK_SPAN) -> Iterator[int]:
+        """Sieve [start, end] in a process pool and yield the chunks in order."""
+        base = array('Q', number_theory.odd_primes_up_to(math.isqrt(end)))
+        block = shared_memory.SharedMemory(create=True, size=max(1, len(base) * 8))
+        block.buf[:len(base) * 8] = base.tobytes()
+
+        try:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_range_worker,
+                                     initargs=(block.name, len(base))) as executor:
+                pending = deque()
+                try:
+                    for low in range(start, end + 1, chunk_span):
+                        high = min(low + chunk_span - 1, end)
+                        pending.append(executor.submit(_sieve_range_chunk, low, high))
+                        if len(pending) >= 2 * workers:
+                            yield from pending.popleft().result()
+                    while pending:
+                        yield from pending.popleft().result()
+                finally:
+                    for future in pending:
+                        future.cancel()
+        finally:
+            block.close()
+            block.unlink()
 
     def generate_first_n_primes(self, n: int) -> List[int]:
         """
@@ -179,7 +274,7 @@ class PrimeGenerator:
         candidate = 2
 
         while len(primes) < n:
-            if self.is_prime(candidate, "optimized"):
+            if self.is_prime(candidate):
                 primes.append(candidate)
             candidate += 1
 
@@ -189,31 +284,16 @@ class PrimeGenerator:
         """
         Find the prime factorization of a number.
 
+        Small factors are divided out by the primes below 1000; what remains
+        is split with Pollard-rho/Brent until every part passes is_prime.
+
         Args:
             n: Number to factorize
 
         Returns:
             List of (prime, power) tuples representing the factorization
         """
-        if n < 2:
-            return []
-
-        factors = []
-        d = 2
-
-        while d * d <= n:
-            power = 0
-            while n % d == 0:
-                power += 1
-                n //= d
-            if power > 0:
-                factors.append((d, power))
-            d += 1
-
-        if n > 1:
-            factors.append((n, 1))
-
-        return factors
+        return number_theory.factorize(n)
 
     def next_prime(self, n: int) -> int:
         """
@@ -225,10 +305,7 @@ class PrimeGenerator:
         Returns:
             Next prime number after n
         """
-        candidate = n + 1
-        while not self.is_prime(candidate, "optimized"):
-            candidate += 1
-        return candidate
+        return number_theory.next_prime(n)
 
     def previous_prime(self, n: int) -> Optional[int]:
         """
@@ -240,20 +317,15 @@ class PrimeGenerator:
         Returns:
             Previous prime number before n, or None if no such prime exists
         """
-        if n <= 2:
-            return None
-
-        candidate = n - 1
-        while candidate >= 2:
-            if self.is_prime(candidate, "optimized"):
-                return candidate
-            candidate -= 1
-        return None
+        return number_theory.previous_prime(n)
 
     def is_mersenne_prime(self, p: int) -> bool:
         """
         Check if 2^p - 1 is a Mersenne prime (where p is prime).
 
+        Uses the Lucas-Lehmer test, so exponents in the thousands take well
+        under a second.
+
         Args:
             p: Exponent to check
 
@@ -263,8 +335,7 @@ class PrimeGenerator:
         if not self.is_prime(p):
             return False
 
-        mersenne_candidate = (2 ** p) - 1
-        return self.is_prime(mersenne_candidate, "optimized")
+        return number_theory.lucas_lehmer(p)
 
     def prime_gaps(self, limit: int) -> List[Tuple[int, int, int]]:
         """
@@ -323,6 +394,55 @@ class PrimeGenerator:
 
         return results
 
+    def benchmark_parallel_range(self, start: int, end: int,
+                                 workers: Optional[int] = None) -> dict:
+        """
+        Time the range sieve with one process and with several.
+
+        iter_primes_in_range sieves ranges narrower than two chunks in
+        process, so the parallel run cuts the range into smaller chunks
+        (two per worker) to make sure it really goes through the pool.
+
+        Args:
+            start: Range start (inclusive)
+            end: Range end (inclusive)
+            workers: Worker processes for the parallel run (default: CPU count)
+
+        Returns:
+            Dictionary with timings per worker count and the speed-up
+
+        Raises:
+            ValueError: If the range is too small to split across the workers
+        """
+        workers = workers or os.cpu_count() or 1
+        if start > end:
+            raise ValueError(f"Start ({start}) must be <= end ({end})")
+        start = max(start, 0)
+        span = end - start + 1
+        chunk_span = min(CHUNK_SPAN, span // (2 * workers))
+        if workers > 1 and chunk_span < MIN_BENCHMARK_CHUNK_SPAN:
+            raise ValueError(f"Range of {span} integers is too small to benchmark {workers} workers; "
+                             f"use at least {2 * workers * MIN_BENCHMARK_CHUNK_SPAN}")
+        results = {}
+
+        for count in sorted({1, workers}):
+            start_time = time.perf_counter()
+            if count == 1:
+                primes = self.iter_primes_in_range(start, end)
+            else:
+                primes = self._iter_primes_parallel(start, end, count, chunk_span)
+            primes_found = sum(1 for _ in primes)
+            results[count] = {
+                "time": time.perf_counter() - start_time,
+                "count": primes_found
+            }
+
+        serial = results[1]["time"]
+        for data in results.values():
+            data["speedup"] = serial / data["time"] if data["time"] > 0 else 0.0
+
+        return results
+
 
 def timing_decorator(func):
     """Decorator to measure function execution time."""
@@ -0,0 +1,142 @@
+"""
+Tests for the number theory engine.
+"""
+
+import math
+import random
+
+import pytest
+
+import number_theory
+from number_theory import (
+    factorize, is_prime, lucas_lehmer, mersenne_digits, next_prime, odd_primes_up_to,
+    pollard_brent, previous_prime, primes_in_range
+)
+
+
+def _reference(n):
+    """Trial division, for checking small numbers."""
+    return n >= 2 and all(n % d for d in range(2, math.isqrt(n) + 1))
+
+
+class TestSieve:
+    """Test cases for the shared segmented sieve."""
+
+    def test_small_ranges(self):
+        """Test ranges around 0, 1 and 2 and the small-prime table."""
+        assert list(primes_in_range(0, 1)) == []
+        assert list(primes_in_range(0, 2)) == [2]
+        assert list(primes_in_range(1, 30)) == [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
+        assert list(primes_in_range(24, 28)) == []
+        assert odd_primes_up_to(2) == [] and odd_primes_up_to(13) == [3, 5, 7, 11, 13]
+        assert number_theory.SMALL_PRIMES == [n for n in range(1000) if _reference(n)]
+
+    def test_multi_segment_window(self):
+        """Test a window spanning several segments, far from zero."""
+        start = 10 ** 12
+        end = start + 2 * number_theory.SEGMENT_SIZE * 2 + 11
+        primes = list(primes_in_range(start, end))
+        assert primes[:3] == [p for p in range(start, start + 200) if is_prime(p)][:3]
+        sample = range(end - 3000, end + 1)
+        assert [p for p in primes if p >= sample[0]] == [p for p in sample if is_prime(p)]
+
+
+class TestIsPrime:
+    """Test cases for Miller-Rabin and Baillie-PSW."""
+
+    def test_matches_trial_division(self):
+        """Test every number below 20000, across the small-prime prefilter boundary."""
+        assert [n for n in range(20000) if is_prime(n)] == [n for n in range(20000) if _reference(n)]
+
+    @pytest.mark.parametrize('n', [
+        2047,                     # strong pseudoprime to base 2
+        3215031751,               # strong pseudoprime to bases 2, 3, 5, 7
+        3825123056546413051,      # strong pseudoprime to the first nine prime bases
+        318665857834031151167461,  # strong pseudoprime to every prime base below 41
+        561, 41041, 825265,       # Carmichael numbers
+    ])
+    def test_pseudoprimes_are_composite(self, n):
+        """Test numbers that fool weaker Miller-Rabin variants."""
+        assert not is_prime(n)
+
+    @pytest.mark.parametrize('n', [
+        2 ** 61 - 1,
+        2 ** 64 - 59,             # largest prime below 2^64
+        2 ** 64 + 13,             # smallest prime above 2^64, tested by BPSW
+        2 ** 89 - 1,
+        2 ** 127 - 1,
+        10 ** 30 + 57,
+    ])
+    def test_large_primes(self, n):
+        """Test primes on both sides of the deterministic 2^64 limit."""
+        assert is_prime(n)
+
+    def test_large_composites(self):
+        """Test semiprimes and squares above 2^64."""
+        p, q = 2 ** 61 - 1, 2 ** 89 - 1
+        assert not is_prime(p * q)
+        assert not is_prime(q * q)
+        assert not is_prime(2 ** 67 - 1)  # 193707721 * 761838257287
+
+    def test_adjacent_primes(self):
+        """Test next_prime and previous_prime around small and wheel-boundary values."""
+        assert [next_prime(n) for n in (-5, 0, 1, 2, 3, 7, 29, 89)] == [2, 2, 2, 3, 5, 11, 31, 97]
+        assert [previous_prime(n) for n in (2, 3, 4, 11, 12, 31, 97)] == [None, 2, 3, 7, 11, 29, 89]
+        assert next_prime(2 ** 64 - 59) == 2 ** 64 + 13
+        assert previous_prime(2 ** 64 + 13) == 2 ** 64 - 59
+
+
+class TestFactorization:
+    """Test cases for Pollard-Brent factorization."""
+
+    def test_pollard_brent_finds_a_factor(self):
+        """Test that every factor returned is non-trivial."""
+        for n in (8051, 10403, 600851475143, (2 ** 31 - 1) * (2 ** 61 - 1)):
+            d = pollard_brent(n, random.Random(1))
+            assert 1 < d < n and n % d == 0
+
+    @pytest.mark.parametrize('n', [
+        1, 2, 360, 9973, 2 ** 40, 3 ** 20 * 7,
+        600851475143,
+        (2 ** 31 - 1) * (2 ** 61 - 1),
+        1000003 ** 2,
+        2 ** 67 - 1,
+    ])
+    def test_factorize(self, n):
+        """Test that factors are prime, sorted and multiply back to n."""
+        factors = factorize(n)
+        assert [p for p, _ in factors] == sorted(p for p, _ in factors)
+        assert all(is_prime(p) for p, _ in factors)
+        assert math.prod(p ** k for p, k in factors) == n
+
+    def test_factorize_known(self):
+        """Test a few exact factorizations."""
+        assert factorize(0) == []
+        assert factorize(360) == [(2, 3), (3, 2), (5, 1)]
+        assert factorize(2 ** 67 - 1) == [(193707721, 1), (761838257287, 1)]
+
+
+class TestLucasLehmer:
+    """Test cases for the Mersenne prime test."""
+
+    def test_mersenne_exponents(self):
+        """Test the exponents of the Mersenne primes below 2^1300."""
+        exponents = [p for p in range(2, 1300) if lucas_lehmer(p)]
+        assert exponents == [2, 3, 5, 7, 13, 17, 19, 31, 61, 89, 107, 127, 521, 607, 1279]
+
+    def test_composite_exponent(self):
+        """Test that a composite exponent never gives a Mersenne prime."""
+        assert not lucas_lehmer(1)
+        assert not lucas_lehmer(11)  # prime exponent, 2047 = 23 * 89
+        assert not lucas_lehmer(15)
+
+    def test_agrees_with_is_prime(self):
+        """Test Lucas-Lehmer against BPSW for small prime exponents."""
+        for p in number_theory.SMALL_PRIMES[:40]:
+            assert lucas_lehmer(p) == is_prime(2 ** p - 1)
+
+    def test_mersenne_digits(self):
+        """Test digit counts without stringifying large numbers."""
+        assert [mersenne_digits(p) for p in (1, 2, 3, 4, 10, 127)] == [1, 1, 1, 2, 4, 39]
+        assert mersenne_digits(19937) == 6002
+        assert all(mersenne_digits(p) == len(str(2 ** p - 1)) for p in range(1, 2000))
@@ -0,0 +1,56 @@
+"""
+Tests for the multi-process range sieve and its --workers command-line path.
+"""
+
+import pytest
+
+import prime_generator
+from main import PrimeGeneratorApp
+from prime_generator import PrimeGenerator
+
+
+class TestParallelRange:
+    """Test cases for sieving a range in a process pool."""
+
+    @pytest.mark.parametrize('start, end', [(0, 200_000), (10 ** 9, 10 ** 9 + 150_001)])
+    def test_matches_serial_sieve(self, start, end):
+        """Test that two workers over several chunks yield the serial result, in order."""
+        generator = PrimeGenerator()
+        parallel = list(generator._iter_primes_parallel(start, end, 2, chunk_span=20_000))
+        assert parallel == generator.generate_primes_in_range(start, end)
+
+    def test_abandoned_iteration(self):
+        """Test that stopping early cancels the remaining chunks without hanging."""
+        primes = PrimeGenerator()._iter_primes_parallel(0, 10 ** 7, 2, chunk_span=50_000)
+        assert [next(primes) for _ in range(5)] == [2, 3, 5, 7, 11]
+        primes.close()
+
+    def test_workers_option(self, monkeypatch, capsys):
+        """Test --range with --workers goes through the pool and prints the serial count."""
+        calls = []
+        sieve = PrimeGenerator._iter_primes_parallel
+
+        def spy(self, start, end, workers, chunk_span=prime_generator.CHUNK_SPAN):
+            calls.append(workers)
+            return sieve(self, start, end, workers, 30_000)
+
+        # Small enough that a test-sized range counts as at least two chunks
+        monkeypatch.setattr(prime_generator, 'CHUNK_SPAN', 30_000)
+        monkeypatch.setattr(PrimeGenerator, '_iter_primes_parallel', spy)
+
+        app = PrimeGeneratorApp()
+        args = app.setup_argument_parser().parse_args(
+            ['--range', '1000000', '1100000', '--workers', '2', '--format', 'count'])
+        app.run_command_line(args)
+
+        expected = len(PrimeGenerator().generate_primes_in_range(1_000_000, 1_100_000))
+        assert calls == [2]
+        assert capsys.readouterr().out.strip() == f"Count: {expected}"
+
+    def test_invalid_arguments(self):
+        """Test that bad ranges and worker counts are rejected."""
+        generator = PrimeGenerator()
+        with pytest.raises(ValueError):
+            generator.generate_primes_in_range(10, 5, workers=2)
+        with pytest.raises(ValueError):
+            generator.generate_primes_in_range(0, 10, workers=0)
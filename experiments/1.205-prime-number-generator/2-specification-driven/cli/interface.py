@@ -19,7 +19,8 @@ try:
         AlgorithmComparator,
         BenchmarkRunner,
         format_performance_report,
-        format_comparison_report
+        format_comparison_report,
+        format_parallel_report
     )
     from ..utils import (
         format_number,
@@ -41,7 +42,8 @@ except ImportError:
         AlgorithmComparator,
         BenchmarkRunner,
         format_performance_report,
-        format_comparison_report
+        format_comparison_report,
+        format_parallel_report
     )
     from utils import (
         format_number,
@@ -82,6 +84,7 @@ Examples:
   %(prog)s generate --limit 100
   %(prog)s generate --count 50
   %(prog)s generate --range 100 200
+  %(prog)s generate --range 1000000000000 1000100000000 --workers 4
   %(prog)s validate 97
   %(prog)s validate 97 98 99 100
   %(prog)s benchmark --limit 10000
@@ -101,6 +104,8 @@ Examples:
 
         generate_parser.add_argument('--algorithm', choices=['auto', 'sieve', 'trial_division', 'optimized_trial'],
                                    default='auto', help='Algorithm to use')
+        generate_parser.add_argument('--workers', type=int, default=1,
+                                   help='Worker processes for sieve generation (default: 1)')
         generate_parser.add_argument('--format', choices=['list', 'json', 'csv'], default='list',
                                    help='Output format')
         generate_parser.add_argument('--output', help='Output file path')
@@ -127,6 +132,10 @@ Examples:
                                     help='Algorithms to compare')
         benchmark_parser.add_argument('--comprehensive', action='store_true',
                                     help='Run comprehensive benchmark suite')
+        benchmark_parser.add_argument('--workers', type=int,
+                                    help='Benchmark the parallel range sieve with 1..WORKERS processes')
+        benchmark_parser.add_argument('--start', type=int, default=0,
+                                    help='Range start for the parallel benchmark (default: 0)')
         benchmark_parser.add_argument('--output', help='Output file for results')
 
         # Algorithms command
@@ -186,13 +195,17 @@ Examples:
     def _handle_generate(self, args) -> int:
         """Handle the generate command."""
         try:
+            if args.workers < 1:
+                raise InvalidInputError(f"--workers must be at least 1, got {args.workers}")
+
             start_time = time.perf_counter()
 
             # Determine generation parameters
             if args.limit is not None:
                 if args.verbose:
                     print(f"Generating primes up to {format_number(args.limit)}...")
-                result = self.generator.generate_primes_up_to(args.limit, args.algorithm)
+                result = self.generator.generate_primes_up_to(args.limit, args.algorithm,
+                                                              workers=args.workers)
                 operation = f"Generated primes up to {format_number(args.limit)}"
 
             elif args.count is not None:
@@ -205,7 +218,8 @@ Examples:
                 start, end = args.range
                 if args.verbose:
                     print(f"Generating primes from {format_number(start)} to {format_number(end)}...")
-                result = self.generator.generate_primes_in_range(start, end, args.algorithm)
+                result = self.generator.generate_primes_in_range(start, end, args.algorithm,
+                                                                 workers=args.workers)
                 operation = f"Generated primes from {format_number(start)} to {format_number(end)}"
 
             end_time = time.perf_counter()
@@ -279,7 +293,20 @@ Examples:
     def _handle_benchmark(self, args) -> int:
         """Handle the benchmark command."""
         try:
-            if args.comprehensive:
+            if args.workers is not None:
+                print(f"Benchmarking parallel sieve from {format_number(args.start)} "
+                      f"to {format_number(args.limit)} with up to {args.workers} workers...")
+                worker_counts = [1]
+                while worker_counts[-1] * 2 < args.workers:
+                    worker_counts.append(worker_counts[-1] * 2)
+                worker_counts.append(args.workers)
+
+                results = self.benchmark_runner.run_parallel_benchmark(
+                    args.start, args.limit, worker_counts
+                )
+                output_content = format_parallel_report(results)
+
+            elif args.comprehensive:
                 print("Running comprehensive benchmark suite...")
                 algorithms = {
                     'sieve': lambda **kwargs: self.generator.generate_primes_up_to(algorithm='sieve', **kwargs),
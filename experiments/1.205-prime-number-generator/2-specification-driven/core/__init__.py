@@ -13,12 +13,15 @@ from .algorithms import (
     AlgorithmConfig
 )
 
+from .parallel import ParallelSieve
+
 from .validators import (
     PrimeValidator,
     BatchValidator,
     ValidationResult,
     quick_prime_check,
-    validate_prime_list
+    validate_prime_list,
+    is_prime_miller_rabin
 )
 
 from .performance import (
@@ -28,7 +31,8 @@ from .performance import (
     PerformanceMetrics,
     ComparisonResult,
     format_performance_report,
-    format_comparison_report
+    format_comparison_report,
+    format_parallel_report
 )
 
 __all__ = [
@@ -38,6 +42,7 @@ __all__ = [
     'TrialDivision',
     'OptimizedTrialDivision',
     'AlgorithmConfig',
+    'ParallelSieve',
 
     # Validators
     'PrimeValidator',
@@ -45,6 +50,7 @@ __all__ = [
     'ValidationResult',
     'quick_prime_check',
     'validate_prime_list',
+    'is_prime_miller_rabin',
 
     # Performance
     'PerformanceMonitor',
@@ -53,5 +59,6 @@ __all__ = [
     'PerformanceMetrics',
     'ComparisonResult',
     'format_performance_report',
-    'format_comparison_report'
+    'format_comparison_report',
+    'format_parallel_report'
 ]
\ No newline at end of file
@@ -2,18 +2,21 @@
 Prime number generation algorithms for the Prime Number Generator application.
 
 This module implements various algorithms for generating and working with
-prime numbers, including the Sieve of Eratosthenes and Trial Division methods.
+prime numbers, including a segmented Sieve of Eratosthenes and Trial Division
+methods.
 """
 
 import math
-from typing import List, Generator, Optional, Tuple
+from bisect import bisect_right
+from itertools import compress
+from typing import Iterator, List, Generator, Optional, Tuple
 from dataclasses import dataclass
 try:
     from ..utils.exceptions import InvalidLimitError, InvalidRangeError, AlgorithmError
-    from ..utils.helpers import validate_positive_integer, validate_non_negative_integer, estimate_sieve_memory
+    from ..utils.helpers import validate_positive_integer, validate_non_negative_integer
 except ImportError:
     from utils.exceptions import InvalidLimitError, InvalidRangeError, AlgorithmError
-    from utils.helpers import validate_positive_integer, validate_non_negative_integer, estimate_sieve_memory
+    from utils.helpers import validate_positive_integer, validate_non_negative_integer
 
 
 @dataclass
@@ -27,62 +30,193 @@ class AlgorithmConfig:
     space_complexity: str
 
 
-class SieveOfEratosthenes:
+# Odd numbers per sieve segment. One byte per odd number, so a segment
+# covers 512K integers in 256 KB and stays resident in a typical L2 cache.
+DEFAULT_SEGMENT_SIZE = 1 << 18
+
+
+def odd_prime_sieve(limit: int) -> List[int]:
     """
-    Implementation of the Sieve of Eratosthenes algorithm.
+    Return the odd primes up to limit with a single odd-only bytearray sieve.
 
-    This algorithm is highly efficient for generating all prime numbers
-    up to a given limit, with time complexity O(n log log n).
+    Used for the base primes of the segmented sieve, so limit is at most
+    sqrt of the segmented sieve's end.
+
+    Args:
+        limit: Upper limit (inclusive)
+
+    Returns:
+        List of odd prime numbers up to limit
     """
+    if limit < 3:
+        return []
 
-    def __init__(self):
+    # Index i represents the odd number 2 * i + 1
+    size = (limit - 1) // 2 + 1
+    flags = bytearray(b'\x01') * size
+    flags[0] = 0  # 1 is not prime
+
+    for i in range(1, (math.isqrt(limit) - 1) // 2 + 1):
+        if flags[i]:
+            p = 2 * i + 1
+            first = (p * p - 1) // 2
+            flags[first::p] = bytes(len(range(first, size, p)))
+
+    return list(compress(range(1, 2 * size, 2), flags))
+
+
+class SieveOfEratosthenes:
+    """
+    Segmented, odd-only implementation of the Sieve of Eratosthenes.
+
+    Base primes up to sqrt(end) are sieved once; the interval is then
+    processed in fixed-size bytearray segments that hold only odd numbers,
+    so memory stays at O(sqrt(end) + segment_size) however large the limit
+    is, and a window [start, end] is sieved without touching [0, start).
+    Multiples are struck out with extended slice assignment, which runs in
+    C rather than in an interpreted loop.
+    """
+
+    def __init__(self, segment_size: int = DEFAULT_SEGMENT_SIZE):
+        if segment_size < 1:
+            raise AlgorithmError(f"Segment size must be positive, got {segment_size}")
+        self.segment_size = segment_size
         self.config = AlgorithmConfig(
             name="Sieve of Eratosthenes",
-            description="Efficient algorithm for finding all primes up to a limit",
-            optimal_range=(1000, 10_000_000),
-            memory_efficient=False,
+            description="Segmented odd-only sieve streaming all primes up to a limit or within a range",
+            optimal_range=(1000, 10**12),
+            memory_efficient=True,
             time_complexity="O(n log log n)",
-            space_complexity="O(n)"
+            space_complexity="O(sqrt(n) + segment size)"
         )
 
-    def generate_primes_up_to(self, limit: int) -> List[int]:
+    def iter_primes_up_to(self, limit: int) -> Iterator[int]:
         """
-        Generate all prime numbers up to the given limit.
+        Lazily yield all prime numbers up to the given limit in ascending order.
 
         Args:
             limit: Upper limit (inclusive)
 
-        Returns:
-            List of prime numbers up to limit
+        Yields:
+            Prime numbers up to limit
 
         Raises:
             InvalidLimitError: If limit is invalid
         """
         limit = validate_non_negative_integer(limit, "limit")
+        return self._iter_segments(0, limit)
 
-        if limit < 2:
-            return []
+    def iter_primes_in_range(self, start: int, end: int) -> Iterator[int]:
+        """
+        Lazily yield prime numbers within [start, end] in ascending order.
+
+        Only the window itself is sieved, so narrow ranges far from zero
+        (e.g. around 10**12) cost O(sqrt(end)) for the base primes plus the
+        width of the window.
+
+        Args:
+            start: Range start (inclusive)
+            end: Range end (inclusive)
+
+        Yields:
+            Prime numbers in range
+
+        Raises:
+            InvalidRangeError: If range is invalid
+        """
+        start = validate_non_negative_integer(start, "start")
+        end = validate_non_negative_integer(end, "end")
+
+        if start > end:
+            raise InvalidRangeError(f"Start ({start}) must be <= end ({end})")
+
+        return self._iter_segments(start, end)
+
+    def _iter_segments(self, start: int, end: int,
+                       base_primes: Optional[List[int]] = None) -> Iterator[int]:
+        """
+        Sieve [start, end] segment by segment, yielding primes as they are found.
+
+        base_primes, if given, must hold every odd prime up to sqrt(end) in
+        ascending order; larger entries are ignored. Parallel workers pass
+        the shared table here instead of re-sieving it.
+        """
+        if end < 2:
+            return
+        if start <= 2:
+            yield 2
+
+        for low, segment in self.iter_odd_segments(start, end, base_primes):
+            yield from compress(range(low, low + 2 * len(segment), 2), segment)
 
-        # Estimate memory usage and warn if excessive
-        estimated_memory = estimate_sieve_memory(limit)
-        if estimated_memory > 1_000_000_000:  # 1GB limit
-            raise AlgorithmError(f"Estimated memory usage ({estimated_memory} bytes) exceeds limit")
+    def iter_odd_segments(self, start: int, end: int,
+                          base_primes: Optional[List[int]] = None) -> Iterator[Tuple[int, bytearray]]:
+        """
+        Yield the raw sieve segments covering the odd numbers in [start, end].
 
-        # Create boolean array "prime[0..limit]" and initialize all entries as True
-        prime = [True] * (limit + 1)
-        prime[0] = prime[1] = False  # 0 and 1 are not prime
+        Each item is (low, segment) where segment[i] is 1 if low + 2 * i is
+        prime and 0 otherwise. The even prime 2 is never represented. Callers
+        that only need to look numbers up (e.g. batch validation) can index
+        the flags directly instead of materialising the primes.
 
-        p = 2
-        while p * p <= limit:
-            # If prime[p] is not changed, then it is a prime
-            if prime[p]:
-                # Update all multiples of p
-                for i in range(p * p, limit + 1, p):
-                    prime[i] = False
-            p += 1
+        Args:
+            start: Range start (inclusive)
+            end: Range end (inclusive)
+            base_primes: Odd primes up to at least sqrt(end), ascending;
+                sieved on demand when omitted
 
-        # Collect all prime numbers
-        return [i for i in range(2, limit + 1) if prime[i]]
+        Yields:
+            (low, segment) pairs in ascending order
+        """
+        low = max(start, 3) | 1  # first odd number in the window
+        if low > end:
+            return
+
+        if base_primes is None:
+            base_primes = odd_prime_sieve(math.isqrt(end))
+        else:
+            base_primes = base_primes[:bisect_right(base_primes, math.isqrt(end))]
+        segment_size = self.segment_size
+        zeros = memoryview(bytes(segment_size))
+
+        # Index (into the current segment) of the next odd multiple of each
+        # base prime; carried across segments so each is computed only once.
+        offsets = []
+        for p in base_primes:
+            first = max(p * p, (low + p - 1) // p * p)
+            if not first & 1:
+                first += p
+            offsets.append((first - low) // 2)
+
+        while low <= end:
+            size = min(segment_size, (end - low) // 2 + 1)
+            segment = bytearray(b'\x01') * size
+
+            for j, p in enumerate(base_primes):
+                index = offsets[j]
+                if index < size:
+                    count = (size - 1 - index) // p + 1
+                    segment[index::p] = zeros[:count]
+                    index += count * p
+                offsets[j] = index - size
+
+            yield low, segment
+            low += 2 * size
+
+    def generate_primes_up_to(self, limit: int) -> List[int]:
+        """
+        Generate all prime numbers up to the given limit.
+
+        Args:
+            limit: Upper limit (inclusive)
+
+        Returns:
+            List of prime numbers up to limit
+
+        Raises:
+            InvalidLimitError: If limit is invalid
+        """
+        return list(self.iter_primes_up_to(limit))
 
     def generate_primes_in_range(self, start: int, end: int) -> List[int]:
         """
@@ -101,15 +235,7 @@ class SieveOfEratosthenes:
         start = validate_non_negative_integer(start, "start")
         end = validate_non_negative_integer(end, "end")
 
-        if start > end:
-            raise InvalidRangeError(f"Start ({start}) must be <= end ({end})")
-
-        if end < 2:
-            return []
-
-        # Generate all primes up to end, then filter by range
-        all_primes = self.generate_primes_up_to(end)
-        return [p for p in all_primes if p >= start]
+        return list(self.iter_primes_in_range(start, end))
 
 
 class TrialDivision:
@@ -317,13 +443,26 @@ class PrimeGenerator:
     Unified interface for prime number generation using multiple algorithms.
 
     This class automatically selects the most appropriate algorithm based
-    on the input parameters and provides a consistent interface.
+    on the input parameters and provides a consistent interface. With more
+    than one worker, sieve requests are split across worker processes.
     """
 
-    def __init__(self):
+    def __init__(self, workers: int = 1):
         self.sieve = SieveOfEratosthenes()
         self.trial_division = TrialDivision()
         self.optimized_trial = OptimizedTrialDivision()
+        self.workers = validate_positive_integer(workers, "workers")
+
+    def _sieve_for(self, workers: Optional[int]):
+        """Return the sieve to use for the given worker count (default: self.workers)."""
+        workers = self.workers if workers is None else validate_positive_integer(workers, "workers")
+        if workers == 1:
+            return self.sieve
+        try:
+            from .parallel import ParallelSieve
+        except ImportError:
+            from core.parallel import ParallelSieve
+        return ParallelSieve(workers, segment_size=self.sieve.segment_size)
 
     def select_algorithm(self, operation_type: str, limit: Optional[int] = None,
                         range_size: Optional[int] = None) -> str:
@@ -357,13 +496,15 @@ class PrimeGenerator:
 
         return 'optimized_trial'  # Default
 
-    def generate_primes_up_to(self, limit: int, algorithm: str = 'auto') -> List[int]:
+    def generate_primes_up_to(self, limit: int, algorithm: str = 'auto',
+                              workers: Optional[int] = None) -> List[int]:
         """
         Generate all prime numbers up to the given limit.
 
         Args:
             limit: Upper limit (inclusive)
             algorithm: Algorithm to use ('auto', 'sieve', 'trial', 'optimized_trial')
+            workers: Worker processes for the sieve (default: self.workers)
 
         Returns:
             List of prime numbers up to limit
@@ -372,7 +513,7 @@ class PrimeGenerator:
             algorithm = self.select_algorithm('generate', limit=limit)
 
         if algorithm == 'sieve':
-            return self.sieve.generate_primes_up_to(limit)
+            return self._sieve_for(workers).generate_primes_up_to(limit)
         elif algorithm == 'trial_division':
             return self.trial_division.generate_primes_up_to(limit)
         elif algorithm == 'optimized_trial':
@@ -422,7 +563,8 @@ class PrimeGenerator:
 
         return primes[:count]
 
-    def generate_primes_in_range(self, start: int, end: int, algorithm: str = 'auto') -> List[int]:
+    def generate_primes_in_range(self, start: int, end: int, algorithm: str = 'auto',
+                                 workers: Optional[int] = None) -> List[int]:
         """
         Generate prime numbers within a given range.
 
@@ -430,6 +572,7 @@ class PrimeGenerator:
             start: Range start (inclusive)
             end: Range end (inclusive)
             algorithm: Algorithm to use
+            workers: Worker processes for the sieve (default: self.workers)
 
         Returns:
             List of prime numbers in range
@@ -446,7 +589,7 @@ class PrimeGenerator:
             algorithm = self.select_algorithm('range', range_size=range_size)
 
         if algorithm == 'sieve':
-            return self.sieve.generate_primes_in_range(start, end)
+            return self._sieve_for(workers).generate_primes_in_range(start, end)
         elif algorithm == 'trial_division':
             return self.trial_division.generate_primes_in_range(start, end)
         elif algorithm == 'optimized_trial':
@@ -454,6 +597,24 @@ class PrimeGenerator:
         else:
             raise AlgorithmError(f"Unknown algorithm: {algorithm}")
 
+    def iter_primes_in_range(self, start: int, end: int,
+                             workers: Optional[int] = None) -> Iterator[int]:
+        """
+        Stream prime numbers within a range using the segmented sieve.
+
+        Unlike generate_primes_in_range, the result is never materialised, so
+        ranges with billions of primes can be consumed in bounded memory.
+
+        Args:
+            start: Range start (inclusive)
+            end: Range end (inclusive)
+            workers: Worker processes for the sieve (default: self.workers)
+
+        Yields:
+            Prime numbers in range, in ascending order
+        """
+        return self._sieve_for(workers).iter_primes_in_range(start, end)
+
     def is_prime(self, n: int) -> bool:
         """
         Check if a number is prime.
@@ -0,0 +1,192 @@
+"""
+Multi-process range sieve for the Prime Number Generator application.
+
+This module splits a range into contiguous chunks and sieves them in a
+ProcessPoolExecutor. The base primes up to sqrt(end) are sieved once in
+the parent and published to the workers through a shared memory block, so
+no worker repeats that work and no task pickles the table. Results are
+yielded in ascending order as soon as the next chunk is ready.
+"""
+
+import math
+import os
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Optional, Union
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # pragma: no cover - Python < 3.8
+    shared_memory = None
+try:
+    from .algorithms import SieveOfEratosthenes, DEFAULT_SEGMENT_SIZE, odd_prime_sieve
+    from ..utils.exceptions import InvalidRangeError, AlgorithmError
+    from ..utils.helpers import validate_non_negative_integer
+except ImportError:
+    from core.algorithms import SieveOfEratosthenes, DEFAULT_SEGMENT_SIZE, odd_prime_sieve
+    from utils.exceptions import InvalidRangeError, AlgorithmError
+    from utils.helpers import validate_non_negative_integer
+
+
+# Integers per task: 16 default segments, a fraction of a second of work
+DEFAULT_CHUNK_SPAN = 2 * DEFAULT_SEGMENT_SIZE * 16
+
+# Results are shipped back as packed uint64 arrays while they fit
+_UINT64_LIMIT = 1 << 64
+
+# Per-process state, set once by _init_worker
+_worker_base_primes: List[int] = []
+_worker_sieve: Optional[SieveOfEratosthenes] = None
+
+
+def _init_worker(shm_name: Optional[str], count: int, payload: Optional[bytes],
+                 segment_size: int) -> None:
+    """Load the base primes into this worker, from shared memory when available."""
+    global _worker_base_primes, _worker_sieve
+
+    if shm_name is not None:
+        block = shared_memory.SharedMemory(name=shm_name)
+        try:
+            with block.buf[:count * 8] as raw, raw.cast('Q') as view:
+                _worker_base_primes = view.tolist()
+        finally:
+            block.close()
+    else:
+        table = array('Q')
+        table.frombytes(payload)
+        _worker_base_primes = table.tolist()
+
+    _worker_sieve = SieveOfEratosthenes(segment_size)
+
+
+def _sieve_chunk(start: int, end: int) -> Union[array, List[int]]:
+    """Sieve one chunk with the worker's base primes."""
+    primes = _worker_sieve._iter_segments(start, end, _worker_base_primes)
+    if end < _UINT64_LIMIT:
+        return array('Q', primes)
+    return list(primes)
+
+
+class ParallelSieve:
+    """
+    Segmented Sieve of Eratosthenes spread across worker processes.
+
+    Ranges narrower than two chunks, or a single worker, are sieved in
+    process with SieveOfEratosthenes, where start-up cost would outweigh
+    any gain.
+    """
+
+    def __init__(self, workers: Optional[int] = None,
+                 chunk_span: int = DEFAULT_CHUNK_SPAN,
+                 segment_size: int = DEFAULT_SEGMENT_SIZE):
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1:
+            raise AlgorithmError(f"Worker count must be positive, got {workers}")
+        if chunk_span < 2:
+            raise AlgorithmError(f"Chunk span must be at least 2, got {chunk_span}")
+
+        self.workers = workers
+        self.chunk_span = chunk_span
+        self.segment_size = segment_size
+        self.sieve = SieveOfEratosthenes(segment_size)
+
+    def iter_primes_in_range(self, start: int, end: int) -> Iterator[int]:
+        """
+        Lazily yield prime numbers within [start, end] in ascending order.
+
+        At most two chunks per worker are in flight, so memory stays bounded
+        however slowly the caller consumes the primes.
+
+        Args:
+            start: Range start (inclusive)
+            end: Range end (inclusive)
+
+        Yields:
+            Prime numbers in range
+
+        Raises:
+            InvalidRangeError: If range is invalid
+        """
+        start = validate_non_negative_integer(start, "start")
+        end = validate_non_negative_integer(end, "end")
+
+        if start > end:
+            raise InvalidRangeError(f"Start ({start}) must be <= end ({end})")
+
+        if self.workers == 1 or end - start + 1 < 2 * self.chunk_span:
+            return self.sieve.iter_primes_in_range(start, end)
+
+        return self._iter_parallel(start, end)
+
+    def generate_primes_in_range(self, start: int, end: int) -> List[int]:
+        """
+        Generate prime numbers within a given range.
+
+        Args:
+            start: Range start (inclusive)
+            end: Range end (inclusive)
+
+        Returns:
+            List of prime numbers in range
+        """
+        return list(self.iter_primes_in_range(start, end))
+
+    def generate_primes_up_to(self, limit: int) -> List[int]:
+        """
+        Generate all prime numbers up to the given limit.
+
+        Args:
+            limit: Upper limit (inclusive)
+
+        Returns:
+            List of prime numbers up to limit
+        """
+        limit = validate_non_negative_integer(limit, "limit")
+        return list(self.iter_primes_in_range(0, limit))
+
+    def _iter_parallel(self, start: int, end: int) -> Iterator[int]:
+        """Fan the chunks out to a process pool and yield their primes in order."""
+        base = array('Q', odd_prime_sieve(math.isqrt(end)))
+        block = self._publish(base)
+
+        if block is not None:
+            initargs = (block.name, len(base), None, self.segment_size)
+        else:
+            initargs = (None, len(base), base.tobytes(), self.segment_size)
+
+        try:
+            with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                     initargs=initargs) as executor:
+                chunks = ((low, min(low + self.chunk_span - 1, end))
+                          for low in range(start, end + 1, self.chunk_span))
+                pending = deque()
+
+                try:
+                    for low, high in chunks:
+                        pending.append(executor.submit(_sieve_chunk, low, high))
+                        if len(pending) >= 2 * self.workers:
+                            yield from pending.popleft().result()
+
+                    while pending:
+                        yield from pending.popleft().result()
+                finally:
+                    # Abandoned early: don't sieve chunks nobody will read
+                    for future in pending:
+                        future.cancel()
+        finally:
+            if block is not None:
+                block.close()
+                block.unlink()
+
+    @staticmethod
+    def _publish(base: array):
+        """Copy the base primes into a new shared memory block, or return None."""
+        if shared_memory is None or not base:
+            return None
+        try:
+            block = shared_memory.SharedMemory(create=True, size=len(base) * base.itemsize)
+        except OSError:
+            return None
+        block.buf[:len(base) * base.itemsize] = base.tobytes()
+        return block
@@ -5,17 +5,26 @@ This module provides comprehensive performance analysis capabilities including
 execution time measurement, memory usage tracking, and algorithm comparison.
 """
 
+import os
 import time
 import gc
 import tracemalloc
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Sequence
 from dataclasses import dataclass, field
 try:
-    from ..utils.exceptions import PerformanceError
-    from ..utils.helpers import format_time, format_memory, get_system_info
+    from .algorithms import DEFAULT_SEGMENT_SIZE
+    from .parallel import ParallelSieve, DEFAULT_CHUNK_SPAN
+    from ..utils.exceptions import PerformanceError, InvalidRangeError
+    from ..utils.helpers import format_time, format_memory, format_number, get_system_info
 except ImportError:
-    from utils.exceptions import PerformanceError
-    from utils.helpers import format_time, format_memory, get_system_info
+    from core.algorithms import DEFAULT_SEGMENT_SIZE
+    from core.parallel import ParallelSieve, DEFAULT_CHUNK_SPAN
+    from utils.exceptions import PerformanceError, InvalidRangeError
+    from utils.helpers import format_time, format_memory, format_number, get_system_info
+
+
+# Smallest task the parallel benchmark hands a worker: one full sieve segment
+MIN_BENCHMARK_CHUNK_SPAN = 2 * DEFAULT_SEGMENT_SIZE
 
 
 @dataclass
@@ -424,6 +433,95 @@ class BenchmarkRunner:
 
         return results
 
+    def run_parallel_benchmark(self, start: int, end: int,
+                               worker_counts: Optional[Sequence[int]] = None,
+                               chunk_span: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Time the range sieve at several worker counts and report the speed-up.
+
+        Wall-clock time is measured with perf_counter only; tracemalloc would
+        slow the parent down and cannot see memory used by worker processes.
+
+        ParallelSieve quietly sieves ranges narrower than two chunks in
+        process, which would make every run time the same code. By default
+        the chunk span is therefore shrunk until the range splits into two
+        chunks per worker, so each multi-worker run really uses the pool.
+
+        Args:
+            start: Range start (inclusive)
+            end: Range end (inclusive)
+            worker_counts: Worker counts to try (default: 1, 2, 4, ... up to
+                the CPU count); 1 is always included as the baseline
+            chunk_span: Integers per worker task (default: DEFAULT_CHUNK_SPAN,
+                or less for ranges narrower than two chunks per worker)
+
+        Returns:
+            Dictionary with per-worker-count timings, speed-up and efficiency
+
+        Raises:
+            InvalidRangeError: If a multi-worker run would not reach the
+                process pool
+        """
+        cpu_count = os.cpu_count() or 1
+        if worker_counts is None:
+            worker_counts = [1]
+            while worker_counts[-1] * 2 <= cpu_count:
+                worker_counts.append(worker_counts[-1] * 2)
+            if worker_counts[-1] != cpu_count:
+                worker_counts.append(cpu_count)
+        worker_counts = sorted(set(worker_counts) | {1})
+
+        if start > end:
+            raise InvalidRangeError(f"Start ({start}) must be <= end ({end})")
+        span = end - start + 1
+        max_workers = worker_counts[-1]
+        if chunk_span is None:
+            chunk_span = max(2, min(DEFAULT_CHUNK_SPAN, span // (2 * max_workers)))
+            if max_workers > 1 and chunk_span < MIN_BENCHMARK_CHUNK_SPAN:
+                raise InvalidRangeError(
+                    f"Range of {format_number(span)} integers is too small to benchmark "
+                    f"{max_workers} workers; use at least "
+                    f"{format_number(2 * max_workers * MIN_BENCHMARK_CHUNK_SPAN)} integers"
+                )
+        elif max_workers > 1 and span < 2 * chunk_span:
+            raise InvalidRangeError(
+                f"Range of {format_number(span)} integers is narrower than two chunks of "
+                f"{format_number(chunk_span)}, so it would be sieved in process"
+            )
+
+        runs = []
+        baseline_time = baseline_count = None
+
+        for workers in worker_counts:
+            sieve = ParallelSieve(workers, chunk_span=chunk_span)
+            gc.collect()
+            start_time = time.perf_counter()
+            prime_count = sum(1 for _ in sieve.iter_primes_in_range(start, end))
+            execution_time = time.perf_counter() - start_time
+
+            if baseline_time is None:
+                baseline_time, baseline_count = execution_time, prime_count
+
+            speedup = baseline_time / execution_time if execution_time > 0 else 0.0
+            runs.append({
+                'workers': workers,
+                'execution_time': execution_time,
+                'prime_count': prime_count,
+                'speedup': speedup,
+                'efficiency': speedup / workers,
+                'correct': prime_count == baseline_count
+            })
+
+        return {
+            'timestamp': time.time(),
+            'system_info': get_system_info(),
+            'cpu_count': cpu_count,
+            'range': (start, end),
+            'chunk_span': chunk_span,
+            'runs': runs,
+            'best': max(runs, key=lambda run: run['speedup'])
+        }
+
     def _generate_benchmark_summary(self, results: Dict[str, Any]) -> Dict[str, Any]:
         """
         Generate summary statistics from benchmark results.
@@ -505,6 +603,35 @@ def format_performance_report(metrics: PerformanceMetrics) -> str:
     return report
 
 
+def format_parallel_report(results: Dict[str, Any]) -> str:
+    """
+    Format parallel sieve benchmark results into a readable report.
+
+    Args:
+        results: Output of BenchmarkRunner.run_parallel_benchmark
+
+    Returns:
+        Formatted report string
+    """
+    start, end = results['range']
+    report = "Parallel Sieve Benchmark\n"
+    report += "=" * 24 + "\n\n"
+    report += f"Range: {format_number(start)} - {format_number(end)}\n"
+    report += f"Chunk span: {format_number(results['chunk_span'])} integers per task\n"
+    report += f"CPUs available: {results['cpu_count']}\n\n"
+
+    report += f"{'Workers':>7}  {'Time':>12}  {'Speed-up':>8}  {'Efficiency':>10}  Primes\n"
+    for run in results['runs']:
+        flag = "" if run['correct'] else "  (count mismatch!)"
+        report += (f"{run['workers']:>7}  {format_time(run['execution_time']):>12}  "
+                   f"{run['speedup']:>7.2f}x  {run['efficiency']:>10.0%}  "
+                   f"{format_number(run['prime_count'])}{flag}\n")
+
+    best = results['best']
+    report += f"\nBest: {best['workers']} worker(s), {best['speedup']:.2f}x faster than 1 worker\n"
+    return report
+
+
 def format_comparison_report(comparison: ComparisonResult) -> str:
     """
     Format algorithm comparison results into a readable report.
@@ -3,19 +3,168 @@ Prime number validation functionality for the Prime Number Generator application
 
 This module provides comprehensive validation capabilities for single numbers
 and batch validation of multiple numbers.
+
+Batch validation deduplicates and sorts its input, then either sieves the
+window [min, max] once or runs a deterministic Miller-Rabin test over the
+whole batch. NumPy is used for the vectorized paths when it is installed;
+without it the same algorithms run element by element.
 """
 
+import math
 import time
-from typing import List, Optional
+from bisect import bisect_left
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional
 from dataclasses import dataclass
 try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+try:
+    from .algorithms import SieveOfEratosthenes
     from ..utils.exceptions import InvalidNumberError, InvalidInputError
     from ..utils.helpers import validate_non_negative_integer, get_prime_factors
 except ImportError:
+    from core.algorithms import SieveOfEratosthenes
     from utils.exceptions import InvalidNumberError, InvalidInputError
     from utils.helpers import validate_non_negative_integer, get_prime_factors
 
 
+# Sieve the window [min, max] when the sieve's work -- the window itself plus
+# the base primes up to sqrt(max) -- is at most this many integers per
+# distinct number in the batch; otherwise test each number with Miller-Rabin.
+SIEVE_DENSITY_THRESHOLD = 64
+
+# Bases that make Miller-Rabin deterministic for every n < 2**64
+MILLER_RABIN_BASES = (2, 325, 9375, 28178, 450775, 9780504, 1795265022)
+
+# Vectorized modular multiplication is exact while n < 2**50 (see _mulmod)
+_VECTOR_LIMIT = 1 << 50
+_UINT64_LIMIT = 1 << 64
+
+_SMALL_PRIMES = (3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47)
+
+# Odd primes below 1000, for naming the smallest factor in batch explanations
+_EXPLAIN_PRIMES = tuple(p for p in range(3, 1000, 2)
+                        if all(p % q for q in range(3, int(p ** 0.5) + 1, 2)))
+
+
+def is_prime_miller_rabin(n: int) -> bool:
+    """
+    Deterministic Miller-Rabin primality test.
+
+    Exact for every n < 2**64; above that it is a strong probable-prime test
+    to the same seven bases.
+
+    Args:
+        n: Number to test
+
+    Returns:
+        True if n is prime, False otherwise
+    """
+    if n < 2:
+        return False
+    if n < 4:
+        return True
+    if n % 2 == 0:
+        return False
+    for p in _SMALL_PRIMES:
+        if n % p == 0:
+            return n == p
+
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+
+    for base in MILLER_RABIN_BASES:
+        a = base % n
+        if a == 0:
+            continue
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _mulmod(a, b, n):
+    """
+    Element-wise (a * b) % n for uint64 arrays with every n < 2**50.
+
+    The quotient is estimated in float64, which is off by at most one or two
+    for these sizes; the remainder is then computed exactly with wrapping
+    uint64 arithmetic, reinterpreted as signed and corrected into [0, n).
+    """
+    q = np.floor(a.astype(np.float64) * b.astype(np.float64) / n.astype(np.float64))
+    r = (a * b - q.astype(np.uint64) * n).view(np.int64)
+    n_signed = n.view(np.int64)
+    r = np.where(r < 0, r + n_signed, r)
+    r = np.where(r < 0, r + n_signed, r)
+    r = np.where(r >= n_signed, r - n_signed, r)
+    r = np.where(r >= n_signed, r - n_signed, r)
+    return r.view(np.uint64)
+
+
+def _miller_rabin_vector(values) -> "np.ndarray":
+    """
+    Vectorized deterministic Miller-Rabin over a uint64 array.
+
+    Args:
+        values: uint64 array of odd numbers, each > 47 and < 2**50, with no
+            factor among the small primes
+
+    Returns:
+        Boolean array, True where the value is prime
+    """
+    n = values
+    one = np.uint64(1)
+    n_minus_1 = n - one
+
+    # n - 1 = d * 2**s with d odd
+    d = n_minus_1.copy()
+    s = np.zeros(len(n), dtype=np.int64)
+    while True:
+        even = (d & one) == 0
+        if not even.any():
+            break
+        d = np.where(even, d >> one, d)
+        s += even
+
+    is_prime = np.ones(len(n), dtype=bool)
+    for base in MILLER_RABIN_BASES:
+        a = np.uint64(base) % n
+        active = is_prime & (a != 0)
+        if not active.any():
+            continue
+
+        # x = a**d mod n, square-and-multiply over the per-element exponents
+        x = np.ones(len(n), dtype=np.uint64)
+        power = a
+        exponent = d.copy()
+        while exponent.any():
+            odd = (exponent & one) == 1
+            x = np.where(odd, _mulmod(x, power, n), x)
+            power = _mulmod(power, power, n)
+            exponent >>= one
+
+        passed = (x == one) | (x == n_minus_1)
+        for step in range(1, int(s.max())):
+            pending = ~passed & (s > step)
+            if not pending.any():
+                break
+            x = np.where(pending, _mulmod(x, x, n), x)
+            passed |= pending & (x == n_minus_1)
+
+        is_prime &= passed | ~active
+    return is_prime
+
+
 @dataclass
 class ValidationResult:
     """Result of prime number validation."""
@@ -145,13 +294,23 @@ class BatchValidator:
     """
     Batch validation for multiple numbers with performance optimization.
 
-    This class efficiently validates multiple numbers and provides
-    summary statistics and performance metrics.
+    The batch is deduplicated and sorted, then classified in one pass:
+    when the window [min, max] is dense enough the segmented sieve marks it
+    once and every number is a table lookup. The sieve also has to find the
+    base primes up to sqrt(max), so a short window of very large numbers is
+    not dense enough. Otherwise each distinct number gets a deterministic
+    Miller-Rabin test, vectorized with NumPy when available. Results come back in input order, and duplicates share one
+    ValidationResult. Each result's execution_time is its share of the
+    batch's classification time.
     """
 
-    def __init__(self, max_batch_size: int = 10000):
+    def __init__(self, max_batch_size: Optional[int] = None,
+                 sieve_density_threshold: int = SIEVE_DENSITY_THRESHOLD):
         self.validator = PrimeValidator()
         self.max_batch_size = max_batch_size
+        self.sieve_density_threshold = sieve_density_threshold
+        self.sieve = SieveOfEratosthenes()
+        self.last_strategy: Optional[str] = None
 
     def validate_batch(self, numbers: List[int], include_factors: bool = False) -> List[ValidationResult]:
         """
@@ -162,32 +321,173 @@ class BatchValidator:
             include_factors: Whether to include factors for composite numbers
 
         Returns:
-            List of ValidationResult objects
+            List of ValidationResult objects, in the same order as numbers
 
         Raises:
-            InvalidInputError: If batch size exceeds limit
+            InvalidInputError: If max_batch_size is set and exceeded
         """
-        if len(numbers) > self.max_batch_size:
+        return self._validate_batch(numbers, include_factors, enforce_cap=True)
+
+    def _validate_batch(self, numbers: List[int], include_factors: bool,
+                        enforce_cap: bool) -> List[ValidationResult]:
+        """Body of validate_batch; validate_stream skips the max_batch_size cap."""
+        if enforce_cap and self.max_batch_size is not None and len(numbers) > self.max_batch_size:
             raise InvalidInputError(
                 f"Batch size ({len(numbers)}) exceeds maximum ({self.max_batch_size})"
             )
 
-        results = []
+        # Converted value of each input by position, None where invalid; the
+        # inputs themselves may be unhashable
+        converted: List[Optional[int]] = []
         for number in numbers:
+            if type(number) is int and number >= 0:
+                converted.append(number)
+                continue
             try:
-                result = self.validator.validate(number, include_factors)
-                results.append(result)
-            except InvalidNumberError:
+                converted.append(validate_non_negative_integer(number, "number"))
+            except InvalidInputError:
+                converted.append(None)
+
+        start_time = time.perf_counter()
+        flags = self.classify(sorted({n for n in converted if n is not None}))
+        per_number = (time.perf_counter() - start_time) / max(len(flags), 1)
+
+        results: Dict[int, ValidationResult] = {}
+        for num, is_prime in flags.items():
+            factors = None
+            if not is_prime and include_factors and num > 1:
+                factors = get_prime_factors(num)
+            results[num] = ValidationResult(
+                number=num,
+                is_prime=is_prime,
+                factors=factors,
+                execution_time=per_number,
+                explanation=self._explain(num, is_prime)
+            )
+
+        output = []
+        for number, value in zip(numbers, converted):
+            if value is None:
                 # Create error result for invalid numbers
-                results.append(ValidationResult(
+                output.append(ValidationResult(
                     number=number,
                     is_prime=False,
                     factors=None,
                     execution_time=0.0,
                     explanation=f"Invalid input: {number}"
                 ))
+            else:
+                output.append(results[value])
+
+        return output
+
+    def validate_stream(self, numbers: Iterable[int], include_factors: bool = False,
+                        chunk_size: int = 100_000) -> Iterator[List[ValidationResult]]:
+        """
+        Validate an iterable of numbers of any length, chunk by chunk.
+
+        The input is consumed lazily and max_batch_size does not apply, so
+        memory is bounded by chunk_size rather than by the input length.
 
-        return results
+        Args:
+            numbers: Iterable of numbers to validate
+            include_factors: Whether to include factors for composite numbers
+            chunk_size: Numbers per chunk
+
+        Yields:
+            Lists of ValidationResult objects, in input order
+        """
+        if chunk_size < 1:
+            raise InvalidInputError(f"Chunk size must be positive, got {chunk_size}")
+
+        iterator = iter(numbers)
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                return
+            yield self._validate_batch(chunk, include_factors, enforce_cap=False)
+
+    def classify(self, numbers: List[int]) -> Dict[int, bool]:
+        """
+        Decide primality for sorted, distinct non-negative integers.
+
+        Sets last_strategy to 'sieve' or 'miller_rabin'.
+
+        Args:
+            numbers: Distinct non-negative integers in ascending order
+
+        Returns:
+            Dictionary mapping each number to whether it is prime
+        """
+        if not numbers:
+            self.last_strategy = None
+            return {}
+
+        sieve_cost = numbers[-1] - numbers[0] + 1 + math.isqrt(numbers[-1])
+        if sieve_cost <= self.sieve_density_threshold * len(numbers):
+            self.last_strategy = 'sieve'
+            return self._classify_by_sieve(numbers)
+
+        self.last_strategy = 'miller_rabin'
+        return self._classify_by_miller_rabin(numbers)
+
+    def _classify_by_sieve(self, numbers: List[int]) -> Dict[int, bool]:
+        """Sieve [min, max] once and look every number up in the segments."""
+        flags = {n: n == 2 for n in numbers if n < 3 or n % 2 == 0}
+        odd = [n for n in numbers if n >= 3 and n % 2 == 1]
+        if not odd:
+            return flags
+
+        position = 0
+        for low, segment in self.sieve.iter_odd_segments(odd[0], odd[-1]):
+            stop = bisect_left(odd, low + 2 * len(segment), position)
+            window = odd[position:stop]
+            if np is not None and len(window) > 64 and window[-1] < _UINT64_LIMIT // 2:
+                indexes = (np.array(window, dtype=np.int64) - low) >> 1
+                marks = np.frombuffer(segment, dtype=np.uint8)[indexes]
+                flags.update(zip(window, marks.astype(bool).tolist()))
+            else:
+                flags.update((n, segment[(n - low) // 2] == 1) for n in window)
+            position = stop
+        return flags
+
+    def _classify_by_miller_rabin(self, numbers: List[int]) -> Dict[int, bool]:
+        """Test every number with Miller-Rabin, vectorizing the candidates below 2**50."""
+        if np is None:
+            return {n: is_prime_miller_rabin(n) for n in numbers}
+
+        flags = {}
+        candidates = []
+        for n in numbers:
+            if n < 2500 or n >= _VECTOR_LIMIT:
+                flags[n] = is_prime_miller_rabin(n)
+            else:
+                candidates.append(n)
+
+        if candidates:
+            values = np.array(candidates, dtype=np.uint64)
+            # Strip small factors first; the vectorized test expects coprime input
+            survivors = np.ones(len(values), dtype=bool)
+            for p in (2,) + _SMALL_PRIMES:
+                survivors &= (values % np.uint64(p)) != 0
+
+            is_prime = np.zeros(len(values), dtype=bool)
+            if survivors.any():
+                is_prime[survivors] = _miller_rabin_vector(values[survivors])
+            flags.update(zip(candidates, is_prime.tolist()))
+        return flags
+
+    def _explain(self, number: int, is_prime: bool) -> str:
+        """Explanation without an unbounded factor search for large composites."""
+        if is_prime or number < 3 or number % 2 == 0:
+            return self.validator._generate_explanation(number, is_prime)
+
+        for divisor in _EXPLAIN_PRIMES:
+            if number % divisor == 0:
+                return f"{number} is not prime. It is divisible by {divisor} (and {number // divisor})."
+            if divisor * divisor > number:
+                break
+        return f"{number} is not prime."
 
     def get_batch_summary(self, results: List[ValidationResult]) -> dict:
         """
@@ -244,7 +544,7 @@ class BatchValidator:
             List of ValidationResult objects
 
         Raises:
-            InvalidInputError: If range is too large
+            InvalidInputError: If max_batch_size is set and the range exceeds it
         """
         start = validate_non_negative_integer(start, "start")
         end = validate_non_negative_integer(end, "end")
@@ -253,7 +553,7 @@ class BatchValidator:
             raise InvalidInputError(f"Start ({start}) must be <= end ({end})")
 
         range_size = end - start + 1
-        if range_size > self.max_batch_size:
+        if self.max_batch_size is not None and range_size > self.max_batch_size:
             raise InvalidInputError(
                 f"Range size ({range_size}) exceeds maximum batch size ({self.max_batch_size})"
             )
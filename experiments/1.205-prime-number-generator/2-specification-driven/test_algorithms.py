@@ -0,0 +1,79 @@
+"""
+Test suite for the segmented sieve.
+"""
+
+import pytest
+from itertools import islice
+from core.algorithms import SieveOfEratosthenes, odd_prime_sieve
+from core.validators import is_prime_miller_rabin
+from utils.exceptions import AlgorithmError, InvalidRangeError
+
+
+def _reference(n: int) -> bool:
+    """Trial division, for checking small numbers."""
+    if n < 2:
+        return False
+    return all(n % d for d in range(2, int(n ** 0.5) + 1))
+
+
+class TestOddPrimeSieve:
+    """Test cases for the base-prime sieve."""
+
+    def test_small_limits(self):
+        """Test limits below, at and just above small primes and squares."""
+        for limit in (0, 1, 2, 3, 4, 9, 25, 49, 1000):
+            assert odd_prime_sieve(limit) == [n for n in range(3, limit + 1) if _reference(n)]
+
+
+class TestSegmentedSieve:
+    """Test cases for the segmented odd-only sieve."""
+
+    @pytest.mark.parametrize('start, end', [
+        (0, 0), (0, 1), (0, 2), (2, 3), (1, 100), (24, 28), (90, 97), (1_000_000, 1_005_000),
+    ])
+    def test_windows_across_tiny_segments(self, start, end):
+        """Test windows that span many segments, including their edges."""
+        sieve = SieveOfEratosthenes(segment_size=7)
+        expected = [n for n in range(start, end + 1) if _reference(n)]
+        assert sieve.generate_primes_in_range(start, end) == expected
+
+    def test_segments_flag_odd_numbers(self):
+        """Test the raw segments: contiguous, odd-only and flagged correctly."""
+        sieve = SieveOfEratosthenes(segment_size=10)
+        low_expected = 101
+        for low, segment in sieve.iter_odd_segments(100, 200):
+            assert low == low_expected
+            assert len(segment) <= 10
+            assert list(segment) == [int(_reference(low + 2 * i)) for i in range(len(segment))]
+            low_expected = low + 2 * len(segment)
+        assert low_expected == 201
+
+    def test_shared_base_primes(self):
+        """Test that a longer base-prime table gives the same result as sieving one."""
+        sieve = SieveOfEratosthenes(segment_size=64)
+        base_primes = odd_prime_sieve(2000)
+        assert list(sieve._iter_segments(50_000, 60_000, base_primes)) == \
+            sieve.generate_primes_in_range(50_000, 60_000)
+
+    def test_window_far_from_zero(self):
+        """Test a window near 1e12 without sieving [0, start)."""
+        start = 10 ** 12
+        primes = SieveOfEratosthenes().generate_primes_in_range(start, start + 10_000)
+        assert primes == [n for n in range(start, start + 10_001) if is_prime_miller_rabin(n)]
+
+    def test_streaming_up_to(self):
+        """Test that iter_primes_up_to is lazy and agrees with the list form."""
+        sieve = SieveOfEratosthenes(segment_size=64)
+        primes = sieve.generate_primes_up_to(10_000)
+        assert len(primes) == 1229
+        assert list(sieve.iter_primes_up_to(10_000)) == primes
+
+        # Only the first segment of a 1e10 sieve is ever computed
+        assert list(islice(sieve.iter_primes_up_to(10 ** 10), 5)) == [2, 3, 5, 7, 11]
+
+    def test_invalid_arguments(self):
+        """Test invalid segment sizes and ranges are rejected."""
+        with pytest.raises(AlgorithmError):
+            SieveOfEratosthenes(segment_size=0)
+        with pytest.raises(InvalidRangeError):
+            SieveOfEratosthenes().generate_primes_in_range(10, 5)
@@ -0,0 +1,35 @@
+"""
+Test suite for the multi-process range sieve.
+"""
+
+import pytest
+from itertools import islice
+from core.algorithms import SieveOfEratosthenes
+from core.parallel import ParallelSieve
+from utils.exceptions import AlgorithmError, InvalidRangeError
+
+
+class TestParallelSieve:
+    """Test cases for ParallelSieve."""
+
+    def test_matches_serial_sieve(self):
+        """Test that pool results equal the in-process sieve, in order."""
+        sieve = ParallelSieve(workers=2, chunk_span=1000)
+        serial = SieveOfEratosthenes()
+        for start, end in ((0, 50_000), (12_345, 40_000)):
+            assert sieve.generate_primes_in_range(start, end) == serial.generate_primes_in_range(start, end)
+
+    def test_abandoned_iteration(self):
+        """Test that stopping early does not hang or leak the pool."""
+        iterator = ParallelSieve(workers=2, chunk_span=500).iter_primes_in_range(0, 1_000_000)
+        assert list(islice(iterator, 5)) == [2, 3, 5, 7, 11]
+        iterator.close()
+
+    def test_invalid_arguments(self):
+        """Test invalid worker counts and chunk spans are rejected."""
+        with pytest.raises(AlgorithmError):
+            ParallelSieve(workers=0)
+        with pytest.raises(AlgorithmError):
+            ParallelSieve(workers=2, chunk_span=1)
+        with pytest.raises(InvalidRangeError):
+            ParallelSieve(workers=2).generate_primes_in_range(10, 5)
@@ -0,0 +1,34 @@
+"""
+Test suite for the parallel sieve benchmark.
+"""
+
+import pytest
+from core.performance import BenchmarkRunner, MIN_BENCHMARK_CHUNK_SPAN
+from core.parallel import DEFAULT_CHUNK_SPAN
+from utils.exceptions import InvalidRangeError
+
+
+class TestParallelBenchmark:
+    """Test cases for BenchmarkRunner.run_parallel_benchmark."""
+
+    def test_small_range_still_reaches_the_pool(self):
+        """Test that a range below two default chunks is split for the workers."""
+        end = 4 * MIN_BENCHMARK_CHUNK_SPAN - 1
+        assert end < 2 * DEFAULT_CHUNK_SPAN
+
+        results = BenchmarkRunner().run_parallel_benchmark(0, end, worker_counts=[2])
+        assert results['chunk_span'] == MIN_BENCHMARK_CHUNK_SPAN
+        assert [run['workers'] for run in results['runs']] == [1, 2]
+        assert all(run['correct'] for run in results['runs'])
+
+    def test_too_small_range_is_refused(self):
+        """Test that ranges that cannot be split are refused, not timed in process."""
+        runner = BenchmarkRunner()
+        with pytest.raises(InvalidRangeError, match="too small"):
+            runner.run_parallel_benchmark(0, 10000, worker_counts=[1, 2])
+        with pytest.raises(InvalidRangeError, match="narrower than two chunks"):
+            runner.run_parallel_benchmark(0, 10000, worker_counts=[2], chunk_span=8000)
+
+        # A single worker is only a baseline and never needs the pool
+        results = runner.run_parallel_benchmark(0, 10000, worker_counts=[1])
+        assert results['runs'][0]['prime_count'] == 1229
@@ -0,0 +1,121 @@
+"""
+Test suite for batch prime validation.
+"""
+
+import random
+
+import pytest
+from core import validators
+from core.validators import BatchValidator, is_prime_miller_rabin
+from utils.exceptions import InvalidInputError
+
+
+def _reference(n: int) -> bool:
+    """Trial division, for checking small numbers."""
+    if n < 2:
+        return False
+    return all(n % d for d in range(2, int(n ** 0.5) + 1))
+
+
+class TestBatchStrategy:
+    """Test cases for choosing between the sieve and Miller-Rabin."""
+
+    def test_dense_small_window_is_sieved(self):
+        """Test that a dense window of small numbers uses the sieve."""
+        validator = BatchValidator()
+        flags = validator.classify(list(range(1000, 1200)))
+        assert validator.last_strategy == 'sieve'
+        assert flags == {n: _reference(n) for n in range(1000, 1200)}
+
+    @pytest.mark.parametrize('base', [10 ** 12, 10 ** 14, 10 ** 16])
+    def test_large_consecutive_numbers_use_miller_rabin(self, base):
+        """Test that consecutive large numbers skip the sqrt(max) base-prime sieve."""
+        validator = BatchValidator()
+        numbers = list(range(base, base + 200))
+        flags = validator.classify(numbers)
+        assert validator.last_strategy == 'miller_rabin'
+        assert flags == {n: is_prime_miller_rabin(n) for n in numbers}
+        assert any(flags.values())
+
+    def test_empty(self):
+        """Test that an empty batch has no strategy."""
+        validator = BatchValidator()
+        assert validator.classify([]) == {}
+        assert validator.last_strategy is None
+
+
+class TestValidateBatch:
+    """Test cases for BatchValidator.validate_batch and validate_stream."""
+
+    def test_results_follow_input_order(self):
+        """Test that duplicates and unsorted input keep their positions."""
+        numbers = [97, 4, 97, 0, 1, 2, 15, 4]
+        results = BatchValidator().validate_batch(numbers)
+        assert [r.number for r in results] == numbers
+        assert [r.is_prime for r in results] == [_reference(n) for n in numbers]
+
+    def test_invalid_items_get_error_results(self):
+        """Test that invalid and unhashable items become error results."""
+        numbers = [7, [3], -5, 'x', {}, 11]
+        results = BatchValidator().validate_batch(numbers)
+        assert [r.number for r in results] == numbers
+        assert [r.is_prime for r in results] == [True, False, False, False, False, True]
+        assert results[1].explanation == "Invalid input: [3]"
+        assert results[4].explanation == "Invalid input: {}"
+
+    def test_max_batch_size(self):
+        """Test that oversized batches are refused but streams are not."""
+        validator = BatchValidator(max_batch_size=3)
+        with pytest.raises(InvalidInputError):
+            validator.validate_batch([1, 2, 3, 4])
+
+        chunks = list(validator.validate_stream(iter(range(10)), chunk_size=4))
+        assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+        assert [r.is_prime for chunk in chunks for r in chunk] == [_reference(n) for n in range(10)]
+        assert validator.max_batch_size == 3
+
+    def test_suspended_stream_keeps_the_cap(self):
+        """Test that a paused or abandoned stream does not lift the cap for other batches."""
+        validator = BatchValidator(max_batch_size=3)
+        stream = validator.validate_stream(iter(range(20)), chunk_size=5)
+        assert len(next(stream)) == 5
+        with pytest.raises(InvalidInputError):
+            validator.validate_batch([1, 2, 3, 4])
+        del stream
+        with pytest.raises(InvalidInputError):
+            validator.validate_batch([1, 2, 3, 4])
+
+    def test_include_factors(self):
+        """Test that factors are attached to composites only."""
+        results = BatchValidator().validate_batch([12, 13], include_factors=True)
+        assert results[0].factors == [2, 2, 3]
+        assert results[1].factors is None
+
+
+class TestMillerRabin:
+    """Test cases for the scalar and vectorized Miller-Rabin paths."""
+
+    def test_scalar_matches_trial_division(self):
+        """Test every number below 5000."""
+        assert [n for n in range(5000) if is_prime_miller_rabin(n)] == [n for n in range(5000) if _reference(n)]
+
+    @pytest.mark.skipif(validators.np is None, reason="numpy not installed")
+    def test_vector_path_matches_scalar(self):
+        """Test sparse numbers below 2**50, which take the numpy path, against the scalar test."""
+        rng = random.Random(7)
+        numbers = sorted({rng.randrange(2500, 2 ** 50) | 1 for _ in range(2000)})
+        numbers += [3215031751, 2152302898747, 3474749660383]  # strong pseudoprimes to small bases
+        validator = BatchValidator()
+        flags = validator.classify(sorted(set(numbers)))
+        assert validator.last_strategy == 'miller_rabin'
+        assert flags == {n: is_prime_miller_rabin(n) for n in flags}
+        assert not any(flags[n] for n in (3215031751, 2152302898747, 3474749660383))
+
+    def test_without_numpy(self, monkeypatch):
+        """Test that both strategies work when numpy is unavailable."""
+        monkeypatch.setattr(validators, 'np', None)
+        validator = BatchValidator()
+        assert validator.classify(list(range(100, 400))) == {n: _reference(n) for n in range(100, 400)}
+        numbers = [10 ** 12 + 39, 10 ** 12 + 41, 2 ** 61 - 1]
+        assert validator.classify(numbers) == {n: is_prime_miller_rabin(n) for n in numbers}
+        assert validator.last_strategy == 'miller_rabin'
@@ -108,18 +108,26 @@ def get_prime_factors(n: int) -> List[int]:
     return factors
 
 
-def estimate_sieve_memory(limit: int) -> int:
+def estimate_sieve_memory(limit: int, segment_size: int = 1 << 18) -> int:
     """
-    Estimate memory usage for Sieve of Eratosthenes.
+    Estimate working memory for the segmented Sieve of Eratosthenes.
+
+    The segmented sieve keeps one odd-only bytearray segment plus the base
+    primes up to sqrt(limit) and their offsets; the primes it yields are not
+    counted.
 
     Args:
         limit: Upper limit for sieve
+        segment_size: Odd numbers per segment (one byte each)
 
     Returns:
         Estimated memory usage in bytes
     """
-    # Boolean array uses 1 byte per element in Python
-    return limit + 1
+    root = math.isqrt(max(limit, 0))
+    # Roughly root / ln(root) base primes, each held as an int plus an offset
+    base_primes = int(root / math.log(root)) + 1 if root > 2 else 1
+    segment = min(segment_size, limit // 2 + 1)
+    return segment + base_primes * 2 * (sys.getsizeof(root) + 8)
 
 
 def calculate_nth_prime_upper_bound(n: int) -> int:
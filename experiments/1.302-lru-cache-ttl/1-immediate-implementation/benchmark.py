@@ -21,12 +21,16 @@ import statistics
 import sys
 import gc
 import random
+import tracemalloc
 import string
+import itertools
 from typing import List, Dict, Any, Callable
 from collections import defaultdict
 import psutil
 import os
-from lru_cache_ttl import LRUCacheWithTTL, create_cache
+import tempfile
+from lru_cache_ttl import LRUCacheWithTTL, create_cache, create_sharded_cache
+from eviction_policies import POLICIES
 
 
 class PerformanceTimer:
@@ -89,6 +93,52 @@ class MemoryTracker:
         }
 
 
+def generate_trace(workload: str, length: int, key_space: int, seed: int = 42) -> List[str]:
+    """
+    Generate a synthetic key trace for policy comparisons.
+
+    Workloads:
+        zipf: keys drawn from a Zipf(0.99) distribution over key_space
+        scan: the zipf trace with long one-off sequential scans of cold keys
+            interleaved (each scan is key_space keys long), as in batch jobs
+    """
+    rng = random.Random(seed)
+    weights = [1.0 / (rank ** 0.99) for rank in range(1, key_space + 1)]
+    cum_weights = list(itertools.accumulate(weights))
+
+    if workload == 'zipf':
+        return [f"k{i}" for i in rng.choices(range(key_space), cum_weights=cum_weights, k=length)]
+
+    if workload == 'scan':
+        trace: List[str] = []
+        scan_id = 0
+        while len(trace) < length:
+            burst = rng.choices(range(key_space), cum_weights=cum_weights, k=key_space * 2)
+            trace.extend(f"k{i}" for i in burst)
+            trace.extend(f"scan{scan_id}_{i}" for i in range(key_space))
+            scan_id += 1
+        return trace[:length]
+
+    raise ValueError(f"Unknown workload '{workload}'")
+
+
+def replay_trace(cache, trace: List[str]) -> Dict[str, float]:
+    """Replay a trace read-through style (get, then set on miss) and measure it."""
+    hits = 0
+    get = cache.get
+    put = cache.set
+    with PerformanceTimer("Trace replay") as timer:
+        for key in trace:
+            if get(key) is None:
+                put(key, key)
+            else:
+                hits += 1
+    return {
+        'hit_rate': hits / len(trace) if trace else 0.0,
+        'ops_per_sec': len(trace) / timer.elapsed if timer.elapsed else 0.0
+    }
+
+
 class BenchmarkSuite:
     """Comprehensive benchmark suite for LRU Cache with TTL."""
 
@@ -312,6 +362,86 @@ class BenchmarkSuite:
         finally:
             cache.close()
 
+    def benchmark_thread_scaling(self, thread_counts: List[int] = None, cache_size: int = 10000,
+                                 operations_per_thread: int = 10000, num_shards: int = 16):
+        """Compare single-lock and sharded caches as the thread count grows."""
+        if thread_counts is None:
+            thread_counts = [1, 2, 4, 8, 16, 32]
+
+        self.log(f"Benchmarking thread scaling (threads={thread_counts}, {operations_per_thread} ops each)")
+
+        factories = {
+            'single_lock': lambda: create_cache(max_size=cache_size),
+            'sharded': lambda: create_sharded_cache(max_size=cache_size, num_shards=num_shards)
+        }
+
+        for num_threads in thread_counts:
+            row = {'threads': num_threads}
+
+            for name, factory in factories.items():
+                cache = factory()
+                barrier = threading.Barrier(num_threads + 1)
+                # Pre-generate a read-heavy key stream per thread (80% get, 20% set)
+                workloads = []
+                for thread_id in range(num_threads):
+                    keys = [f"key_{random.randint(0, cache_size - 1)}" for _ in range(operations_per_thread)]
+                    ops = [random.random() < 0.8 for _ in range(operations_per_thread)]
+                    workloads.append(list(zip(ops, keys)))
+
+                def worker(workload):
+                    barrier.wait()
+                    for is_get, key in workload:
+                        if is_get:
+                            cache.get(key)
+                        else:
+                            cache.set(key, key)
+
+                try:
+                    for i in range(cache_size):
+                        cache.set(f"key_{i}", i)
+
+                    threads = [threading.Thread(target=worker, args=(w,)) for w in workloads]
+                    for t in threads:
+                        t.start()
+
+                    with PerformanceTimer(f"{name} x{num_threads}") as timer:
+                        barrier.wait()
+                        for t in threads:
+                            t.join()
+
+                    row[name] = (num_threads * operations_per_thread) / timer.elapsed
+                finally:
+                    cache.close()
+
+            row['speedup'] = row['sharded'] / row['single_lock']
+            self.results['thread_scaling'].append(row)
+            self.log(f"{num_threads:>2} threads: single-lock {row['single_lock']:>10,.0f} ops/sec, "
+                     f"sharded {row['sharded']:>10,.0f} ops/sec ({row['speedup']:.2f}x)")
+
+    def benchmark_policies(self, policies: List[str] = None, workloads: List[str] = None,
+                           cache_size: int = 1000, trace_length: int = 200000, key_space: int = 20000):
+        """Replay Zipfian and scan-heavy traces against each eviction policy."""
+        if policies is None:
+            policies = list(POLICIES)
+        if workloads is None:
+            workloads = ['zipf', 'scan']
+
+        self.log(f"Benchmarking eviction policies (cache_size={cache_size}, trace={trace_length}, "
+                 f"keys={key_space})")
+
+        for workload in workloads:
+            trace = generate_trace(workload, trace_length, key_space)
+            for policy in policies:
+                cache = LRUCacheWithTTL(max_size=cache_size, background_cleanup=False, policy=policy)
+                try:
+                    row = replay_trace(cache, trace)
+                finally:
+                    cache.close()
+                row.update({'workload': workload, 'policy': policy})
+                self.results['policy_comparison'].append(row)
+                self.log(f"{workload:>5} / {policy:<10}: hit rate {row['hit_rate']:.1%}, "
+                         f"{row['ops_per_sec']:,.0f} ops/sec")
+
     def benchmark_memory_usage(self, cache_sizes: List[int] = None):
         """Benchmark memory usage with different cache sizes."""
         if cache_sizes is None:
@@ -343,6 +473,103 @@ class BenchmarkSuite:
             finally:
                 cache.close()
 
+    def benchmark_entry_memory(self, entry_counts: List[int] = None, ttl: float = None):
+        """Measure cache bytes/entry for standard vs compact storage with tracemalloc."""
+        if entry_counts is None:
+            entry_counts = [10_000, 100_000, 1_000_000]
+
+        self.log(f"Benchmarking per-entry memory (entries={entry_counts}, ttl={ttl})")
+
+        for count in entry_counts:
+            # Keys and values are allocated before tracing so that only the
+            # cache's own bookkeeping (entries, dict slots, expiry index) is counted.
+            keys = [f"key_{i}" for i in range(count)]
+            values = list(range(count))
+            row = {'entries': count}
+
+            for mode, compact in (('standard', False), ('compact', True)):
+                gc.collect()
+                tracemalloc.start()
+                cache = LRUCacheWithTTL(max_size=count, default_ttl=ttl,
+                                        background_cleanup=False, compact=compact)
+                try:
+                    for key, value in zip(keys, values):
+                        cache.set(key, value)
+                    current, _ = tracemalloc.get_traced_memory()
+                finally:
+                    tracemalloc.stop()
+                    cache.close()
+                    del cache
+                row[mode] = current / count
+
+            row['saving_percent'] = (row['standard'] - row['compact']) / row['standard'] * 100
+            self.results['entry_memory'].append(row)
+            self.log(f"{count:>10,} entries: standard {row['standard']:.1f} B/entry, "
+                     f"compact {row['compact']:.1f} B/entry ({row['saving_percent']:.0f}% smaller)")
+
+            del keys, values
+
+    def benchmark_persistence(self, num_entries: int = 100000):
+        """Compare JSON persistence with binary snapshots (eager and lazy load)."""
+        self.log(f"Benchmarking persistence ({num_entries} entries)")
+
+        cache = create_cache(max_size=num_entries)
+        keys = self.generate_keys(num_entries)
+        values = self.generate_values(num_entries, "medium")
+        for key, value in zip(keys, values):
+            cache.set(key, value)
+
+        tmp_dir = tempfile.mkdtemp()
+        json_path = os.path.join(tmp_dir, "cache.json")
+        snap_path = os.path.join(tmp_dir, "cache.snap")
+        row = {'entries': num_entries}
+
+        try:
+            with PerformanceTimer("JSON save") as timer:
+                cache.save_to_file(json_path)
+            row['json_save_ms'] = timer.elapsed_ms
+
+            with PerformanceTimer("Snapshot save") as timer:
+                cache.save_snapshot(snap_path)
+            row['snapshot_save_ms'] = timer.elapsed_ms
+
+            # Lock hold time of a background save is the reference copy only
+            with PerformanceTimer("Snapshot background save") as timer:
+                writer = cache.save_snapshot(snap_path, background=True)
+            row['snapshot_blocking_ms'] = timer.elapsed_ms
+            writer.join()
+
+            row['json_bytes'] = os.path.getsize(json_path)
+            row['snapshot_bytes'] = os.path.getsize(snap_path)
+
+            for label, loader in (
+                ('json_load_ms', lambda c: c.load_from_file(json_path)),
+                ('snapshot_load_ms', lambda c: c.load_snapshot(snap_path, lazy=False)),
+                ('snapshot_lazy_load_ms', lambda c: c.load_snapshot(snap_path, lazy=True)),
+            ):
+                restored = create_cache(max_size=num_entries)
+                try:
+                    with PerformanceTimer(label) as timer:
+                        loader(restored)
+                        restored.get(keys[-1])
+                    row[label] = timer.elapsed_ms
+                finally:
+                    restored.close()
+        finally:
+            cache.close()
+            for path in (json_path, snap_path):
+                if os.path.exists(path):
+                    os.unlink(path)
+            os.rmdir(tmp_dir)
+
+        self.results['persistence'].append(row)
+        self.log(f"JSON: save {row['json_save_ms']:.0f}ms, load {row['json_load_ms']:.0f}ms, "
+                 f"{row['json_bytes'] / 1024 / 1024:.1f} MB")
+        self.log(f"Snapshot: save {row['snapshot_save_ms']:.0f}ms "
+                 f"(background blocks {row['snapshot_blocking_ms']:.0f}ms), "
+                 f"load {row['snapshot_load_ms']:.0f}ms, lazy load {row['snapshot_lazy_load_ms']:.0f}ms, "
+                 f"{row['snapshot_bytes'] / 1024 / 1024:.1f} MB")
+
     def benchmark_vs_dict(self, num_operations: int = 10000):
         """Benchmark against standard Python dict."""
         self.log(f"Benchmarking vs Python dict ({num_operations} operations)")
@@ -490,6 +717,41 @@ class BenchmarkSuite:
             for cache_size, memory_per_item in self.results['memory_per_item']:
                 print(f"Cache size {cache_size:>6}: {memory_per_item:>6.1f} bytes/item")
 
+        # Eviction policies
+        if 'policy_comparison' in self.results:
+            print(f"\nEviction Policies (trace replay):")
+            print("-" * 50)
+            print(f"{'Workload':>8} {'Policy':>10} {'Hit rate':>9} {'Ops/sec':>12}")
+            for row in self.results['policy_comparison']:
+                print(f"{row['workload']:>8} {row['policy']:>10} {row['hit_rate']:>8.1%} {row['ops_per_sec']:>12,.0f}")
+
+        # Per-entry memory by storage mode
+        if 'entry_memory' in self.results:
+            print(f"\nPer-entry Memory (bytes/entry):")
+            print("-" * 50)
+            print(f"{'Entries':>11} {'Standard':>10} {'Compact':>10} {'Saving':>8}")
+            for row in self.results['entry_memory']:
+                print(f"{row['entries']:>11,} {row['standard']:>10.1f} {row['compact']:>10.1f} {row['saving_percent']:>7.0f}%")
+
+        # Thread scaling
+        if 'thread_scaling' in self.results:
+            print(f"\nThread Scaling (ops/sec):")
+            print("-" * 50)
+            print(f"{'Threads':>7} {'Single lock':>14} {'Sharded':>14} {'Speedup':>9}")
+            for row in self.results['thread_scaling']:
+                print(f"{row['threads']:>7} {row['single_lock']:>14,.0f} {row['sharded']:>14,.0f} {row['speedup']:>8.2f}x")
+
+        # Persistence
+        if 'persistence' in self.results:
+            row = self.results['persistence'][-1]
+            print(f"\nPersistence ({row['entries']:,} entries, ms):")
+            print("-" * 50)
+            print(f"{'Format':>10} {'Save':>8} {'Load':>8} {'Lazy load':>10} {'MB':>8}")
+            print(f"{'JSON':>10} {row['json_save_ms']:>8.0f} {row['json_load_ms']:>8.0f} {'-':>10} "
+                  f"{row['json_bytes'] / 1024 / 1024:>8.1f}")
+            print(f"{'Snapshot':>10} {row['snapshot_save_ms']:>8.0f} {row['snapshot_load_ms']:>8.0f} "
+                  f"{row['snapshot_lazy_load_ms']:>10.0f} {row['snapshot_bytes'] / 1024 / 1024:>8.1f}")
+
         # Comparison with dict
         if 'cache_vs_dict' in self.results:
             comparison = self.results['cache_vs_dict'][-1]
@@ -509,6 +771,9 @@ def main():
     parser.add_argument('--stress-duration', type=int, default=10, help='Stress test duration in seconds')
     parser.add_argument('--max-cache-size', type=int, default=10000, help='Maximum cache size for testing')
     parser.add_argument('--threads', type=int, default=4, help='Number of threads for concurrency test')
+    parser.add_argument('--memory-max-entries', type=int, default=1_000_000,
+                        help='Largest entry count for the per-entry memory test (e.g. 10000000)')
+    parser.add_argument('--shards', type=int, default=16, help='Number of shards for the thread scaling test')
     parser.add_argument('--output', help='Save detailed results to JSON file')
 
     args = parser.parse_args()
@@ -549,8 +814,27 @@ def main():
             operations_per_thread=operations_scale // args.threads
         )
 
+        benchmark.benchmark_policies(
+            cache_size=min(1000, args.max_cache_size),
+            trace_length=operations_scale * 20
+        )
+
+        benchmark.benchmark_thread_scaling(
+            cache_size=min(10000, args.max_cache_size),
+            operations_per_thread=operations_scale,
+            num_shards=args.shards
+        )
+
         if not args.quick:
             benchmark.benchmark_memory_usage()
+            entry_counts = []
+            count = 10_000
+            while count <= args.memory_max_entries:
+                entry_counts.append(count)
+                count *= 10
+            benchmark.benchmark_entry_memory(entry_counts)
+
+        benchmark.benchmark_persistence(num_entries=operations_scale * 10)
 
         benchmark.benchmark_vs_dict(num_operations=operations_scale // 2)
 
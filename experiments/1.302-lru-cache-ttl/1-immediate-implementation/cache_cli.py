@@ -22,6 +22,25 @@ import threading
 from typing import Any, Dict, List, Optional
 import readline  # For better CLI experience
 from lru_cache_ttl import LRUCacheWithTTL, create_cache
+from eviction_policies import POLICIES
+
+
+SNAPSHOT_EXTENSION = '.snap'
+
+
+def save_cache(cache: LRUCacheWithTTL, filepath: str) -> None:
+    """Save a cache as a binary snapshot (.snap) or JSON (anything else)."""
+    if filepath.endswith(SNAPSHOT_EXTENSION):
+        cache.save_snapshot(filepath)
+    else:
+        cache.save_to_file(filepath)
+
+
+def load_cache(cache: LRUCacheWithTTL, filepath: str) -> bool:
+    """Load a cache from a binary snapshot (.snap) or JSON (anything else)."""
+    if filepath.endswith(SNAPSHOT_EXTENSION):
+        return cache.load_snapshot(filepath)
+    return cache.load_from_file(filepath)
 
 
 class CacheCLI(cmd.Cmd):
@@ -247,8 +266,11 @@ Type 'quit' or 'exit' to leave.
         Save cache to a file.
         Usage: save <filepath>
 
+        Files ending in .snap are written as binary snapshots.
+
         Example:
             save cache_backup.json
+            save cache_backup.snap
         """
         if not args.strip():
             print("Usage: save <filepath>")
@@ -256,7 +278,7 @@ Type 'quit' or 'exit' to leave.
 
         filepath = args.strip()
         try:
-            self.cache.save_to_file(filepath)
+            save_cache(self.cache, filepath)
             print(f"Cache saved to '{filepath}'")
         except Exception as e:
             print(f"Error saving cache: {e}")
@@ -266,8 +288,11 @@ Type 'quit' or 'exit' to leave.
         Load cache from a file.
         Usage: load <filepath>
 
+        Files ending in .snap are loaded lazily from binary snapshots.
+
         Example:
             load cache_backup.json
+            load cache_backup.snap
         """
         if not args.strip():
             print("Usage: load <filepath>")
@@ -275,7 +300,7 @@ Type 'quit' or 'exit' to leave.
 
         filepath = args.strip()
         try:
-            if self.cache.load_from_file(filepath):
+            if load_cache(self.cache, filepath):
                 print(f"Cache loaded from '{filepath}'")
             else:
                 print(f"Failed to load cache from '{filepath}'")
@@ -500,6 +525,7 @@ Examples:
   %(prog)s                              # Start interactive shell
   %(prog)s --max-size 256 --ttl 300     # Start with custom settings
   %(prog)s --load cache.json            # Load saved cache
+  %(prog)s --load cache.snap            # Lazy-load a binary snapshot
   %(prog)s --command "set key value"    # Execute single command
   %(prog)s --batch commands.txt         # Execute batch commands
         """
@@ -509,6 +535,8 @@ Examples:
                         help='Maximum cache size (default: 128)')
     parser.add_argument('--ttl', type=float, default=None,
                         help='Default TTL in seconds (default: no expiration)')
+    parser.add_argument('--policy', choices=list(POLICIES), default='lru',
+                        help='Eviction policy (default: lru)')
     parser.add_argument('--load', metavar='FILE',
                         help='Load cache from file on startup')
     parser.add_argument('--command', metavar='CMD',
@@ -521,11 +549,11 @@ Examples:
     args = parser.parse_args()
 
     # Create cache with specified parameters
-    cache = create_cache(max_size=args.max_size, default_ttl=args.ttl)
+    cache = create_cache(max_size=args.max_size, default_ttl=args.ttl, policy=args.policy)
 
     # Load cache if specified
     if args.load:
-        if cache.load_from_file(args.load):
+        if load_cache(cache, args.load):
             print(f"Loaded cache from '{args.load}'")
         else:
             print(f"Failed to load cache from '{args.load}'")
@@ -551,7 +579,7 @@ Examples:
         # Save cache if specified
         if args.save_on_exit:
             try:
-                cache.save_to_file(args.save_on_exit)
+                save_cache(cache, args.save_on_exit)
                 print(f"Saved cache to '{args.save_on_exit}'")
             except Exception as e:
                 print(f"Failed to save cache: {e}")
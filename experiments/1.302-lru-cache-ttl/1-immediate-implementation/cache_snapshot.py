@@ -0,0 +1,178 @@
+"""
+Binary Snapshot Format for LRU Cache with TTL
+
+A compact, mmap-friendly alternative to the JSON persistence in
+lru_cache_ttl.py. A snapshot file is laid out as:
+
+    header   fixed-size struct (magic, version, entry count, index offset,
+             max_size, default_ttl, timestamp)
+    values   pickled values, back to back
+    index    one record per entry in LRU -> MRU order: key length,
+             created_at, expires_at, access_count, value offset, value
+             length, followed by the UTF-8 key
+
+Readers parse the header and index only; values stay in the memory-mapped
+file until they are first accessed, so a restarted process can serve keys
+before the value section has been read.
+
+Snapshots contain pickled data: only load files from a trusted source.
+"""
+
+import math
+import mmap
+import os
+import pickle
+import struct
+import time
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+
+MAGIC = b'LRUSNAP1'
+VERSION = 1
+
+# magic, version, entry_count, index_offset, max_size, default_ttl, timestamp
+_HEADER = struct.Struct('<8sH6xQQQdd')
+# key_len, created_at, expires_at, access_count, value_offset, value_len
+_INDEX_RECORD = struct.Struct('<IddQQQ')
+
+# (key, value, created_at, expires_at, access_count)
+SnapshotRecord = Tuple[str, Any, float, Optional[float], int]
+
+
+class SnapshotError(ValueError):
+    """Raised when a snapshot file is missing its header or is corrupt."""
+
+
+class SnapshotValue:
+    """
+    A value that still lives in a memory-mapped snapshot file.
+
+    The cache stores these in place of real values after a lazy load and
+    replaces them with the unpickled object on first access.
+    """
+
+    __slots__ = ('_mm', '_offset', '_length')
+
+    def __init__(self, mm: mmap.mmap, offset: int, length: int):
+        self._mm = mm
+        self._offset = offset
+        self._length = length
+
+    def load(self) -> Any:
+        """Unpickle the value straight from the mapped file."""
+        with memoryview(self._mm) as view:
+            return pickle.loads(view[self._offset:self._offset + self._length])
+
+    def raw(self) -> bytes:
+        """Return the pickled bytes without unpickling them."""
+        return self._mm[self._offset:self._offset + self._length]
+
+
+def _encode_ttl(value: Optional[float]) -> float:
+    return math.nan if value is None else value
+
+
+def _decode_ttl(value: float) -> Optional[float]:
+    return None if math.isnan(value) else value
+
+
+def write_snapshot(filepath: str, records: Iterable[SnapshotRecord],
+                   max_size: int, default_ttl: Optional[float]) -> int:
+    """
+    Write records to a binary snapshot file.
+
+    The file is written to a temporary path and atomically renamed, so a
+    crash mid-write never leaves a truncated snapshot behind.
+
+    Args:
+        filepath: Destination path
+        records: (key, value, created_at, expires_at, access_count) tuples in
+            LRU -> MRU order; values may be SnapshotValue (copied unpickled)
+        max_size: Cache capacity to record in the header
+        default_ttl: Cache default TTL to record in the header
+
+    Returns:
+        The number of entries written
+    """
+    tmp_path = f"{filepath}.tmp"
+    index: List[Tuple[bytes, float, Optional[float], int, int, int]] = []
+
+    with open(tmp_path, 'wb') as f:
+        f.write(b'\0' * _HEADER.size)
+        offset = _HEADER.size
+
+        for key, value, created_at, expires_at, access_count in records:
+            if isinstance(value, SnapshotValue):
+                payload = value.raw()
+            else:
+                payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            f.write(payload)
+            index.append((key.encode('utf-8'), created_at, expires_at, access_count,
+                          offset, len(payload)))
+            offset += len(payload)
+
+        index_offset = offset
+        for key_bytes, created_at, expires_at, access_count, value_offset, value_len in index:
+            f.write(_INDEX_RECORD.pack(len(key_bytes), created_at, _encode_ttl(expires_at),
+                                       access_count, value_offset, value_len))
+            f.write(key_bytes)
+
+        f.seek(0)
+        f.write(_HEADER.pack(MAGIC, VERSION, len(index), index_offset, max_size,
+                             _encode_ttl(default_ttl), time.time()))
+        f.flush()
+        os.fsync(f.fileno())
+
+    os.replace(tmp_path, filepath)
+    return len(index)
+
+
+class SnapshotReader:
+    """Memory-mapped reader for binary snapshot files."""
+
+    def __init__(self, filepath: str):
+        with open(filepath, 'rb') as f:
+            try:
+                self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise SnapshotError(f"Empty snapshot file: {filepath}")
+
+        if len(self._mm) < _HEADER.size:
+            raise SnapshotError(f"Truncated snapshot header: {filepath}")
+
+        (magic, version, self.entry_count, self._index_offset, self.max_size,
+         default_ttl, self.timestamp) = _HEADER.unpack_from(self._mm, 0)
+
+        if magic != MAGIC:
+            raise SnapshotError(f"Not a cache snapshot: {filepath}")
+        if version != VERSION:
+            raise SnapshotError(f"Unsupported snapshot version {version}")
+        if self._index_offset > len(self._mm):
+            raise SnapshotError(f"Corrupt snapshot index offset: {filepath}")
+
+        self.default_ttl = _decode_ttl(default_ttl)
+
+    def records(self) -> Iterator[Tuple[str, float, Optional[float], int, SnapshotValue]]:
+        """
+        Iterate the index in LRU -> MRU order without touching the values.
+
+        Yields:
+            (key, created_at, expires_at, access_count, SnapshotValue) tuples
+        """
+        mm = self._mm
+        pos = self._index_offset
+        end = len(mm)
+        for _ in range(self.entry_count):
+            if pos + _INDEX_RECORD.size > end:
+                raise SnapshotError("Truncated snapshot index")
+            (key_len, created_at, expires_at, access_count,
+             value_offset, value_len) = _INDEX_RECORD.unpack_from(mm, pos)
+            pos += _INDEX_RECORD.size
+            if pos + key_len > end:
+                raise SnapshotError("Truncated snapshot index")
+            key = mm[pos:pos + key_len].decode('utf-8')
+            pos += key_len
+            if value_offset + value_len > self._index_offset:
+                raise SnapshotError(f"Corrupt value offset for key {key!r}")
+            yield (key, created_at, _decode_ttl(expires_at), access_count,
+                   SnapshotValue(mm, value_offset, value_len))
@@ -0,0 +1,351 @@
+"""
+Eviction and Admission Policies for LRU Cache with TTL
+
+LRUCacheWithTTL stores its entries in an OrderedDict kept in recency order
+and delegates two decisions to a policy object:
+
+- which key to evict when the cache is full, and
+- whether a new key should be admitted at all.
+
+Policies provided:
+- LRUPolicy: plain least-recently-used eviction (the default)
+- SegmentedLRUPolicy: probation + protected segments, so keys must be hit
+  twice before they are protected from a one-off scan
+- TinyLFUPolicy: a frequency-sketch admission filter in front of an SLRU
+  main space; a new key only displaces the victim if it is estimated to be
+  accessed more often
+- WindowTinyLFUPolicy: a small LRU admission window in front of the
+  TinyLFU-filtered SLRU main space, so recency-heavy bursts are not rejected
+
+Policies are notified through the record_* hooks while the cache lock is
+held, so they need no locking of their own.
+"""
+
+from collections import OrderedDict
+from typing import Dict, Optional, Type
+
+
+class EvictionPolicy:
+    """Base class for cache eviction policies; the hooks default to no-ops."""
+
+    name = 'base'
+
+    def bind(self, max_size: int) -> None:
+        """Called by the cache with its capacity, and again whenever the capacity changes."""
+        self.max_size = max_size
+
+    def record_access(self, key: str) -> None:
+        """A key was read (hit) or overwritten."""
+
+    def record_miss(self, key: str) -> None:
+        """A lookup for a key missed."""
+
+    def record_insert(self, key: str) -> None:
+        """A new key was stored."""
+
+    def record_remove(self, key: str) -> None:
+        """A key left the cache (delete, expiry or eviction)."""
+
+    def select_victim(self, candidate: str, entries: OrderedDict) -> Optional[str]:
+        """
+        Choose the key to evict so that candidate can be inserted.
+
+        Args:
+            candidate: The new key about to be inserted
+            entries: The cache's entries in LRU -> MRU order
+
+        Returns:
+            The key to evict, candidate itself to reject the insertion, or
+            None if there is nothing to evict
+        """
+        return next(iter(entries), None)
+
+    def clear(self) -> None:
+        """Forget all tracked keys."""
+
+
+class LRUPolicy(EvictionPolicy):
+    """Evict the least recently used key; the cache's own order is enough."""
+
+    name = 'lru'
+
+
+class SegmentedLRUPolicy(EvictionPolicy):
+    """
+    Segmented LRU.
+
+    New keys enter a probation segment; a hit promotes a key to the
+    protected segment (about protected_ratio of the capacity). Victims are
+    taken from probation first, so a scan of keys seen once cannot push out
+    keys that have been hit more than once.
+    """
+
+    name = 'slru'
+
+    def __init__(self, protected_ratio: float = 0.8):
+        if not 0 < protected_ratio < 1:
+            raise ValueError("protected_ratio must be between 0 and 1")
+        self.protected_ratio = protected_ratio
+        self._probation: OrderedDict = OrderedDict()
+        self._protected: OrderedDict = OrderedDict()
+
+    def bind(self, max_size: int) -> None:
+        super().bind(max_size)
+        self.protected_size = max(1, int(max_size * self.protected_ratio))
+
+    def record_access(self, key: str) -> None:
+        if key in self._protected:
+            self._protected.move_to_end(key)
+        elif key in self._probation:
+            del self._probation[key]
+            self._protected[key] = None
+            if len(self._protected) > self.protected_size:
+                # Demote the protected LRU back to the MRU end of probation
+                demoted, _ = self._protected.popitem(last=False)
+                self._probation[demoted] = None
+
+    def record_insert(self, key: str) -> None:
+        self._probation[key] = None
+
+    def record_remove(self, key: str) -> None:
+        if self._probation.pop(key, False) is False:
+            self._protected.pop(key, None)
+
+    def select_victim(self, candidate: str, entries: OrderedDict) -> Optional[str]:
+        if self._probation:
+            return next(iter(self._probation))
+        return next(iter(self._protected), None)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._probation or key in self._protected
+
+    def __len__(self) -> int:
+        return len(self._probation) + len(self._protected)
+
+    def clear(self) -> None:
+        self._probation.clear()
+        self._protected.clear()
+
+
+class FrequencySketch:
+    """
+    Approximate access-frequency counter: a count-min sketch plus doorkeeper.
+
+    The doorkeeper is a small bit set that absorbs the first occurrence of
+    each key, so one-hit wonders never reach the counters. Counters saturate
+    at 15 and the whole structure is halved every sample_size (10 x width)
+    increments so that old popularity fades.
+    """
+
+    DEPTH = 4
+    MAX_COUNT = 15
+    _MASK64 = (1 << 64) - 1
+
+    def __init__(self, capacity: int):
+        width = 64
+        while width < capacity:
+            width <<= 1
+        self.width = width
+        self._index_mask = width - 1
+        self._rows = [bytearray(width) for _ in range(self.DEPTH)]
+        self._doorkeeper = bytearray(width // 2)  # 4 bits per expected key
+        self._doorkeeper_mask = len(self._doorkeeper) * 8 - 1
+        self.sample_size = 10 * width
+        self._additions = 0
+
+    def _indexes(self, h: int):
+        """Counter index in each row, by double hashing the two halves of h."""
+        mask = self._index_mask
+        h1 = h & 0xFFFFFFFF
+        h2 = (h >> 32) | 1
+        return (h1 & mask, (h1 + h2) & mask, (h1 + 2 * h2) & mask, (h1 + 3 * h2) & mask)
+
+    def _in_doorkeeper(self, h: int, add: bool = False) -> bool:
+        """Test (and optionally set) the key's two doorkeeper bits."""
+        door = self._doorkeeper
+        bit_a = (h >> 7) & self._doorkeeper_mask
+        bit_b = (h >> 39) & self._doorkeeper_mask
+        mask_a, mask_b = 1 << (bit_a & 7), 1 << (bit_b & 7)
+        present = bool(door[bit_a >> 3] & mask_a and door[bit_b >> 3] & mask_b)
+        if add and not present:
+            door[bit_a >> 3] |= mask_a
+            door[bit_b >> 3] |= mask_b
+        return present
+
+    def increment(self, key: str) -> None:
+        """Record one occurrence of key."""
+        h = hash(key) & self._MASK64
+        if self._in_doorkeeper(h, add=True):
+            r0, r1, r2, r3 = self._rows
+            i0, i1, i2, i3 = self._indexes(h)
+            limit = self.MAX_COUNT
+            if r0[i0] < limit:
+                r0[i0] += 1
+            if r1[i1] < limit:
+                r1[i1] += 1
+            if r2[i2] < limit:
+                r2[i2] += 1
+            if r3[i3] < limit:
+                r3[i3] += 1
+
+        self._additions += 1
+        if self._additions >= self.sample_size:
+            self._age()
+
+    def frequency(self, key: str) -> int:
+        """Estimate how often key has been seen recently."""
+        h = hash(key) & self._MASK64
+        r0, r1, r2, r3 = self._rows
+        i0, i1, i2, i3 = self._indexes(h)
+        return min(r0[i0], r1[i1], r2[i2], r3[i3]) + self._in_doorkeeper(h)
+
+    def _age(self) -> None:
+        """Halve every counter and reset the doorkeeper."""
+        halve = bytes(value >> 1 for value in range(256))
+        for row in self._rows:
+            row[:] = row.translate(halve)
+        self._doorkeeper = bytearray(len(self._doorkeeper))
+        self._additions //= 2
+
+    def clear(self) -> None:
+        for row in self._rows:
+            row[:] = bytes(len(row))
+        self._doorkeeper = bytearray(len(self._doorkeeper))
+        self._additions = 0
+
+
+class TinyLFUPolicy(EvictionPolicy):
+    """
+    TinyLFU admission in front of a segmented LRU.
+
+    When the cache is full, the candidate is admitted only if its estimated
+    frequency is higher than that of the SLRU victim; otherwise the
+    insertion is rejected and the working set survives the scan.
+    """
+
+    name = 'tinylfu'
+
+    def __init__(self, protected_ratio: float = 0.8):
+        self._main = SegmentedLRUPolicy(protected_ratio)
+
+    def bind(self, max_size: int) -> None:
+        super().bind(max_size)
+        self._main.bind(max_size)
+        self.sketch = FrequencySketch(max_size)
+
+    def record_access(self, key: str) -> None:
+        self.sketch.increment(key)
+        self._main.record_access(key)
+
+    def record_miss(self, key: str) -> None:
+        self.sketch.increment(key)
+
+    def record_insert(self, key: str) -> None:
+        self._main.record_insert(key)
+
+    def record_remove(self, key: str) -> None:
+        self._main.record_remove(key)
+
+    def select_victim(self, candidate: str, entries: OrderedDict) -> Optional[str]:
+        self.sketch.increment(candidate)
+        victim = self._main.select_victim(candidate, entries)
+        if victim is None:
+            return None
+        if self.sketch.frequency(candidate) > self.sketch.frequency(victim):
+            return victim
+        return candidate
+
+    def clear(self) -> None:
+        self._main.clear()
+        self.sketch.clear()
+
+
+class WindowTinyLFUPolicy(EvictionPolicy):
+    """
+    W-TinyLFU: an LRU admission window plus a TinyLFU-filtered SLRU.
+
+    New keys always enter the window (about window_ratio of the capacity).
+    Once the cache is full, the window's LRU key competes with the main
+    space's victim on estimated frequency and the loser is evicted, so no
+    insertion is ever rejected outright.
+    """
+
+    name = 'w-tinylfu'
+
+    def __init__(self, window_ratio: float = 0.01, protected_ratio: float = 0.8):
+        if not 0 < window_ratio < 1:
+            raise ValueError("window_ratio must be between 0 and 1")
+        self.window_ratio = window_ratio
+        self._window: OrderedDict = OrderedDict()
+        self._main = SegmentedLRUPolicy(protected_ratio)
+
+    def bind(self, max_size: int) -> None:
+        super().bind(max_size)
+        self.window_size = max(1, int(max_size * self.window_ratio))
+        self._main.bind(max(1, max_size - self.window_size))
+        self.sketch = FrequencySketch(max_size)
+
+    def record_access(self, key: str) -> None:
+        self.sketch.increment(key)
+        if key in self._window:
+            self._window.move_to_end(key)
+        else:
+            self._main.record_access(key)
+
+    def record_miss(self, key: str) -> None:
+        self.sketch.increment(key)
+
+    def record_insert(self, key: str) -> None:
+        self._window[key] = None
+        if len(self._window) > self.window_size:
+            # While the cache is filling up, window overflow moves to main as-is
+            overflow, _ = self._window.popitem(last=False)
+            self._main.record_insert(overflow)
+
+    def record_remove(self, key: str) -> None:
+        if self._window.pop(key, False) is False:
+            self._main.record_remove(key)
+
+    def select_victim(self, candidate: str, entries: OrderedDict) -> Optional[str]:
+        self.sketch.increment(candidate)
+        main_victim = self._main.select_victim(candidate, entries)
+        if not self._window:
+            return main_victim
+        if main_victim is None:
+            return next(iter(self._window))
+        if len(self._window) < self.window_size:
+            return main_victim
+
+        window_victim = next(iter(self._window))
+        if self.sketch.frequency(window_victim) > self.sketch.frequency(main_victim):
+            # The window's LRU key earns a place in main probation
+            del self._window[window_victim]
+            self._main.record_insert(window_victim)
+            return main_victim
+        return window_victim
+
+    def clear(self) -> None:
+        self._window.clear()
+        self._main.clear()
+        self.sketch.clear()
+
+
+POLICIES: Dict[str, Type[EvictionPolicy]] = {
+    LRUPolicy.name: LRUPolicy,
+    SegmentedLRUPolicy.name: SegmentedLRUPolicy,
+    TinyLFUPolicy.name: TinyLFUPolicy,
+    WindowTinyLFUPolicy.name: WindowTinyLFUPolicy,
+}
+
+
+def create_policy(name: str) -> EvictionPolicy:
+    """
+    Create a policy by name ('lru', 'slru', 'tinylfu' or 'w-tinylfu').
+
+    Raises:
+        ValueError: If the name is unknown
+    """
+    try:
+        return POLICIES[name.lower()]()
+    except KeyError:
+        raise ValueError(f"Unknown eviction policy '{name}'. Choose from: {', '.join(POLICIES)}")
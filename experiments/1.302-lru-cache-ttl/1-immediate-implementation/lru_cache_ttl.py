@@ -3,25 +3,39 @@ LRU Cache with TTL (Time-To-Live) Implementation
 
 This module provides a thread-safe LRU cache with TTL functionality.
 Features:
-- Least Recently Used (LRU) eviction policy
+- Least Recently Used (LRU) eviction policy, or pluggable SLRU / TinyLFU policies
 - Time-To-Live (TTL) expiration for entries
+- Min-heap expiry index so expiring entries costs O(expired), not O(size)
+- Optional compact (__slots__) entry storage for large caches of small values
 - Thread-safe operations with proper locking
 - Configurable maximum capacity
 - Statistics tracking (hits, misses, evictions)
-- Optional persistence and configuration
+- Optional persistence (JSON, or binary snapshots with lazy mmap loading)
+- Read-through loading (get_or_set, aget_or_set, @cached) with stampede
+  protection and stale-while-revalidate
 """
 
 import time
+import asyncio
+import functools
+import heapq
+import inspect
+import itertools
 import threading
-from typing import Any, Optional, Dict, Tuple, Iterator
+from typing import Any, Awaitable, Callable, Optional, Dict, List, Tuple, Iterator, Union
 from collections import OrderedDict
 import json
 import os
+import pickle
 from datetime import datetime, timedelta
+from cache_snapshot import SnapshotError, SnapshotReader, SnapshotValue, write_snapshot
+from eviction_policies import EvictionPolicy, create_policy
 
 
-class CacheEntry:
-    """Represents a single cache entry with value and expiration time."""
+class _BaseCacheEntry:
+    """Shared behaviour for cache entries; subclasses decide the storage layout."""
+
+    __slots__ = ()
 
     def __init__(self, value: Any, ttl_seconds: Optional[float] = None):
         self.value = value
@@ -49,6 +63,33 @@ class CacheEntry:
         return max(0, remaining)
 
 
+class CacheEntry(_BaseCacheEntry):
+    """Represents a single cache entry with value and expiration time."""
+
+
+class CompactCacheEntry(_BaseCacheEntry):
+    """
+    Memory-compact cache entry.
+
+    Identical to CacheEntry but stores its attributes in __slots__ instead of
+    a per-instance __dict__, which removes the dict allocation from every
+    entry. Arbitrary attributes can no longer be attached to entries.
+    """
+
+    __slots__ = ('value', 'created_at', 'last_accessed', 'expires_at', 'access_count')
+
+
+class _InFlight:
+    """A load in progress; concurrent callers for the same key wait on it."""
+
+    __slots__ = ('event', 'value', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.value = None
+        self.error: Optional[BaseException] = None
+
+
 class LRUCacheWithTTL:
     """
     A thread-safe LRU Cache with TTL (Time-To-Live) functionality.
@@ -57,22 +98,39 @@ class LRUCacheWithTTL:
     items when full. Items also automatically expire after their TTL.
     """
 
-    def __init__(self, max_size: int = 128, default_ttl: Optional[float] = None):
+    def __init__(self, max_size: int = 128, default_ttl: Optional[float] = None,
+                 background_cleanup: bool = True, compact: bool = False,
+                 policy: Union[str, EvictionPolicy] = 'lru'):
         """
         Initialize the LRU Cache with TTL.
 
         Args:
             max_size: Maximum number of items to store in cache
             default_ttl: Default TTL in seconds for new entries (None = no expiration)
+            background_cleanup: Start a background thread that purges expired entries
+            compact: Store entries as slotted CompactCacheEntry objects
+            policy: Eviction policy name ('lru', 'slru', 'tinylfu', 'w-tinylfu')
+                or an EvictionPolicy instance (see eviction_policies.py)
         """
         if max_size <= 0:
             raise ValueError("max_size must be positive")
 
         self.max_size = max_size
         self.default_ttl = default_ttl
-        self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
+        self.compact = compact
+        self._entry_class = CompactCacheEntry if compact else CacheEntry
+        self._cache: OrderedDict[str, _BaseCacheEntry] = OrderedDict()
         self._lock = threading.RLock()
 
+        self._policy = create_policy(policy) if isinstance(policy, str) else policy
+        self._policy.bind(max_size)
+
+        # Expiry index: min-heap of (expires_at, seq, key, entry). Entries that
+        # are overwritten, deleted or evicted are left in the heap and skipped
+        # lazily when popped; the heap is rebuilt once stale items dominate.
+        self._expiry_heap: List[Tuple[float, int, str, _BaseCacheEntry]] = []
+        self._expiry_seq = itertools.count()
+
         # Statistics
         self._stats = {
             'hits': 0,
@@ -80,14 +138,27 @@ class LRUCacheWithTTL:
             'evictions': 0,
             'expirations': 0,
             'sets': 0,
-            'deletes': 0
+            'deletes': 0,
+            'rejections': 0,
+            'loads': 0,
+            'load_errors': 0,
+            'coalesced': 0,
+            'stale_hits': 0
         }
 
+        # Read-through loading: loads in flight per key, and the soft expiry
+        # time of entries stored with a stale-while-revalidate window
+        self._inflight: Dict[str, _InFlight] = {}
+        self._async_inflight: Dict[str, asyncio.Future] = {}
+        self._refresh_at: Dict[str, float] = {}
+        self._load_setter: Optional[Callable[[str, Any, Optional[float]], None]] = None
+
         # Background cleanup
         self._cleanup_interval = 60  # seconds
         self._cleanup_thread = None
         self._stop_cleanup = threading.Event()
-        self._start_cleanup_thread()
+        if background_cleanup:
+            self._start_cleanup_thread()
 
     def _start_cleanup_thread(self) -> None:
         """Start the background cleanup thread."""
@@ -100,14 +171,96 @@ class LRUCacheWithTTL:
     def _cleanup_expired_entries(self) -> None:
         """Background thread to clean up expired entries."""
         while not self._stop_cleanup.wait(self._cleanup_interval):
-            with self._lock:
-                expired_keys = [
-                    key for key, entry in self._cache.items()
-                    if entry.is_expired()
-                ]
-                for key in expired_keys:
-                    del self._cache[key]
+            self.expire_due()
+
+    def _store(self, key: str, entry: _BaseCacheEntry) -> None:
+        """Insert an entry and index its expiry time. Caller must hold the lock."""
+        if self._refresh_at:
+            self._refresh_at.pop(key, None)
+        if key in self._cache:
+            self._policy.record_access(key)
+        else:
+            self._policy.record_insert(key)
+        self._cache[key] = entry
+        if entry.expires_at is not None:
+            heapq.heappush(self._expiry_heap, (entry.expires_at, next(self._expiry_seq), key, entry))
+            if len(self._expiry_heap) > 2 * len(self._cache) + 64:
+                self._rebuild_expiry_heap()
+
+    def _rebuild_expiry_heap(self) -> None:
+        """Drop stale heap items, keeping only live entries. Caller must hold the lock."""
+        self._expiry_heap = [
+            item for item in self._expiry_heap
+            if self._cache.get(item[2]) is item[3]
+        ]
+        heapq.heapify(self._expiry_heap)
+
+    def expire_due(self, now: Optional[float] = None, limit: Optional[int] = None) -> int:
+        """
+        Remove entries whose TTL has passed, using the expiry index.
+
+        Only the expired entries (plus stale index items) are visited, so this
+        is cheap enough to call from a caller's own event loop or timer.
+
+        Args:
+            now: Reference time (defaults to time.time())
+            limit: Maximum number of entries to expire in this call
+
+        Returns:
+            The number of entries removed
+        """
+        if now is None:
+            now = time.time()
+
+        removed = 0
+        with self._lock:
+            heap = self._expiry_heap
+            while heap and heap[0][0] < now:
+                if limit is not None and removed >= limit:
+                    break
+                _, _, key, entry = heapq.heappop(heap)
+                if self._cache.get(key) is entry:
+                    self._remove(key)
                     self._stats['expirations'] += 1
+                    removed += 1
+        return removed
+
+    def next_expiry(self) -> Optional[float]:
+        """Return the earliest pending expiry timestamp, or None if nothing expires."""
+        with self._lock:
+            heap = self._expiry_heap
+            while heap and self._cache.get(heap[0][2]) is not heap[0][3]:
+                heapq.heappop(heap)
+            return heap[0][0] if heap else None
+
+    def _remove(self, key: str) -> None:
+        """Remove an entry and tell the policy. Caller must hold the lock."""
+        del self._cache[key]
+        self._policy.record_remove(key)
+        if self._refresh_at:
+            self._refresh_at.pop(key, None)
+
+    def _resize(self, max_size: int) -> None:
+        """Change the capacity and rebind the policy to it. Caller must hold the lock."""
+        if max_size != self.max_size:
+            self.max_size = max_size
+            self._policy.bind(max_size)
+
+    def _make_room(self, candidate: str) -> bool:
+        """
+        Evict the policy's victim so candidate can be inserted. Caller must hold the lock.
+
+        Returns:
+            False if the policy rejected the candidate, True otherwise
+        """
+        victim = self._policy.select_victim(candidate, self._cache)
+        if victim == candidate:
+            self._stats['rejections'] += 1
+            return False
+        if victim is not None:
+            self._remove(victim)
+            self._stats['evictions'] += 1
+        return True
 
     def get(self, key: str) -> Optional[Any]:
         """
@@ -122,23 +275,34 @@ class LRUCacheWithTTL:
         with self._lock:
             if key not in self._cache:
                 self._stats['misses'] += 1
+                self._policy.record_miss(key)
                 return None
 
             entry = self._cache[key]
 
             # Check if expired
             if entry.is_expired():
-                del self._cache[key]
+                self._remove(key)
                 self._stats['misses'] += 1
                 self._stats['expirations'] += 1
+                self._policy.record_miss(key)
                 return None
 
             # Move to end (most recently used)
             self._cache.move_to_end(key)
+            self._policy.record_access(key)
             entry.touch()
             self._stats['hits'] += 1
 
-            return entry.value
+            return self._resolve(entry)
+
+    @staticmethod
+    def _resolve(entry: _BaseCacheEntry) -> Any:
+        """Return an entry's value, unpickling it first if it came from a lazy snapshot load."""
+        value = entry.value
+        if isinstance(value, SnapshotValue):
+            value = entry.value = value.load()
+        return value
 
     def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
         """
@@ -154,20 +318,181 @@ class LRUCacheWithTTL:
 
             if key in self._cache:
                 # Update existing entry
-                self._cache[key] = CacheEntry(value, ttl_to_use)
+                self._store(key, self._entry_class(value, ttl_to_use))
                 self._cache.move_to_end(key)
             else:
-                # Add new entry
-                if len(self._cache) >= self.max_size:
-                    # Evict least recently used item
-                    oldest_key = next(iter(self._cache))
-                    del self._cache[oldest_key]
-                    self._stats['evictions'] += 1
+                # Add new entry, evicting the policy's victim when full. An
+                # admission policy may reject the new key instead.
+                if len(self._cache) >= self.max_size and not self._make_room(key):
+                    return
 
-                self._cache[key] = CacheEntry(value, ttl_to_use)
+                self._store(key, self._entry_class(value, ttl_to_use))
 
             self._stats['sets'] += 1
 
+    def _lookup_for_load(self, key: str) -> Tuple[str, Any]:
+        """
+        Look a key up on behalf of get_or_set. Caller must hold the lock.
+
+        Returns:
+            ('hit', value), ('stale', value) when the entry is past its soft
+            expiry but inside its stale window, or ('miss', None)
+        """
+        entry = self._cache.get(key)
+        if entry is not None:
+            if entry.is_expired():
+                self._remove(key)
+                self._stats['expirations'] += 1
+            else:
+                self._cache.move_to_end(key)
+                self._policy.record_access(key)
+                entry.touch()
+                self._stats['hits'] += 1
+                value = self._resolve(entry)
+                refresh_at = self._refresh_at.get(key) if self._refresh_at else None
+                if refresh_at is not None and time.time() >= refresh_at:
+                    self._stats['stale_hits'] += 1
+                    return 'stale', value
+                return 'hit', value
+
+        self._stats['misses'] += 1
+        self._policy.record_miss(key)
+        return 'miss', None
+
+    def _store_loaded(self, key: str, value: Any, ttl: Optional[float],
+                      stale_ttl: Optional[float]) -> None:
+        """Store a freshly loaded value, keeping it stale_ttl seconds past its TTL."""
+        ttl_to_use = ttl if ttl is not None else self.default_ttl
+        setter = self._load_setter or self.set
+        with self._lock:
+            self._stats['loads'] += 1
+
+        # A sharded setter may lock another shard, so never call it holding ours
+        if stale_ttl and ttl_to_use is not None:
+            setter(key, value, ttl_to_use + stale_ttl)
+            with self._lock:
+                if key in self._cache:
+                    self._refresh_at[key] = time.time() + ttl_to_use
+        else:
+            setter(key, value, ttl_to_use)
+
+    def _run_load(self, key: str, loader: Callable[[], Any], ttl: Optional[float],
+                  stale_ttl: Optional[float], flight: _InFlight) -> None:
+        """Call the loader for a single-flight load and publish the result."""
+        try:
+            flight.value = loader()
+            self._store_loaded(key, flight.value, ttl, stale_ttl)
+        except BaseException as e:
+            flight.error = e
+            with self._lock:
+                self._stats['load_errors'] += 1
+        finally:
+            with self._lock:
+                if self._inflight.get(key) is flight:
+                    del self._inflight[key]
+            flight.event.set()
+
+    def get_or_set(self, key: str, loader: Callable[[], Any], ttl: Optional[float] = None,
+                   stale_ttl: Optional[float] = None) -> Any:
+        """
+        Return the cached value for key, calling loader() to fill it on a miss.
+
+        Concurrent misses for the same key share a single loader call: one
+        thread loads while the others wait for its result (or exception).
+
+        Args:
+            key: The cache key
+            loader: Zero-argument callable producing the value
+            ttl: TTL in seconds for the loaded value (uses default_ttl if None)
+            stale_ttl: Stale-while-revalidate window. Once ttl has passed the
+                old value is still returned for up to stale_ttl seconds while
+                a single background thread reloads it.
+
+        Returns:
+            The cached or freshly loaded value
+
+        Raises:
+            Whatever loader() raised, to every caller waiting on that load
+        """
+        with self._lock:
+            status, value = self._lookup_for_load(key)
+            if status == 'hit':
+                return value
+
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = _InFlight()
+            elif status == 'miss':
+                self._stats['coalesced'] += 1
+
+        if status == 'stale':
+            if leader:
+                threading.Thread(
+                    target=self._run_load,
+                    args=(key, loader, ttl, stale_ttl, flight),
+                    daemon=True
+                ).start()
+            return value
+
+        if leader:
+            self._run_load(key, loader, ttl, stale_ttl, flight)
+        else:
+            flight.event.wait()
+
+        if flight.error is not None:
+            raise flight.error
+        return flight.value
+
+    async def _async_load(self, key: str, loader: Callable[[], Any], ttl: Optional[float],
+                          stale_ttl: Optional[float]) -> Any:
+        """Await (or call) the loader and store its result."""
+        try:
+            value = loader()
+            if inspect.isawaitable(value):
+                value = await value
+        except BaseException:
+            with self._lock:
+                self._stats['load_errors'] += 1
+            raise
+        self._store_loaded(key, value, ttl, stale_ttl)
+        return value
+
+    def _finish_async_load(self, key: str, task: asyncio.Future) -> None:
+        """Forget a finished async load (and retrieve its exception to avoid warnings)."""
+        with self._lock:
+            if self._async_inflight.get(key) is task:
+                del self._async_inflight[key]
+        if not task.cancelled():
+            task.exception()
+
+    async def aget_or_set(self, key: str, loader: Callable[[], Union[Any, Awaitable[Any]]],
+                          ttl: Optional[float] = None, stale_ttl: Optional[float] = None) -> Any:
+        """
+        Async version of get_or_set.
+
+        loader may be a coroutine function or a plain callable. Concurrent
+        misses from coroutines on the same event loop await one shared task;
+        with stale_ttl a stale value is returned immediately while the
+        refresh task runs in the background.
+        """
+        with self._lock:
+            status, value = self._lookup_for_load(key)
+            if status == 'hit':
+                return value
+
+            task = self._async_inflight.get(key)
+            if task is None:
+                task = asyncio.ensure_future(self._async_load(key, loader, ttl, stale_ttl))
+                self._async_inflight[key] = task
+                task.add_done_callback(functools.partial(self._finish_async_load, key))
+            elif status == 'miss':
+                self._stats['coalesced'] += 1
+
+        if status == 'stale':
+            return value
+        return await asyncio.shield(task)
+
     def delete(self, key: str) -> bool:
         """
         Delete a key from the cache.
@@ -180,7 +505,7 @@ class LRUCacheWithTTL:
         """
         with self._lock:
             if key in self._cache:
-                del self._cache[key]
+                self._remove(key)
                 self._stats['deletes'] += 1
                 return True
             return False
@@ -189,6 +514,9 @@ class LRUCacheWithTTL:
         """Clear all items from the cache."""
         with self._lock:
             self._cache.clear()
+            self._expiry_heap.clear()
+            self._policy.clear()
+            self._refresh_at.clear()
 
     def exists(self, key: str) -> bool:
         """Check if a key exists and is not expired."""
@@ -198,7 +526,7 @@ class LRUCacheWithTTL:
 
             entry = self._cache[key]
             if entry.is_expired():
-                del self._cache[key]
+                self._remove(key)
                 self._stats['expirations'] += 1
                 return False
 
@@ -212,7 +540,7 @@ class LRUCacheWithTTL:
 
             entry = self._cache[key]
             if entry.is_expired():
-                del self._cache[key]
+                self._remove(key)
                 self._stats['expirations'] += 1
                 return None
 
@@ -235,29 +563,15 @@ class LRUCacheWithTTL:
         """Get an iterator over all non-expired keys."""
         with self._lock:
             # Clean up expired entries first
-            expired_keys = [
-                key for key, entry in self._cache.items()
-                if entry.is_expired()
-            ]
-            for key in expired_keys:
-                del self._cache[key]
-                self._stats['expirations'] += 1
-
+            self.expire_due()
             return iter(list(self._cache.keys()))
 
     def items(self) -> Iterator[Tuple[str, Any]]:
         """Get an iterator over all non-expired key-value pairs."""
         with self._lock:
             # Clean up expired entries first
-            expired_keys = [
-                key for key, entry in self._cache.items()
-                if entry.is_expired()
-            ]
-            for key in expired_keys:
-                del self._cache[key]
-                self._stats['expirations'] += 1
-
-            return iter([(key, entry.value) for key, entry in self._cache.items()])
+            self.expire_due()
+            return iter([(key, self._resolve(entry)) for key, entry in self._cache.items()])
 
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
@@ -267,7 +581,8 @@ class LRUCacheWithTTL:
                 'size': len(self._cache),
                 'capacity': self.max_size,
                 'hit_rate': stats['hits'] / (stats['hits'] + stats['misses']) if (stats['hits'] + stats['misses']) > 0 else 0,
-                'load_factor': len(self._cache) / self.max_size
+                'load_factor': len(self._cache) / self.max_size,
+                'policy': self._policy.name
             })
             return stats
 
@@ -290,7 +605,7 @@ class LRUCacheWithTTL:
             for key, entry in self._cache.items():
                 if not entry.is_expired():
                     data['entries'][key] = {
-                        'value': entry.value,
+                        'value': self._resolve(entry),
                         'created_at': entry.created_at,
                         'expires_at': entry.expires_at,
                         'access_count': entry.access_count
@@ -310,7 +625,7 @@ class LRUCacheWithTTL:
 
             with self._lock:
                 self.clear()
-                self.max_size = data.get('max_size', self.max_size)
+                self._resize(data.get('max_size', self.max_size))
                 self.default_ttl = data.get('default_ttl', self.default_ttl)
 
                 current_time = time.time()
@@ -318,17 +633,99 @@ class LRUCacheWithTTL:
                     # Only load non-expired entries
                     expires_at = entry_data.get('expires_at')
                     if expires_at is None or current_time <= expires_at:
-                        entry = CacheEntry(entry_data['value'])
+                        entry = self._entry_class(entry_data['value'])
                         entry.created_at = entry_data.get('created_at', current_time)
                         entry.expires_at = expires_at
                         entry.access_count = entry_data.get('access_count', 1)
                         entry.last_accessed = current_time
-                        self._cache[key] = entry
+                        self._store(key, entry)
 
             return True
         except (json.JSONDecodeError, KeyError, TypeError):
             return False
 
+    def save_snapshot(self, filepath: str, background: bool = False) -> Optional[threading.Thread]:
+        """
+        Save cache contents to a binary snapshot file (see cache_snapshot.py).
+
+        The lock is held only while the entry references are copied; pickling
+        and disk I/O happen afterwards, so writers are not blocked for the
+        whole dump. Values are captured by reference, so an object mutated in
+        place during the dump may be saved in its new state.
+
+        Args:
+            filepath: Destination path (written atomically)
+            background: Write the file on a daemon thread and return it
+
+        Returns:
+            The writer thread if background is True, otherwise None
+        """
+        with self._lock:
+            now = time.time()
+            records = [
+                (key, entry.value, entry.created_at, entry.expires_at, entry.access_count)
+                for key, entry in self._cache.items()
+                if entry.expires_at is None or entry.expires_at >= now
+            ]
+            max_size = self.max_size
+            default_ttl = self.default_ttl
+
+        if not background:
+            write_snapshot(filepath, records, max_size, default_ttl)
+            return None
+
+        writer = threading.Thread(
+            target=write_snapshot,
+            args=(filepath, records, max_size, default_ttl),
+            daemon=True
+        )
+        writer.start()
+        return writer
+
+    def load_snapshot(self, filepath: str, lazy: bool = True) -> bool:
+        """
+        Load cache contents from a binary snapshot file.
+
+        With lazy=True only the index is read: keys, TTLs and LRU order are
+        restored immediately while values stay in the memory-mapped file and
+        are unpickled on first access. Snapshots contain pickled data, so
+        only load files from a trusted source.
+
+        Args:
+            filepath: Snapshot path
+            lazy: Defer unpickling values until they are accessed
+
+        Returns:
+            True if the snapshot was loaded, False if missing or invalid
+        """
+        if not os.path.exists(filepath):
+            return False
+
+        try:
+            reader = SnapshotReader(filepath)
+            current_time = time.time()
+            loaded = []
+            for key, created_at, expires_at, access_count, value in reader.records():
+                if expires_at is not None and current_time > expires_at:
+                    continue
+                entry = self._entry_class(value if lazy else value.load())
+                entry.created_at = created_at
+                entry.expires_at = expires_at
+                entry.access_count = access_count
+                entry.last_accessed = current_time
+                loaded.append((key, entry))
+        except (SnapshotError, OSError, pickle.UnpicklingError, UnicodeDecodeError):
+            return False
+
+        with self._lock:
+            self.clear()
+            self._resize(reader.max_size)
+            self.default_ttl = reader.default_ttl
+            for key, entry in loaded[-self.max_size:]:
+                self._store(key, entry)
+
+        return True
+
     def __len__(self) -> int:
         """Get the current size of the cache."""
         return self.size()
@@ -372,19 +769,335 @@ class LRUCacheWithTTL:
             pass
 
 
+class ShardedLRUCacheWithTTL:
+    """
+    A lock-striped LRU Cache with TTL for multi-threaded workloads.
+
+    Keys are hashed across a fixed number of independent LRUCacheWithTTL
+    shards, each with its own lock, LRU order and TTL handling, so threads
+    touching different shards never contend. LRU order is per shard, which
+    makes eviction approximately (not strictly) least recently used.
+    """
+
+    def __init__(self, max_size: int = 128, default_ttl: Optional[float] = None,
+                 num_shards: int = 16, approximate_global_capacity: bool = False,
+                 compact: bool = False, policy: str = 'lru'):
+        """
+        Initialize the sharded cache.
+
+        Args:
+            max_size: Maximum number of items to store across all shards
+            default_ttl: Default TTL in seconds for new entries (None = no expiration)
+            num_shards: Number of independently locked shards
+            approximate_global_capacity: If True, any shard may grow until the
+                total size reaches max_size (then evicting from the largest
+                shard). If False, each shard holds at most
+                ceil(max_size / num_shards) items.
+            compact: Store entries as slotted CompactCacheEntry objects
+            policy: Eviction policy name; each shard gets its own instance
+        """
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+        if num_shards <= 0:
+            raise ValueError("num_shards must be positive")
+
+        self.max_size = max_size
+        self.default_ttl = default_ttl
+        self.num_shards = num_shards
+        self.approximate_global_capacity = approximate_global_capacity
+
+        if approximate_global_capacity:
+            shard_size = max_size
+        else:
+            shard_size = -(-max_size // num_shards)
+
+        self._shards = [
+            LRUCacheWithTTL(max_size=shard_size, default_ttl=default_ttl,
+                            background_cleanup=False, compact=compact, policy=policy)
+            for _ in range(num_shards)
+        ]
+        if approximate_global_capacity:
+            # Loaded values must respect the global bound too
+            for shard in self._shards:
+                shard._load_setter = self.set
+
+        # A single cleanup thread visits the shards one at a time
+        self._cleanup_interval = 60  # seconds
+        self._stop_cleanup = threading.Event()
+        self._cleanup_thread = threading.Thread(
+            target=self._cleanup_expired_entries,
+            daemon=True
+        )
+        self._cleanup_thread.start()
+
+    def _cleanup_expired_entries(self) -> None:
+        """Background thread to clean up expired entries shard by shard."""
+        while not self._stop_cleanup.wait(self._cleanup_interval):
+            self.expire_due()
+
+    def _shard_for(self, key: str) -> LRUCacheWithTTL:
+        """Return the shard responsible for a key."""
+        return self._shards[hash(key) % self.num_shards]
+
+    def expire_due(self, now: Optional[float] = None, limit: Optional[int] = None) -> int:
+        """
+        Remove due entries from every shard (see LRUCacheWithTTL.expire_due).
+
+        A limit is spread evenly across the shards first, then any budget
+        left over goes to shards that still have due entries.
+
+        Returns:
+            The number of entries removed
+        """
+        if now is None:
+            now = time.time()
+        if limit is None:
+            return sum(shard.expire_due(now) for shard in self._shards)
+
+        removed = 0
+        share = -(-limit // self.num_shards)
+        for shard in self._shards:
+            removed += shard.expire_due(now, min(share, limit - removed))
+        for shard in self._shards:
+            if removed >= limit:
+                break
+            removed += shard.expire_due(now, limit - removed)
+        return removed
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a value from the cache, or None if not found or expired."""
+        return self._shard_for(key).get(key)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Set a value in the cache (ttl uses default_ttl if None)."""
+        shard = self._shard_for(key)
+        if self.approximate_global_capacity and key not in shard._cache \
+                and self.size() >= self.max_size:
+            # The shard being written may be empty, so make room in the
+            # largest one. Only one shard lock is held at a time; the total
+            # is read without the others, so the global bound may be
+            # overshot briefly under concurrent writes.
+            largest = max(self._shards, key=lambda s: len(s._cache))
+            with largest._lock:
+                if largest._cache and not largest._make_room(key):
+                    return
+        shard.set(key, value, ttl)
+
+    def get_or_set(self, key: str, loader: Callable[[], Any], ttl: Optional[float] = None,
+                   stale_ttl: Optional[float] = None) -> Any:
+        """Return the cached value, loading it once on a miss (see LRUCacheWithTTL.get_or_set)."""
+        return self._shard_for(key).get_or_set(key, loader, ttl, stale_ttl)
+
+    async def aget_or_set(self, key: str, loader: Callable[[], Union[Any, Awaitable[Any]]],
+                          ttl: Optional[float] = None, stale_ttl: Optional[float] = None) -> Any:
+        """Async version of get_or_set."""
+        return await self._shard_for(key).aget_or_set(key, loader, ttl, stale_ttl)
+
+    def delete(self, key: str) -> bool:
+        """Delete a key, returning True if it was found."""
+        return self._shard_for(key).delete(key)
+
+    def clear(self) -> None:
+        """Clear all items from every shard."""
+        for shard in self._shards:
+            shard.clear()
+
+    def exists(self, key: str) -> bool:
+        """Check if a key exists and is not expired."""
+        return self._shard_for(key).exists(key)
+
+    def ttl(self, key: str) -> Optional[float]:
+        """Get the remaining TTL for a key in seconds."""
+        return self._shard_for(key).ttl(key)
+
+    def size(self) -> int:
+        """Get the current number of items across all shards."""
+        return sum(len(shard._cache) for shard in self._shards)
+
+    def capacity(self) -> int:
+        """Get the maximum capacity of the cache."""
+        return self.max_size
+
+    def is_full(self) -> bool:
+        """Check if the cache is at maximum capacity."""
+        return self.size() >= self.max_size
+
+    def keys(self) -> Iterator[str]:
+        """Get an iterator over all non-expired keys."""
+        keys = []
+        for shard in self._shards:
+            keys.extend(shard.keys())
+        return iter(keys)
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        """Get an iterator over all non-expired key-value pairs."""
+        items = []
+        for shard in self._shards:
+            items.extend(shard.items())
+        return iter(items)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics aggregated across all shards."""
+        shard_stats = [shard.get_stats() for shard in self._shards]
+        stats = {
+            name: sum(s[name] for s in shard_stats)
+            for name in ('hits', 'misses', 'evictions', 'expirations', 'sets', 'deletes',
+                         'rejections', 'loads', 'load_errors', 'coalesced', 'stale_hits', 'size')
+        }
+        lookups = stats['hits'] + stats['misses']
+        stats.update({
+            'capacity': self.max_size,
+            'hit_rate': stats['hits'] / lookups if lookups > 0 else 0,
+            'load_factor': stats['size'] / self.max_size,
+            'num_shards': self.num_shards,
+            'policy': shard_stats[0]['policy'],
+            'shard_sizes': [s['size'] for s in shard_stats]
+        })
+        return stats
+
+    def reset_stats(self) -> None:
+        """Reset all statistics counters on every shard."""
+        for shard in self._shards:
+            shard.reset_stats()
+
+    def __len__(self) -> int:
+        """Get the current size of the cache."""
+        return self.size()
+
+    def __contains__(self, key: str) -> bool:
+        """Check if a key exists in the cache."""
+        return self.exists(key)
+
+    def __getitem__(self, key: str) -> Any:
+        """Get an item from the cache (raises KeyError if not found)."""
+        return self._shard_for(key)[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        """Set an item in the cache."""
+        self.set(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        """Delete an item from the cache (raises KeyError if not found)."""
+        if not self.delete(key):
+            raise KeyError(key)
+
+    def __repr__(self) -> str:
+        """String representation of the cache."""
+        return (f"ShardedLRUCacheWithTTL(size={self.size()}, capacity={self.max_size}, "
+                f"shards={self.num_shards}, default_ttl={self.default_ttl})")
+
+    def close(self) -> None:
+        """Clean up resources and stop background threads."""
+        self._stop_cleanup.set()
+        if self._cleanup_thread and self._cleanup_thread.is_alive():
+            self._cleanup_thread.join(timeout=1)
+        for shard in self._shards:
+            shard.close()
+
+    def __del__(self) -> None:
+        """Cleanup when object is destroyed."""
+        try:
+            self.close()
+        except:
+            pass
+
+
 # Factory function for easy creation
-def create_cache(max_size: int = 128, default_ttl: Optional[float] = None) -> LRUCacheWithTTL:
+def create_cache(max_size: int = 128, default_ttl: Optional[float] = None,
+                 compact: bool = False, policy: Union[str, EvictionPolicy] = 'lru') -> LRUCacheWithTTL:
     """
     Factory function to create an LRU Cache with TTL.
 
     Args:
         max_size: Maximum number of items to store
         default_ttl: Default TTL in seconds for new entries
+        compact: Use memory-compact slotted entry storage
+        policy: Eviction policy name or EvictionPolicy instance
 
     Returns:
         A new LRUCacheWithTTL instance
     """
-    return LRUCacheWithTTL(max_size=max_size, default_ttl=default_ttl)
+    return LRUCacheWithTTL(max_size=max_size, default_ttl=default_ttl, compact=compact,
+                           policy=policy)
+
+
+def create_sharded_cache(max_size: int = 128, default_ttl: Optional[float] = None,
+                         num_shards: int = 16,
+                         approximate_global_capacity: bool = False,
+                         compact: bool = False, policy: str = 'lru') -> ShardedLRUCacheWithTTL:
+    """
+    Factory function to create a lock-striped LRU Cache with TTL.
+
+    Args:
+        max_size: Maximum number of items to store
+        default_ttl: Default TTL in seconds for new entries
+        num_shards: Number of independently locked shards
+        approximate_global_capacity: Share max_size across shards instead of
+            giving each shard a fixed slice
+        compact: Use memory-compact slotted entry storage
+        policy: Eviction policy name used by every shard
+
+    Returns:
+        A new ShardedLRUCacheWithTTL instance
+    """
+    return ShardedLRUCacheWithTTL(
+        max_size=max_size,
+        default_ttl=default_ttl,
+        num_shards=num_shards,
+        approximate_global_capacity=approximate_global_capacity,
+        compact=compact,
+        policy=policy
+    )
+
+
+def cached(cache: Union[LRUCacheWithTTL, ShardedLRUCacheWithTTL], ttl: Optional[float] = None,
+           stale_ttl: Optional[float] = None,
+           key: Optional[Callable[..., str]] = None) -> Callable:
+    """
+    Decorator that memoizes a function in a cache.
+
+    Works on plain and async functions. Calls are keyed on the function's
+    qualified name plus the repr of its arguments unless a key function is
+    given, and concurrent calls with the same arguments share one
+    computation (see get_or_set).
+
+    Args:
+        cache: The cache to store results in
+        ttl: TTL in seconds for results (uses the cache's default_ttl if None)
+        stale_ttl: Stale-while-revalidate window in seconds
+        key: Optional callable taking the function's arguments and returning the key
+
+    Example:
+        @cached(cache, ttl=60)
+        def load_user(user_id):
+            ...
+    """
+    def decorator(func: Callable) -> Callable:
+        prefix = f"{func.__module__}.{func.__qualname__}"
+
+        def make_key(args, kwargs) -> str:
+            if key is not None:
+                return key(*args, **kwargs)
+            return f"{prefix}:{args!r}:{sorted(kwargs.items())!r}"
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                return await cache.aget_or_set(
+                    make_key(args, kwargs), lambda: func(*args, **kwargs), ttl, stale_ttl
+                )
+            async_wrapper.cache = cache
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return cache.get_or_set(
+                make_key(args, kwargs), lambda: func(*args, **kwargs), ttl, stale_ttl
+            )
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
 
 
 if __name__ == "__main__":
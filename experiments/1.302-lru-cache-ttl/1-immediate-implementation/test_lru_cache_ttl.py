@@ -14,13 +14,21 @@ Tests cover:
 """
 
 import unittest
+import asyncio
 import time
 import threading
 import tempfile
 import os
 import json
 from unittest.mock import patch, MagicMock
-from lru_cache_ttl import LRUCacheWithTTL, CacheEntry, create_cache
+from lru_cache_ttl import (
+    LRUCacheWithTTL, ShardedLRUCacheWithTTL, CacheEntry, CompactCacheEntry,
+    cached, create_cache, create_sharded_cache
+)
+from cache_snapshot import SnapshotValue
+from eviction_policies import (
+    FrequencySketch, SegmentedLRUPolicy, TinyLFUPolicy, WindowTinyLFUPolicy, create_policy
+)
 
 
 class TestCacheEntry(unittest.TestCase):
@@ -68,6 +76,20 @@ class TestCacheEntry(unittest.TestCase):
         self.assertEqual(entry.access_count, initial_count + 1)
         self.assertGreater(entry.last_accessed, initial_access_time)
 
+    def test_compact_cache_entry(self):
+        """Test the slotted entry behaves like CacheEntry without a __dict__."""
+        entry = CompactCacheEntry("test_value", ttl_seconds=10.0)
+
+        self.assertEqual(entry.value, "test_value")
+        self.assertEqual(entry.access_count, 1)
+        self.assertAlmostEqual(entry.time_to_live(), 10.0, delta=0.1)
+        entry.touch()
+        self.assertEqual(entry.access_count, 2)
+
+        self.assertFalse(hasattr(entry, '__dict__'))
+        with self.assertRaises(AttributeError):
+            entry.extra = 1
+
 
 class TestLRUCacheWithTTL(unittest.TestCase):
     """Test cases for LRUCacheWithTTL class."""
@@ -314,6 +336,90 @@ class TestLRUCacheWithTTL(unittest.TestCase):
         finally:
             os.unlink(temp_file)
 
+    def test_snapshot_persistence(self):
+        """Test binary snapshot save and eager/lazy load."""
+        self.cache.set("key1", "value1")
+        self.cache.set("key2", {"nested": ("tuple", 1)})
+        self.cache.set("key3", "value3", ttl=3600)
+        self.cache.get("key1")  # key1 becomes most recently used
+
+        with tempfile.NamedTemporaryFile(delete=False, suffix='.snap') as f:
+            temp_file = f.name
+
+        try:
+            self.cache.save_snapshot(temp_file)
+
+            for lazy in (False, True):
+                new_cache = LRUCacheWithTTL(max_size=5)
+                try:
+                    self.assertTrue(new_cache.load_snapshot(temp_file, lazy=lazy))
+                    self.assertEqual(new_cache.max_size, 3)
+                    self.assertEqual(list(new_cache._cache), ["key2", "key3", "key1"])
+                    self.assertEqual(
+                        isinstance(new_cache._cache["key2"].value, SnapshotValue), lazy
+                    )
+
+                    self.assertEqual(new_cache.get("key2"), {"nested": ("tuple", 1)})
+                    self.assertNotIsInstance(new_cache._cache["key2"].value, SnapshotValue)
+                    self.assertAlmostEqual(new_cache.ttl("key3"), 3600, delta=5)
+                    self.assertEqual(dict(new_cache.items())["key1"], "value1")
+                finally:
+                    new_cache.close()
+
+            self.assertFalse(LRUCacheWithTTL(max_size=1).load_snapshot("nonexistent.snap"))
+        finally:
+            os.unlink(temp_file)
+
+    def test_snapshot_skips_expired_and_resaves_lazy_values(self):
+        """Test expired entries are dropped and lazy values are copied unpickled."""
+        self.cache.set("short", "value", ttl=0.05)
+        self.cache.set("long", [1, 2, 3])
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            first = os.path.join(tmp_dir, "first.snap")
+            second = os.path.join(tmp_dir, "second.snap")
+            self.cache.save_snapshot(first)
+            time.sleep(0.1)
+
+            lazy_cache = LRUCacheWithTTL(max_size=5)
+            try:
+                self.assertTrue(lazy_cache.load_snapshot(first))
+                self.assertEqual(list(lazy_cache.keys()), ["long"])
+
+                writer = lazy_cache.save_snapshot(second, background=True)
+                writer.join()
+                self.assertIsInstance(lazy_cache._cache["long"].value, SnapshotValue)
+            finally:
+                lazy_cache.close()
+
+            restored = LRUCacheWithTTL(max_size=5)
+            try:
+                self.assertTrue(restored.load_snapshot(second))
+                self.assertEqual(restored.get("long"), [1, 2, 3])
+            finally:
+                restored.close()
+
+    def test_snapshot_rejects_invalid_files(self):
+        """Test corrupt or foreign files are reported as load failures."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            json_file = os.path.join(tmp_dir, "cache.json")
+            snap_file = os.path.join(tmp_dir, "cache.snap")
+            self.cache.set("key1", "value1")
+            self.cache.save_to_file(json_file)
+            self.cache.save_snapshot(snap_file)
+
+            with open(snap_file, 'rb') as f:
+                data = f.read()
+            with open(snap_file, 'wb') as f:
+                f.write(data[:-3])
+
+            for path in (json_file, snap_file):
+                cache = LRUCacheWithTTL(max_size=5)
+                try:
+                    self.assertFalse(cache.load_snapshot(path))
+                finally:
+                    cache.close()
+
     def test_thread_safety(self):
         """Test thread safety of cache operations."""
         num_threads = 10
@@ -372,6 +478,87 @@ class TestLRUCacheWithTTL(unittest.TestCase):
         # Items should be cleaned up
         self.assertEqual(self.cache.size(), 0)
 
+    def test_compact_storage(self):
+        """Test compact mode keeps full cache behaviour and persistence."""
+        cache = create_cache(max_size=2, compact=True)
+        try:
+            cache.set("a", 1)
+            cache.set("b", 2, ttl=3600)
+            cache.get("a")
+            cache.set("c", 3)  # evicts "b"
+
+            self.assertIsInstance(cache._cache["a"], CompactCacheEntry)
+            self.assertEqual(cache.get("a"), 1)
+            self.assertIsNone(cache.get("b"))
+            self.assertEqual(sorted(cache.keys()), ["a", "c"])
+
+            with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
+                temp_file = f.name
+            try:
+                cache.save_to_file(temp_file)
+                restored = LRUCacheWithTTL(max_size=2, compact=True)
+                try:
+                    self.assertTrue(restored.load_from_file(temp_file))
+                    self.assertEqual(restored.get("c"), 3)
+                    self.assertIsInstance(restored._cache["c"], CompactCacheEntry)
+                finally:
+                    restored.close()
+            finally:
+                os.unlink(temp_file)
+        finally:
+            cache.close()
+
+    def test_expire_due(self):
+        """Test the expiry index removes only entries that are due."""
+        cache = LRUCacheWithTTL(max_size=100, background_cleanup=False)
+        try:
+            now = time.time()
+            for i in range(10):
+                cache.set(f"key{i}", i, ttl=10 + i)
+            cache.set("forever", "value")
+
+            self.assertAlmostEqual(cache.next_expiry(), now + 10, delta=0.5)
+            self.assertEqual(cache.expire_due(now=now + 14.5), 5)
+            self.assertEqual(cache.size(), 6)
+            self.assertIsNone(cache.get("key4"))
+            self.assertEqual(cache.get("key5"), 5)
+
+            self.assertEqual(cache.expire_due(now=now + 100, limit=2), 2)
+            self.assertEqual(cache.expire_due(now=now + 100), 3)
+            self.assertEqual(list(cache.keys()), ["forever"])
+            self.assertIsNone(cache.next_expiry())
+            self.assertEqual(cache.get_stats()['expirations'], 10)
+        finally:
+            cache.close()
+
+    def test_expire_due_skips_stale_index_items(self):
+        """Test overwritten, deleted and evicted entries are not double-expired."""
+        cache = LRUCacheWithTTL(max_size=2, background_cleanup=False)
+        try:
+            now = time.time()
+            cache.set("a", 1, ttl=1)
+            cache.set("a", 2, ttl=100)   # overwrite with a later expiry
+            cache.set("b", 1, ttl=1)
+            cache.delete("b")
+            cache.set("c", 1, ttl=1)
+            cache.set("d", 1, ttl=1)     # evicts "a"
+
+            self.assertEqual(cache.expire_due(now=now + 5), 2)
+            self.assertEqual(cache.size(), 0)
+            self.assertEqual(cache.get_stats()['expirations'], 2)
+        finally:
+            cache.close()
+
+    def test_expiry_heap_stays_bounded(self):
+        """Test repeated overwrites do not grow the expiry index without bound."""
+        cache = LRUCacheWithTTL(max_size=10, background_cleanup=False)
+        try:
+            for i in range(10000):
+                cache.set(f"key{i % 10}", i, ttl=3600)
+            self.assertLessEqual(len(cache._expiry_heap), 2 * cache.size() + 65)
+        finally:
+            cache.close()
+
     def test_edge_cases(self):
         """Test various edge cases."""
         # Setting same key multiple times
@@ -470,6 +657,463 @@ class TestConcurrentAccess(unittest.TestCase):
         self.assertGreaterEqual(stats['hits'] + stats['misses'], 0)
 
 
+class TestShardedLRUCacheWithTTL(unittest.TestCase):
+    """Test cases for the lock-striped ShardedLRUCacheWithTTL class."""
+
+    def setUp(self):
+        self.cache = ShardedLRUCacheWithTTL(max_size=64, num_shards=4)
+
+    def tearDown(self):
+        self.cache.close()
+
+    def test_basic_operations(self):
+        """Test get/set/delete route to the right shard."""
+        for i in range(20):
+            self.cache.set(f"key{i}", i)
+        for i in range(20):
+            self.assertEqual(self.cache.get(f"key{i}"), i)
+
+        self.assertEqual(len(self.cache), 20)
+        self.assertTrue(self.cache.delete("key0"))
+        self.assertFalse(self.cache.delete("key0"))
+        self.assertNotIn("key0", self.cache)
+        with self.assertRaises(KeyError):
+            _ = self.cache["key0"]
+
+    def test_per_shard_capacity(self):
+        """Test each shard is bounded by its slice of max_size by default."""
+        for i in range(1000):
+            self.cache.set(f"key{i}", i)
+
+        stats = self.cache.get_stats()
+        self.assertLessEqual(stats['size'], 64)
+        self.assertTrue(all(size <= 16 for size in stats['shard_sizes']))
+        self.assertEqual(stats['evictions'], 1000 - stats['size'])
+
+    def test_approximate_global_capacity(self):
+        """Test a single hot shard may use the whole global capacity."""
+        cache = create_sharded_cache(max_size=10, num_shards=4, approximate_global_capacity=True)
+        try:
+            shard = cache._shard_for("seed")
+            keys = [f"k{i}" for i in range(500) if cache._shard_for(f"k{i}") is shard][:15]
+            for key in keys:
+                cache.set(key, key)
+
+            self.assertEqual(cache.size(), 10)
+            self.assertIsNone(cache.get(keys[0]))
+            self.assertEqual(cache.get(keys[-1]), keys[-1])
+        finally:
+            cache.close()
+
+    def test_approximate_global_capacity_empty_shard(self):
+        """Test a new key in an empty shard evicts from the largest shard."""
+        cache = create_sharded_cache(max_size=10, num_shards=4, approximate_global_capacity=True)
+        try:
+            hot = cache._shard_for("seed")
+            keys = [f"k{i}" for i in range(500) if cache._shard_for(f"k{i}") is hot][:10]
+            for key in keys:
+                cache.set(key, key)
+
+            others = [f"k{i}" for i in range(500) if cache._shard_for(f"k{i}") is not hot]
+            for key in others[:20]:
+                cache.set(key, key)
+                self.assertLessEqual(cache.size(), 10)
+
+            self.assertEqual(cache.size(), 10)
+            self.assertIsNone(cache.get(keys[0]))
+            self.assertEqual(cache.get(others[19]), others[19])
+        finally:
+            cache.close()
+
+    def test_ttl(self):
+        """Test TTL expiration is handled per shard."""
+        self.cache.set("temp", "value", ttl=0.1)
+        self.cache.set("keep", "value")
+        self.assertAlmostEqual(self.cache.ttl("temp"), 0.1, delta=0.05)
+
+        time.sleep(0.15)
+        self.assertIsNone(self.cache.get("temp"))
+        self.assertEqual(self.cache.expire_due(), 0)
+        self.assertEqual(list(self.cache.keys()), ["keep"])
+
+    def test_expire_due_limit(self):
+        """Test a limit is spread across shards and leftover budget is reused."""
+        now = time.time()
+        shards = self.cache._shards
+        by_shard = {id(shard): [] for shard in shards}
+        for i in range(2000):
+            bucket = by_shard[id(self.cache._shard_for(f"key{i}"))]
+            if len(bucket) < 3:
+                bucket.append(f"key{i}")
+        for shard in shards:
+            # The first shard's entries never expire
+            ttl = None if shard is shards[0] else 10
+            for key in by_shard[id(shard)]:
+                self.cache.set(key, key, ttl=ttl)
+
+        self.assertEqual(self.cache.expire_due(now=now + 100, limit=3), 3)
+        self.assertEqual([len(shard._cache) for shard in shards], [3, 2, 2, 2])
+
+        # The first shard has nothing due, so its share goes to the next shard
+        self.assertEqual(self.cache.expire_due(now=now + 100, limit=4), 4)
+        self.assertEqual([len(shard._cache) for shard in shards], [3, 0, 1, 1])
+        self.assertEqual(self.cache.expire_due(now=now + 100, limit=100), 2)
+        self.assertEqual(self.cache.size(), 3)
+
+    def test_aggregated_stats(self):
+        """Test statistics are summed across shards."""
+        for i in range(10):
+            self.cache.set(f"key{i}", i)
+        for i in range(15):
+            self.cache.get(f"key{i}")
+
+        stats = self.cache.get_stats()
+        self.assertEqual(stats['sets'], 10)
+        self.assertEqual(stats['hits'], 10)
+        self.assertEqual(stats['misses'], 5)
+        self.assertAlmostEqual(stats['hit_rate'], 10 / 15)
+        self.assertEqual(stats['num_shards'], 4)
+
+        self.cache.reset_stats()
+        self.assertEqual(self.cache.get_stats()['hits'], 0)
+
+    def test_concurrent_access(self):
+        """Test concurrent writers on different shards keep values consistent."""
+        def worker(thread_id):
+            for i in range(200):
+                key = f"t{thread_id}_{i}"
+                self.cache.set(key, key)
+                value = self.cache.get(key)
+                if value is not None:
+                    self.assertEqual(value, key)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertLessEqual(self.cache.size(), 64)
+
+    def test_invalid_arguments(self):
+        """Test invalid sizes are rejected."""
+        with self.assertRaises(ValueError):
+            ShardedLRUCacheWithTTL(max_size=0)
+        with self.assertRaises(ValueError):
+            ShardedLRUCacheWithTTL(num_shards=0)
+
+
+class TestEvictionPolicies(unittest.TestCase):
+    """Test cases for the pluggable eviction and admission policies."""
+
+    HOT_KEYS = [f"hot{i}" for i in range(5)]
+
+    def _warm_and_scan(self, policy):
+        """Hit a small hot set repeatedly, then scan many cold keys through the cache."""
+        cache = LRUCacheWithTTL(max_size=10, background_cleanup=False, policy=policy)
+        for _ in range(20):
+            for key in self.HOT_KEYS:
+                if cache.get(key) is None:
+                    cache.set(key, key)
+        for i in range(100):
+            if cache.get(f"cold{i}") is None:
+                cache.set(f"cold{i}", i)
+        return cache
+
+    def test_default_policy_is_lru(self):
+        """Test the default policy keeps plain LRU behaviour."""
+        cache = self._warm_and_scan('lru')
+        try:
+            self.assertEqual(cache.get_stats()['policy'], 'lru')
+            self.assertTrue(all(key not in cache for key in self.HOT_KEYS))
+        finally:
+            cache.close()
+
+    def test_scan_resistant_policies_keep_hot_keys(self):
+        """Test SLRU, TinyLFU and W-TinyLFU keep the working set through a scan."""
+        for name in ('slru', 'tinylfu', 'w-tinylfu'):
+            with self.subTest(policy=name):
+                cache = self._warm_and_scan(name)
+                try:
+                    self.assertTrue(all(key in cache for key in self.HOT_KEYS))
+                    self.assertLessEqual(cache.size(), 10)
+                finally:
+                    cache.close()
+
+    def test_tinylfu_rejects_cold_candidates(self):
+        """Test TinyLFU admission counts rejected insertions."""
+        cache = self._warm_and_scan(TinyLFUPolicy())
+        try:
+            stats = cache.get_stats()
+            self.assertEqual(stats['policy'], 'tinylfu')
+            self.assertGreater(stats['rejections'], 0)
+            self.assertIsNone(cache.get("cold0"))
+        finally:
+            cache.close()
+
+    def test_window_tinylfu_never_rejects(self):
+        """Test W-TinyLFU always admits new keys into its window."""
+        cache = self._warm_and_scan(WindowTinyLFUPolicy(window_ratio=0.2))
+        try:
+            self.assertEqual(cache.get_stats()['rejections'], 0)
+            self.assertIn("cold99", cache)
+        finally:
+            cache.close()
+
+    def test_policy_tracks_removals(self):
+        """Test deletes, expirations and clear keep policy state in sync."""
+        policy = SegmentedLRUPolicy()
+        cache = LRUCacheWithTTL(max_size=5, background_cleanup=False, policy=policy)
+        try:
+            cache.set("a", 1)
+            cache.set("b", 2, ttl=0.01)
+            cache.set("c", 3)
+            cache.get("a")
+            cache.delete("c")
+            time.sleep(0.02)
+            cache.expire_due()
+
+            self.assertEqual(len(policy), cache.size())
+            self.assertIn("a", policy)
+            cache.clear()
+            self.assertEqual(len(policy), 0)
+        finally:
+            cache.close()
+
+    def test_load_rebinds_policy_to_new_capacity(self):
+        """Test loading a larger cache resizes the SLRU segments and the sketch."""
+        source = LRUCacheWithTTL(max_size=400, background_cleanup=False)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            json_file = os.path.join(tmp_dir, "cache.json")
+            snap_file = os.path.join(tmp_dir, "cache.snap")
+            try:
+                for i in range(300):
+                    source.set(f"key{i}", i)
+                source.save_to_file(json_file)
+                source.save_snapshot(snap_file)
+            finally:
+                source.close()
+
+            for load in ('load_from_file', 'load_snapshot'):
+                with self.subTest(load=load):
+                    policy = TinyLFUPolicy()
+                    cache = LRUCacheWithTTL(max_size=5, background_cleanup=False, policy=policy)
+                    try:
+                        path = json_file if load == 'load_from_file' else snap_file
+                        self.assertTrue(getattr(cache, load)(path))
+                        self.assertEqual(policy.max_size, 400)
+                        self.assertEqual(policy._main.protected_size, 320)
+                        self.assertEqual(policy.sketch.width, FrequencySketch(400).width)
+
+                        # Hits promote up to the new protected size, not the old one
+                        for i in range(300):
+                            cache.get(f"key{i}")
+                        self.assertEqual(len(policy._main._protected), 300)
+                        self.assertEqual(len(policy._main), cache.size())
+                    finally:
+                        cache.close()
+
+    def test_sharded_cache_policy(self):
+        """Test the sharded cache builds one policy per shard."""
+        cache = create_sharded_cache(max_size=40, num_shards=4, policy='slru')
+        try:
+            cache.set("a", 1)
+            self.assertEqual(cache.get_stats()['policy'], 'slru')
+            self.assertIsNot(cache._shards[0]._policy, cache._shards[1]._policy)
+        finally:
+            cache.close()
+
+    def test_frequency_sketch(self):
+        """Test the doorkeeper absorbs first hits and aging halves counts."""
+        sketch = FrequencySketch(100)
+        self.assertEqual(sketch.frequency("key"), 0)
+
+        sketch.increment("key")
+        self.assertEqual(sketch.frequency("key"), 1)  # doorkeeper only
+
+        for _ in range(30):
+            sketch.increment("key")
+        self.assertEqual(sketch.frequency("key"), FrequencySketch.MAX_COUNT + 1)
+
+        sketch._age()
+        self.assertEqual(sketch.frequency("key"), FrequencySketch.MAX_COUNT // 2)
+
+        sketch.clear()
+        self.assertEqual(sketch.frequency("key"), 0)
+
+    def test_unknown_policy(self):
+        """Test unknown policy names are rejected."""
+        with self.assertRaises(ValueError):
+            create_policy("fifo")
+        with self.assertRaises(ValueError):
+            LRUCacheWithTTL(max_size=5, policy="fifo")
+
+
+class TestReadThroughLoading(unittest.TestCase):
+    """Test cases for get_or_set, aget_or_set and the cached decorator."""
+
+    def setUp(self):
+        self.cache = LRUCacheWithTTL(max_size=100)
+
+    def tearDown(self):
+        self.cache.close()
+
+    def test_get_or_set(self):
+        """Test the loader runs once and its result (even None) is cached."""
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return None
+
+        self.assertIsNone(self.cache.get_or_set("key", loader))
+        self.assertIsNone(self.cache.get_or_set("key", loader))
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(self.cache.get_stats()['loads'], 1)
+
+    def test_concurrent_misses_share_one_load(self):
+        """Test a stampede of threads triggers a single loader call."""
+        calls = []
+        results = []
+        barrier = threading.Barrier(20)
+
+        def loader():
+            calls.append(1)
+            time.sleep(0.05)
+            return "value"
+
+        def worker():
+            barrier.wait()
+            results.append(self.cache.get_or_set("key", loader))
+
+        threads = [threading.Thread(target=worker) for _ in range(20)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, ["value"] * 20)
+        self.assertEqual(self.cache.get_stats()['coalesced'], 19)
+
+    def test_loader_errors_propagate_and_are_not_cached(self):
+        """Test every waiter sees the loader's exception and the next call retries."""
+        def failing():
+            raise RuntimeError("boom")
+
+        with self.assertRaises(RuntimeError):
+            self.cache.get_or_set("key", failing)
+        self.assertNotIn("key", self.cache)
+        self.assertEqual(self.cache.get_or_set("key", lambda: 42), 42)
+        self.assertEqual(self.cache.get_stats()['load_errors'], 1)
+
+    def test_stale_while_revalidate(self):
+        """Test a stale value is served while one background refresh runs."""
+        versions = iter(["v1", "v2", "v3"])
+        refreshed = threading.Event()
+
+        def loader():
+            value = next(versions)
+            if value == "v2":
+                refreshed.set()
+            return value
+
+        self.assertEqual(self.cache.get_or_set("key", loader, ttl=0.05, stale_ttl=10), "v1")
+        time.sleep(0.1)
+
+        self.assertEqual(self.cache.get_or_set("key", loader, ttl=0.05, stale_ttl=10), "v1")
+        self.assertTrue(refreshed.wait(1))
+        time.sleep(0.01)
+        self.assertEqual(self.cache.get_or_set("key", loader, ttl=0.05, stale_ttl=10), "v2")
+        self.assertEqual(self.cache.get_stats()['stale_hits'], 1)
+
+        # A plain set clears the stale window
+        self.cache.set("key", "manual", ttl=60)
+        self.assertNotIn("key", self.cache._refresh_at)
+
+    def test_aget_or_set(self):
+        """Test concurrent coroutines share one async load."""
+        calls = []
+
+        async def loader():
+            calls.append(1)
+            await asyncio.sleep(0.02)
+            return "value"
+
+        async def run():
+            return await asyncio.gather(*[self.cache.aget_or_set("key", loader) for _ in range(10)])
+
+        self.assertEqual(asyncio.run(run()), ["value"] * 10)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(self.cache.get("key"), "value")
+
+    def test_cached_decorator(self):
+        """Test the decorator memoizes sync and async functions per argument set."""
+        calls = []
+
+        @cached(self.cache, ttl=60)
+        def square(x, offset=0):
+            calls.append(x)
+            return x * x + offset
+
+        @cached(self.cache, key=lambda x: f"double:{x}")
+        async def double(x):
+            calls.append(x)
+            return x * 2
+
+        self.assertEqual(square(3), 9)
+        self.assertEqual(square(3), 9)
+        self.assertEqual(square(3, offset=1), 10)
+        self.assertEqual(asyncio.run(double(4)), 8)
+        self.assertEqual(asyncio.run(double(4)), 8)
+        self.assertEqual(calls, [3, 3, 4])
+        self.assertIn("double:4", self.cache)
+        self.assertIs(square.cache, self.cache)
+
+    def test_sharded_load_at_global_capacity_releases_its_shard(self):
+        """Test a load waiting to evict from another shard does not hold its own shard's lock."""
+        cache = create_sharded_cache(max_size=2, num_shards=2, approximate_global_capacity=True)
+        try:
+            full, own = cache._shards
+            keys = [f"k{i}" for i in range(100) if cache._shard_for(f"k{i}") is full][:2]
+            for key in keys:
+                cache.set(key, key)
+            new_key = next(f"n{i}" for i in range(100) if cache._shard_for(f"n{i}") is own)
+
+            # Hold the largest shard so the load blocks while storing into it
+            with full._lock:
+                loader = threading.Thread(target=cache.get_or_set, args=(new_key, lambda: "loaded"),
+                                          daemon=True)
+                loader.start()
+                deadline = time.time() + 5
+                while own._stats['loads'] == 0 and time.time() < deadline:
+                    time.sleep(0.001)
+
+                # A second load into the full shard would now need this lock
+                acquired = own._lock.acquire(timeout=2)
+                if acquired:
+                    own._lock.release()
+            loader.join(timeout=5)
+
+            self.assertTrue(acquired, "loader held its own shard's lock while waiting on another")
+            self.assertFalse(loader.is_alive())
+            self.assertEqual(cache.get(new_key), "loaded")
+            self.assertEqual(cache.size(), 2)
+        finally:
+            cache.close()
+
+    def test_sharded_get_or_set(self):
+        """Test the sharded cache forwards loads to the owning shard."""
+        cache = create_sharded_cache(max_size=8, num_shards=4, approximate_global_capacity=True)
+        try:
+            for i in range(20):
+                self.assertEqual(cache.get_or_set(f"key{i}", lambda i=i: i), i)
+            self.assertLessEqual(cache.size(), 8)
+            self.assertEqual(cache.get_stats()['loads'], 20)
+        finally:
+            cache.close()
+
+
 if __name__ == '__main__':
     # Set up test suite
     loader = unittest.TestLoader()
@@ -480,7 +1124,10 @@ if __name__ == '__main__':
         TestCacheEntry,
         TestLRUCacheWithTTL,
         TestFactoryFunction,
-        TestConcurrentAccess
+        TestConcurrentAccess,
+        TestShardedLRUCacheWithTTL,
+        TestEvictionPolicies,
+        TestReadThroughLoading
     ]
 
     for test_class in test_classes:
@@ -48,6 +48,8 @@ class CacheNode:
         next: Next node in the linked list
     """
 
+    __slots__ = ('key', 'value', 'expiry_time', 'prev', 'next')
+
     def __init__(self, key: Any = None, value: Any = None, expiry_time: float = 0):
         self.key = key
         self.value = value
@@ -15,8 +15,17 @@ Key Features:
 """
 
 import json
+import sys
+from pathlib import Path
 from typing import Optional, Any, Dict
 
+# The shared Ollama client lives in utils/llm at the repository root
+_REPO_ROOT = str(Path(__file__).resolve().parents[4])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from utils.llm import get_client
+
 
 def story_to_haiku(text: str, llm_client: Optional[Any] = None) -> Dict[str, Any]:
     """
@@ -37,7 +46,7 @@ def story_to_haiku(text: str, llm_client: Optional[Any] = None) -> Dict[str, Any
         text: Input story or paragraph to convert into haiku.
               Must be non-empty string with meaningful content.
         llm_client: Optional LLM client for dependency injection.
-                   If None, creates real Ollama client.
+                   If None, uses the shared pooled Ollama client.
                    Used for testing with mocks.
 
     Returns:
@@ -80,14 +89,7 @@ def story_to_haiku(text: str, llm_client: Optional[Any] = None) -> Dict[str, Any
 
     # Step 2: Initialize LLM Client (with dependency injection support)
     if llm_client is None:
-        try:
-            import ollama
-            llm_client = ollama
-        except ImportError as e:
-            return _create_error_response(
-                f"Failed to import ollama module: {e}. "
-                "Please ensure ollama is installed: pip install ollama==0.1.6"
-            )
+        llm_client = get_client()
 
     # Step 3: Build Optimized Prompt
     prompt = _build_optimized_prompt(text)
@@ -10,6 +10,7 @@ Tests validate structure, parsing, validation, and error handling.
 import json
 import pytest
 from haiku_converter import story_to_haiku
+from utils.llm import OllamaClient, StubOllamaServer
 
 
 # ============================================================================
@@ -469,6 +470,32 @@ class TestLLMCommunicationErrors:
         assert "Ollama communication failed" in str(exc_info.value)
 
 
+class TestSharedOllamaClient:
+    """Test the real HTTP client against a local stub Ollama server."""
+
+    def test_haiku_over_http(self):
+        """Test a full conversion through the shared client's chat API."""
+        # Arrange
+        reply = json.dumps({
+            'lines': ['Wings slice through blue air', 'Feathered freedom gliding high', 'Sky holds its secrets'],
+            'syllables': [5, 7, 5],
+            'essence': 'Freedom of flight'
+        })
+
+        # Act
+        with StubOllamaServer(reply=reply) as stub:
+            with OllamaClient(stub.url) as client:
+                result = story_to_haiku("A bird flew across the sky", llm_client=client)
+
+        # Assert
+        assert result['valid'] is True
+        assert result['lines'][0] == 'Wings slice through blue air'
+        path, payload = stub.requests[0]
+        assert path == '/api/chat'
+        assert payload['model'] == 'llama3.2'
+        assert payload['format'] == 'json'
+
+
 class TestPromptConstruction:
     """Test that prompts are constructed correctly with optimized templates."""
 
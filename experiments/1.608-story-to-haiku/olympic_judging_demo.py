@@ -23,6 +23,20 @@ import json
 from pathlib import Path
 import importlib.util
 
+# The shared Ollama client lives in utils/llm at the repository root
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from utils.llm import (
+    CallScheduler,
+    OllamaClient,
+    add_cache_arguments,
+    add_scheduler_arguments,
+    cache_from_args,
+    get_client,
+)
+
+# Model every methodology generates with
+GENERATOR_MODEL = 'llama3.2'
+
 # Test story for comparison
 DEMO_STORY = """In a small village nestled between mountains, an old woman
 tended her garden every morning. She spoke to each plant as if they
@@ -66,8 +80,9 @@ def warmup_models(warmup_story="The sun rises over the mountains.", judge_models
     """
     Warm up ALL Ollama models (generator + judges) to eliminate cold-start bias.
     This ensures fair timing comparisons across all methods and judges.
+    Warm-up calls bypass the response cache so they always reach the models.
     """
-    import ollama
+    client = OllamaClient()
 
     print("="*70)
     print("MODEL WARM-UP (Trial 0 - Not Scored)")
@@ -79,7 +94,7 @@ def warmup_models(warmup_story="The sun rises over the mountains.", judge_models
     try:
         module = load_method(1)
         start = time.time()
-        result = module.story_to_haiku(warmup_story)
+        result = module.story_to_haiku(warmup_story, llm_client=client)
         elapsed = time.time() - start
         print(f"✓ ({elapsed:.1f}s)")
     except Exception as e:
@@ -90,7 +105,7 @@ def warmup_models(warmup_story="The sun rises over the mountains.", judge_models
         print(f"Judge ({judge_model}): ", end="", flush=True)
         try:
             start = time.time()
-            response = ollama.generate(
+            response = client.generate(
                 model=judge_model,
                 prompt="Rate this haiku 1-10: Cherry blossoms fall / Softly on the quiet pond / Spring whispers arrive. Return JSON: {\"score\": 8}"
             )
@@ -99,18 +114,20 @@ def warmup_models(warmup_story="The sun rises over the mountains.", judge_models
         except Exception as e:
             print(f"✗ {e}")
 
+    client.close()
     print(f"\n✅ All models warmed up and ready for timed trials.\n")
 
-def generate_all_haiku(story, run_dir, num_methods=4, skip_warmup=False, delay_between_runs=2.0):
+def generate_all_haiku(story, run_dir, scheduler, num_methods=4, skip_warmup=False, delay_between_runs=0.0):
     """
-    Generate haiku from all methods in specified run.
+    Generate haiku from all methods in specified run, concurrently.
 
     Args:
         story: The story to convert to haiku
         run_dir: Path to the run directory (e.g., 3-clean-room)
+        scheduler: CallScheduler that runs the method calls
         num_methods: Number of methods to test (4 or 5)
         skip_warmup: If True, skip model warm-up
-        delay_between_runs: Seconds to wait between method calls (default 2.0)
+        delay_between_runs: Seconds between method starts (default 0)
     """
 
     # Warm up models first (unless skipped)
@@ -121,19 +138,33 @@ def generate_all_haiku(story, run_dir, num_methods=4, skip_warmup=False, delay_b
     print(f"GENERATING HAIKU FROM ALL {num_methods} METHODOLOGIES")
     print("="*70)
     print(f"\n📖 Story: {story[:80]}...\n")
+    print(f"⚡ Up to {scheduler.per_model} concurrent calls per model\n")
     if delay_between_runs > 0:
-        print(f"⏱️  Delay between runs: {delay_between_runs}s (prevents Ollama serial call issues)\n")
+        print(f"⏱️  Delay between method starts: {delay_between_runs}s\n")
+
+    # Load every method up front, then run them all at once
+    pending = []
+    for method_num in range(1, num_methods + 1):
+        try:
+            module = load_method(method_num, run_dir)
+            pending.append(scheduler.submit(f"Method {method_num}", GENERATOR_MODEL,
+                                            module.story_to_haiku, story, llm_client=get_client()))
+        except Exception as e:
+            pending.append(e)
+
+        if delay_between_runs > 0 and method_num < num_methods:
+            time.sleep(delay_between_runs)
 
     results = []
 
-    for method_num in range(1, num_methods + 1):
+    for method_num, call in enumerate(pending, 1):
         print(f"Method {method_num}: ", end="", flush=True)
 
         try:
-            module = load_method(method_num, run_dir)
-            start = time.time()
-            result = module.story_to_haiku(story)
-            elapsed = time.time() - start
+            if isinstance(call, Exception):
+                raise call
+            result = call.result()
+            elapsed = call.timing.elapsed
 
             # Display haiku
             print(f"✓ ({elapsed:.1f}s)")
@@ -155,11 +186,6 @@ def generate_all_haiku(story, run_dir, num_methods=4, skip_warmup=False, delay_b
                 'error': str(e)
             })
 
-        # Add delay between runs (except after last run)
-        if delay_between_runs > 0 and method_num < num_methods:
-            print(f"   Waiting {delay_between_runs}s before next run...\n")
-            time.sleep(delay_between_runs)
-
     return results
 
 def judge_haiku(story, all_results, judge_model='phi3:mini'):
@@ -168,8 +194,6 @@ def judge_haiku(story, all_results, judge_model='phi3:mini'):
 
     Returns dict with scores and reasoning.
     """
-    import ollama
-
     # Prepare haiku for judging
     haiku_texts = []
     for r in all_results:
@@ -208,7 +232,7 @@ Example: {{"scores": [8, 6, 9, 5], "winner": 3, "reasoning": "Best imagery and e
 """
 
     try:
-        response = ollama.generate(model=judge_model, prompt=prompt)
+        response = get_client().generate(model=judge_model, prompt=prompt)
         response_text = response['response'].strip()
 
         # Try to extract JSON from response (handle case where LLM adds text)
@@ -231,9 +255,10 @@ Example: {{"scores": [8, 6, 9, 5], "winner": 3, "reasoning": "Best imagery and e
             'reasoning': f'Error in judging: {e}'
         }
 
-def olympic_judging(story, all_results):
+def olympic_judging(story, all_results, scheduler):
     """
     Olympic-style judging: 3 judges, drop highest/lowest, average.
+    All judges score at once through the scheduler.
     """
     print("\n" + "="*70)
     print("OLYMPIC JUDGING PHASE")
@@ -245,18 +270,19 @@ def olympic_judging(story, all_results):
         ('gemma2:2b', 'Google model - different training')
     ]
 
+    pending = [scheduler.submit(f"Judge {judge_model}", judge_model, judge_haiku, story, all_results, judge_model)
+               for judge_model, _ in judges]
+
     all_judgments = []
 
-    for judge_model, description in judges:
+    for (judge_model, description), call in zip(judges, pending):
         print(f"\n🏅 Judge: {judge_model}")
         print(f"   {description}")
         print("   Judging", end="", flush=True)
 
-        start = time.time()
-        judgment = judge_haiku(story, all_results, judge_model)
-        elapsed = time.time() - start
+        judgment = call.result()
 
-        print(f" ... done ({elapsed:.1f}s)")
+        print(f" ... done ({call.timing.elapsed:.1f}s)")
         print(f"   Scores: {judgment['scores']}")
         print(f"   Prefers: Method {judgment['winner']}")
 
@@ -342,11 +368,24 @@ def main():
                        help='Generate haiku only, skip judging')
     parser.add_argument('--skip-warmup', action='store_true',
                        help='Skip model warm-up (Trial 0) - useful if model already warm')
-    parser.add_argument('--delay', type=float, default=2.0,
-                       help='Seconds to wait between method runs (default: 2.0, use 0 for no delay)')
+    parser.add_argument('--delay', type=float, default=0.0,
+                       help='Seconds between method starts (default: 0)')
+    add_scheduler_arguments(parser)
+    add_cache_arguments(parser)
 
     args = parser.parse_args()
 
+    # Method and judge calls run concurrently, at most --parallel per model;
+    # the shared client gets one pooled connection per possible call
+    scheduler = CallScheduler(per_model=args.parallel)
+    get_client(max_connections=scheduler.max_workers)
+
+    # Generations and judgments already made for the same prompts come from the cache
+    cache = cache_from_args(args)
+    get_client().cache = cache
+    if cache is not None and cache.mode == 'replay':
+        args.skip_warmup = True  # Replays never call a model, so there is nothing to warm up
+
     # Determine run directory
     run_dirs = {
         1: "1-initial-run",
@@ -375,7 +414,7 @@ def main():
 
     # Phase 1: Generate all haiku
     start_total = time.time()
-    all_results = generate_all_haiku(story, run_dir, num_methods=args.methods,
+    all_results = generate_all_haiku(story, run_dir, scheduler, num_methods=args.methods,
                                      skip_warmup=args.skip_warmup,
                                      delay_between_runs=args.delay)
 
@@ -386,11 +425,12 @@ def main():
         return
 
     if args.no_judging:
+        print(f"\n{scheduler.report()}")
         print("\n✅ Generation complete (judging skipped)")
         return
 
     # Phase 2: Olympic judging
-    all_judgments = olympic_judging(story, all_results)
+    all_judgments = olympic_judging(story, all_results, scheduler)
 
     # Phase 3: Calculate final scores
     final_scores = calculate_final_scores(all_judgments, args.methods)
@@ -399,6 +439,10 @@ def main():
     announce_winner(all_results, final_scores)
 
     elapsed_total = time.time() - start_total
+    print(f"\n{scheduler.report()}")
+    if cache is not None:
+        stats = cache.statistics()
+        print(f"\n💾 Response cache ({stats['mode']}): {stats['hits']} hits, {stats['misses']} misses")
     print(f"\n⏱️  Total time: {elapsed_total:.1f}s")
     print("\n✨ Demo complete!\n")
 
@@ -4,9 +4,24 @@ Specification-Driven Implementation
 """
 
 import re
-import subprocess
+import sys
+from pathlib import Path
 from typing import Dict, Tuple
 
+# The shared Ollama client lives in utils/llm at the repository root
+_REPO_ROOT = str(Path(__file__).resolve().parents[3])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from utils.llm import (
+    DEFAULT_HOST,
+    OllamaConnectionError,
+    OllamaError,
+    OllamaResponseError,
+    OllamaTimeoutError,
+    get_client,
+)
+
 
 class SyllableCounter:
     """Count syllables in English words."""
@@ -83,44 +98,39 @@ class MeterValidator:
 
 
 class OllamaClient:
-    """Handle Ollama communication."""
+    """Handle Ollama communication over the shared, pooled HTTP client."""
 
-    def __init__(self, model: str = "llama3.2", timeout: int = 60):
+    def __init__(self, model: str = "llama3.2", timeout: int = 60, host: str = DEFAULT_HOST):
         self.model = model
         self.timeout = timeout
+        self.client = get_client(host)
 
     def is_available(self) -> bool:
         """Check if Ollama is available."""
-        try:
-            result = subprocess.run(['ollama', 'list'], capture_output=True, text=True, timeout=5)
-            return result.returncode == 0 and self.model in result.stdout
-        except:
-            return False
+        return self.client.is_available(self.model)
 
     def generate(self, prompt: str) -> str:
         """Generate text."""
-        if not self.is_available():
-            raise ConnectionError(f"Ollama not available or model '{self.model}' not found")
-
         try:
-            result = subprocess.run(
-                ['ollama', 'run', self.model, prompt],
-                capture_output=True,
-                text=True,
-                timeout=self.timeout
-            )
-            if result.returncode != 0:
-                raise RuntimeError(f"Generation failed: {result.stderr}")
-            return result.stdout.strip()
-        except subprocess.TimeoutExpired:
+            result = self.client.generate(self.model, prompt, timeout=self.timeout)
+        except OllamaConnectionError:
+            raise ConnectionError(f"Ollama not available at {self.client.host}")
+        except OllamaTimeoutError:
             raise TimeoutError(f"Generation timed out after {self.timeout}s")
+        except OllamaResponseError as e:
+            if e.status == 404:
+                raise ConnectionError(f"Ollama not available or model '{self.model}' not found")
+            raise RuntimeError(f"Generation failed: {e.message}")
+        except OllamaError as e:
+            raise RuntimeError(f"Generation failed: {e}")
+        return result.get('response', '').strip()
 
 
 class IambicConverter:
     """Convert prose to iambic pentameter."""
 
-    def __init__(self, model: str = "llama3.2", strict: bool = False):
-        self.ollama = OllamaClient(model=model)
+    def __init__(self, model: str = "llama3.2", strict: bool = False, host: str = DEFAULT_HOST):
+        self.ollama = OllamaClient(model=model, host=host)
         self.validator = MeterValidator(strict=strict)
         self.max_attempts = 3
 
@@ -4,13 +4,12 @@ Comprehensive test suite for iambic_converter module.
 Tests all components:
 - SyllableCounter: Word and line syllable counting
 - MeterValidator: Iambic pentameter validation
-- OllamaClient: LLM communication (mocked)
+- OllamaClient: LLM communication (local stub server)
 - IambicConverter: Full conversion pipeline (mocked and integration)
 """
 
 import unittest
 from unittest.mock import Mock, patch, MagicMock
-import subprocess
 
 from iambic_converter import (
     SyllableCounter,
@@ -18,6 +17,7 @@ from iambic_converter import (
     OllamaClient,
     IambicConverter
 )
+from utils.llm import StubOllamaServer
 
 
 class TestSyllableCounter(unittest.TestCase):
@@ -249,94 +249,74 @@ And summer's lease hath all too short a date"""
 
 
 class TestOllamaClient(unittest.TestCase):
-    """Test Ollama client functionality."""
+    """Test Ollama client functionality against a local stub server."""
 
     def setUp(self):
-        self.client = OllamaClient(model="llama3.2")
+        self.stub = StubOllamaServer(reply="Generated poem text", models=["llama3.2:latest", "llama2:latest"])
+        self.stub.start()
+        self.addCleanup(self.stub.stop)
+        self.client = OllamaClient(model="llama3.2", host=self.stub.url)
 
-    @patch('subprocess.run')
-    def test_is_available_success(self, mock_run):
+    def test_is_available_success(self):
         """Test Ollama availability check when service is running."""
-        mock_run.return_value = Mock(
-            returncode=0,
-            stdout="llama3.2\nllama2\n"
-        )
-
         self.assertTrue(self.client.is_available())
 
-    @patch('subprocess.run')
-    def test_is_available_model_not_found(self, mock_run):
+    def test_is_available_model_not_found(self):
         """Test Ollama availability when model is missing."""
-        mock_run.return_value = Mock(
-            returncode=0,
-            stdout="llama2\nother-model\n"
-        )
+        self.stub.models = ["llama2:latest", "other-model:latest"]
 
         self.assertFalse(self.client.is_available())
 
-    @patch('subprocess.run')
-    def test_is_available_service_down(self, mock_run):
+    def test_is_available_service_down(self):
         """Test Ollama availability when service is down."""
-        mock_run.return_value = Mock(returncode=1)
+        client = OllamaClient(model="llama3.2", host="http://127.0.0.1:1")
 
-        self.assertFalse(self.client.is_available())
+        self.assertFalse(client.is_available())
 
-    @patch('subprocess.run')
-    def test_is_available_timeout(self, mock_run):
-        """Test Ollama availability check timeout."""
-        mock_run.side_effect = subprocess.TimeoutExpired('ollama', 5)
+    def test_generate_success(self):
+        """Test successful text generation."""
+        result = self.client.generate("Test prompt")
+        self.assertEqual(result, "Generated poem text")
+        self.assertEqual(self.stub.requests[-1][1]["prompt"], "Test prompt")
 
-        self.assertFalse(self.client.is_available())
+    def test_generate_reuses_connection(self):
+        """Test that repeated generations share one keep-alive connection."""
+        for _ in range(3):
+            self.client.generate("Test prompt")
 
-    @patch('subprocess.run')
-    def test_is_available_not_installed(self, mock_run):
-        """Test Ollama availability when not installed."""
-        mock_run.side_effect = FileNotFoundError()
+        self.assertEqual(self.stub.connections, 1)
 
-        self.assertFalse(self.client.is_available())
+    def test_generate_ollama_unavailable(self):
+        """Test generation when Ollama is unavailable."""
+        client = OllamaClient(model="llama3.2", host="http://127.0.0.1:1")
 
-    @patch('subprocess.run')
-    def test_generate_success(self, mock_run):
-        """Test successful text generation."""
-        # Mock is_available check
-        mock_run.side_effect = [
-            Mock(returncode=0, stdout="llama3.2\n"),  # is_available check
-            Mock(returncode=0, stdout="Generated poem text")  # generate call
-        ]
+        with self.assertRaises(ConnectionError) as context:
+            client.generate("Test prompt")
 
-        result = self.client.generate("Test prompt")
-        self.assertEqual(result, "Generated poem text")
+        self.assertIn("not available", str(context.exception))
 
-    @patch('subprocess.run')
-    def test_generate_ollama_unavailable(self, mock_run):
-        """Test generation when Ollama is unavailable."""
-        mock_run.return_value = Mock(returncode=1)
+    def test_generate_model_not_found(self):
+        """Test generation with a model the server does not have."""
+        self.stub.error = (404, "model 'llama3.2' not found")
 
         with self.assertRaises(ConnectionError) as context:
             self.client.generate("Test prompt")
 
-        self.assertIn("not available", str(context.exception))
+        self.assertIn("not found", str(context.exception))
 
-    @patch('subprocess.run')
-    def test_generate_timeout(self, mock_run):
+    def test_generate_timeout(self):
         """Test generation timeout."""
-        mock_run.side_effect = [
-            Mock(returncode=0, stdout="llama3.2\n"),  # is_available check
-            subprocess.TimeoutExpired('ollama', 60)  # generate call
-        ]
+        self.stub.delay = 0.5
+        self.client.timeout = 0.1
 
         with self.assertRaises(TimeoutError) as context:
             self.client.generate("Test prompt")
 
         self.assertIn("timed out", str(context.exception))
 
-    @patch('subprocess.run')
-    def test_generate_failure(self, mock_run):
+    def test_generate_failure(self):
         """Test generation failure."""
-        mock_run.side_effect = [
-            Mock(returncode=0, stdout="llama3.2\n"),  # is_available check
-            Mock(returncode=1, stderr="Generation error")  # generate call
-        ]
+        self.stub.error = (500, "Generation error")
 
         with self.assertRaises(RuntimeError) as context:
             self.client.generate("Test prompt")
@@ -7,11 +7,18 @@ Judge models: llama3.2 (Meta), phi3:mini (Microsoft), gemma2:2b (Google)
 """
 
 import sys
-import subprocess
 import json
 import argparse
+from concurrent.futures import as_completed
 from pathlib import Path
 
+# The shared Ollama client lives in utils/llm at the repository root
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from utils.llm import CallScheduler, add_cache_arguments, add_scheduler_arguments, cache_from_args, get_client
+
+# Model every method converts with
+GENERATOR_MODEL = 'llama3.2'
+
 
 class OlympicJudge:
     """Single LLM judge for scoring iambic pentameter quality"""
@@ -39,15 +46,11 @@ IAMBIC PENTAMETER OUTPUT:
 Provide ONLY a score from 0-10 (one number). No explanation."""
 
         try:
-            result = subprocess.run(
-                ["ollama", "run", self.model, prompt],
-                capture_output=True,
-                text=True,
-                timeout=60  # Increased for slower models (phi3, gemma2)
-            )
+            # Increased timeout for slower models (phi3, gemma2)
+            response = get_client().generate(model=self.model, prompt=prompt, timeout=60)
 
             # Extract number from output
-            score_text = result.stdout.strip()
+            score_text = response['response'].strip()
             # Try to find a number in the output
             import re
             numbers = re.findall(r'\d+\.?\d*', score_text)
@@ -73,13 +76,21 @@ class OlympicJudgingSystem:
         """
         self.judges = [OlympicJudge(i+1, model) for i, model in enumerate(judge_models)]
 
-    def judge(self, original_prose, iambic_output, method_name):
-        """Get Olympic score for an output"""
+    def submit(self, scheduler, original_prose, iambic_output, method_name):
+        """Start every judge scoring an output at once; returns the pending scores"""
+        return [
+            scheduler.submit(f"{method_name} / Judge {judge.judge_id}", judge.model,
+                             judge.score, original_prose, iambic_output)
+            for judge in self.judges
+        ]
+
+    def judge(self, method_name, pending):
+        """Get Olympic score for an output from its pending judge scores"""
         print(f"\n🏅 Judging {method_name}...")
 
         scores = []
-        for judge in self.judges:
-            score = judge.score(original_prose, iambic_output)
+        for judge, call in zip(self.judges, pending):
+            score = call.result()
             scores.append(score)
             print(f"  Judge {judge.judge_id} ({judge.model}): {score:.1f}")
 
@@ -119,12 +130,8 @@ def load_implementation(method_dir):
     return module
 
 
-def run_conversion(method_dir, prose):
-    """Run conversion using a specific method"""
-    module = load_implementation(method_dir)
-    if not module:
-        return None
-
+def run_conversion(module, prose):
+    """Run conversion using a loaded method implementation"""
     try:
         # Try different class/function names used by different methods
         if hasattr(module, 'IambicConverter'):
@@ -146,8 +153,19 @@ def main():
     parser.add_argument('--run', type=int, default=1, help='Run number (default: 1)')
     parser.add_argument('--methods', type=int, default=4, help='Number of methods to judge (default: 4)')
     parser.add_argument('--prose', type=str, help='Custom prose to convert')
+    add_scheduler_arguments(parser)
+    add_cache_arguments(parser)
     args = parser.parse_args()
 
+    # Conversions and judge calls run concurrently, at most --parallel per model;
+    # the shared client gets one pooled connection per possible call
+    scheduler = CallScheduler(per_model=args.parallel)
+    get_client(max_connections=scheduler.max_workers)
+
+    # Conversions and scores already made for the same prompts come from the cache
+    cache = cache_from_args(args)
+    get_client().cache = cache
+
     # Default test prose
     test_prose = args.prose or "The cat sat on the mat and watched the birds fly overhead."
 
@@ -170,20 +188,30 @@ def main():
     print(f"Scoring: Drop high/low, average remaining")
     print(f"Methods to judge: {len(methods)}\n")
 
-    # Run conversions and collect outputs
-    outputs = []
+    # Load every method up front, then run all conversions at once
+    conversions = {}
     for method_dir, method_name in methods:
-        full_path = exp_dir / method_dir
-        print(f"\n🔧 Running {method_name}...")
-        output = run_conversion(full_path, test_prose)
+        module = load_implementation(exp_dir / method_dir)
+        if module:
+            conversions[scheduler.submit(method_name, GENERATOR_MODEL, run_conversion, module, test_prose)] = method_name
+        else:
+            print(f"\n⚠️  {method_name} skipped (implementation not found)")
+
+    # Judges start on each output as soon as it is converted
+    judging_system = OlympicJudgingSystem()
+    judgings = []
+    for call in as_completed(conversions):
+        method_name = conversions[call]
+        output = call.result()
+        print(f"\n🔧 {method_name} ({call.timing.elapsed:.1f}s)")
 
         if output:
             print(f"Output preview: {output[:100]}...")
-            outputs.append((method_name, output))
+            judgings.append((method_name, judging_system.submit(scheduler, test_prose, output, method_name)))
         else:
             print(f"⚠️  Skipped (implementation error)")
 
-    if not outputs:
+    if not judgings:
         print("\n❌ No methods produced output!")
         return 1
 
@@ -192,11 +220,10 @@ def main():
     print("📊 JUDGING RESULTS")
     print("="*80)
 
-    judging_system = OlympicJudgingSystem()
     results = []
 
-    for method_name, output in outputs:
-        result = judging_system.judge(test_prose, output, method_name)
+    for method_name, pending in judgings:
+        result = judging_system.judge(method_name, pending)
         results.append(result)
 
     # Rank and display final results
@@ -211,6 +238,11 @@ def main():
         medal = medals[i] if i < len(medals) else '  '
         print(f"{medal} {i+1}. {result['method']}: {result['final_score']:.2f}/10")
 
+    print(f"\n{scheduler.report()}")
+    if cache is not None:
+        stats = cache.statistics()
+        print(f"\n💾 Response cache ({stats['mode']}): {stats['hits']} hits, {stats['misses']} misses")
+
     print("\n" + "="*80)
 
     return 0
@@ -8,10 +8,24 @@ Technical Specification: docs/technical-spec.md
 
 import json
 import re
+import sys
 import time
 from datetime import datetime
+from pathlib import Path
 from typing import Dict, List, Optional, Tuple
-import requests
+
+# The shared Ollama client lives in utils/llm at the repository root
+_REPO_ROOT = str(Path(__file__).resolve().parents[3])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from utils.llm import (
+    OllamaClient,
+    OllamaConnectionError,
+    OllamaError,
+    OllamaTimeoutError,
+    get_client,
+)
 
 
 class SyllableCounter:
@@ -283,7 +297,8 @@ Return ONLY the 5 lines of the limerick, one per line, nothing else."""
     def __init__(
         self,
         model: str = "llama3.2",
-        ollama_host: str = "http://localhost:11434"
+        ollama_host: str = "http://localhost:11434",
+        client: Optional[OllamaClient] = None
     ):
         """
         Initialize the limerick converter.
@@ -291,10 +306,12 @@ Return ONLY the 5 lines of the limerick, one per line, nothing else."""
         Args:
             model: The Ollama model to use (default: llama3.2)
             ollama_host: Ollama API endpoint (default: http://localhost:11434)
+            client: Ollama client to use (default: the shared pooled client for ollama_host)
         """
         self.model = model
         self.ollama_host = ollama_host
         self.api_endpoint = f"{ollama_host}/api/generate"
+        self.client = client or get_client(ollama_host)
 
     def _build_prompt(self, story: str) -> str:
         """
@@ -310,7 +327,7 @@ Return ONLY the 5 lines of the limerick, one per line, nothing else."""
 
     def _call_ollama(self, prompt: str, timeout: int = 30) -> str:
         """
-        Make HTTP request to Ollama API.
+        Generate a completion through the shared, keep-alive Ollama client.
 
         Args:
             prompt: The prompt to send
@@ -323,39 +340,32 @@ Return ONLY the 5 lines of the limerick, one per line, nothing else."""
             ConnectionError: If Ollama is not reachable
             TimeoutError: If request times out
         """
-        payload = {
-            "model": self.model,
-            "prompt": prompt,
-            "stream": False,
-            "options": {
-                "temperature": 0.7,
-                "top_p": 0.9,
-                "num_predict": 200
-            }
+        options = {
+            "temperature": 0.7,
+            "top_p": 0.9,
+            "num_predict": 200
         }
 
         try:
-            response = requests.post(
-                self.api_endpoint,
-                json=payload,
+            result = self.client.generate(
+                self.model,
+                prompt,
+                options=options,
                 timeout=timeout
             )
-            response.raise_for_status()
-
-            result = response.json()
             return result.get("response", "")
 
-        except requests.exceptions.ConnectionError as e:
+        except OllamaConnectionError as e:
             raise ConnectionError(
                 f"Cannot connect to Ollama at {self.ollama_host}. "
                 f"Make sure Ollama is running. Error: {str(e)}"
             )
-        except requests.exceptions.Timeout as e:
+        except OllamaTimeoutError as e:
             raise TimeoutError(
                 f"Request to Ollama timed out after {timeout} seconds. "
                 f"Error: {str(e)}"
             )
-        except requests.exceptions.RequestException as e:
+        except OllamaError as e:
             raise Exception(f"Error calling Ollama API: {str(e)}")
 
     def _parse_response(self, response: str) -> List[str]:
@@ -15,10 +15,26 @@ Judges:
 import sys
 import os
 import json
-import subprocess
+import argparse
 import time
+from concurrent.futures import as_completed
 from pathlib import Path
 
+# The shared Ollama client lives in utils/llm at the repository root
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from utils.llm import (
+    CallScheduler,
+    OllamaError,
+    OllamaTimeoutError,
+    add_cache_arguments,
+    add_scheduler_arguments,
+    cache_from_args,
+    get_client,
+)
+
+# Model every method generates with
+GENERATOR_MODEL = "llama3.2"
+
 
 # Sample test story
 TEST_STORY = """
@@ -53,20 +69,9 @@ Return ONLY a single number from 1-10, nothing else. Be critical and differentia
 Your score (1-10):"""
 
     try:
-        result = subprocess.run(
-            ["ollama", "run", model],
-            input=prompt,
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-
-        if result.returncode != 0:
-            print(f"  Warning: {model} failed: {result.stderr}")
-            return 5.0  # Default score
+        response = get_client().generate(model=model, prompt=prompt, timeout=30)['response'].strip()
 
         # Extract number from response
-        response = result.stdout.strip()
         # Try to find a number in the response
         import re
         numbers = re.findall(r'\d+\.?\d*', response)
@@ -78,9 +83,12 @@ Your score (1-10):"""
             print(f"  Warning: {model} didn't return a number: {response[:50]}")
             return 5.0
 
-    except subprocess.TimeoutExpired:
+    except OllamaTimeoutError:
         print(f"  Warning: {model} timed out")
         return 5.0
+    except OllamaError as e:
+        print(f"  Warning: {model} failed: {e}")
+        return 5.0  # Default score
     except Exception as e:
         print(f"  Warning: {model} error: {e}")
         return 5.0
@@ -89,9 +97,18 @@ Your score (1-10):"""
 def generate_limerick_method1(story: str) -> dict:
     """Generate limerick using Method 1: Immediate Implementation."""
     sys.path.insert(0, str(Path(__file__).parent / "1-immediate-implementation"))
-    from limerick_converter import LimerickConverter
 
-    converter = LimerickConverter()
+    # Loaded by path like the other methods: methods run concurrently, so a
+    # plain import could pick up another method's limerick_converter
+    import importlib.util
+    spec = importlib.util.spec_from_file_location(
+        "limerick_converter_m1",
+        Path(__file__).parent / "1-immediate-implementation" / "limerick_converter.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    converter = module.LimerickConverter()
     result = converter.convert(story, validate=True)
 
     return {
@@ -183,6 +200,20 @@ def olympic_scoring(scores: list) -> float:
 
 
 def main():
+    parser = argparse.ArgumentParser(description='Olympic Judging Demo for the Limerick Converter')
+    add_scheduler_arguments(parser)
+    add_cache_arguments(parser)
+    args = parser.parse_args()
+
+    # Generations and judge calls run concurrently, at most --parallel per model;
+    # the shared client gets one pooled connection per possible call
+    scheduler = CallScheduler(per_model=args.parallel)
+    get_client(max_connections=scheduler.max_workers)
+
+    # Limericks and scores already made for the same prompts come from the cache
+    cache = cache_from_args(args)
+    get_client().cache = cache
+
     print("=" * 80)
     print("OLYMPIC JUDGING DEMO: Experiment 1.608.B - Limerick Converter")
     print("=" * 80)
@@ -201,17 +232,30 @@ def main():
         ("Method 4: Adaptive/Validated TDD", generate_limerick_method4),
     ]
 
+    judges = [
+        ("llama3.2", "Judge 1"),
+        ("phi3:mini", "Judge 2"),
+        ("gemma2:2b", "Judge 3"),
+    ]
+
     results = {}
 
     print("GENERATING LIMERICKS FROM ALL 4 METHODS...")
     print()
 
-    for method_name, generator in methods:
+    generations = {
+        scheduler.submit(method_name, GENERATOR_MODEL, generator, TEST_STORY): method_name
+        for method_name, generator in methods
+    }
+
+    # Judges start on each limerick as soon as it is generated
+    pending_scores = {}
+    for call in as_completed(generations):
+        method_name = generations[call]
         print(f"⏳ {method_name}...")
         try:
-            start_time = time.time()
-            result = generator(TEST_STORY)
-            gen_time = time.time() - start_time
+            result = call.result()
+            gen_time = call.timing.elapsed
 
             results[method_name] = {
                 "limerick": result["limerick"],
@@ -220,10 +264,18 @@ def main():
                 "generation_time": round(gen_time, 2)
             }
             print(f"   ✓ Generated in {gen_time:.2f}s")
+            pending_scores[method_name] = [
+                scheduler.submit(f"{method_name} / {judge_name}", model,
+                                 call_ollama_judge, model, result["limerick"], method_name)
+                for model, judge_name in judges
+            ]
         except Exception as e:
             print(f"   ✗ Error: {e}")
             results[method_name] = None
 
+    # Report in method order rather than finishing order
+    results = {method_name: results[method_name] for method_name, _ in methods}
+
     print()
     print("=" * 80)
     print("GENERATED LIMERICKS")
@@ -246,23 +298,15 @@ def main():
     print("=" * 80)
     print()
 
-    judges = [
-        ("llama3.2", "Judge 1"),
-        ("phi3:mini", "Judge 2"),
-        ("gemma2:2b", "Judge 3"),
-    ]
-
     judge_scores = {method: [] for method in results.keys() if results[method]}
 
-    for model, judge_name in judges:
+    for judge_index, (model, judge_name) in enumerate(judges):
         print(f"🧑‍⚖️  {judge_name} ({model}) scoring...")
-        for method_name in results.keys():
-            if results[method_name]:
-                limerick = results[method_name]["limerick"]
-                print(f"   Scoring {method_name}...", end=" ")
-                score = call_ollama_judge(model, limerick, method_name)
-                judge_scores[method_name].append(score)
-                print(f"{score}/10")
+        for method_name in judge_scores:
+            print(f"   Scoring {method_name}...", end=" ")
+            score = pending_scores[method_name][judge_index].result()
+            judge_scores[method_name].append(score)
+            print(f"{score}/10")
         print()
 
     print("=" * 80)
@@ -294,6 +338,13 @@ def main():
         medal = medals[i] if i < len(medals) else f"{i+1}."
         print(f"{medal} {method_name}: {score:.2f}/10")
 
+    print()
+    print(scheduler.report())
+
+    if cache is not None:
+        stats = cache.statistics()
+        print(f"\n💾 Response cache ({stats['mode']}): {stats['hits']} hits, {stats['misses']} misses")
+
     print()
     print("=" * 80)
     print("EXPERIMENT COMPLETE")
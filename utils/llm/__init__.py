@@ -0,0 +1,55 @@
+"""
+Shared LLM access for the poetry experiments (1.608 story-to-haiku,
+1.608.A iambic pentameter, 1.608.B limerick).
+
+- ollama_client: pooled keep-alive HTTP client for Ollama, async and blocking
+- response_cache: persistent content-addressed response cache with record/replay
+- scheduler: concurrent calls with a per-model parallelism cap, timed
+- stub_server: local Ollama stand-in for tests
+"""
+
+from .ollama_client import (
+    DEFAULT_HOST,
+    AsyncOllamaClient,
+    CallMetrics,
+    OllamaClient,
+    OllamaConnectionError,
+    OllamaError,
+    OllamaResponseError,
+    OllamaTimeoutError,
+    get_client,
+    summarize_metrics,
+)
+from .response_cache import (
+    CACHE_MODES,
+    CacheMissError,
+    ResponseCache,
+    add_cache_arguments,
+    cache_from_args,
+    request_key,
+)
+from .scheduler import CallScheduler, CallTiming, add_scheduler_arguments
+from .stub_server import StubOllamaServer
+
+__all__ = [
+    'DEFAULT_HOST',
+    'AsyncOllamaClient',
+    'CallMetrics',
+    'OllamaClient',
+    'OllamaConnectionError',
+    'OllamaError',
+    'OllamaResponseError',
+    'OllamaTimeoutError',
+    'get_client',
+    'summarize_metrics',
+    'CACHE_MODES',
+    'CacheMissError',
+    'ResponseCache',
+    'add_cache_arguments',
+    'cache_from_args',
+    'request_key',
+    'CallScheduler',
+    'CallTiming',
+    'add_scheduler_arguments',
+    'StubOllamaServer',
+]
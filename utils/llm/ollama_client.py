@@ -0,0 +1,669 @@
+"""
+Shared Ollama client for the poetry converters.
+
+A standard-library HTTP/1.1 client for the Ollama REST API:
+- keep-alive connections are pooled per client and reused across calls
+- at most max_connections requests are in flight at once
+- AsyncOllamaClient is the asyncio API; OllamaClient is a blocking facade
+  that runs it on a background event loop, so synchronous converters share
+  the same pooled connections
+- generate_stream/chat_stream yield tokens as the server produces them
+- every call records latency and token metrics (CallMetrics)
+- an optional ResponseCache is consulted before every call
+
+Converters normally use get_client(), which returns one OllamaClient per
+host for the whole process, with the cache configured by LLM_CACHE_PATH
+(see ResponseCache.from_env).
+"""
+
+import asyncio
+import concurrent.futures
+import json
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional, Set
+from urllib.parse import urlsplit
+
+
+DEFAULT_HOST = 'http://localhost:11434'
+DEFAULT_TIMEOUT = 60.0
+DEFAULT_MAX_CONNECTIONS = 4
+
+# How many CallMetrics each client keeps for inspection
+METRICS_HISTORY = 1000
+
+_READ_SIZE = 65536
+
+logger = logging.getLogger(__name__)
+
+
+class OllamaError(Exception):
+    """Base class for errors raised by the Ollama client."""
+
+
+class OllamaConnectionError(OllamaError, ConnectionError):
+    """The Ollama server could not be reached or dropped the connection."""
+
+
+class OllamaTimeoutError(OllamaError, TimeoutError):
+    """The Ollama server sent nothing within the timeout."""
+
+
+class OllamaResponseError(OllamaError):
+    """The Ollama server answered with an error status or a malformed body."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(f"Ollama returned {status}: {message}")
+        self.status = status
+        self.message = message
+
+
+@dataclass
+class CallMetrics:
+    """Latency and token counts of one Ollama call."""
+    endpoint: str
+    model: str
+    latency: float = 0.0
+    time_to_first_token: Optional[float] = None
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    generation_time: Optional[float] = None
+    connection_reused: bool = False
+    streamed: bool = False
+    cached: bool = False
+
+    @property
+    def tokens_per_second(self) -> float:
+        """Completion tokens per second of generation (or of latency if unreported)."""
+        seconds = self.generation_time or self.latency
+        return self.completion_tokens / seconds if seconds else 0.0
+
+
+def summarize_metrics(metrics: Iterable[CallMetrics]) -> Dict[str, Any]:
+    """
+    Aggregate per-call metrics.
+
+    Returns:
+        Dictionary with calls, cache hits, mean and max latency, total prompt
+        and completion tokens, and the fraction of calls on a reused connection
+    """
+    metrics = list(metrics)
+    if not metrics:
+        return {'calls': 0, 'cache_hits': 0, 'mean_latency': 0.0, 'max_latency': 0.0,
+                'prompt_tokens': 0, 'completion_tokens': 0, 'connection_reuse': 0.0}
+    return {
+        'calls': len(metrics),
+        'cache_hits': sum(m.cached for m in metrics),
+        'mean_latency': sum(m.latency for m in metrics) / len(metrics),
+        'max_latency': max(m.latency for m in metrics),
+        'prompt_tokens': sum(m.prompt_tokens for m in metrics),
+        'completion_tokens': sum(m.completion_tokens for m in metrics),
+        'connection_reuse': sum(m.connection_reused for m in metrics) / len(metrics),
+    }
+
+
+class _Connection:
+    """One keep-alive connection to the server."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self.requests = 0
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+class _Response:
+    """Status, headers and a body that is read incrementally from a connection."""
+
+    def __init__(self, connection: _Connection, status: int, headers: Dict[str, str], timeout: float):
+        self.connection = connection
+        self.status = status
+        self.headers = headers
+        self.timeout = timeout
+        self.complete = False
+        self.reused = False
+        self.keep_alive = headers.get('connection', '').lower() != 'close'
+
+    async def _read(self, awaitable):
+        try:
+            return await asyncio.wait_for(awaitable, self.timeout)
+        except asyncio.TimeoutError:
+            raise OllamaTimeoutError(f"No response from Ollama within {self.timeout} seconds")
+        except (asyncio.IncompleteReadError, ConnectionError) as e:
+            raise OllamaConnectionError(f"Connection to Ollama lost mid-response: {e}")
+
+    async def iter_chunks(self) -> AsyncIterator[bytes]:
+        """Yield the body as it arrives, undoing chunked transfer encoding."""
+        reader = self.connection.reader
+        if self.headers.get('transfer-encoding', '').lower() == 'chunked':
+            while True:
+                size_line = await self._read(reader.readline())
+                size = int(size_line.split(b';', 1)[0].strip() or b'0', 16)
+                if size == 0:
+                    # Skip any trailers up to the blank line that ends the body
+                    while (await self._read(reader.readline())).strip():
+                        pass
+                    break
+                data = await self._read(reader.readexactly(size + 2))
+                yield data[:-2]
+        elif 'content-length' in self.headers:
+            remaining = int(self.headers['content-length'])
+            while remaining:
+                data = await self._read(reader.read(min(remaining, _READ_SIZE)))
+                if not data:
+                    raise OllamaConnectionError("Connection to Ollama closed mid-response")
+                remaining -= len(data)
+                yield data
+        else:
+            # No framing: the body runs to the end of the connection
+            self.keep_alive = False
+            while True:
+                data = await self._read(reader.read(_READ_SIZE))
+                if not data:
+                    break
+                yield data
+        self.complete = True
+
+    async def iter_lines(self) -> AsyncIterator[bytes]:
+        """Yield non-empty body lines, e.g. the objects of a JSON-lines stream."""
+        buffer = b''
+        async for chunk in self.iter_chunks():
+            buffer += chunk
+            *lines, buffer = buffer.split(b'\n')
+            for line in lines:
+                if line.strip():
+                    yield line
+        if buffer.strip():
+            yield buffer
+
+    async def read(self) -> bytes:
+        """Read the whole body."""
+        return b''.join([chunk async for chunk in self.iter_chunks()])
+
+
+def _decode(line: bytes, status: int) -> Dict[str, Any]:
+    """Parse one JSON object from the server, raising on error payloads."""
+    try:
+        data = json.loads(line)
+    except ValueError:
+        raise OllamaResponseError(status, f"malformed JSON: {line[:200]!r}")
+    if not isinstance(data, dict):
+        raise OllamaResponseError(status, f"unexpected JSON: {line[:200]!r}")
+    if 'error' in data:
+        raise OllamaResponseError(status, str(data['error']))
+    return data
+
+
+class AsyncOllamaClient:
+    """
+    Asyncio client for the Ollama REST API with a keep-alive connection pool.
+
+    Up to max_connections requests run concurrently; further calls wait for
+    a free slot, so callers can gather() any number of generations safely.
+    Non-streaming calls return the server's JSON object unchanged, so
+    response['response'] and response['message']['content'] work as with the
+    ollama package.
+    """
+
+    def __init__(self, host: str = DEFAULT_HOST, max_connections: int = DEFAULT_MAX_CONNECTIONS,
+                 timeout: float = DEFAULT_TIMEOUT,
+                 on_metrics: Optional[Callable[[CallMetrics], None]] = None,
+                 cache=None):
+        """
+        Initialize the client; no connection is made until the first call.
+
+        Args:
+            host: Base URL of the Ollama server
+            max_connections: Maximum concurrent requests and pooled connections
+            timeout: Default seconds to wait for the server to send anything
+            on_metrics: Called with the CallMetrics of every completed call
+            cache: ResponseCache consulted before every generation (default: none)
+
+        Raises:
+            ValueError: If host is not an http(s) URL or max_connections < 1
+        """
+        parts = urlsplit(host)
+        if parts.scheme not in ('http', 'https') or not parts.hostname:
+            raise ValueError(f"host must be an http(s) URL, got {host!r}")
+        if max_connections < 1:
+            raise ValueError(f"max_connections must be at least 1, got {max_connections}")
+
+        self.host = host.rstrip('/')
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.on_metrics = on_metrics
+        self.cache = cache
+        self.metrics: deque = deque(maxlen=METRICS_HISTORY)
+        self.connections_opened = 0
+
+        self._ssl = parts.scheme == 'https'
+        self._hostname = parts.hostname
+        self._port = parts.port or (443 if self._ssl else 80)
+        self._netloc = parts.netloc
+        self._prefix = parts.path.rstrip('/')
+        self._idle: deque = deque()
+        self._slots = asyncio.Semaphore(max_connections)
+
+    async def __aenter__(self) -> 'AsyncOllamaClient':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close every pooled connection."""
+        while self._idle:
+            self._idle.pop().close()
+
+    async def _connect(self, timeout: float) -> _Connection:
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(self._hostname, self._port, ssl=self._ssl or None),
+                timeout
+            )
+        except asyncio.TimeoutError:
+            raise OllamaTimeoutError(f"Connecting to Ollama at {self.host} timed out after {timeout} seconds")
+        except OSError as e:
+            raise OllamaConnectionError(f"Cannot connect to Ollama at {self.host}: {e}")
+        self.connections_opened += 1
+        return _Connection(reader, writer)
+
+    async def _send(self, connection: _Connection, method: str, path: str,
+                    body: bytes, timeout: float) -> _Response:
+        head = (f"{method} {self._prefix}{path} HTTP/1.1\r\n"
+                f"Host: {self._netloc}\r\n"
+                f"Accept: application/json\r\n")
+        if body:
+            head += f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n"
+        connection.writer.write(head.encode('latin-1') + b'\r\n' + body)
+        await connection.writer.drain()
+        connection.requests += 1
+
+        reader = connection.reader
+        status_line = await asyncio.wait_for(reader.readline(), timeout)
+        if not status_line:
+            raise ConnectionResetError("connection closed before a response was received")
+        try:
+            status = int(status_line.split(None, 2)[1])
+        except (IndexError, ValueError):
+            raise OllamaResponseError(0, f"malformed status line {status_line!r}")
+
+        headers: Dict[str, str] = {}
+        while True:
+            line = await asyncio.wait_for(reader.readline(), timeout)
+            if not line.strip():
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+        return _Response(connection, status, headers, timeout)
+
+    @asynccontextmanager
+    async def _request(self, method: str, path: str, payload: Optional[Dict] = None,
+                       timeout: Optional[float] = None) -> AsyncIterator[_Response]:
+        """
+        Send one request on a pooled connection and yield the response.
+
+        The connection goes back to the pool only if the body was read to the
+        end and the server allows keep-alive; otherwise it is closed.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        body = json.dumps(payload).encode('utf-8') if payload is not None else b''
+
+        async with self._slots:
+            while True:
+                reused = bool(self._idle)
+                connection = self._idle.popleft() if reused else await self._connect(timeout)
+                try:
+                    response = await self._send(connection, method, path, body, timeout)
+                    break
+                except asyncio.TimeoutError:
+                    connection.close()
+                    raise OllamaTimeoutError(f"No response from Ollama within {timeout} seconds")
+                except (ConnectionError, OSError, asyncio.IncompleteReadError) as e:
+                    connection.close()
+                    # The server may have dropped an idle connection; retry on a fresh one
+                    if reused:
+                        continue
+                    raise OllamaConnectionError(f"Cannot talk to Ollama at {self.host}: {e}")
+                except BaseException:
+                    connection.close()
+                    raise
+
+            response.reused = reused
+            try:
+                if response.status >= 400:
+                    error = await response.read()
+                    try:
+                        message = json.loads(error).get('error', error.decode('utf-8', 'replace'))
+                    except (ValueError, AttributeError):
+                        message = error.decode('utf-8', 'replace')
+                    raise OllamaResponseError(response.status, str(message))
+                yield response
+            finally:
+                if response.complete and response.keep_alive:
+                    self._idle.append(connection)
+                else:
+                    connection.close()
+
+    def _cached(self, path: str, payload: Dict[str, Any]):
+        """Return (key, cached response) for a request; both None without a cache."""
+        if self.cache is None or not self.cache.enabled:
+            return None, None
+        key = self.cache.key(path, payload)
+        return key, self.cache.lookup(key)
+
+    def _record(self, metrics: CallMetrics, final: Dict[str, Any], started: float) -> None:
+        metrics.latency = time.perf_counter() - started
+        metrics.prompt_tokens = final.get('prompt_eval_count', 0) or 0
+        metrics.completion_tokens = final.get('eval_count', 0) or 0
+        if final.get('eval_duration'):
+            metrics.generation_time = final['eval_duration'] / 1e9
+        self.metrics.append(metrics)
+        logger.debug("%s %s: %.3fs, %d+%d tokens%s", metrics.endpoint, metrics.model, metrics.latency,
+                     metrics.prompt_tokens, metrics.completion_tokens,
+                     ' (cached)' if metrics.cached else
+                     ' (reused connection)' if metrics.connection_reused else '')
+        if self.on_metrics is not None:
+            self.on_metrics(metrics)
+
+    async def _call(self, path: str, payload: Dict[str, Any], timeout: Optional[float]) -> Dict[str, Any]:
+        started = time.perf_counter()
+        metrics = CallMetrics(endpoint=path, model=payload['model'])
+        key, data = self._cached(path, payload)
+        if data is not None:
+            metrics.cached = True
+            self._record(metrics, data, started)
+            return data
+
+        async with self._request('POST', path, payload, timeout) as response:
+            metrics.connection_reused = response.reused
+            data = _decode(await response.read(), response.status)
+        if key is not None:
+            self.cache.store(key, path, payload['model'], data)
+        self._record(metrics, data, started)
+        return data
+
+    async def _stream(self, path: str, payload: Dict[str, Any], timeout: Optional[float],
+                      extract: Callable[[Dict[str, Any]], str]) -> AsyncIterator[str]:
+        started = time.perf_counter()
+        metrics = CallMetrics(endpoint=path, model=payload['model'], streamed=True)
+        key, cached = self._cached(path, payload)
+        if cached is not None:
+            # A cached response replays as a single piece
+            metrics.cached = True
+            metrics.time_to_first_token = time.perf_counter() - started
+            yield extract(cached)
+            self._record(metrics, cached, started)
+            return
+
+        final: Dict[str, Any] = {}
+        pieces = []
+        async with self._request('POST', path, payload, timeout) as response:
+            metrics.connection_reused = response.reused
+            async for line in response.iter_lines():
+                data = _decode(line, response.status)
+                piece = extract(data)
+                if piece:
+                    if metrics.time_to_first_token is None:
+                        metrics.time_to_first_token = time.perf_counter() - started
+                    pieces.append(piece)
+                    yield piece
+                if data.get('done'):
+                    final = data
+        if key is not None:
+            # Store what a non-streaming call would have returned
+            text = ''.join(pieces)
+            if path == '/api/chat':
+                self.cache.store(key, path, payload['model'],
+                                 {**final, 'message': {'role': 'assistant', 'content': text}})
+            else:
+                self.cache.store(key, path, payload['model'], {**final, 'response': text})
+        self._record(metrics, final, started)
+
+    @staticmethod
+    def _generate_payload(model: str, prompt: str, stream: bool, system: Optional[str],
+                          options: Optional[Dict], format: Optional[str]) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {'model': model, 'prompt': prompt, 'stream': stream}
+        if system:
+            payload['system'] = system
+        if options:
+            payload['options'] = options
+        if format:
+            payload['format'] = format
+        return payload
+
+    @staticmethod
+    def _chat_payload(model: str, messages: List[Dict[str, str]], stream: bool,
+                      options: Optional[Dict], format: Optional[str]) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {'model': model, 'messages': messages, 'stream': stream}
+        if options:
+            payload['options'] = options
+        if format:
+            payload['format'] = format
+        return payload
+
+    async def generate(self, model: str, prompt: str, system: Optional[str] = None,
+                       options: Optional[Dict] = None, format: Optional[str] = None,
+                       timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Generate a completion with /api/generate.
+
+        Args:
+            model: Model name, e.g. 'llama3.2'
+            prompt: Prompt text
+            system: Optional system prompt
+            options: Model options such as temperature or num_predict
+            format: 'json' to constrain the output to JSON
+            timeout: Seconds to wait for the server (default: the client's timeout)
+
+        Returns:
+            The server's response object; the text is in response['response']
+
+        Raises:
+            OllamaConnectionError: If the server cannot be reached
+            OllamaTimeoutError: If the server sends nothing within the timeout
+            OllamaResponseError: If the server reports an error, e.g. an unknown model
+        """
+        payload = self._generate_payload(model, prompt, False, system, options, format)
+        return await self._call('/api/generate', payload, timeout)
+
+    async def chat(self, model: str, messages: List[Dict[str, str]], options: Optional[Dict] = None,
+                   format: Optional[str] = None, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Run a chat completion with /api/chat.
+
+        Returns:
+            The server's response object; the text is in response['message']['content']
+
+        Raises:
+            The same errors as generate()
+        """
+        payload = self._chat_payload(model, messages, False, options, format)
+        return await self._call('/api/chat', payload, timeout)
+
+    async def generate_stream(self, model: str, prompt: str, system: Optional[str] = None,
+                              options: Optional[Dict] = None, format: Optional[str] = None,
+                              timeout: Optional[float] = None) -> AsyncIterator[str]:
+        """
+        Stream a completion from /api/generate, one token (or piece) at a time.
+
+        The timeout applies between pieces rather than to the whole call.
+        Metrics are recorded when the stream is read to the end.
+        """
+        payload = self._generate_payload(model, prompt, True, system, options, format)
+        async for piece in self._stream('/api/generate', payload, timeout,
+                                        lambda data: data.get('response', '')):
+            yield piece
+
+    async def chat_stream(self, model: str, messages: List[Dict[str, str]], options: Optional[Dict] = None,
+                          format: Optional[str] = None, timeout: Optional[float] = None) -> AsyncIterator[str]:
+        """Stream a chat completion from /api/chat, one piece of content at a time."""
+        payload = self._chat_payload(model, messages, True, options, format)
+        async for piece in self._stream('/api/chat', payload, timeout,
+                                        lambda data: (data.get('message') or {}).get('content', '')):
+            yield piece
+
+    async def list_models(self, timeout: Optional[float] = None) -> List[str]:
+        """Return the names of the locally installed models (/api/tags)."""
+        async with self._request('GET', '/api/tags', timeout=timeout) as response:
+            data = _decode(await response.read(), response.status)
+        return [model.get('name', '') for model in data.get('models', [])]
+
+    async def is_available(self, model: Optional[str] = None, timeout: float = 5.0) -> bool:
+        """
+        Check that the server answers and, if given, that model is installed.
+
+        A model name without a tag, e.g. 'llama3.2', matches any of its tags.
+        """
+        try:
+            names = await self.list_models(timeout=timeout)
+        except OllamaError:
+            return False
+        if model is None:
+            return True
+        return any(name == model or name.split(':', 1)[0] == model for name in names)
+
+
+class OllamaClient:
+    """
+    Blocking facade over AsyncOllamaClient.
+
+    The async client runs on a private event loop in a daemon thread, so its
+    connection pool survives between calls and is shared by every thread
+    that uses this object. Methods mirror AsyncOllamaClient. Closing the
+    client cancels calls still in flight, and later calls fail at once,
+    so no caller is left blocked on the stopped loop.
+    """
+
+    def __init__(self, host: str = DEFAULT_HOST, max_connections: int = DEFAULT_MAX_CONNECTIONS,
+                 timeout: float = DEFAULT_TIMEOUT,
+                 on_metrics: Optional[Callable[[CallMetrics], None]] = None,
+                 cache=None):
+        self.async_client = AsyncOllamaClient(host, max_connections, timeout, on_metrics, cache)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name='ollama-client', daemon=True)
+        self._thread.start()
+        self._closing = False
+        self._calls: Set[concurrent.futures.Future] = set()
+        self._calls_lock = threading.Lock()
+
+    @property
+    def host(self) -> str:
+        return self.async_client.host
+
+    @property
+    def cache(self):
+        """The ResponseCache consulted before every call, or None."""
+        return self.async_client.cache
+
+    @cache.setter
+    def cache(self, cache) -> None:
+        self.async_client.cache = cache
+
+    @property
+    def metrics(self) -> deque:
+        """Metrics of the most recent calls, oldest first."""
+        return self.async_client.metrics
+
+    def _run(self, coroutine):
+        with self._calls_lock:
+            if self._closing:
+                coroutine.close()
+                raise RuntimeError("OllamaClient is closed")
+            call = asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+            self._calls.add(call)
+        try:
+            return call.result()
+        except concurrent.futures.CancelledError:
+            if self._closing:
+                raise RuntimeError("OllamaClient was closed during the call") from None
+            raise
+        finally:
+            with self._calls_lock:
+                self._calls.discard(call)
+
+    def _iterate(self, agen) -> Iterator[str]:
+        try:
+            while True:
+                try:
+                    yield self._run(agen.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            if not self._closing:
+                self._run(agen.aclose())
+
+    def generate(self, model: str, prompt: str, **kwargs) -> Dict[str, Any]:
+        """See AsyncOllamaClient.generate."""
+        return self._run(self.async_client.generate(model, prompt, **kwargs))
+
+    def chat(self, model: str, messages: List[Dict[str, str]], **kwargs) -> Dict[str, Any]:
+        """See AsyncOllamaClient.chat."""
+        return self._run(self.async_client.chat(model, messages, **kwargs))
+
+    def generate_stream(self, model: str, prompt: str, **kwargs) -> Iterator[str]:
+        """See AsyncOllamaClient.generate_stream."""
+        return self._iterate(self.async_client.generate_stream(model, prompt, **kwargs))
+
+    def chat_stream(self, model: str, messages: List[Dict[str, str]], **kwargs) -> Iterator[str]:
+        """See AsyncOllamaClient.chat_stream."""
+        return self._iterate(self.async_client.chat_stream(model, messages, **kwargs))
+
+    def list_models(self, **kwargs) -> List[str]:
+        """See AsyncOllamaClient.list_models."""
+        return self._run(self.async_client.list_models(**kwargs))
+
+    def is_available(self, model: Optional[str] = None, **kwargs) -> bool:
+        """See AsyncOllamaClient.is_available."""
+        return self._run(self.async_client.is_available(model, **kwargs))
+
+    def close(self) -> None:
+        """Cancel calls in flight, close pooled connections and stop the background event loop."""
+        with self._calls_lock:
+            if self._closing:
+                return
+            self._closing = True
+            calls = list(self._calls)
+        for call in calls:
+            call.cancel()
+        asyncio.run_coroutine_threadsafe(self.async_client.close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def __enter__(self) -> 'OllamaClient':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+_shared_clients: Dict[str, OllamaClient] = {}
+_shared_lock = threading.Lock()
+
+
+def get_client(host: str = DEFAULT_HOST, max_connections: int = DEFAULT_MAX_CONNECTIONS) -> OllamaClient:
+    """
+    Return the process-wide client for host, creating it on first use.
+
+    Every converter that calls this shares one connection pool per host.
+    max_connections only applies when the client is created, so callers
+    that need a larger pool (e.g. a CallScheduler) must ask first.
+    New clients use the response cache configured in the environment
+    (LLM_CACHE_PATH, LLM_CACHE_MODE, LLM_CACHE_TTL); assign client.cache
+    to change it.
+    """
+    from .response_cache import ResponseCache
+
+    host = host.rstrip('/')
+    with _shared_lock:
+        client = _shared_clients.get(host)
+        if client is None or client._closing:
+            client = _shared_clients[host] = OllamaClient(host, max_connections, cache=ResponseCache.from_env())
+        return client
@@ -0,0 +1,241 @@
+"""
+Persistent, content-addressed cache of LLM responses.
+
+Entries are keyed by a SHA-256 of the request that produced them (endpoint,
+model, prompt or messages, options, format, ...), so any caller that sends
+the same request gets the same response without a model call. Entries live
+in one SQLite file, expire after a TTL, and the least recently used are
+evicted once the cache exceeds its entry or byte limit.
+
+Modes:
+- 'read-write': serve hits, call the model on a miss and store the result
+- 'record': always call the model and store (overwrite) every result
+- 'replay': serve only from the cache, ignoring the TTL; a miss raises
+  CacheMissError, so replayed runs never reach a model
+- 'off': bypass the cache
+
+AsyncOllamaClient and OllamaClient consult the cache before every call.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from .ollama_client import OllamaError
+
+
+CACHE_MODES = ('read-write', 'record', 'replay', 'off')
+
+DEFAULT_TTL = 30 * 24 * 3600
+DEFAULT_MAX_ENTRIES = 10_000
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Request fields that never change the response
+_IGNORED_FIELDS = ('stream', 'keep_alive')
+
+
+class CacheMissError(OllamaError):
+    """A replaying cache was asked for a response it never recorded."""
+
+
+def request_key(endpoint: str, payload: Dict[str, Any]) -> str:
+    """
+    Return the content address of a request.
+
+    Streaming and non-streaming requests for the same content share a key.
+    """
+    canonical = {k: v for k, v in payload.items() if k not in _IGNORED_FIELDS}
+    canonical['endpoint'] = endpoint
+    data = json.dumps(canonical, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+def add_cache_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add --cache and --cache-mode options to a command-line parser."""
+    parser.add_argument('--cache', metavar='PATH',
+                        help='Cache LLM responses in this file (default: $LLM_CACHE_PATH, if set)')
+    parser.add_argument('--cache-mode', choices=CACHE_MODES, default='read-write',
+                        help='read-write (default), record (refresh every entry), '
+                             'replay (cache only, no model calls) or off')
+
+
+def cache_from_args(args: argparse.Namespace) -> Optional['ResponseCache']:
+    """Build the cache selected by add_cache_arguments options, or None."""
+    if args.cache_mode == 'off':
+        return None
+    if args.cache:
+        return ResponseCache(args.cache, mode=args.cache_mode)
+    return ResponseCache.from_env()
+
+
+class ResponseCache:
+    """
+    On-disk response cache shared by every client given it.
+
+    Safe to use from several threads; several processes may share a file,
+    although their eviction decisions are not coordinated.
+    """
+
+    def __init__(self, path: str, mode: str = 'read-write', ttl: Optional[float] = DEFAULT_TTL,
+                 max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Open (or create) a cache file.
+
+        Args:
+            path: SQLite file to store responses in
+            mode: One of CACHE_MODES
+            ttl: Seconds an entry stays valid (None: forever)
+            max_entries: Evict least recently used entries beyond this count
+            max_bytes: Evict least recently used entries beyond this many response bytes
+
+        Raises:
+            ValueError: If mode is unknown or a limit is not positive
+        """
+        if mode not in CACHE_MODES:
+            raise ValueError(f"mode must be one of {', '.join(CACHE_MODES)}, got {mode!r}")
+        if max_entries < 1 or max_bytes < 1:
+            raise ValueError("max_entries and max_bytes must be positive")
+
+        self.path = path
+        self.mode = mode
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS responses ('
+            ' key TEXT PRIMARY KEY, endpoint TEXT, model TEXT,'
+            ' created REAL, accessed REAL, size INTEGER, response TEXT)'
+        )
+        self._db.execute('CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)')
+
+    @classmethod
+    def from_env(cls) -> Optional['ResponseCache']:
+        """
+        Build a cache from LLM_CACHE_PATH, LLM_CACHE_MODE and LLM_CACHE_TTL.
+
+        Returns None when LLM_CACHE_PATH is unset or the mode is 'off'.
+        """
+        path = os.environ.get('LLM_CACHE_PATH')
+        mode = os.environ.get('LLM_CACHE_MODE', 'read-write')
+        if not path or mode == 'off':
+            return None
+        ttl = os.environ.get('LLM_CACHE_TTL')
+        return cls(path, mode=mode, ttl=float(ttl) if ttl else DEFAULT_TTL)
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != 'off'
+
+    def key(self, endpoint: str, payload: Dict[str, Any]) -> str:
+        """See request_key."""
+        return request_key(endpoint, payload)
+
+    def lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached response for key, or None if the model must be called.
+
+        Raises:
+            CacheMissError: In replay mode, if key was never recorded
+        """
+        if self.mode in ('off', 'record'):
+            return None
+
+        now = time.time()
+        with self._lock:
+            row = self._db.execute('SELECT created, response FROM responses WHERE key = ?', (key,)).fetchone()
+            if row is not None and self.mode != 'replay' and self.ttl is not None and now - row[0] > self.ttl:
+                self._db.execute('DELETE FROM responses WHERE key = ?', (key,))
+                row = None
+            if row is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._db.execute('UPDATE responses SET accessed = ? WHERE key = ?', (now, key))
+
+        if row is None:
+            if self.mode == 'replay':
+                raise CacheMissError(f"No recorded response for request {key[:12]} in {self.path}")
+            return None
+        return json.loads(row[1])
+
+    def store(self, key: str, endpoint: str, model: str, response: Dict[str, Any]) -> None:
+        """Save a response, then evict entries beyond the limits."""
+        if self.mode in ('off', 'replay'):
+            return
+
+        data = json.dumps(response, ensure_ascii=False)
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (key, endpoint, model, now, now, len(data), data)
+            )
+            self.stores += 1
+            self._evict()
+
+    def _evict(self) -> None:
+        count, size = self._db.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses').fetchone()
+        if count <= self.max_entries and size <= self.max_bytes:
+            return
+        # Walk from least recently used, deleting until both limits hold
+        doomed = []
+        for key, entry_size in self._db.execute('SELECT key, size FROM responses ORDER BY accessed'):
+            if count <= self.max_entries and size <= self.max_bytes:
+                break
+            doomed.append((key,))
+            count -= 1
+            size -= entry_size
+        self._db.executemany('DELETE FROM responses WHERE key = ?', doomed)
+        self.evictions += len(doomed)
+
+    def clear(self) -> None:
+        """Delete every entry; counters are kept."""
+        with self._lock:
+            self._db.execute('DELETE FROM responses')
+
+    def statistics(self) -> Dict[str, Any]:
+        """Hit, miss, store and eviction counts plus current entries and bytes."""
+        with self._lock:
+            count, size = self._db.execute(
+                'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses'
+            ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            'mode': self.mode,
+            'entries': count,
+            'bytes': size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'stores': self.stores,
+            'evictions': self.evictions,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+
+    def __enter__(self) -> 'ResponseCache':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
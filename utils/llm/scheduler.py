@@ -0,0 +1,164 @@
+"""
+Concurrent scheduling of model-bound calls for the olympic judging demos.
+
+CallScheduler runs calls (method generations, judge scorings, ...) on a
+thread pool, with at most per_model calls in flight for any one model, and
+times each call. A judging round therefore costs roughly its slowest chain
+of calls rather than the sum of all of them:
+
+    with CallScheduler(per_model=2) as scheduler:
+        futures = [scheduler.submit(f"Judge {m}", m, judge, m) for m in models]
+        scores = [f.result() for f in futures]
+        print(scheduler.report())
+
+Any callable can be scheduled, so converters that reach Ollama through
+their own transport (subprocess, requests) are capped the same way.
+"""
+
+import argparse
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+
+DEFAULT_PER_MODEL = 2
+DEFAULT_MAX_WORKERS = 16
+
+
+@dataclass
+class CallTiming:
+    """When one scheduled call was submitted, started and finished (seconds since the scheduler started)."""
+    name: str
+    model: str
+    submitted: float
+    started: Optional[float] = None
+    finished: Optional[float] = None
+    error: Optional[str] = None
+
+    @property
+    def waited(self) -> float:
+        """Seconds spent queued behind the model's parallelism cap."""
+        return (self.started or self.submitted) - self.submitted
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds the call itself took."""
+        if self.started is None or self.finished is None:
+            return 0.0
+        return self.finished - self.started
+
+
+def add_scheduler_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the --parallel option to a command-line parser."""
+    parser.add_argument('--parallel', type=int, default=DEFAULT_PER_MODEL, metavar='N',
+                        help=f'Concurrent calls per model (default: {DEFAULT_PER_MODEL}; '
+                             f'1 runs each model\'s calls one at a time)')
+
+
+class CallScheduler:
+    """
+    Thread pool that caps concurrent calls per model and times every call.
+
+    Calls for different models run side by side; calls for the same model
+    queue once per_model of them are in flight.
+    """
+
+    def __init__(self, per_model: int = DEFAULT_PER_MODEL, max_workers: int = DEFAULT_MAX_WORKERS,
+                 keep_timings: bool = True):
+        """
+        Args:
+            per_model: Maximum concurrent calls for any one model
+            max_workers: Maximum concurrent calls overall
+            keep_timings: Keep every call's CallTiming for report(); turn off
+                          for long-lived schedulers that run unbounded calls
+
+        Raises:
+            ValueError: If per_model or max_workers is less than 1
+        """
+        if per_model < 1:
+            raise ValueError(f"per_model must be at least 1, got {per_model}")
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+
+        self.per_model = per_model
+        self.max_workers = max_workers
+        self.keep_timings = keep_timings
+        self.timings: List[CallTiming] = []
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='llm-call')
+        self._slots: Dict[str, threading.Semaphore] = {}
+        self._lock = threading.Lock()
+        self._start = time.perf_counter()
+
+    def _now(self) -> float:
+        return time.perf_counter() - self._start
+
+    def _slot(self, model: str) -> threading.Semaphore:
+        with self._lock:
+            if model not in self._slots:
+                self._slots[model] = threading.Semaphore(self.per_model)
+            return self._slots[model]
+
+    def _run(self, timing: CallTiming, fn: Callable[..., Any], args, kwargs) -> Any:
+        with self._slot(timing.model):
+            timing.started = self._now()
+            try:
+                return fn(*args, **kwargs)
+            except BaseException as e:
+                timing.error = str(e) or type(e).__name__
+                raise
+            finally:
+                timing.finished = self._now()
+
+    def submit(self, name: str, model: str, fn: Callable[..., Any], *args, **kwargs) -> Future:
+        """
+        Schedule fn(*args, **kwargs) as a call to model.
+
+        Returns:
+            Future for the call's result; its timing attribute is the call's CallTiming
+        """
+        timing = CallTiming(name=name, model=model, submitted=self._now())
+        if self.keep_timings:
+            with self._lock:
+                self.timings.append(timing)
+        future = self._executor.submit(self._run, timing, fn, args, kwargs)
+        future.timing = timing
+        return future
+
+    @property
+    def wall_clock(self) -> float:
+        """Seconds from the first submission to the last finished call."""
+        finished = [t.finished for t in self.timings if t.finished is not None]
+        if not finished:
+            return 0.0
+        return max(finished) - min(t.submitted for t in self.timings)
+
+    @property
+    def total_call_time(self) -> float:
+        """Seconds the calls would have taken one after another."""
+        return sum(t.elapsed for t in self.timings)
+
+    def report(self) -> str:
+        """Wall-clock summary followed by one line per call, in submission order."""
+        wall_clock = self.wall_clock
+        total = self.total_call_time
+        speedup = total / wall_clock if wall_clock else 1.0
+        lines = [f"⏱️  Wall clock: {wall_clock:.1f}s for {len(self.timings)} calls "
+                 f"({total:.1f}s one after another, {speedup:.1f}x faster)"]
+        width = max((len(t.name) for t in self.timings), default=0)
+        for t in self.timings:
+            status = f"✗ {t.error}" if t.error else "✓"
+            lines.append(f"   {t.name:<{width}}  {t.model:<12} {t.elapsed:6.1f}s  "
+                         f"(started +{t.started or 0:.1f}s, waited {t.waited:.1f}s) {status}")
+        return '\n'.join(lines)
+
+    def close(self) -> None:
+        """Wait for scheduled calls to finish and stop the worker threads."""
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> 'CallScheduler':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,173 @@
+"""
+Local stand-in for an Ollama server, for tests and demos.
+
+StubOllamaServer answers /api/generate, /api/chat and /api/tags on
+127.0.0.1 from a background thread, speaking HTTP/1.1 with keep-alive and
+chunked JSON-lines streaming like the real server. No model is involved:
+every generation returns the configured reply.
+"""
+
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+
+Reply = Union[str, Callable[[Dict[str, Any]], str]]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        super().setup()
+        # Like the real server; otherwise Nagle delays each small body write
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        with self.server.stub.lock:
+            self.server.stub.connections += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status: int, data: Dict[str, Any]) -> None:
+        body = json.dumps(data).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_chunk(self, data: Dict[str, Any]) -> None:
+        line = json.dumps(data).encode('utf-8') + b'\n'
+        self.wfile.write(f"{len(line):x}\r\n".encode('ascii') + line + b'\r\n')
+        self.wfile.flush()
+
+    def do_GET(self):
+        stub = self.server.stub
+        if self.path == '/api/tags':
+            self._send_json(200, {'models': [{'name': name} for name in stub.models]})
+        else:
+            self._send_json(404, {'error': 'not found'})
+
+    def do_POST(self):
+        stub = self.server.stub
+        length = int(self.headers.get('Content-Length', 0))
+        payload = json.loads(self.rfile.read(length) or b'{}')
+        with stub.lock:
+            stub.requests.append((self.path, payload))
+
+        if self.path not in ('/api/generate', '/api/chat'):
+            self._send_json(404, {'error': 'not found'})
+            return
+        if stub.error is not None:
+            status, message = stub.error
+            self._send_json(status, {'error': message})
+            return
+
+        if stub.delay:
+            time.sleep(stub.delay)
+        text = stub.reply(payload) if callable(stub.reply) else stub.reply
+        pieces = [word + ' ' for word in text.split(' ')]
+        pieces[-1] = pieces[-1][:-1]
+        prompt = payload.get('prompt') or ' '.join(m.get('content', '') for m in payload.get('messages', []))
+        final = {
+            'model': payload.get('model'),
+            'done': True,
+            'prompt_eval_count': len(prompt.split()),
+            'eval_count': len(pieces),
+            'eval_duration': 1_000_000 * len(pieces),
+        }
+
+        def body(piece: str, done: bool) -> Dict[str, Any]:
+            data = {'model': payload.get('model'), 'done': done}
+            if self.path == '/api/chat':
+                data['message'] = {'role': 'assistant', 'content': piece}
+            else:
+                data['response'] = piece
+            return data
+
+        if stub.drop_connections:
+            self.close_connection = True
+
+        if not payload.get('stream', True):
+            self._send_json(200, {**body(text, True), **final})
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        for piece in pieces:
+            self._send_chunk(body(piece, False))
+            if stub.token_delay:
+                time.sleep(stub.token_delay)
+        self._send_chunk({**body('', True), **final})
+        self.wfile.write(b'0\r\n\r\n')
+        self.wfile.flush()
+
+
+class StubOllamaServer:
+    """
+    Minimal Ollama server on a free local port.
+
+    Attributes:
+        url: Base URL to pass to the client as host
+        requests: (path, JSON payload) of every POST received
+        connections: Number of TCP connections accepted so far
+
+    Examples:
+        >>> with StubOllamaServer(reply='An old silent pond') as stub:  # doctest: +SKIP
+        ...     OllamaClient(stub.url).generate('llama3.2', 'haiku')['response']
+        'An old silent pond'
+    """
+
+    def __init__(self, reply: Reply = 'stub reply', models: Iterable[str] = ('llama3.2:latest',),
+                 delay: float = 0.0, token_delay: float = 0.0,
+                 error: Optional[Tuple[int, str]] = None, drop_connections: bool = False):
+        """
+        Args:
+            reply: Text of every generation, or a function of the request payload
+            models: Model names listed by /api/tags
+            delay: Seconds to wait before answering a generation
+            token_delay: Seconds to wait between streamed pieces
+            error: (status, message) to answer every generation with instead
+            drop_connections: Close the connection after each generation without
+                telling the client, like a server timing out idle keep-alives
+        """
+        self.reply = reply
+        self.models: List[str] = list(models)
+        self.delay = delay
+        self.token_delay = token_delay
+        self.error = error
+        self.drop_connections = drop_connections
+        self.requests: List[Tuple[str, Dict[str, Any]]] = []
+        self.connections = 0
+        self.lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        self._server.daemon_threads = True
+        self._server.stub = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'StubOllamaServer':
+        self._thread = threading.Thread(target=self._server.serve_forever, args=(0.05,), daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> 'StubOllamaServer':
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
@@ -0,0 +1,190 @@
+"""
+Tests for the shared Ollama client, run against the local stub server.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from utils.llm import (
+    AsyncOllamaClient,
+    OllamaClient,
+    OllamaConnectionError,
+    OllamaResponseError,
+    OllamaTimeoutError,
+    StubOllamaServer,
+    get_client,
+    summarize_metrics,
+)
+
+
+@pytest.fixture
+def stub():
+    with StubOllamaServer(reply='An old silent pond') as server:
+        yield server
+
+
+@pytest.fixture
+def client(stub):
+    with OllamaClient(stub.url) as ollama:
+        yield ollama
+
+
+class TestOllamaClient:
+    """Test cases for the blocking client."""
+
+    def test_generate_and_chat(self, client, stub):
+        """Test non-streaming calls return the server's JSON unchanged."""
+        response = client.generate('llama3.2', 'Write a haiku', options={'temperature': 0.7})
+        assert response['response'] == 'An old silent pond'
+        response = client.chat('llama3.2', [{'role': 'user', 'content': 'Write a haiku'}], format='json')
+        assert response['message']['content'] == 'An old silent pond'
+
+        assert stub.requests[0] == ('/api/generate', {
+            'model': 'llama3.2', 'prompt': 'Write a haiku', 'stream': False,
+            'options': {'temperature': 0.7}
+        })
+        assert stub.requests[1][1]['format'] == 'json'
+
+    def test_connections_are_reused(self, client, stub):
+        """Test that sequential calls share one keep-alive connection."""
+        for _ in range(5):
+            client.generate('llama3.2', 'prompt')
+        assert stub.connections == 1
+        assert [m.connection_reused for m in client.metrics] == [False, True, True, True, True]
+
+    def test_dropped_connection_is_retried(self, client, stub):
+        """Test that a pooled connection closed by the server is replaced transparently."""
+        stub.drop_connections = True
+        for _ in range(3):
+            assert client.generate('llama3.2', 'prompt')['response'] == 'An old silent pond'
+        assert stub.connections == 3
+
+    def test_streaming(self, client):
+        """Test that streamed pieces join to the full reply and are measured."""
+        assert list(client.generate_stream('llama3.2', 'prompt')) == ['An ', 'old ', 'silent ', 'pond']
+        assert ''.join(client.chat_stream('llama3.2', [{'role': 'user', 'content': 'x'}])) == 'An old silent pond'
+
+        metrics = client.metrics[-1]
+        assert metrics.streamed
+        assert metrics.completion_tokens == 4
+        assert metrics.time_to_first_token is not None
+        assert metrics.time_to_first_token <= metrics.latency
+
+    def test_abandoned_stream_frees_connection(self, client, stub):
+        """Test that stopping a stream early does not leak a connection slot."""
+        stub.token_delay = 0.01
+        for _ in range(client.async_client.max_connections + 1):
+            stream = client.generate_stream('llama3.2', 'prompt')
+            assert next(stream) == 'An '
+            stream.close()
+        assert client.generate('llama3.2', 'prompt')['response'] == 'An old silent pond'
+
+    def test_metrics(self, stub):
+        """Test per-call metrics and their summary."""
+        seen = []
+        with OllamaClient(stub.url, on_metrics=seen.append) as client:
+            client.generate('llama3.2', 'three word prompt')
+            client.generate('llama3.2', 'prompt')
+
+        assert [m.prompt_tokens for m in seen] == [3, 1]
+        assert [m.completion_tokens for m in seen] == [4, 4]
+        assert all(m.latency > 0 and m.tokens_per_second > 0 for m in seen)
+        summary = summarize_metrics(seen)
+        assert summary['calls'] == 2
+        assert summary['completion_tokens'] == 8
+        assert summary['connection_reuse'] == 0.5
+
+    def test_availability(self, client):
+        """Test model listing and availability checks."""
+        assert client.list_models() == ['llama3.2:latest']
+        assert client.is_available()
+        assert client.is_available('llama3.2')
+        assert client.is_available('llama3.2:latest')
+        assert not client.is_available('mistral')
+
+    def test_errors(self, client, stub):
+        """Test that server, connection and timeout failures raise typed errors."""
+        stub.error = (404, "model 'missing' not found")
+        with pytest.raises(OllamaResponseError, match="not found") as info:
+            client.generate('missing', 'prompt')
+        assert info.value.status == 404
+
+        stub.error = None
+        stub.delay = 0.5
+        with pytest.raises(OllamaTimeoutError):
+            client.generate('llama3.2', 'prompt', timeout=0.1)
+
+        with OllamaClient('http://127.0.0.1:1') as unreachable:
+            with pytest.raises(OllamaConnectionError):
+                unreachable.generate('llama3.2', 'prompt')
+            # Still ConnectionError for callers that catch the builtin
+            with pytest.raises(ConnectionError):
+                unreachable.generate('llama3.2', 'prompt')
+            assert not unreachable.is_available()
+
+        with pytest.raises(ValueError):
+            OllamaClient('localhost:11434')
+
+    def test_close_cancels_calls_in_flight(self, stub):
+        """Test that closing fails calls still waiting on the server instead of leaving them blocked."""
+        stub.delay = 5
+        client = OllamaClient(stub.url)
+        errors = []
+
+        def call():
+            try:
+                client.generate('llama3.2', 'prompt')
+            except RuntimeError as e:
+                errors.append(str(e))
+
+        caller = threading.Thread(target=call)
+        caller.start()
+        while not stub.requests:
+            time.sleep(0.01)
+        client.close()
+        caller.join(timeout=2)
+
+        assert not caller.is_alive()
+        assert errors == ["OllamaClient was closed during the call"]
+        with pytest.raises(RuntimeError, match="closed"):
+            client.generate('llama3.2', 'prompt')
+
+    def test_get_client_is_shared(self, stub):
+        """Test that get_client returns one client per host."""
+        assert get_client(stub.url) is get_client(stub.url + '/')
+        assert get_client(stub.url) is not get_client('http://127.0.0.1:1')
+
+
+class TestAsyncOllamaClient:
+    """Test cases for the asyncio client."""
+
+    def test_concurrency_is_bounded(self, stub):
+        """Test that gathered calls run max_connections at a time on pooled connections."""
+        stub.delay = 0.1
+
+        async def run():
+            async with AsyncOllamaClient(stub.url, max_connections=3) as client:
+                started = time.perf_counter()
+                responses = await asyncio.gather(*[client.generate('llama3.2', str(i)) for i in range(9)])
+                return responses, time.perf_counter() - started, client.connections_opened
+
+        responses, elapsed, opened = asyncio.run(run())
+        assert [r['response'] for r in responses] == ['An old silent pond'] * 9
+        assert opened == stub.connections == 3
+        # Three waves of three calls, not nine sequential calls
+        assert 0.3 <= elapsed < 0.8
+
+    def test_streaming(self, stub):
+        """Test async streaming."""
+        async def run():
+            async with AsyncOllamaClient(stub.url) as client:
+                return [piece async for piece in client.generate_stream('llama3.2', 'prompt')]
+
+        assert asyncio.run(run()) == ['An ', 'old ', 'silent ', 'pond']
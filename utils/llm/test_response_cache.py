@@ -0,0 +1,137 @@
+"""
+Tests for the persistent LLM response cache.
+"""
+
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from utils.llm import CacheMissError, OllamaClient, ResponseCache, StubOllamaServer, request_key
+
+
+UNREACHABLE = 'http://127.0.0.1:1'
+
+
+@pytest.fixture
+def stub():
+    with StubOllamaServer(reply=lambda payload: f"reply to {payload.get('prompt')}") as server:
+        yield server
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / 'responses.sqlite')
+
+
+class TestResponseCache:
+    """Test cases for ResponseCache on its own and inside the client."""
+
+    def test_request_key(self):
+        """Test that keys depend on content, not on streaming or field order."""
+        payload = {'model': 'llama3.2', 'prompt': 'p', 'options': {'temperature': 0.7, 'top_p': 0.9}}
+        reordered = {'options': {'top_p': 0.9, 'temperature': 0.7}, 'prompt': 'p', 'model': 'llama3.2'}
+        assert request_key('/api/generate', payload) == request_key('/api/generate', reordered)
+        assert request_key('/api/generate', payload) == request_key('/api/generate', {**payload, 'stream': True})
+        assert request_key('/api/generate', payload) != request_key('/api/chat', payload)
+        assert request_key('/api/generate', payload) != request_key('/api/generate', {**payload, 'model': 'phi3:mini'})
+        assert request_key('/api/generate', payload) != request_key(
+            '/api/generate', {**payload, 'options': {'temperature': 0.0, 'top_p': 0.9}})
+
+    def test_hits_skip_the_model(self, stub, cache_path):
+        """Test that a repeated request is answered from the cache."""
+        with ResponseCache(cache_path) as cache, OllamaClient(stub.url, cache=cache) as client:
+            first = client.generate('llama3.2', 'story', options={'temperature': 0.7})
+            second = client.generate('llama3.2', 'story', options={'temperature': 0.7})
+            client.generate('llama3.2', 'story', options={'temperature': 0.2})
+
+            assert first == second
+            assert len(stub.requests) == 2
+            assert [m.cached for m in client.metrics] == [False, True, False]
+            assert cache.statistics()['hits'] == 1
+
+    def test_persists_across_processes(self, stub, cache_path):
+        """Test that a reopened cache file still answers, with no server at all."""
+        with ResponseCache(cache_path) as cache, OllamaClient(stub.url, cache=cache) as client:
+            expected = client.chat('llama3.2', [{'role': 'user', 'content': 'story'}])
+
+        with ResponseCache(cache_path) as cache, OllamaClient(UNREACHABLE, cache=cache) as client:
+            assert client.chat('llama3.2', [{'role': 'user', 'content': 'story'}]) == expected
+
+    def test_streams_are_cached(self, stub, cache_path):
+        """Test that a streamed response is stored and serves later calls of either kind."""
+        with ResponseCache(cache_path) as cache, OllamaClient(stub.url, cache=cache) as client:
+            streamed = ''.join(client.generate_stream('llama3.2', 'story'))
+            assert client.generate('llama3.2', 'story')['response'] == streamed
+            assert list(client.generate_stream('llama3.2', 'story')) == [streamed]
+            assert len(stub.requests) == 1
+
+    def test_ttl(self, stub, cache_path):
+        """Test that expired entries are fetched again."""
+        with ResponseCache(cache_path, ttl=0.05) as cache, OllamaClient(stub.url, cache=cache) as client:
+            client.generate('llama3.2', 'story')
+            time.sleep(0.1)
+            client.generate('llama3.2', 'story')
+            assert len(stub.requests) == 2
+
+    def test_eviction_is_least_recently_used(self, stub, cache_path):
+        """Test that the entry limit evicts the entry used longest ago."""
+        with ResponseCache(cache_path, max_entries=2) as cache, OllamaClient(stub.url, cache=cache) as client:
+            client.generate('llama3.2', 'a')
+            client.generate('llama3.2', 'b')
+            client.generate('llama3.2', 'a')  # a is now more recent than b
+            client.generate('llama3.2', 'c')  # evicts b
+
+            assert len(cache) == 2
+            assert cache.evictions == 1
+            requests_before = len(stub.requests)
+            client.generate('llama3.2', 'a')
+            client.generate('llama3.2', 'c')
+            assert len(stub.requests) == requests_before
+            client.generate('llama3.2', 'b')
+            assert len(stub.requests) == requests_before + 1
+
+    def test_byte_limit(self, stub, cache_path):
+        """Test that the byte limit bounds the stored responses."""
+        with ResponseCache(cache_path, max_bytes=600) as cache, OllamaClient(stub.url, cache=cache) as client:
+            for i in range(10):
+                client.generate('llama3.2', f'story {i}')
+            assert cache.statistics()['bytes'] <= 600
+            assert 0 < len(cache) < 10
+
+    def test_record_then_replay(self, stub, cache_path):
+        """Test that a recorded run replays deterministically without a model."""
+        prompts = ['first story', 'second story']
+        with ResponseCache(cache_path, mode='record') as cache, OllamaClient(stub.url, cache=cache) as client:
+            recorded = [client.generate('llama3.2', p)['response'] for p in prompts]
+            # Recording always calls the model, refreshing existing entries
+            client.generate('llama3.2', prompts[0])
+            assert len(stub.requests) == 3
+
+        with ResponseCache(cache_path, mode='replay', ttl=0) as cache, \
+                OllamaClient(UNREACHABLE, cache=cache) as client:
+            assert [client.generate('llama3.2', p)['response'] for p in prompts] == recorded
+            with pytest.raises(CacheMissError):
+                client.generate('llama3.2', 'never recorded')
+            assert cache.statistics()['misses'] == 1
+
+    def test_from_env(self, cache_path, monkeypatch):
+        """Test configuration through the environment."""
+        monkeypatch.delenv('LLM_CACHE_PATH', raising=False)
+        assert ResponseCache.from_env() is None
+
+        monkeypatch.setenv('LLM_CACHE_PATH', cache_path)
+        monkeypatch.setenv('LLM_CACHE_MODE', 'replay')
+        monkeypatch.setenv('LLM_CACHE_TTL', '60')
+        cache = ResponseCache.from_env()
+        assert (cache.mode, cache.ttl) == ('replay', 60.0)
+        cache.close()
+
+        monkeypatch.setenv('LLM_CACHE_MODE', 'off')
+        assert ResponseCache.from_env() is None
+
+        with pytest.raises(ValueError):
+            ResponseCache(cache_path, mode='sometimes')
@@ -0,0 +1,93 @@
+"""
+Tests for the per-model call scheduler.
+"""
+
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from utils.llm import CallScheduler, OllamaClient, StubOllamaServer
+
+
+class TestCallScheduler:
+    """Test cases for CallScheduler."""
+
+    def test_models_run_side_by_side(self):
+        """Test that a round costs about its slowest call, not the sum."""
+        with CallScheduler(per_model=1) as scheduler:
+            futures = [scheduler.submit(f"Judge {m}", m, time.sleep, 0.1) for m in ('a', 'b', 'c')]
+            for future in futures:
+                future.result()
+
+        assert 0.1 <= scheduler.wall_clock < 0.25
+        assert scheduler.total_call_time >= 0.3
+        assert all(f.timing.elapsed >= 0.1 for f in futures)
+
+    def test_per_model_cap(self):
+        """Test that no more than per_model calls for one model are in flight."""
+        in_flight = {'a': 0, 'b': 0}
+        peak = {'a': 0, 'b': 0}
+        lock = threading.Lock()
+
+        def call(model):
+            with lock:
+                in_flight[model] += 1
+                peak[model] = max(peak[model], in_flight[model])
+            time.sleep(0.02)
+            with lock:
+                in_flight[model] -= 1
+            return model
+
+        with CallScheduler(per_model=2) as scheduler:
+            futures = [scheduler.submit(str(i), model, call, model) for i in range(6) for model in ('a', 'b')]
+            assert [f.result() for f in futures] == ['a', 'b'] * 6
+
+        assert peak == {'a': 2, 'b': 2}
+        assert any(t.waited > 0 for t in scheduler.timings)
+
+    def test_errors_are_reported(self):
+        """Test that a failing call raises from its future and shows in the report."""
+        def fail():
+            raise ConnectionError("model unavailable")
+
+        with CallScheduler() as scheduler:
+            future = scheduler.submit("Method 1", 'llama3.2', fail)
+            with pytest.raises(ConnectionError):
+                future.result()
+            scheduler.submit("Method 2", 'llama3.2', lambda: 'ok').result()
+
+        report = scheduler.report()
+        assert "2 calls" in report
+        assert "✗ model unavailable" in report
+        assert future.timing.error == "model unavailable"
+
+    def test_without_timings(self):
+        """Test that a long-lived scheduler can skip keeping timings but still times each call."""
+        with CallScheduler(keep_timings=False) as scheduler:
+            futures = [scheduler.submit(str(i), 'a', time.sleep, 0.01) for i in range(3)]
+            for future in futures:
+                future.result()
+
+        assert scheduler.timings == []
+        assert all(f.timing.elapsed >= 0.01 for f in futures)
+
+    def test_shares_the_client_pool(self):
+        """Test concurrent calls through one pooled client."""
+        with StubOllamaServer(reply=lambda payload: payload['prompt'].upper(), delay=0.1) as stub, \
+                OllamaClient(stub.url, max_connections=6) as client, \
+                CallScheduler(per_model=2) as scheduler:
+            futures = [scheduler.submit(f"{model} {i}", model, client.generate, model, f"story {i}")
+                       for model in ('llama3.2', 'phi3:mini', 'gemma2:2b') for i in range(2)]
+            assert [f.result()['response'] for f in futures] == ['STORY 0', 'STORY 1'] * 3
+            assert scheduler.wall_clock < 0.3
+
+    def test_invalid_limits(self):
+        with pytest.raises(ValueError):
+            CallScheduler(per_model=0)
+        with pytest.raises(ValueError):
+            CallScheduler(max_workers=0)
@@ -0,0 +1,34 @@
+"""
+Poetry generation for the 1.608 experiments (haiku, iambic pentameter,
+limerick), built on the gold-medal converters.
+
+- forms: generate_all_forms() runs every form for one text, in process
+- batch: resumable JSONL pipeline over many stories, with throughput reporting
+"""
+
+from .forms import (
+    FORMS,
+    GOLD_METHOD,
+    PoemResult,
+    add_form_arguments,
+    format_results,
+    generate_all_forms,
+    generate_form,
+    load_converter,
+)
+from .batch import ThroughputMeter, completed_ids, read_stories, run_batch
+
+__all__ = [
+    'FORMS',
+    'GOLD_METHOD',
+    'PoemResult',
+    'add_form_arguments',
+    'format_results',
+    'generate_all_forms',
+    'generate_form',
+    'load_converter',
+    'ThroughputMeter',
+    'completed_ids',
+    'read_stories',
+    'run_batch',
+]
@@ -0,0 +1,231 @@
+"""
+Batch story-to-poem pipeline over JSONL.
+
+Reads stories from JSONL (one {"id": ..., "text": ...} object per line;
+"story" is accepted for "text", a bare JSON string is a story whose id is
+its line number), runs generate_all_forms on up to `concurrency` stories at
+once, and appends one result line per story to the output JSONL as soon
+as it finishes:
+
+    {"id": "42", "ok": true, "elapsed": 3.1,
+     "forms": {"haiku": {"poem": ..., "valid": true, "validation": {...}}, ...}}
+
+The output file is the checkpoint. A rerun skips every id already in it
+(after dropping a line torn by the interruption), so an interrupted job
+resumes where it stopped. Progress -- stories/min and tokens/sec -- is
+reported as the batch runs.
+"""
+
+import json
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Set, Tuple
+
+from utils.llm import DEFAULT_HOST, CallMetrics, CallScheduler, OllamaClient
+
+from .forms import FORMS, generate_all_forms
+
+
+DEFAULT_CONCURRENCY = 4
+DEFAULT_REPORT_EVERY = 10.0
+DEFAULT_SYNC_EVERY = 100
+
+
+def read_stories(lines: Iterable[str]) -> Iterator[Tuple[str, str]]:
+    """
+    Parse JSONL input into (id, text) pairs.
+
+    Raises:
+        ValueError: If a line is not JSON or has no text
+    """
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Line {number}: invalid JSON ({e})")
+
+        if isinstance(record, str):
+            story_id, text = str(number), record
+        elif isinstance(record, dict):
+            story_id, text = str(record.get('id', number)), record.get('text', record.get('story'))
+        else:
+            story_id, text = None, None
+        if not isinstance(text, str):
+            raise ValueError(f"Line {number}: expected a JSON string or an object with a 'text' field")
+        yield story_id, text
+
+
+def completed_ids(output_path: str) -> Set[str]:
+    """
+    Return the ids already written to an output file.
+
+    A final line without its newline was torn by an interrupted run; it is
+    truncated away so the story is generated again.
+    """
+    if not os.path.exists(output_path):
+        return set()
+
+    done = set()
+    with open(output_path, 'rb+') as f:
+        end = 0
+        for line in f:
+            if not line.endswith(b'\n'):
+                break
+            end += len(line)
+            done.add(json.loads(line)['id'])
+        f.truncate(end)
+    return done
+
+
+class ThroughputMeter:
+    """Counts finished stories and generated tokens; safe to feed from any thread."""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.stories = 0
+        self.failed = 0
+        self.skipped = 0
+        self.tokens = 0
+        self._lock = threading.Lock()
+
+    def record_call(self, metrics: CallMetrics) -> None:
+        """Client on_metrics hook: count the call's generated tokens."""
+        with self._lock:
+            self.tokens += metrics.completion_tokens or 0
+
+    def record_story(self, ok: bool) -> None:
+        with self._lock:
+            self.stories += 1
+            if not ok:
+                self.failed += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Counts so far plus stories/min and tokens/sec since the meter started."""
+        elapsed = time.perf_counter() - self.start
+        with self._lock:
+            return {
+                'stories': self.stories,
+                'failed': self.failed,
+                'skipped': self.skipped,
+                'tokens': self.tokens,
+                'elapsed': elapsed,
+                'stories_per_minute': self.stories / elapsed * 60 if elapsed else 0.0,
+                'tokens_per_second': self.tokens / elapsed if elapsed else 0.0,
+            }
+
+    def format(self) -> str:
+        stats = self.snapshot()
+        line = (f"{stats['stories']} stories ({stats['failed']} failed) in {stats['elapsed']:.0f}s: "
+                f"{stats['stories_per_minute']:.1f} stories/min, {stats['tokens_per_second']:.1f} tokens/s")
+        if stats['skipped']:
+            line += f", {stats['skipped']} already done"
+        return line
+
+
+def _convert(story_id: str, text: str, forms, client, scheduler) -> Dict[str, Any]:
+    start = time.perf_counter()
+    results = generate_all_forms(text, forms, client, scheduler)
+    return {
+        'id': story_id,
+        'ok': all(result.ok for result in results.values()),
+        'elapsed': round(time.perf_counter() - start, 3),
+        'forms': {form: {k: v for k, v in result.to_dict().items() if k != 'form'}
+                  for form, result in results.items()},
+    }
+
+
+def run_batch(stories: Iterable[Tuple[str, str]], output_path: str, forms: Iterable[str] = FORMS,
+              concurrency: int = DEFAULT_CONCURRENCY, host: str = DEFAULT_HOST, cache=None,
+              resume: bool = True, progress: Optional[Callable[[str], None]] = None,
+              report_every: float = DEFAULT_REPORT_EVERY,
+              sync_every: int = DEFAULT_SYNC_EVERY) -> Dict[str, Any]:
+    """
+    Convert every story into each form, appending results to output_path.
+
+    Args:
+        stories: (id, text) pairs, e.g. from read_stories
+        output_path: JSONL file to append results to; also the checkpoint
+        forms: Forms to generate (default: all of FORMS)
+        concurrency: Stories in flight at once
+        host: Ollama server
+        cache: Optional ResponseCache for the batch's client
+        resume: Skip ids already in output_path (False starts a new file)
+        progress: Called with a throughput line every report_every seconds
+                  and once at the end
+        report_every: Seconds between progress reports
+        sync_every: fsync the output after this many results
+
+    Returns:
+        Final ThroughputMeter snapshot
+
+    Raises:
+        ValueError: If concurrency is less than 1 or a form is unknown
+    """
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+    forms = list(forms)
+    for form in forms:
+        if form not in FORMS:
+            raise ValueError(f"form must be one of {', '.join(FORMS)}, got {form!r}")
+
+    done = completed_ids(output_path) if resume else set()
+    meter = ThroughputMeter()
+    last_report = time.perf_counter()
+    written = 0
+
+    # One pooled connection, and one scheduler slot, per form call that can be in flight
+    calls = max(concurrency * len(forms), 1)
+    client = OllamaClient(host, max_connections=calls, on_metrics=meter.record_call, cache=cache)
+    scheduler = CallScheduler(per_model=calls, max_workers=calls, keep_timings=False)
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='poetry-batch')
+
+    with open(output_path, 'a' if resume else 'w', encoding='utf-8') as output:
+        def write(record):
+            nonlocal written
+            output.write(json.dumps(record, ensure_ascii=False) + '\n')
+            output.flush()
+            written += 1
+            if written % sync_every == 0:
+                os.fsync(output.fileno())
+            meter.record_story(record['ok'])
+
+        pending = set()
+
+        def drain(limit):
+            nonlocal pending, last_report
+            while len(pending) > limit:
+                finished, pending = wait(pending, timeout=report_every, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    write(future.result())
+                if progress and time.perf_counter() - last_report >= report_every:
+                    progress(meter.format())
+                    last_report = time.perf_counter()
+
+        try:
+            for story_id, text in stories:
+                if story_id in done:
+                    meter.skipped += 1
+                    continue
+                pending.add(executor.submit(_convert, story_id, text, forms, client, scheduler))
+                # Keep at most `concurrency` stories queued behind the running ones,
+                # so the input is read lazily however long it is
+                drain(concurrency * 2 - 1)
+            drain(0)
+        finally:
+            # Stories still in flight are not in the output, so a rerun redoes them.
+            # Closing the client fails their pending calls, so their threads
+            # exit instead of blocking interpreter shutdown.
+            executor.shutdown(wait=False, cancel_futures=True)
+            output.flush()
+            os.fsync(output.fileno())
+            client.close()
+            scheduler.close()
+
+    if progress:
+        progress(meter.format())
+    return meter.snapshot()
@@ -0,0 +1,222 @@
+"""
+In-process access to the gold-medal poetry converters.
+
+Method 2 (Specification-Driven) won the olympic judging for all three
+forms. This module loads those converters once per process and runs them
+directly, so callers get structured results instead of spawning the
+generate-* CLIs and scraping their output:
+
+    from utils.poetry import generate_all_forms
+
+    results = generate_all_forms("An old woman tended her garden...")
+    print(results['haiku'].poem)
+
+The forms run concurrently over the shared, pooled Ollama client.
+"""
+
+import argparse
+import importlib.util
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, Iterable, List, Optional
+
+from utils.llm import CallScheduler, get_client
+
+
+FORMS = ('haiku', 'iambic', 'limerick')
+
+FORM_TITLES = {
+    'haiku': '🎋 Haiku',
+    'iambic': '📜 Iambic Pentameter',
+    'limerick': '🎪 Limerick',
+}
+
+GOLD_METHOD = 'Method 2: Specification-Driven'
+
+# Model the gold-medal converters generate with
+GENERATOR_MODEL = 'llama3.2'
+
+_EXPERIMENTS = Path(__file__).resolve().parents[2] / 'experiments'
+_CONVERTER_PATHS = {
+    'haiku': _EXPERIMENTS / '1.608-story-to-haiku' / '4-optimized-prompts'
+             / '2-specification-driven' / 'haiku_converter.py',
+    'iambic': _EXPERIMENTS / '1.608.A-iambic-pentameter' / '2-specification-driven' / 'iambic_converter.py',
+    'limerick': _EXPERIMENTS / '1.608.B-limerick-converter' / '2-specification-driven' / 'limerick_converter.py',
+}
+
+_converters: Dict[str, ModuleType] = {}
+_converters_lock = threading.Lock()
+
+
+@dataclass
+class PoemResult:
+    """One form's poem for one text, with the converter's validation."""
+    form: str
+    poem: str = ''
+    lines: List[str] = field(default_factory=list)
+    valid: bool = False
+    validation: Dict[str, Any] = field(default_factory=dict)
+    elapsed: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """True if the converter produced a poem."""
+        return self.error is None and bool(self.lines)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _parse_forms(value: str) -> List[str]:
+    forms = [form.strip() for form in value.split(',') if form.strip()]
+    if not forms or any(form not in FORMS for form in forms):
+        raise argparse.ArgumentTypeError(f"choose from {', '.join(FORMS)}")
+    return forms
+
+
+def add_form_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the --forms option (a comma-separated subset of FORMS) to a command-line parser."""
+    parser.add_argument('--forms', type=_parse_forms, default=list(FORMS),
+                        help=f"Comma-separated forms to generate (default: {','.join(FORMS)})")
+
+
+def load_converter(form: str) -> ModuleType:
+    """
+    Return the gold-medal converter module for form, loading it on first use.
+
+    Raises:
+        ValueError: If form is not one of FORMS
+    """
+    if form not in _CONVERTER_PATHS:
+        raise ValueError(f"form must be one of {', '.join(FORMS)}, got {form!r}")
+
+    with _converters_lock:
+        if form not in _converters:
+            spec = importlib.util.spec_from_file_location(f"gold_{form}_converter", _CONVERTER_PATHS[form])
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            _converters[form] = module
+        return _converters[form]
+
+
+def _haiku(text: str, client) -> PoemResult:
+    result = load_converter('haiku').story_to_haiku(text, llm_client=client)
+    return PoemResult(
+        form='haiku',
+        poem=result['haiku'],
+        lines=result['lines'],
+        valid=result['valid'],
+        validation={'syllables': result['syllables'], 'essence': result['essence']},
+        error=result.get('error'),
+    )
+
+
+def _iambic(text: str, client) -> PoemResult:
+    converter = load_converter('iambic').IambicConverter()
+    converter.ollama.client = client
+    output = converter.convert(text)
+    # convert() appends an accuracy note to imperfect poems; validate the poem itself
+    poem = output.split('\n\n[Note:')[0]
+    validation = converter.validator.validate_poem(poem)
+    return PoemResult(
+        form='iambic',
+        poem=poem,
+        lines=poem.split('\n'),
+        valid=validation['valid'],
+        validation={k: v for k, v in validation.items() if k != 'details'},
+    )
+
+
+def _limerick(text: str, client) -> PoemResult:
+    result = load_converter('limerick').LimerickConverter(client=client).convert(text)
+    if 'error' in result:
+        return PoemResult(form='limerick', error=f"{result['error']}: {result['details']}")
+    return PoemResult(
+        form='limerick',
+        poem=result['limerick']['text'],
+        lines=result['limerick']['lines'],
+        valid=result['validation']['is_valid'],
+        validation=result['validation'],
+    )
+
+
+_GENERATORS = {
+    'haiku': _haiku,
+    'iambic': _iambic,
+    'limerick': _limerick,
+}
+
+
+def generate_form(form: str, text: str, client=None) -> PoemResult:
+    """
+    Convert text into one poetry form with its gold-medal converter.
+
+    Converter failures are reported in PoemResult.error rather than raised.
+
+    Args:
+        form: One of FORMS
+        text: Story or prose to convert
+        client: OllamaClient to use (default: the shared client)
+
+    Raises:
+        ValueError: If form is not one of FORMS
+    """
+    if form not in _GENERATORS:
+        raise ValueError(f"form must be one of {', '.join(FORMS)}, got {form!r}")
+
+    start = time.perf_counter()
+    try:
+        result = _GENERATORS[form](text, client or get_client())
+    except Exception as e:
+        result = PoemResult(form=form, error=str(e) or type(e).__name__)
+    result.elapsed = time.perf_counter() - start
+    return result
+
+
+def generate_all_forms(text: str, forms: Iterable[str] = FORMS, client=None,
+                       scheduler: Optional[CallScheduler] = None) -> Dict[str, PoemResult]:
+    """
+    Convert text into every poetry form at once.
+
+    Args:
+        text: Story or prose to convert
+        forms: Forms to generate (default: all of FORMS)
+        client: OllamaClient to use (default: the shared client)
+        scheduler: CallScheduler to run the forms on, e.g. one shared by a
+                   batch of texts (default: a private scheduler running
+                   every form concurrently)
+
+    Returns:
+        PoemResult for each form, in the order requested
+
+    Raises:
+        ValueError: If a form is not one of FORMS
+    """
+    forms = list(forms)
+    for form in forms:
+        load_converter(form)
+
+    own_scheduler = scheduler is None
+    if own_scheduler:
+        scheduler = CallScheduler(per_model=max(len(forms), 1))
+    try:
+        pending = {form: scheduler.submit(form, GENERATOR_MODEL, generate_form, form, text, client)
+                   for form in forms}
+        return {form: call.result() for form, call in pending.items()}
+    finally:
+        if own_scheduler:
+            scheduler.close()
+
+
+def format_results(results: Dict[str, PoemResult]) -> str:
+    """Render results as the gold-medal section printed by tools/generate-poetry."""
+    sections = [f"🥇 GOLD MEDAL RESULTS ({GOLD_METHOD})\n{'=' * 80}"]
+    for form, result in results.items():
+        if result.ok:
+            poem = '\n'.join(f"   {line}" for line in result.lines)
+            sections.append(f"{FORM_TITLES[form]}\n{'-' * 80}\n{poem}")
+    return '\n\n'.join(sections)
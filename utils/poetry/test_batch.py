@@ -0,0 +1,166 @@
+"""
+Tests for the resumable batch pipeline, run against the local stub server.
+"""
+
+import io
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, REPO_ROOT)
+
+from utils.llm import StubOllamaServer
+from utils.poetry import FORMS, completed_ids, read_stories, run_batch
+from utils.poetry.test_forms import reply
+
+
+def stories(count):
+    return [(f"s{i}", f"Story number {i} about a clever fox.") for i in range(count)]
+
+
+def read_output(path):
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+@pytest.fixture
+def stub():
+    with StubOllamaServer(reply=reply) as server:
+        yield server
+
+
+class TestBatch:
+    """Test cases for the batch pipeline."""
+
+    def test_read_stories(self):
+        """Test the accepted input shapes and their ids."""
+        lines = io.StringIO('{"id": 7, "text": "a"}\n\n"b"\n{"story": "c"}\n')
+        assert list(read_stories(lines)) == [('7', 'a'), ('3', 'b'), ('4', 'c')]
+
+        with pytest.raises(ValueError, match="Line 1"):
+            list(read_stories(['not json']))
+        with pytest.raises(ValueError, match="Line 1"):
+            list(read_stories(['{"id": 1}']))
+
+    def test_run_batch(self, stub, tmp_path):
+        """Test that every story gets one line with every form and its validation."""
+        output = str(tmp_path / 'poems.jsonl')
+        reports = []
+        stats = run_batch(stories(6), output, host=stub.url, concurrency=3, progress=reports.append)
+
+        records = read_output(output)
+        assert sorted(r['id'] for r in records) == [f"s{i}" for i in range(6)]
+        assert all(r['ok'] and set(r['forms']) == set(FORMS) for r in records)
+        assert all('valid' in form and 'validation' in form for r in records for form in r['forms'].values())
+        assert len(stub.requests) == 6 * len(FORMS)
+
+        assert stats['stories'] == 6 and stats['failed'] == 0
+        assert stats['tokens'] > 0
+        assert stats['stories_per_minute'] > 0 and stats['tokens_per_second'] > 0
+        assert 'stories/min' in reports[-1] and 'tokens/s' in reports[-1]
+
+    def test_one_scheduler_per_batch(self, stub, tmp_path, monkeypatch):
+        """Test that every story shares the batch's scheduler instead of building its own."""
+        from utils.llm import CallScheduler
+        from utils.poetry import batch, forms
+
+        created = []
+
+        class CountingScheduler(CallScheduler):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                created.append(self)
+
+        monkeypatch.setattr(batch, 'CallScheduler', CountingScheduler)
+        monkeypatch.setattr(forms, 'CallScheduler', CountingScheduler)
+        run_batch(stories(5), str(tmp_path / 'poems.jsonl'), host=stub.url, concurrency=2)
+
+        assert len(created) == 1
+        assert created[0].per_model == 2 * len(FORMS)
+        assert len(stub.requests) == 5 * len(FORMS)
+
+    def test_resume(self, stub, tmp_path):
+        """Test that a rerun skips finished stories and redoes a torn last line."""
+        output = str(tmp_path / 'poems.jsonl')
+        run_batch(stories(3), output, host=stub.url, forms=['haiku'])
+        with open(output, 'a', encoding='utf-8') as f:
+            f.write('{"id": "s3", "ok": tr')  # interrupted mid-write
+
+        assert completed_ids(output) == {'s0', 's1', 's2'}
+        stub.requests.clear()
+        stats = run_batch(stories(5), output, host=stub.url, forms=['haiku'])
+
+        assert stats['skipped'] == 3 and stats['stories'] == 2
+        assert len(stub.requests) == 2
+        assert sorted(r['id'] for r in read_output(output)) == [f"s{i}" for i in range(5)]
+
+        # --restart semantics: start a new file
+        run_batch(stories(1), output, host=stub.url, forms=['haiku'], resume=False)
+        assert [r['id'] for r in read_output(output)] == ['s0']
+
+    def test_failures_are_recorded(self, tmp_path):
+        """Test that an unreachable model yields failed records, not an aborted batch."""
+        output = str(tmp_path / 'poems.jsonl')
+        stats = run_batch(stories(2), output, host='http://127.0.0.1:1', forms=['iambic'])
+        records = read_output(output)
+        assert stats['failed'] == 2
+        assert all(not r['ok'] and r['forms']['iambic']['error'] for r in records)
+
+        with pytest.raises(ValueError):
+            run_batch(stories(1), output, concurrency=0)
+
+    def test_cli(self, stub, tmp_path):
+        """Test tools/batch-poetry reading stdin."""
+        output = str(tmp_path / 'poems.jsonl')
+        tool = os.path.join(REPO_ROOT, 'tools', 'batch-poetry')
+        lines = '\n'.join(json.dumps({'id': i, 'text': t}) for i, t in stories(2)) + '\n'
+        completed = subprocess.run([sys.executable, tool, '-', '-o', output, '--forms', 'haiku,limerick',
+                                    '--host', stub.url], input=lines, capture_output=True, text=True,
+                                   timeout=60)
+
+        assert completed.returncode == 0, completed.stderr
+        assert 'stories/min' in completed.stderr
+        records = read_output(output)
+        assert sorted(r['id'] for r in records) == ['s0', 's1']
+        assert set(records[0]['forms']) == {'haiku', 'limerick'}
+
+    @pytest.mark.skipif(sys.platform == 'win32', reason="needs POSIX signals")
+    def test_cli_interrupt_and_resume(self, tmp_path):
+        """Test that SIGINT exits promptly while stories are mid-call, and a rerun resumes."""
+        output = str(tmp_path / 'poems.jsonl')
+        tool = os.path.join(REPO_ROOT, 'tools', 'batch-poetry')
+        lines = '\n'.join(json.dumps({'id': i, 'text': t}) for i, t in stories(4)) + '\n'
+        command = [sys.executable, tool, '-', '-o', output, '--forms', 'haiku', '--concurrency', '2']
+
+        with StubOllamaServer(reply=reply, delay=3) as slow:
+            process = subprocess.Popen(command + ['--host', slow.url], stdin=subprocess.PIPE,
+                                       stderr=subprocess.PIPE, text=True)
+            process.stdin.write(lines)
+            process.stdin.close()
+            deadline = time.time() + 10
+            while not slow.requests and time.time() < deadline:
+                time.sleep(0.05)
+            assert slow.requests, "no story reached the server"
+
+            process.send_signal(signal.SIGINT)
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                pytest.fail("batch-poetry hung after SIGINT")
+            stderr = process.stderr.read()
+            process.stderr.close()
+        assert process.returncode == 130
+        assert 'Interrupted' in stderr
+
+        with StubOllamaServer(reply=reply) as stub:
+            completed = subprocess.run(command + ['--host', stub.url], input=lines, capture_output=True,
+                                       text=True, timeout=60)
+        assert completed.returncode == 0, completed.stderr
+        assert sorted(r['id'] for r in read_output(output)) == [f"s{i}" for i in range(4)]
@@ -0,0 +1,100 @@
+"""
+Tests for in-process poetry generation, run against the local stub server.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, REPO_ROOT)
+
+from utils.llm import OllamaClient, StubOllamaServer
+from utils.poetry import FORMS, format_results, generate_all_forms, generate_form
+
+
+HAIKU = {
+    'lines': ['An old silent pond', 'A frog jumps into the pond', 'Splash! Silence again'],
+    'syllables': [5, 7, 5],
+    'essence': 'stillness broken',
+}
+IAMBIC = "The cat sat on the mat and watched the sky\nAnd birds flew high above the garden wall"
+LIMERICK = ("There once was a fox in a wood\n"
+            "Who stole all the bait that he could\n"
+            "The hunters would shout\n"
+            "The fox ran about\n"
+            "And feasted as well as he should")
+
+
+def reply(payload):
+    """Answer like llama3.2 would for each converter's prompt."""
+    if 'messages' in payload:
+        return json.dumps(HAIKU)
+    if 'limerick' in payload['prompt']:
+        return LIMERICK
+    return IAMBIC
+
+
+@pytest.fixture
+def client():
+    with StubOllamaServer(reply=reply, delay=0.1) as stub, OllamaClient(stub.url) as ollama:
+        yield ollama
+
+
+class TestGenerateAllForms:
+    """Test cases for generate_all_forms."""
+
+    def test_all_forms(self, client):
+        """Test that every form returns a structured, validated poem."""
+        results = generate_all_forms("A fox outsmarted the hunters.", client=client)
+
+        assert list(results) == list(FORMS)
+        assert all(result.ok for result in results.values())
+        assert results['haiku'].lines == HAIKU['lines']
+        assert results['haiku'].valid
+        assert results['iambic'].lines == IAMBIC.split('\n')
+        assert 'accuracy' in results['iambic'].validation
+        assert results['limerick'].poem == LIMERICK
+        assert results['limerick'].validation['line_count'] == 5
+
+    def test_forms_run_concurrently(self, client):
+        """Test that the forms cost about one call, not three."""
+        results = generate_all_forms("A fox outsmarted the hunters.", client=client)
+        slowest = max(result.elapsed for result in results.values())
+        assert slowest < 0.3
+        assert [m.connection_reused for m in client.metrics].count(False) == 3
+
+    def test_errors_are_reported(self):
+        """Test that an unreachable model becomes an error result, not an exception."""
+        with OllamaClient('http://127.0.0.1:1') as unreachable:
+            result = generate_form('iambic', "A fox outsmarted the hunters.", client=unreachable)
+        assert not result.ok
+        assert 'not available' in result.error
+
+        with pytest.raises(ValueError):
+            generate_all_forms("text", forms=['sonnet'])
+
+    def test_format_results(self, client):
+        """Test the gold medal section shared by the CLIs."""
+        results = generate_all_forms("A fox.", forms=['haiku', 'limerick'], client=client)
+        section = format_results(results)
+        assert section.startswith("🥇 GOLD MEDAL RESULTS")
+        assert "🎋 Haiku" in section and "🎪 Limerick" in section
+        assert "   An old silent pond" in section
+
+    def test_cli_json(self):
+        """Test that tools/generate-poetry --json prints structured results."""
+        tool = os.path.join(REPO_ROOT, 'tools', 'generate-poetry')
+        with StubOllamaServer(reply=reply) as stub:
+            completed = subprocess.run([sys.executable, tool, '-', '--json', '--host', stub.url],
+                                       input="A fox outsmarted the hunters.",
+                                       capture_output=True, text=True, timeout=60)
+
+        assert completed.returncode == 0, completed.stderr
+        output = json.loads(completed.stdout)
+        assert set(output) == set(FORMS)
+        assert output['haiku']['lines'] == HAIKU['lines']
+        assert output['limerick']['valid'] in (True, False)